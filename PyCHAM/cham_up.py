@@ -238,8 +238,12 @@ def cham_up(sumt, Pnow,
 			# RH should be allowed to vary with temperature
 			[_, Psat_water, _] = water_calc(temp_nown, RH[RHt_cnt], si.N_A)
 			# update vapour pressures of all components (molecules/cc and Pa), 
-			# ignore density output
-			[Psat, _, Psat_Pa] = volat_calc.volat_calc(0, Pybel_objects, temp_nown, H2Oi,   
+			# using the temperature dependence parameters from prop_calc, 
+			# unless these did not reproduce the estimates
+			if (self.Psat_fit == 1):
+				[Psat, Psat_Pa] = volat_calc.Psat_T(temp_nown, Psat_water, H2Oi, self)
+			else: # estimate again, ignore density output
+				[Psat, _, Psat_Pa] = volat_calc.volat_calc(0, Pybel_objects, temp_nown, H2Oi,   
 							num_comp, Psat_water, [], [], 0, corei, seed_name, 
 							pconc, 0, 0.0, [], 1, nuci, nuc_comp)
 			
@@ -26,11 +26,11 @@
 
 import sch_interr
 import xml_interr
+import mech_cache
 import re
-import write_rate_file
+import rrc_comp
 import formatting
 import photo_num
-import importlib
 
 def chem_scheme_SMILES_extr(self):
 
@@ -53,7 +53,8 @@ def chem_scheme_SMILES_extr(self):
 		RO2_names] = sch_interr.sch_interr(total_list_eqn, self)
 	
 	# interrogate xml to list all component names and SMILES
-	[err_mess_new, comp_smil, comp_name] = xml_interr.xml_interr(self.xml_name)
+	[err_mess_new, comp_smil, comp_name] = xml_interr.xml_interr(self.xml_name, 
+		None, mech_cache.cache_dir(self))
 	
 	# in case error given by xml_interr
 	if err_mess_new[0:5] == 'Error':
@@ -200,20 +201,19 @@ def chem_scheme_SMILES_extr(self):
 		err_mess = 'Note: no gas-phase reactions seen, this could be due to the chemical scheme marker input (chem_scheme_markers in the model variables input) not corresponding to the chemical scheme file, please see README for more guidance.'
 	
 	# check on whether all rate coefficients can be calculated
-	# call function to generate reaction rate calculation module
-	write_rate_file.write_rate_file(reac_coef, [], rrc, rrc_name, 0)
+	# compile the reaction rate calculation function
+	[erf, err_mess_rrc, self] = rrc_comp.rrc_comp(reac_coef, [], rrc, rrc_name, self)
+	if (erf == 1):
+		return(comp_namelist, comp_list, err_mess_rrc, H2Oi)
 
 	# get number of photolysis equations
 	Jlen = photo_num.photo_num(self.photo_path)
 	
 	# call on reaction rate calculation (with dummy inputs) to check for issues
 	try:
-		import rate_coeffs
-		importlib.reload(rate_coeffs) # ensure latest version uploaded
+		[rate_values, erf, err_mess] = self.rrc_func(0., 0., 298.15, 1, 0., 1., 1., 1., Jlen, 1., 1., 1., 0., self)
 		
-		[rate_values, erf, err_mess] = rate_coeffs.evaluate_rates(0., 0., 298.15, 1, 0., 1., 1., 1., Jlen, 1., 1., 1., 0., self)
-		
-	except: # in case import fails
+	except: # in case evaluation fails
 		err_mess = 'Error: chemical reactions not interpreted correctly, this could be because of inconsistency between the chemical scheme marker input (chem_scheme_markers in the model variables input) and the format of the chemical scheme file, please see README for more guidance.'
 		
 	return(comp_namelist, comp_list, err_mess, H2Oi)
\ No newline at end of file
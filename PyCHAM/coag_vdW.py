@@ -0,0 +1,218 @@
+##########################################################################################
+#                                                                                        											 #
+#    Copyright (C) 2018-2022 Simon O'Meara : simon.omeara@manchester.ac.uk                  				 #
+#                                                                                       											 #
+#    All Rights Reserved.                                                                									 #
+#    This file is part of PyCHAM                                                         									 #
+#                                                                                        											 #
+#    PyCHAM is free software: you can redistribute it and/or modify it under              						 #
+#    the terms of the GNU General Public License as published by the Free Software       					 #
+#    Foundation, either version 3 of the License, or (at your option) any later          						 #
+#    version.                                                                            										 #
+#                                                                                        											 #
+#    PyCHAM is distributed in the hope that it will be useful, but WITHOUT                						 #
+#    ANY WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS       			 #
+#    FOR A PARTICULAR PURPOSE.  See the GNU General Public License for more              				 #
+#    details.                                                                            										 #
+#                                                                                        											 #
+#    You should have received a copy of the GNU General Public License along with        					 #
+#    PyCHAM.  If not, see <http://www.gnu.org/licenses/>.                                 							 #
+#                                                                                        											 #
+##########################################################################################
+'''van der Waals/viscous collision correction to the coagulation kernel'''
+# the correction factors of eqs. 15.43 and 15.44 of Jacobson (2005) depend
+# on the radii of a particle pair only through their ratio (and, with the
+# Hamaker constant proportional to temperature as in coag, not on 
+# temperature), so are integrated once over a grid of radius ratio, in 
+# parallel, stored beside the mechanism cache and interpolated when 
+# coagulation kernels are calculated
+
+import os
+import numpy as np
+import scipy.integrate as integ
+import concurrent.futures
+import mech_cache
+
+# grid of the log10 of radius ratio, beyond which the correction factors
+# are taken as those at the ends of the grid (where they are within 0.2 % of 
+# their limit of 1 for very different sizes)
+q_grid = np.linspace(-5., 5., 401)
+
+# Hamaker constant divided by the product of the Boltzmann constant and 
+# temperature (dimensionless)
+A_kT = 200.
+
+# correction factors on q_grid (W_c in first column, W_k in second) and
+# maximum relative error of interpolation between grid points, once loaded
+tab = None
+tab_err = None
+
+# direct integration of the correction factors (eqs. 15.43 and 15.44)
+def W_int(q):
+
+	# inputs: ----------------------------------------------------
+	# q - log10 of the ratio of particle radii (ri/rj)
+	# ------------------------------------------------------------
+
+	# radii scaled so that their sum is 1, with energies in units of the 
+	# product of the Boltzmann constant and temperature, leaving the 
+	# integrals dimensionless
+	W = np.zeros((len(q), 2))
+	
+	for it in range(len(q)):
+	
+		rj = 1./(1.+10.**q[it])
+		ri = 1.-rj
+		a = (-A_kT/6.0)*2.0*ri*rj
+		b = (-A_kT/6.0)
+		# square of sum of radii
+		c = (ri+rj)**2.0
+		# square of difference in radii
+		d = (ri-rj)**2.0
+		# product of radii
+		e = ri*rj
+		# sum of radii
+		f = ri+rj
+		# difference of radii
+		g = ri-rj
+		
+		# define the integration in 15.44
+		def integrand(x, a, b, c, d, e, f, g):
+			Dterm = (1.0+((2.6*e)/(c))*((e/(f*(x-g)))**0.5)+e/(f*(x-g)))
+			Ep0_1 = a/(x**2.0-c)
+			Ep0_2 = a/(x**2.0-d)
+			Ep0_3 = b*np.log((x**2.0-c)/(x**2.0-d))
+			rterm = 1.0/(x**2.0)
+			return Dterm*np.exp(Ep0_1+Ep0_2+Ep0_3)*rterm
+		# define the integration in 15.43
+		def integrand2(x, a, b, c, d):
+			# terms of Ep0
+			Ep0_1 = a/(x**2.0-c)
+			Ep0_2 = a/(x**2.0-d)
+			Ep0_3 = b*np.log((x**2.0-c)/(x**2.0-d))
+			Ep0 = Ep0_1+Ep0_2+Ep0_3
+			# terms of first differential Ep0
+			Ep1_1 = (-2.0*a*x)/((x**2.0-c)**2.0)
+			Ep1_2 = (-2.0*a*x)/((x**2.0-d)**2.0)
+			Ep1_3 = (2.0*b*x)/(x**2.0-c)
+			Ep1_4 = (-2.0*b*x)/(x**2.0-d)
+			Ep1 = Ep1_1+Ep1_2+Ep1_3+Ep1_4
+			# terms of second differential Ep0
+			Ep2_1 = (6.0*a*x**4.0-4.0*a*c*x**2.0-2.0*a*c**2.0)/((x**2.0-c)**4.0)	
+			Ep2_2 = (6.0*a*x**4.0-4.0*a*d*x**2.0-2.0*a*d**2.0)/((x**2.0-d)**4.0)
+			Ep2_3 = (-2.0*b*x**2.0-2.0*b*c)/((x**2.0-c)**2.0)
+			Ep2_4 = (2.0*b*x**2.0+2.0*b*d)/((x**2.0-d)**2.0)
+			Ep2 = Ep2_1+Ep2_2+Ep2_3+Ep2_4
+			return (Ep1+x*Ep2)*np.exp(-1.0*((x/2.0)*Ep1+Ep0))*(x**2.0)
+		
+		# integration bounds - note both integral functions
+		# fall to negligible values after (ri+rj)*1.0e2 and if
+		# infinity used as the upper bound numerical issues 
+		# arise, therefore use (ri+rj)*1.0e2 for upper bound, with
+		# relative rather than absolute tolerance since dimensionless
+		ilu = (ri+rj)*1.0e2 # upper
+		ill = (ri+rj) # lower
+		with np.errstate(all = 'ignore'): # overflow of exponent at lower bound
+			# integration in 15.44
+			res = integ.quad(integrand, ill, ilu, args=(a, b, c, d, e, f, g),
+				points=([ill*2.0]), limit=1000, epsabs=0., epsrel=1.e-10)
+			# integration in 15.43
+			res2 = integ.quad(integrand2, ill, ilu, args=(a, b, c, d),
+				points=([ill*2.0]), limit=1000, epsabs=0., epsrel=1.e-10)
+		# 15.44 and 15.43
+		W[it, 0] = 1.0/(f*res[0])
+		W[it, 1] = (-1.0/(2.0*c))*res2[0]
+
+	return(W)
+
+# parallel direct integration over radius ratios
+def W_par(q):
+
+	# inputs: ----------------------------------------------------
+	# q - log10 of the ratio of particle radii (ri/rj)
+	# ------------------------------------------------------------
+
+	nchunk = min(len(q), (os.cpu_count() or 1)*4) # chunks shared between processes
+	with concurrent.futures.ProcessPoolExecutor() as ex:
+		res = list(ex.map(W_int, [q[i::nchunk] for i in range(nchunk)]))
+	
+	W = np.zeros((len(q), 2))
+	for i in range(nchunk):
+		W[i::nchunk, :] = res[i]
+
+	return(W)
+
+# table of correction factors, from memory, disk or integration
+def tab_load(self):
+
+	# inputs: ----------------------------------------------------
+	# self - reference to PyCHAM (for the location of the mechanism cache)
+	# ------------------------------------------------------------
+
+	global tab, tab_err
+	
+	if tab is not None:
+		return(tab)
+	
+	fname = os.path.join(mech_cache.cache_dir(self), 'coag_vdW.npz')
+	
+	try: # table stored for the same grid
+		with np.load(fname) as f:
+			if (np.array_equal(f['q_grid'], q_grid) and float(f['A_kT']) == A_kT):
+				[tab, tab_err] = [f['W'], float(f['err'])]
+				return(tab)
+	except (OSError, KeyError, ValueError):
+		pass
+	
+	# integrate on grid and, for checking accuracy of interpolation, 
+	# midway between grid points
+	q_mid = (q_grid[1::]+q_grid[0:-1])/2.
+	W = W_par(np.append(q_grid, q_mid))
+	tab = W[0:len(q_grid), :]
+	tab_err = float(np.max(np.abs(W_interp(q_mid)-W[len(q_grid)::, :])/
+		W[len(q_grid)::, :]))
+	
+	try: # store for future use
+		os.makedirs(os.path.dirname(fname), exist_ok=True)
+		np.savez(fname, q_grid=q_grid, A_kT=A_kT, W=tab, err=tab_err)
+	except OSError: # table then only held in memory
+		pass
+	
+	return(tab)
+
+# correction factors interpolated from table
+def W_interp(q):
+
+	# inputs: ----------------------------------------------------
+	# q - log10 of the ratio of particle radii (ri/rj)
+	# ------------------------------------------------------------
+
+	W = np.zeros((np.size(q), 2))
+	for i in range(2):
+		W[:, i] = np.interp(np.ravel(q), q_grid, tab[:, i])
+
+	return(W)
+
+# van der Waals/viscous collision correction factor (15.42)
+def V_E(ri, rj, Dpi, Dpj, vbari, vbarj, self):
+
+	# inputs: ----------------------------------------------------
+	# ri - radius of first particle of pairs (m)
+	# rj - radius of second particle of pairs (m)
+	# Dpi - particle diffusion coefficient of first particle (m2/s)
+	# Dpj - particle diffusion coefficient of second particle (m2/s)
+	# vbari - thermal speed of first particle (m/s)
+	# vbarj - thermal speed of second particle (m/s)
+	# self - reference to PyCHAM
+	# ------------------------------------------------------------
+
+	tab_load(self)
+	
+	q = np.log10(ri/rj) # radius ratios, broadcast over pairs
+	W = W_interp(q)
+	W_c = W[:, 0].reshape(np.shape(q))
+	W_k = W[:, 1].reshape(np.shape(q))
+	
+	fac = 4.0*(Dpi+Dpj)/(((vbari**2.0+vbarj**2.0)**0.5)*(ri+rj))
+	
+	return((W_c*(1.0+fac))/(1.0+(W_c/W_k)*fac))
@@ -153,6 +153,9 @@ def def_mod_var(caller, self): # define function
 		delattr(self, 'secx')
 	if hasattr(self, 'cosx'):
 		delattr(self, 'cosx')	
+	# if natural actinic flux tabulated in a previous run then delete
+	if hasattr(self, 'nat_act_tab'):
+		delattr(self, 'nat_act_tab')
 
 
 	# deposition of particles and vapours to wall ------------------------------------------
@@ -196,6 +199,28 @@ def def_mod_var(caller, self): # define function
 	self.obs_file = [] # path to observations file
 	# components to fix to observed
 	self.obs_comp_i = []
+
+	# mechanism reduction ------------------------------------------------
+	# chemical scheme names of components (and SOA for secondary 
+	# particle-phase mass) the reduced scheme must reproduce
+	self.red_trgt = []
+	self.red_thr = 1.e-2 # threshold of relation between components
+	# tolerance of reduced simulation (fraction of reference maximum)
+	self.red_tol = 5.e-2
+	self.red_rec = 0 # flag for recording integrated reaction fluxes
+
+	# flag for lumping particle- and wall-phase organics into volatility
+	# basis set bins during integration (0 for off, 1 for on)
+	self.vbs_lump = 0
+
+	# number of worker processes for estimating component properties (1
+	# for estimating in the main process)
+	self.prop_workers = 1
+
+	# relative change in size bin radius, single particle mass and chamber
+	# conditions below which the coagulation kernel is reused (0 for reuse
+	# only when unchanged)
+	self.coag_tol = 0.
 	# --------------------------------------------------------------------------
 
 	# prepare for pickling
@@ -27,88 +27,113 @@
 
 import numpy as np
 import pybel
+import mol_reg
 import math
+import prop_db
+
+# simple molecules given in Table 4.1 of Taylor (1993)
+# SMILE strings for simple molecules
+simp_molec = ['[He]', '[Ne]', '[Ar]', '[Kr]', '[Xe]', '[H][H]', r'N#N', 'O=O', 'CO', 'O=C=O', 'NO=N', '[H]N([H])[H]', 'O', 'S(F)(F)(F)(F)(F)F', 'ClCl', 'BrBr', 'O=S=O']
+
+# diffusion volumes for simple molecules given in Table 4.1 of  the Taylor (1993) textbook 
+# Multicomponent Mass Transfer, ISBN: 0-471-57417-1
+simp_molec_vol = [2.67, 5.98, 16.2, 24.5, 32.7, 6.12, 18.5, 16.3, 18., 26.7, 35.9, 20.7, 13.1, 71.3, 38.4, 69., 41.8]
+
+# SMARTS for the atoms given in Table 4.1 of  the Taylor (1993) textbook 
+# Multicomponent Mass Transfer, ISBN: 0-471-57417-1, followed by those
+# for atoms in rings of 3 to 10 atoms
+atm_smarts = ['[#6]', '[H]', '[#8]', '[#7]', '[#16]', '[#9]', '[#17]', '[#35]', '[#53]']
+ring_smarts = ['[r3]', '[r4]', '[r5]', '[r6]', '[r7]', '[r8]', '[r9]', '[r10]']
+
+# atomic and molecular diffusion volume increments (Table 4.1 Taylor 1993), 
+# the final element is per ring
+vol_inc = np.array((15.9, 2.31, 6.11, 4.54, 22.9, 14.7, 21., 21.9, 29.8, -18.3))
+
+# patterns compiled once per process (see patterns): diffusion volumes of 
+# simple molecules keyed by formula, and the compiled atom and ring SMARTS
+pat = {}
+
+# diffusion volumes estimated by this process, keyed by SMILES
+memo = {}
+
+def patterns():
+
+	# returns the patterns, compiling them on first call
+	if (len(pat) == 0):
+		# diffusion volumes of simple molecules, with the first of any 
+		# molecules with the same formula used
+		pat['simp'] = {}
+		for i in range(len(simp_molec)):
+			pat['simp'].setdefault(mol_reg.mol(simp_molec[i]).formula, simp_molec_vol[i])
+		pat['atm'] = [pybel.Smarts(smrt) for smrt in atm_smarts]
+		pat['ring'] = [pybel.Smarts(smrt) for smrt in ring_smarts]
+	
+	return(pat)
 
 # define function
-def diff_vol_est(Pybel_object):
+def diff_vol_est(Pybel_object, self=None):
 
 	# inputs: -------------------------------------------------------------------------
 	# Pybel_object - Pybel objects of components
+	# self - reference to PyCHAM, if given, and the Pybel objects have their
+	#	SMILE strings (mol_reg.mol_list), estimates are taken from and stored 
+	#	in the property database
 	# -----------------------------------------------------------------------------------
 	
-	# simple molecules given in Table 4.1 of Taylor (1993)
-	# SMILE strings for simple molecules
-	simp_molec = ['[He]', '[Ne]', '[Ar]', '[Kr]', '[Xe]', '[H][H]', r'N#N', 'O=O', 'CO', 'O=C=O', 'NO=N', '[H]N([H])[H]', 'O', 'S(F)(F)(F)(F)(F)F', 'ClCl', 'BrBr', 'O=S=O']
-	
-	# diffusion volumes for simple molecules given in Table 4.1 of  the Taylor (1993) textbook 
-	# Multicomponent Mass Transfer, ISBN: 0-471-57417-1
-	simp_molec_vol = [2.67, 5.98, 16.2, 24.5, 32.7, 6.12, 18.5, 16.3, 18., 26.7, 35.9, 20.7, 13.1, 71.3, 38.4, 69., 41.8]
-	
-	Pybel_object_ref = [] # empty list
-	# convert to SMARTS (pybel_objects)
-	# generate pybel objects from SMILES
-	for i in simp_molec:	
-		Pybel_object_ref.append(pybel.readstring('smi', i))
-	
 	diff_vol = np.zeros((len(Pybel_object))) # empty results array
 	
-	for compi in range(len(Pybel_object)): # component loop
-	
-		simp_cnt = 0 # count
+	# SMILE strings of components, for reusing estimates
+	smiles = getattr(Pybel_object, 'smiles', None)
 	
-		# check if component is a simple molecule
-		for i_smrt in Pybel_object_ref: # loop through simple molecules
-			if (Pybel_object[compi].formula == i_smrt.formula):
-				diff_vol[compi] = simp_molec_vol[simp_cnt]
-				break
-			simp_cnt += 1
-			
-		# if a simple molecule move onto next component
-		if (simp_cnt < len(Pybel_object_ref)):
+	for compi in range(len(Pybel_object)): # component loop
+		
+		if smiles is None: # estimate
+			diff_vol[compi] = diff_vol_comp(Pybel_object[compi])
 			continue
-			
-		# SMARTS for the atoms given in Table 4.1 of  the Taylor (1993) textbook 
-		# Multicomponent Mass Transfer, ISBN: 0-471-57417-1
-		smarts = []
-		smarts.append(pybel.Smarts('[#6]'))
-		smarts.append(pybel.Smarts('[H]'))
-		smarts.append(pybel.Smarts('[#8]'))
-		smarts.append(pybel.Smarts('[#7]'))
-		smarts.append(pybel.Smarts('[#16]'))
-		smarts.append(pybel.Smarts('[#9]'))
-		smarts.append(pybel.Smarts('[#17]'))
-		smarts.append(pybel.Smarts('[#35]'))
-		smarts.append(pybel.Smarts('[#53]'))
+		
+		# estimate only on first occurrence in this process, taking from
+		# property database if previously estimated
+		smil = smiles[compi]
+		if smil not in memo:
+			if self is not None:
+				memo[smil] = prop_db.prop(smil, 'fuller_dv', 
+					lambda: diff_vol_comp(Pybel_object[compi]), self)
+			else:
+				memo[smil] = diff_vol_comp(Pybel_object[compi])
+		diff_vol[compi] = memo[smil]
 	
-		# count atoms present, final element will be used for number of rings
-		atm_cnt = np.zeros((len(smarts)+1))
+	if smiles is not None and self is not None:
+		prop_db.commit(self)
+
+	return(diff_vol)
+
+# diffusion volume of one component
+def diff_vol_comp(Pybel_object):
+
+	# inputs: -------------------------------------------------------------------------
+	# Pybel_object - Pybel object of component
+	# -----------------------------------------------------------------------------------
+
+	pat = patterns()
+
+	# check if component is a simple molecule
+	if Pybel_object.formula in pat['simp']:
+		return(pat['simp'][Pybel_object.formula])
+
+	# count atoms present, final element will be used for number of rings
+	atm_cnt = np.zeros((len(vol_inc)))
 	
-		# atomic and molecular diffusion volume increments (Table 4.1 Taylor 1993)
-		vol_inc = np.array((15.9, 2.31, 6.11, 4.54, 22.9, 14.7, 21., 21.9, 29.8, -18.3))
+	i_cnt = 0
+	for i_smrt in pat['atm']: # loop through reference groups
+		atm_cnt[i_cnt] = len(i_smrt.findall(Pybel_object))
+		i_cnt += 1
 	
-		i_cnt = 0
-		for i_smrt in smarts: # loop through reference groups
-			atm_cnt[i_cnt] = len(i_smrt.findall(Pybel_object[compi]))
-			i_cnt += 1
-			
-		# smarts for rings
-		smarts = []
-		smarts.append(pybel.Smarts('[r3]'))
-		smarts.append(pybel.Smarts('[r4]'))
-		smarts.append(pybel.Smarts('[r5]'))
-		smarts.append(pybel.Smarts('[r6]'))
-		smarts.append(pybel.Smarts('[r7]'))
-		smarts.append(pybel.Smarts('[r8]'))
-		smarts.append(pybel.Smarts('[r9]'))
-		smarts.append(pybel.Smarts('[r10]'))
-		
-		# check for rings
+	# check for rings, where the molecule has any
+	if (len(Pybel_object.sssr) > 0):
 		num_atm = 3 # count on number of atoms in rings
-		for i_smrt in smarts: # loop through reference groups
-			atm_cnt[i_cnt]  += math.ceil(len(i_smrt.findall(Pybel_object[compi]))/num_atm)
+		for i_smrt in pat['ring']: # loop through reference groups
+			atm_cnt[i_cnt]  += math.ceil(len(i_smrt.findall(Pybel_object))/num_atm)
 			num_atm += 1 # count on number of atoms in rings
 
-		# diffusion volume
-		diff_vol[compi] = np.sum((atm_cnt*vol_inc))
-
-	return(diff_vol)
\ No newline at end of file
+	# diffusion volume
+	return(np.sum((atm_cnt*vol_inc)))
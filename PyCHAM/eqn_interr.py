@@ -21,13 +21,17 @@
 ##########################################################################################
 '''module to interrogate equations to withdraw essential information for solution'''
 # code to extract the equation information for chemical reactions required for 
-# their solution in PyCHAM 
+# their solution in PyCHAM, each equation line is tokenised once and components 
+# are looked up by name in dictionaries, so that the time taken scales 
+# linearly with the number of equations
 
 import numpy as np
 import re
 import formatting
-import pybel
-import sys
+import mol_reg
+
+# stoichiometric number at the start of a reactant or product
+stoich_regex = re.compile(r"^\d*\.\d*|^\d*")
 
 def eqn_interr(num_eqn, eqn_list, aqeqn_list, comp_name, 
 		comp_smil, num_sb, self):
@@ -44,807 +48,496 @@ def eqn_interr(num_eqn, eqn_list, aqeqn_list, comp_name,
 	# ------------------------------------------------------------------------------------
 	
 	# preparatory part ----------------------------------------------------
-	# matrix to record indices of reactants (cols) in each equation (rows)
-	rindx = np.zeros((num_eqn[0], 1)).astype(int)
-	# matrix of indices to arrange reactant concentrations when 
-	# reaction rate coefficient calculated
-	y_arr = (np.ones((num_eqn[0], 1)).astype(int))*-9999
-	# array to arrange reaction rates so they align with reactant stoichiometries
-	rr_arr = np.empty((0))
-	# same but for products
-	rr_arr_p = np.empty((0))
-	# index array for extracting required reactant concentrations for the
-	# reaction rate coefficient calculation
-	y_rind = np.empty((0))
-	# index array for identifying products when assigning gains from reactions
-	y_pind = np.empty((0))	
-	# matrix to record indices of products (cols) in each equation (rows)
-	pindx = np.zeros((num_eqn[0], 1)).astype(int)
-	# matrix to record stoichiometries of reactants (cols) in each equation (rows)
-	rstoi = np.zeros((num_eqn[0], 1))
-	jac_stoi = np.zeros((num_eqn[0], 1))
-	# 1D array to record stoichiometries of reactants per equarion
-	rstoi_flat = np.empty((0))
-	# 1D array to record stoichiometries of products per equarion
-	pstoi_flat = np.empty((0))
-	# matrix to record stoichiometries of products (cols) in each equation (rows)
-	pstoi = np.zeros((num_eqn[0], 1))
-	# arrays to store number of reactants and products in gas-phase equations
-	nreac = np.empty(num_eqn[0], dtype=np.int8)
-	nprod = np.empty(num_eqn[0], dtype=np.int8)
-	# colptrs for sparse matrix
-	reac_col = np.empty(num_eqn[0], dtype=np.int8)
-	prod_col = np.empty(num_eqn[0], dtype=np.int8)
-	# list for equation reaction rate coefficients
-	reac_coef = []
-	# matrix containing index of components who are denominators in the
-	# calculation of equation derivatives in the Jacobian
-	jac_den_indx = np.zeros((num_eqn[0], 1))
-	# total number of Jacobian elements per equation
-	njac = np.zeros((num_eqn[0], 1))
-	# indices of Jacobian to affect per equation (rows)
-	jac_indx = np.zeros((num_eqn[0], 1))
 	# a new list for the name strings of components presented in the scheme (not SMILES)
 	comp_namelist = []
 	comp_list = [] # list for the SMILE strings of components present in the chemical scheme
-	# list of Pybel objects of components in chemical scheme
-	Pybel_objects = []
-	comp_num = 0 # count the number of unique components in the chemical scheme
+	# index of components in the chemical scheme by name
+	comp_indx = {}
 	self.RO_indx = [] # empty list for holding indices of alkoxy components
 	self.gen_num = [] # for holding generation numbers of components
+	
+	# index of components in the xml file by name, where a name is 
+	# repeated the first occurrence is used
+	comp_name_indx = {}
+	for i in range(len(comp_name)):
+		if comp_name[i] not in comp_name_indx:
+			comp_name_indx[comp_name[i]] = i
 	# ---------------------------------------------------------------------
+	
+	# gas-phase equations, which are also used to assign generation numbers
+	[rindx_g, rstoi_g, pindx_g, pstoi_g, reac_coef_g, 
+		nreac_g, nprod_g, jac_stoi_g, 
+		jac_den_indx_g, njac_g, jac_indx_g, 				
+		y_arr_g, y_rind_g, uni_y_rind_g, y_pind_g, 
+		uni_y_pind_g, reac_col_g, prod_col_g, rstoi_flat_g, pstoi_flat_g, 
+		rr_arr_g, rr_arr_p_g, err_mess] = phase_interr(eqn_list, num_eqn[0], 0, 1, 
+		comp_name_indx, comp_smil, comp_namelist, comp_list, comp_indx, 
+		self)
+
+	# same for aqueous-phase equations, where reactant index fillers are -2
+	[rindx_aq, rstoi_aq, pindx_aq, pstoi_aq, reac_coef_aq, 
+		nreac_aq, nprod_aq, jac_stoi_aq, 
+		jac_den_indx_aq, njac_aq, jac_indx_aq, 				
+		y_arr_aq, y_rind_aq, uni_y_rind_aq, y_pind_aq, 
+		uni_y_pind_aq, reac_col_aq, prod_col_aq, rstoi_flat_aq, pstoi_flat_aq, 
+		rr_arr_aq, rr_arr_p_aq, err_mess_aq] = phase_interr(aqeqn_list, num_eqn[1], 
+		-2, 0, comp_name_indx, comp_smil, comp_namelist, comp_list, comp_indx, 
+		self)
+	
+	if (err_mess == ''): # report any error from aqueous-phase equations
+		err_mess = err_mess_aq
+	
+	comp_num = len(comp_namelist) # number of unique components
+	
+	# Pybel objects of components in chemical scheme, only created 
+	# when needed
+	Pybel_objects = mol_reg.mol_list(comp_list)
+	
+	return(rindx_g, rstoi_g, pindx_g, pstoi_g, reac_coef_g, 
+			nreac_g, nprod_g, jac_stoi_g, 
+			jac_den_indx_g, njac_g, jac_indx_g, 				
+			y_arr_g, y_rind_g, uni_y_rind_g, y_pind_g, 
+			uni_y_pind_g, reac_col_g, prod_col_g, rstoi_flat_g, pstoi_flat_g, 
+			rr_arr_g, rr_arr_p_g, rindx_aq, rstoi_aq, pindx_aq, pstoi_aq, reac_coef_aq, 
+			nreac_aq, nprod_aq, jac_stoi_aq, 
+			jac_den_indx_aq, njac_aq, jac_indx_aq, 				
+			y_arr_aq, y_rind_aq, uni_y_rind_aq, y_pind_aq, 
+			uni_y_pind_aq, reac_col_aq, prod_col_aq, rstoi_flat_aq, pstoi_flat_aq, 
+			rr_arr_aq, rr_arr_p_aq, comp_namelist, comp_list, Pybel_objects, 
+			comp_num, err_mess, self)
 
-	max_no_reac = 0. # log maximum number of reactants in a reaction
-	max_no_prod = 0. # log maximum number of products in a reaction
+def phase_interr(eqn_list, neqn, rfill, gen, comp_name_indx, comp_smil, 
+	comp_namelist, comp_list, comp_indx, self):
 
-	# loop through gas-phase equations line by line and extract the required information
-	for eqn_step in range(num_eqn[0]):
-		
-		line = eqn_list[eqn_step] # extract this line
-		
-		# reset list of SMILE strings representing reactants and 
-		# products in this equation
-		SMILES_this_eq = []
-		# reset list of chemical scheme name representing reactants 
-		# and products in this equation
-		name_only_this_eq = []
-		
-		# work out whether equation or reaction rate coefficient part comes first
-		eqn_start = str('.*\\' +  self.chem_sch_mrk[10])
-		rrc_start = str('.*\\' +  self.chem_sch_mrk[9])
-		# get index of these markers, note span is the property of the match object that
-		# gives the location of the marker
-		eqn_start_indx = (re.match(eqn_start, line)).span()[1]
-		rrc_start_indx = (re.match(rrc_start, line)).span()[1]
-		
-		if (eqn_start_indx>rrc_start_indx):
-			eqn_sec = 1 # equation is second part
-		else:
-			eqn_sec = 0 # equation is first part
-		
-		# split the line into 2 parts: equation and rate coefficient
-		# . means match with anything except a new line character., when followed by a * 
-		# means match zero or more times (so now we match with all characters in the line
-		# except for new line characters, so final part is stating the character(s) we 
-		# are specifically looking for, \\ ensures the marker is recognised
-		if eqn_sec == 1:
-			eqn_markers = str('\\' +  self.chem_sch_mrk[10]+ '.*\\' +  self.chem_sch_mrk[11])
-		else: # end of equation part is start of reaction rate coefficient part
-			eqn_markers = str('\\' +  self.chem_sch_mrk[10]+ '.*\\' +  self.chem_sch_mrk[9])
-
-		# extract the equation as a string ([0] extracts the equation section and 
-		# [1:-1] removes the bounding markers)
-		eqn = re.findall(eqn_markers, line)[0][1:-1].strip()
-		
-		eqn_split = eqn.split()
-		eqmark_pos = eqn_split.index('=')
-		# reactants with stoichiometry number and omit any photon
-		reactants = [i for i in eqn_split[:eqmark_pos] if i != '+' and i != 'hv']
-		# products with stoichiometry number
-		products = [t for t in eqn_split[eqmark_pos+1:] if t != '+']
-		
-		# record maximum number of reactants across all equations
-		max_no_reac = np.maximum(len(reactants), max_no_reac)
-		# record maximum number of products across all equations
-		max_no_prod = np.maximum(len(products), max_no_prod)
-
-		# append columns if needed because maximum number of reactants increases
-		while (max_no_reac > np.minimum(rindx.shape[1], rstoi.shape[1])): 
-			rindx = np.append(rindx, (np.zeros((num_eqn[0], 1))).astype(int), axis=1)
-			rstoi = np.append(rstoi, (np.zeros((num_eqn[0], 1))), axis=1)
-			y_arr = np.append(y_arr, (np.ones((num_eqn[0], 1))*-9999).astype(int), axis=1)
-			y_arr_fixer = ((np.arange(0, num_eqn[0], dtype = 'int')).reshape(-1, 1))
-			y_arr_fixer = np.tile(y_arr_fixer, (1, int(max_no_reac)))
-			y_arr[y_arr!=-9999] = y_arr[y_arr!=-9999]+y_arr_fixer[y_arr!=-9999] 
-
-		while (max_no_prod > np.minimum(pindx.shape[1], pstoi.shape[1])): 
-			pindx = np.append(pindx, (np.zeros((num_eqn[0], 1))).astype(int), axis=1)
-			pstoi = np.append(pstoi, (np.zeros((num_eqn[0], 1))), axis=1)
-		while ((len(reactants)**2.0+len(reactants)*len(products))>jac_indx.shape[1]):
-			jac_indx = np.append(jac_indx, (np.zeros((num_eqn[0], 1))), axis=1)
-			jac_den_indx = np.append(jac_den_indx, (np.zeros((num_eqn[0], 1))), axis=1)		
-			jac_stoi = np.append(jac_stoi, (np.zeros((num_eqn[0], 1))), axis=1)
-
-		# .* means occurs anywhere in line and, first \ means second \ can be interpreted 
-		# and second \ ensures recognition of marker
-		rate_coeff_start_mark = str('\\' +  self.chem_sch_mrk[9])
-		# . means match with anything except a new line character, when followed by a * 
-		# means match zero or more times (so now we match with all characters in the line
-		# except for new line characters, \\ ensures the marker
-		# is recognised
-		if eqn_sec == 1: # end of reaction rate coefficient part is start of equation part
-			rate_coeff_end_mark = str('.*\\' +  self.chem_sch_mrk[10])
-		else: # end of reaction rate coefficient part is end of line
-			rate_coeff_end_mark = str('.*\\' +  self.chem_sch_mrk[11])
-		
-		# rate coefficient starts and end punctuation
-		rate_regex = str(rate_coeff_start_mark + rate_coeff_end_mark)
-		# rate coefficient expression in a string
-		rate_ex = re.findall(rate_regex, line)[0][1:-1].strip()
-
-		# convert fortran-type scientific notation to python type
-		rate_ex = formatting.SN_conversion(rate_ex)
-		# convert the rate coefficient expressions into Python readable commands
-		rate_ex = formatting.convert_rate_mcm(rate_ex)
-		if (rate_ex.find('EXP') != -1):
-			print('Error in reaction rate coefficient expression: ', rate_ex)
-			sys.exit()
+	# inputs: ----------------------------------------------------------------------------
+	# eqn_list - equations of this phase in list of strings
+	# neqn - number of equations of this phase
+	# rfill - filler value for reactant indices
+	# gen - flag for whether to assign generation numbers (1) or not (0)
+	# comp_name_indx - index of components in the xml file by name
+	# comp_smil - SMILES from xml file
+	# comp_namelist - chemical scheme names of components found so far
+	# comp_list - SMILES of components found so far
+	# comp_indx - index of components found so far by name
+	# self - reference to PyCHAM
+	# ------------------------------------------------------------------------------------
+
+	err_mess = '' # start by assuming no error
+	
+	# list for equation reaction rate coefficients
+	reac_coef = []
+	# indices and stoichiometries of reactants and products per 
+	# equation, with repeated components combined
+	eqn_rindx = []; eqn_rstoi = []; eqn_pindx = []; eqn_pstoi = []
+	
+	max_no_reac = 0 # log maximum number of reactants in a reaction
+	max_no_prod = 0 # log maximum number of products in a reaction
+	max_no_jac = 0 # log maximum number of Jacobian elements in a reaction
+	
+	if (neqn > 0): # regular expressions for markers
+		mrk_re = mrk_regex(self)
+	
+	# loop through equations line by line and extract the required information
+	for eqn_step in range(neqn):
+		
+		# reactants and products (with stoichiometry number) and 
+		# reaction rate coefficient expression
+		[reactants, products, rate_ex, err_mess] = eqn_line(eqn_list[eqn_step], 
+			mrk_re)
+		if (err_mess != ''): # stop at erroneous equation
+			break
+		
+		# record maximum number of reactants, products and Jacobian 
+		# elements across all equations
+		max_no_reac = max(len(reactants), max_no_reac)
+		max_no_prod = max(len(products), max_no_prod)
+		max_no_jac = max(len(reactants)**2+len(reactants)*len(products), max_no_jac)
 		
 		# store the reaction rate coefficient for this equation 
 		# (/s once any inputs applied)
 		reac_coef.append(rate_ex)
 		
-		# extract the stoichiometric number of the component in current equation
-		reactant_step = 0
-		product_step = 0
-		stoich_regex = r"^\d*\.\d*|^\d*"
-		numr = len(reactants) # number of reactants in this equation
-		
-		
-		# left hand side of equations (losses)
-		for reactant in reactants:
-				
-			if (re.findall(stoich_regex, reactant)[0] != ''):
-				stoich_num = float(re.findall(stoich_regex, reactant)[0])
-				# name with no stoich number
-				name_only = re.sub(stoich_regex, '', reactant)
-			elif (re.findall(stoich_regex, reactant)[0] == ''):
-				stoich_num = 1.
-				name_only = reactant
-			
-			# store stoichiometry
-			rstoi[eqn_step, reactant_step] = stoich_num
-			jac_stoi[eqn_step, reactant_step] = -1*stoich_num
-
-			if name_only not in comp_namelist: # if new component encountered
-				comp_namelist.append(name_only) # add to chemical scheme name list
-			
-				# convert MCM chemical names to SMILES
-				# index where xml file name matches reaction component name
-				name_indx = comp_name.index(name_only)
-				name_SMILE = comp_smil[name_indx] # SMILES of component
-				
-				comp_list.append(name_SMILE) # list SMILE names
-				name_indx = comp_num # allocate index to this species
-				# generate pybel object
-				Pybel_object = pybel.readstring('smi', name_SMILE)
-				# append to Pybel object list
-				Pybel_objects.append(Pybel_object)
-				
-				# check if alkoxy radical present in this component and that component is organic
-				if ('[O]' in name_SMILE):
-					if ('C' in name_SMILE or 'C' in name_SMILE):
-						# if it is an alkoxy radical (rather than alkyl peroxy radical) add its index to list
-						if ('O[O]' not in name_SMILE and '[O]O' not in name_SMILE): # ensure it's not alkyl peroxy radical
-							self.RO_indx.append(comp_num)			
-
-				comp_num += 1 # number of unique species
-				
-
-			else: # if it is a component already encountered it will be in comp_list
-				# existing index
-				name_indx = comp_namelist.index(name_only)
-				name_SMILE = comp_list[name_indx]
-			
-			# store reactant SMILE for this equation
-			SMILES_this_eq.append(name_SMILE)
-			name_only_this_eq.append(name_only)
-			
-			# store reactant index
-			# check if index already present - i.e. component appears more than once
-			if sum(rindx[eqn_step, 0:reactant_step]==int(name_indx))>0:
-				# get existing index of this component
-				exist_indx = (np.where(rindx[eqn_step, 0:reactant_step]==(int(name_indx))))[0]
-				# add to existing stoichiometry
-				rstoi[eqn_step, exist_indx] += rstoi[eqn_step, reactant_step]
-				jac_stoi[eqn_step, exist_indx] += -1*rstoi[eqn_step, reactant_step]
-				# remove stoichiometry added above
-				rstoi[eqn_step, reactant_step] = 0
-				jac_stoi[eqn_step, reactant_step] = 0
-				reactant_step -= 1 # ignore this duplicate
-			else:
-				rindx[eqn_step, reactant_step] = int(name_indx)
-				y_arr[eqn_step, reactant_step] = int((eqn_step*max_no_reac)+reactant_step)
-				y_rind = np.append(y_rind, int(name_indx))
-				rr_arr = np.append(rr_arr, int(eqn_step))
-		
-			reactant_step += 1
-					
-		# number of reactants in this equation
-		nreac[eqn_step] = int(reactant_step)
-		
-		# record 1D array of stoichiometries per equation
-		rstoi_flat = np.append(rstoi_flat, rstoi[eqn_step, 0:int(reactant_step)])
+		# reset list of SMILE strings and chemical scheme names representing 
+		# reactants and products in this equation
+		SMILES_this_eq = []
+		name_only_this_eq = []
 		
-		# right hand side of equations (products/gains)
-		for product in products:
-
-			if (re.findall(stoich_regex, product)[0] != ''):
-				stoich_num = float(re.findall(stoich_regex, product)[0])
-				name_only = re.sub(stoich_regex, '', product) # name with no stoich number
-
-			elif (re.findall(stoich_regex, product)[0] == ''):
-				stoich_num = 1.
-				name_only = product
+		eqn_comp = [] # indices and stoichiometries of reactants, then products
+		for comps in [reactants, products]:
 			
-			# store stoichiometry
-			pstoi[eqn_step, product_step] = stoich_num
-			jac_stoi[eqn_step, reactant_step+product_step] = 1*stoich_num
-			
-			if name_only not in comp_namelist: # if new component encountered
-				comp_namelist.append(name_only)
+			indx = []; stoi = []
+			for comp in comps:
 				
-				# convert MCM chemical names to SMILES
-				# index where xml file name matches reaction component name
-				name_indx = comp_name.index(name_only)
-				name_SMILE = comp_smil[name_indx]
+				# separate the stoichiometric number from the name
+				stoich = stoich_regex.match(comp).group(0)
+				if (stoich != ''):
+					stoich_num = float(stoich)
+					name_only = comp[len(stoich)::] # name with no stoich number
+				else:
+					stoich_num = 1.
+					name_only = comp
 				
-				comp_list.append(name_SMILE) # list SMILE string of parsed species
-				name_indx = comp_num # allocate index to this species
-				# Generate pybel object
-				Pybel_object = pybel.readstring('smi', name_SMILE)
-				# append to Pybel object list
-				Pybel_objects.append(Pybel_object)
+				name_indx = comp_indx.get(name_only)
+				if name_indx is None: # if new component encountered
+					[name_indx, err_mess] = comp_new(name_only, comp_name_indx, 
+						comp_smil, comp_namelist, comp_list, comp_indx, self)
+					if (err_mess != ''): # stop at unknown component
+						break
 				
-				# check if alkoxy radical present in this component and that component is organic
-				if ('[O]' in name_SMILE):
-					if ('C' in name_SMILE or 'C' in name_SMILE):
-						# if it is an alkoxy radical (rather than alkyl peroxy radical) add its index to list
-						if ('O[O]' not in name_SMILE and '[O]O' not in name_SMILE): # ensure it's not alkyl peroxy radical
-							self.RO_indx.append(comp_num)					
-
-				comp_num += 1 # number of unique species
+				# if component appears more than once on this side of the 
+				# equation then add to its existing stoichiometry
+				if name_indx in indx:
+					stoi[indx.index(name_indx)] += stoich_num
+				else:
+					indx.append(name_indx)
+					stoi.append(stoich_num)
 				
-			else: # if it's a species already encountered
-				# index of component already listed
-				name_indx = comp_namelist.index(name_only)
-				name_SMILE = comp_list[name_indx]
-			
-			# store product SMILE for this equation
-			SMILES_this_eq.append(name_SMILE)
-			name_only_this_eq.append(name_only)
+				# store SMILE and name for this equation
+				SMILES_this_eq.append(comp_list[name_indx])
+				name_only_this_eq.append(name_only)
 			
-			# store product index
-			# check if index already present - i.e. component appears more than once
-			if sum(pindx[eqn_step, 0:product_step]==int(name_indx))>0:
-				# get existing index of this component
-				exist_indx = (np.where(pindx[eqn_step, 0:product_step]==(int(name_indx))))[0]
-				# add to existing stoichiometry
-				pstoi[eqn_step, exist_indx] += pstoi[eqn_step, product_step]
-				jac_stoi[eqn_step, reactant_step+exist_indx] += 1*pstoi[eqn_step, product_step]
-				# remove stoichiometry added above
-				pstoi[eqn_step, product_step] = 0
-				jac_stoi[eqn_step, reactant_step+product_step] = 0
-				product_step -= 1 # ignore this duplicate
-			else:
-				pindx[eqn_step, product_step] = int(name_indx)
-				rr_arr_p = np.append(rr_arr_p, int(eqn_step))
-				y_pind = np.append(y_pind, int(name_indx))
-
-			product_step += 1
+			if (err_mess != ''):
+				break
+			eqn_comp += [indx, stoi]
 		
-		# number of products in this equation
-		nprod[eqn_step] = int(product_step)
-		# record 1D array of stoichiometries per equation
-		pstoi_flat = np.append(pstoi_flat, pstoi[eqn_step, 0:int(product_step)])
-		
-		# now that total number of components (reactants and products) 
-		# in an equation is known, replicate the reactant indices over all 
-		# components
-		tot_comp = nreac[eqn_step]+nprod[eqn_step]
-		for i in range(nreac[eqn_step]):
-			jac_den_indx[eqn_step, i*tot_comp:(i+1)*tot_comp] = rindx[eqn_step, i]
-			# also replicate the stoichiometries for every reactant
-			if (i > 0):
-				jac_stoi[eqn_step, i*tot_comp:(i+1)*tot_comp] = jac_stoi[eqn_step, 0:tot_comp] 
- 		# number of Jacobian elements affected by this equation
-		njac[eqn_step, 0] = tot_comp*nreac[eqn_step]
+		if (err_mess != ''):
+			break
 		
-		ci = -1 # count on components in this equation
-		# reset the generation number for reactants
-		reac_min_gen = 0
-		ap_rad_f = 0 # flag for whether reactants include radicals
-		nzr = 0 # flag for non-zero generation number reactants
-		# prepare to store components that appear first as a reactant rather than product
-		early_comp = []
-
-		# loop through components in this equation
-		for SMILEi in SMILES_this_eq:
-			
-			ci += 1 # count on components in this equation
-			
-			# chemical scheme name of this component
-			name_only = name_only_this_eq[ci]
-			# number of carbons in this component
-			numC = SMILEi.count('c')+SMILEi.count('C')
-			# number of oxygens in this component
-			numO = SMILEi.count('o')+SMILEi.count('O')
-
-			if (numC == 0): # if it has no carbon (inorganic)
-				# if generation number not yet included for this component
-				if (len(self.gen_num)-1 < comp_namelist.index(name_only)):
-					self.gen_num.append(0)
-			
-			else:
-				# if it is an unoxidised organic, then say it's 0th-generation
-				if (SMILEi.count('o')+SMILEi.count('O') == 0):
-					# if it's not yet accounted for
-					if (len(self.gen_num)-1 < comp_namelist.index(name_only)):
-						self.gen_num.append(0)
-						
-					# minimum generation number of reactant
-					reac_min_gen = min(0, reac_min_gen)
-					continue # continue onto next component in this equation
-
-				# if it is an oxidised organic
-				# then, if it's a reactant, it should already 
-				# have a generation number assigned because it should have
-				# already appeared as a product which are assigned generation 
-				# numbers below
-				if (ci < len(reactants)):
-
-					
-					
-					# index of this reactant
-					reac_index = comp_namelist.index(name_only)
-
-					# if first appearance of this componenet is as a reactant, 
-					# then store and wait for when it appears as a product
-					if (reac_index >= len(self.gen_num)):
-						self.gen_num.append(0)
-						early_comp.append(name_only)
-						continue
-
-					# check on whether this component is an alkyl peroxy radical
-					if ('[O]O' in SMILEi or 'O[O]' in SMILEi):
-						ap_rad_f = 1 # flag that an alkyl peroxy radical in reactants
-					
-					# if this component appears in the chemical scheme first as a
-					# reactant (rather than product), and is a methane-related 
-					# oxidised molecule, then use it's generation number of one
-					if (reac_index >= len(self.gen_num) and numC == 1 and numO >= 1):
-						# if it's the first non-zero generation number reactant
-						if (nzr > 0):
-							reac_min_gen = min(1, reac_min_gen)
-						if (nzr == 0):
-							reac_min_gen = 1
-							nzr = 1
-					
-					# if this component is already assigned a > 0 
-					# generation number,
-					# then identify minimum generation number in this equation
-					else:
-						if (self.gen_num[reac_index] > 0):
-							# if it's the first non-zero generation number reactant
-							if (nzr == 0):
-								reac_min_gen = self.gen_num[reac_index]
-								nzr = 1
-							reac_min_gen = min(self.gen_num[reac_index], reac_min_gen)
-					continue # continue onto next component in this equation
-				
-				# if a product is being considered
-				if (ci >= len(reactants)):
-
-					# check on whether this component is a radical or Criegee Intermediate
-					if ('[o]' in SMILEi or '[O]' in SMILEi or '[O+]' in SMILEi):
-						if (ap_rad_f == 0): # if no alkyl peroxy radicals in reactants
-							prod_gen = reac_min_gen+1 # suggested generation number
-						if (ap_rad_f == 1): # if alkyl peroxy radicals in reactants
-							prod_gen = reac_min_gen # suggested generation number
-					else: # if it's a termination product
-						prod_gen = reac_min_gen # suggested generation number
-					
-					# check if this already has a generation number
-					if (comp_namelist.index(name_only) <= len(self.gen_num)-1):
-						
-						gn_pre = self.gen_num[comp_namelist.index(name_only)]
-						# if this number less than that suggested by reactants, then
-						# no change needed
-						if (gn_pre < prod_gen and name_only not in early_comp):
-							continue # continue to next component in this equation
-						else: # otherwise 
-							self.gen_num[comp_namelist.index(name_only)] = prod_gen
-					else: # if this component is on first appearance during this loop
-						self.gen_num.append(prod_gen)
-	
-	# remove fillers and flatten index for arranging concentrations 
-	# ready for reaction rate coefficient calculation
-	y_arr_g = y_arr[y_arr != -9999]
-	y_rind_g = y_rind.astype(int) # ensure integer type
-	uni_y_rind_g = (np.unique(y_rind)).astype(int) # unique index of reactants
-	y_pind_g = y_pind.astype(int) # ensure integer type
-	uni_y_pind_g = (np.unique(y_pind)).astype(int) # unique index of products
-	rr_arr_g = rr_arr.astype(int) # ensure integer type
-	rr_arr_p_g = rr_arr_p.astype(int) # ensure integer type	
-	# colptrs for sparse matrix of the change to reactants per equation
-	reac_col_g = np.cumsum(nreac)-nreac
-	# colptrs for sparse matrix of the change to products per equation
-	prod_col_g = np.cumsum(nprod)-nprod
-	if (len(reac_col_g) > 0): # if gas-phase reaction present	
-		# include final columns
-		reac_col_g = np.append(reac_col_g, reac_col_g[-1]+nreac[-1])
-		prod_col_g = np.append(prod_col_g, prod_col_g[-1]+nprod[-1])
+		eqn_rindx.append(eqn_comp[0]); eqn_rstoi.append(eqn_comp[1])
+		eqn_pindx.append(eqn_comp[2]); eqn_pstoi.append(eqn_comp[3])
 		
-	# tag other gas-phase arrays
-	rindx_g = rindx
-	pindx_g = pindx
-	rstoi_g = rstoi
-	pstoi_g = pstoi
-	jac_stoi_g = jac_stoi
-	rstoi_flat_g = rstoi_flat
-	pstoi_flat_g = pstoi_flat
-	nreac_g = nreac
-	nprod_g = nprod
-	reac_coef_g = reac_coef
-	jac_den_indx_g = jac_den_indx.astype(int)
-	njac_g = njac.astype(int)
-	jac_indx_g = jac_indx
-	jac_indx_g = jac_indx_g.astype(int)
-
-	# same for aqueous-phase reactions ----------------------------------
-	# preparatory part ----------------------------------------------------
+		if (gen == 1):
+			gen_num_up(SMILES_this_eq, name_only_this_eq, len(reactants), 
+				comp_indx, self)
+	
+	if (err_mess != ''): # no equations returned when error found
+		neqn = 0
+		reac_coef = []
+		eqn_rindx = []; eqn_rstoi = []; eqn_pindx = []; eqn_pstoi = []
+	
+	# number of columns in arrays with one row per equation
+	ncol_r = max(max_no_reac, 1)
+	ncol_p = max(max_no_prod, 1)
+	ncol_j = max(max_no_jac, 1)
+	
+	# arrays to store number of reactants and products in equations
+	nreac = np.array(([len(i) for i in eqn_rindx]), dtype=np.int8).reshape(-1)
+	nprod = np.array(([len(i) for i in eqn_pindx]), dtype=np.int8).reshape(-1)
 	# matrix to record indices of reactants (cols) in each equation (rows)
-	rindx = (np.ones((num_eqn[1], 1))*-2).astype(int)
-	# matrix of indices to arrange reactant concentrations when 
-	# reaction rate coefficient calculated
-	y_arr = (np.ones((num_eqn[1], 1)).astype(int))*-9999
-	# array to arrange reaction rates so they align with reactant stoichiometries
-	rr_arr = np.empty((0))
-	# same but for products
-	rr_arr_p = np.empty((0))
-	# index array for extracting required reactant concentrations for the
-	# reaction rate coefficient calculation
-	y_rind = np.empty((0))
-	# index array for identifying products when assigning gains from reactions
-	y_pind = np.empty((0))	
-	# matrix to record indices of products (cols) in each equation (rows)
-	pindx = np.zeros((num_eqn[1], 1)).astype(int)
+	rindx = (np.ones((neqn, ncol_r))*rfill).astype(int)
 	# matrix to record stoichiometries of reactants (cols) in each equation (rows)
-	rstoi = np.zeros((num_eqn[1], 1))
-	jac_stoi = np.zeros((num_eqn[1], 1))
-	# 1D array to record stoichiometries of reactants per equation
-	rstoi_flat = np.empty((0))
-	# 1D array to record stoichiometries of products per equation
-	pstoi_flat = np.empty((0))
+	rstoi = np.zeros((neqn, ncol_r))
+	# matrix to record indices of products (cols) in each equation (rows)
+	pindx = np.zeros((neqn, ncol_p)).astype(int)
 	# matrix to record stoichiometries of products (cols) in each equation (rows)
-	pstoi = np.zeros((num_eqn[1], 1))
-	# arrays to store number of reactants and products of equations
-	nreac = np.empty(num_eqn[1], dtype=np.int8)
-	nprod = np.empty(num_eqn[1], dtype=np.int8)
-	# list for equation reaction rate coefficients
-	reac_coef = []
+	pstoi = np.zeros((neqn, ncol_p))
+	# stoichiometries for the Jacobian
+	jac_stoi = np.zeros((neqn, ncol_j))
 	# matrix containing index of components who are denominators in the
 	# calculation of equation derivatives in the Jacobian
-	jac_den_indx = np.zeros((num_eqn[1], 1))
+	jac_den_indx = np.zeros((neqn, ncol_j)).astype(int)
 	# total number of Jacobian elements per equation
-	njac = np.zeros((num_eqn[1], 1))
+	njac = np.zeros((neqn, 1)).astype(int)
 	# indices of Jacobian to affect per equation (rows)
-	jac_indx = np.zeros((num_eqn[1], 1))
-	# ---------------------------------------------------------------------
-
-	max_no_reac = 0. # log maximum number of reactants in a reaction
-	max_no_prod = 0. # log maximum number of products in a reaction
-
-	# loop through aqueous-phase equations line by line and extract the required information
-	for eqn_step in range(num_eqn[1]):
-		
-		line = aqeqn_list[eqn_step] # extract this line
-		
-		# work out whether equation or reaction rate coefficient part comes first
-		eqn_start = str('.*\\' +  self.chem_sch_mrk[10])
-		rrc_start = str('.*\\' +  self.chem_sch_mrk[9])
-		# get index of these markers, note span is the property of the match object that
-		# gives the location of the marker
-		eqn_start_indx = (re.match(eqn_start, line)).span()[1]
-		rrc_start_indx = (re.match(rrc_start, line)).span()[1]
-		
-		if eqn_start_indx>rrc_start_indx:
-			eqn_sec = 1 # equation is second part
-		else:
-			eqn_sec = 0 # equation is first part
-		
-		# split the line into 2 parts: equation and rate coefficient
-		# . means match with anything except a new line character., when followed by a * 
-		# means match zero or more times (so now we match with all characters in the line
-		# except for new line characters, so final part is stating the character(s) we 
-		# are specifically looking for, \\ ensures the marker is recognised
-		if eqn_sec == 1:
-			eqn_markers = str('\\' +  self.chem_sch_mrk[10]+ '.*\\' +  self.chem_sch_mrk[11])
-		else: # end of equation part is start of reaction rate coefficient part
-			eqn_markers = str('\\' +  self.chem_sch_mrk[10]+ '.*\\' +  self.chem_sch_mrk[9])
-
-		# extract the equation as a string ([0] extracts the equation section and 
-		# [1:-1] removes the bounding markers)
-		eqn = re.findall(eqn_markers, line)[0][1:-1].strip()
-		
-		eqn_split = eqn.split()
-		eqmark_pos = eqn_split.index('=')
-		# with stoich number; rule out the photon
-		reactants = [i for i in eqn_split[:eqmark_pos] if i != '+' and i != 'hv']
-		products = [t for t in eqn_split[eqmark_pos+1:] if t != '+'] # with stoich number
-		
-		# record maximum number of reactants across all equations
-		max_no_reac = np.maximum(len(reactants), max_no_reac)
-		# record maximum number of products across all equations
-		max_no_prod = np.maximum(len(products), max_no_prod)
-
-		# append columns if needed
-		while max_no_reac > np.minimum(rindx.shape[1], rstoi.shape[1]): 
-			rindx = np.append(rindx, (np.ones((num_eqn[1], 1))*-2).astype(int), axis=1)
-			rstoi = np.append(rstoi, (np.zeros((num_eqn[1], 1))), axis=1)
-			y_arr = np.append(y_arr, (np.ones((num_eqn[1], 1))*-9999).astype(int), axis=1)
-			y_arr_fixer = ((np.arange(0, num_eqn[1], dtype = 'int')).reshape(-1, 1))
-			y_arr_fixer = np.tile(y_arr_fixer, (1, int(max_no_reac)))
-			y_arr[y_arr!=-9999] = y_arr[y_arr!=-9999]+y_arr_fixer[y_arr!=-9999] 
-		while max_no_prod > np.minimum(pindx.shape[1], pstoi.shape[1]): 
-			pindx = np.append(pindx, (np.zeros((num_eqn[1], 1))).astype(int), axis=1)
-			pstoi = np.append(pstoi, (np.zeros((num_eqn[1], 1))), axis=1)
-		while ((len(reactants)**2.0+len(reactants)*len(products))>jac_indx.shape[1]):
-			jac_indx = np.append(jac_indx, (np.zeros((num_eqn[1], 1))), axis=1)
-			jac_den_indx = np.append(jac_den_indx, (np.zeros((num_eqn[1], 1))), axis=1)		
-			jac_stoi = np.append(jac_stoi, (np.zeros((num_eqn[1], 1))), axis=1)
-
-		# .* means occurs anywhere in line and, first \ means second \ can be interpreted 
-		# and second \ ensures recognition of marker
-		rate_coeff_start_mark = str('\\' +  self.chem_sch_mrk[9])
-		# . means match with anything except a new line character, when followed by a * 
-		# means match zero or more times (so now we match with all characters in the line
-		# except for new line characters, \\ ensures the marker
-		# is recognised
-		if eqn_sec == 1: # end of reaction rate coefficient part is start of equation part
-			rate_coeff_end_mark = str('.*\\' +  self.chem_sch_mrk[10])
-		else: # end of reaction rate coefficient part is end of line
-			rate_coeff_end_mark = str('.*\\' +  self.chem_sch_mrk[11])
-		
-		# rate coefficient starts and end punctuation
-		rate_regex = str(rate_coeff_start_mark + rate_coeff_end_mark)
-		# rate coefficient expression in a string
-		rate_ex = re.findall(rate_regex, line)[0][1:-1].strip()
-
-		# convert fortran-type scientific notation to python type
-		rate_ex = formatting.SN_conversion(rate_ex)
-		# convert the rate coefficient expressions into Python readable commands
-		rate_ex = formatting.convert_rate_mcm(rate_ex)
-		if (rate_ex.find('EXP') != -1):
-			print('Error in reaction rate coefficient expression: ', rate_ex)
-			sys.exit()
-		
-		# store the reaction rate coefficient for this equation 
-		# (/s once any inputs applied)
-		reac_coef.append(rate_ex)
-		
-		# extract the stoichiometric number of the component in current equation
-		reactant_step = 0
-		product_step = 0
-		stoich_regex = r"^\d*\.\d*|^\d*"
-		numr = len(reactants) # number of reactants in this equation
-		
-		
-		# left hand side of equations (losses)
-		for reactant in reactants:
-				
-			if (re.findall(stoich_regex, reactant)[0] != ''):
-				stoich_num = float(re.findall(stoich_regex, reactant)[0])
-				# name with no stoich number
-				name_only = re.sub(stoich_regex, '', reactant)
-			elif (re.findall(stoich_regex, reactant)[0] == ''):
-				stoich_num = 1.0
-				name_only = reactant
-			
-			# store stoichiometry
-			rstoi[eqn_step, reactant_step] = stoich_num
-			jac_stoi[eqn_step, reactant_step] = -1*stoich_num
-
-			if name_only not in comp_namelist: # if new component encountered
-				comp_namelist.append(name_only) # add to chemical scheme name list
-			
-				# convert MCM chemical names to SMILES
-				if name_only in comp_name:
-					# index where xml file name matches reaction component name
-					name_indx = comp_name.index(name_only)
-					name_SMILE = comp_smil[name_indx] # SMILES of component
-				else:
-					print(str('Error: inside eqn_parser, chemical scheme name '+str(name_only)+' not found in xml file'))
-					sys.exit()
-			
-				comp_list.append(name_SMILE) # list SMILE names
-				name_indx = comp_num # allocate index to this species
-				# Generate pybel
-				Pybel_object = pybel.readstring('smi', name_SMILE)
-				# append to Pybel object list
-				Pybel_objects.append(Pybel_object)
-				
-				# check if alkoxy radical present in this component and that component is organic
-				if ('[O]' in name_SMILE):
-					if ('C' in name_SMILE or 'C' in name_SMILE):
-						# if it is an alkoxy radical (rather than alkyl peroxy radical) add its index to list
-						if ('O[O]' not in name_SMILE and '[O]O' not in name_SMILE): # ensure it's not alkyl peroxy radical
-							self.RO_indx.append(comp_num)	
-
-				comp_num += 1 # number of unique species
-				
-
-			else: # if it's a species already encountered it will be in comp_list
-				# existing index
-				name_indx = comp_namelist.index(name_only)
-			
-			# store reactant index
-			# check if index already present - i.e. component appears more than once
-			# as a reactant in this reaction
-			if sum(rindx[eqn_step, 0:reactant_step] == int(name_indx))>0:
-				# get existing index of this component
-				exist_indx = (np.where(rindx[eqn_step, 0:reactant_step]==(int(name_indx))))[0]
-				# add to existing stoichiometry
-				rstoi[eqn_step, exist_indx] += rstoi[eqn_step, reactant_step]
-				jac_stoi[eqn_step, exist_indx] += -1*rstoi[eqn_step, reactant_step]
-				# remove stoichiometry added above
-				rstoi[eqn_step, reactant_step] = 0
-				jac_stoi[eqn_step, reactant_step] = 0
-				reactant_step -= 1 # ignore this duplicate
-			else:
-				rindx[eqn_step, reactant_step] = int(name_indx)
-				y_arr[eqn_step, reactant_step] = int((eqn_step*max_no_reac)+reactant_step)
-				y_rind = np.append(y_rind, int(name_indx))
-				rr_arr = np.append(rr_arr, int(eqn_step))
+	jac_indx = np.zeros((neqn, ncol_j)).astype(int)
+	
+	# flattened index for arranging reactant concentrations when reaction
+	# rate coefficients calculated
+	y_arr = []
+	# index for extracting required reactant concentrations and for 
+	# identifying products when assigning gains from reactions
+	y_rind = []; y_pind = []
+	# arrays to arrange reaction rates so they align with reactant and 
+	# product stoichiometries
+	rr_arr = []; rr_arr_p = []
+	
+	for eqn_step in range(neqn):
 		
-			reactant_step += 1
-					
-		# number of reactants in this equation
-		nreac[eqn_step] = int(reactant_step)
+		nr = nreac[eqn_step]; npr = nprod[eqn_step]
+		rindx[eqn_step, 0:nr] = eqn_rindx[eqn_step]
+		rstoi[eqn_step, 0:nr] = eqn_rstoi[eqn_step]
+		pindx[eqn_step, 0:npr] = eqn_pindx[eqn_step]
+		pstoi[eqn_step, 0:npr] = eqn_pstoi[eqn_step]
 		
-		# record 1D array of stoichiometries per equation
-		rstoi_flat = np.append(rstoi_flat, rstoi[eqn_step, 0:int(reactant_step)])
-		
-		# right hand side of equations (gains)
-		for product in products:
-
-			if (re.findall(stoich_regex, product)[0] != ''):
-				stoich_num = float(re.findall(stoich_regex, product)[0])
-				name_only = re.sub(stoich_regex, '', product) # name with no stoich number
-
-			elif (re.findall(stoich_regex, product)[0] == ''):
-				stoich_num = 1.0
-				name_only = product
-			
-			# store stoichiometry
-			pstoi[eqn_step, product_step] = stoich_num
-			jac_stoi[eqn_step, reactant_step+product_step] = 1*stoich_num
-			if name_only not in comp_namelist: # if new component encountered
-				comp_namelist.append(name_only)
-				
-				# convert MCM chemical names to SMILES
-				# index where xml file name matches reaction component name
-				if name_only in comp_name:
-					name_indx = comp_name.index(name_only)
-					name_SMILE = comp_smil[name_indx]
-				else:
-					print('Error: inside eqn_interr, chemical scheme name '+str(name_only)+' not found in xml file')
-					sys.exit()
-				
-				comp_list.append(name_SMILE) # list SMILE string of parsed species
-				name_indx = comp_num # allocate index to this species
-				
-				# generate pybel object
-				Pybel_object = pybel.readstring('smi', name_SMILE)
-				# append to Pybel object list
-				Pybel_objects.append(Pybel_object)
-
-				# check if alkoxy radical present in this component and that component is organic
-				if ('[O]' in name_SMILE):
-					if ('C' in name_SMILE or 'C' in name_SMILE):
-						# if it is an alkoxy radical (rather than alkyl peroxy radical) add its index to list
-						if ('O[O]' not in name_SMILE and '[O]O' not in name_SMILE): # ensure it's not alkyl peroxy radical
-							self.RO_indx.append(comp_num)
-
-				comp_num += 1 # number of unique species
-				
-			
-
-			else: # if it's a species already encountered
-				# index of component already listed
-				name_indx = comp_namelist.index(name_only)
-				
-			# store product index
-			# check if index already present - i.e. component appears more than once
-			if sum(pindx[eqn_step, 0:product_step]==int(name_indx))>0:
-				# get existing index of this component
-				exist_indx = (np.where(pindx[eqn_step, 0:product_step]==(int(name_indx))))[0]
-				# add to existing stoichiometry
-				pstoi[eqn_step, exist_indx] += pstoi[eqn_step, product_step]
-				jac_stoi[eqn_step, reactant_step+exist_indx] += 1*pstoi[eqn_step, product_step]
-				# remove stoichiometry added above
-				pstoi[eqn_step, product_step] = 0
-				jac_stoi[eqn_step, reactant_step+product_step] = 0
-				product_step -= 1 # ignore this duplicate
-			else:
-				pindx[eqn_step, product_step] = int(name_indx)
-				rr_arr_p = np.append(rr_arr_p, int(eqn_step))
-				y_pind = np.append(y_pind, int(name_indx))
-
-			product_step += 1
-		
-		# number of products in this equation
-		nprod[eqn_step] = int(product_step)
-		# record 1D array of stoichiometries per equation
-		pstoi_flat = np.append(pstoi_flat, pstoi[eqn_step, 0:int(product_step)])
+		y_arr += range(eqn_step*ncol_r, eqn_step*ncol_r+nr)
+		y_rind += eqn_rindx[eqn_step]
+		y_pind += eqn_pindx[eqn_step]
+		rr_arr += [eqn_step]*nr
+		rr_arr_p += [eqn_step]*npr
 		
 		# now that total number of components (reactants and products) 
-		# in an equation is known, replicate the reactant indices over all 
-		# components
-		tot_comp = nreac[eqn_step]+nprod[eqn_step]
-		for i in range(nreac[eqn_step]):
+		# in an equation is known, replicate the reactant indices and 
+		# the stoichiometries over all components
+		tot_comp = nr+npr
+		jac_stoi[eqn_step, 0:nr] = -1*rstoi[eqn_step, 0:nr]
+		jac_stoi[eqn_step, nr:tot_comp] = pstoi[eqn_step, 0:npr]
+		for i in range(nr):
 			jac_den_indx[eqn_step, i*tot_comp:(i+1)*tot_comp] = rindx[eqn_step, i]
-			# also replicate the stoichiometries for every reactant
 			if (i > 0):
 				jac_stoi[eqn_step, i*tot_comp:(i+1)*tot_comp] = jac_stoi[eqn_step, 0:tot_comp] 
- 		# number of Jacobian elements affected by this equation
-		njac[eqn_step, 0] = tot_comp*nreac[eqn_step]
-	
-	# account for gas-phase in Jacobian denominator index
-	jac_den_indx += (comp_num+2)
-
-	# remove fillers and flatten index for arranging concentrations ready for reaction rate coefficient calculation
-	y_arr_aq = y_arr[y_arr != -9999] # remove fillers
-	y_rind_aq = y_rind.astype(int) # ensure integer type
-	uni_y_rind_aq = (np.unique(y_rind)).astype(int) # unique index of reactants
-	y_pind_aq = y_pind.astype(int) # ensure integer type
-	uni_y_pind_aq = (np.unique(y_pind)).astype(int) # unique index of products
-	rr_arr_aq = rr_arr.astype(int) # ensure integer type
-	rr_arr_p_aq = rr_arr_p.astype(int) # ensure integer type	
+		# number of Jacobian elements affected by this equation
+		njac[eqn_step, 0] = tot_comp*nr
+	
+	# 1D arrays of stoichiometries per equation
+	rstoi_flat = np.empty((0))
+	pstoi_flat = np.empty((0))
+	if (neqn > 0):
+		rstoi_flat = np.concatenate([rstoi[i, 0:nreac[i]] for i in range(neqn)])
+		pstoi_flat = np.concatenate([pstoi[i, 0:nprod[i]] for i in range(neqn)])
+	
+	# ensure integer type
+	y_arr = np.array((y_arr)).astype(int)
+	y_rind = np.array((y_rind)).astype(int)
+	uni_y_rind = (np.unique(y_rind)).astype(int) # unique index of reactants
+	y_pind = np.array((y_pind)).astype(int)
+	uni_y_pind = (np.unique(y_pind)).astype(int) # unique index of products
+	rr_arr = np.array((rr_arr)).astype(int)
+	rr_arr_p = np.array((rr_arr_p)).astype(int)
+	
 	# colptrs for sparse matrix of the change to reactants per equation
-	reac_col_aq = np.cumsum(nreac)-nreac
+	reac_col = np.cumsum(nreac)-nreac
 	# colptrs for sparse matrix of the change to products per equation
-	prod_col_aq = np.cumsum(nprod)-nprod
-	if (len(reac_col_aq) > 0): # if aqueous-phase reaction present	
+	prod_col = np.cumsum(nprod)-nprod
+	if (len(reac_col) > 0): # if reaction present	
 		# include final columns
-		reac_col_aq = np.append(reac_col_aq, reac_col_aq[-1]+nreac[-1])
-		prod_col_aq = np.append(prod_col_aq, prod_col_aq[-1]+nprod[-1])
-	
-	# tag other aqueous-phase arrays
-	rindx_aq = rindx
-	pindx_aq = pindx
-	rstoi_aq = rstoi
-	pstoi_aq = pstoi
-	jac_stoi_aq = jac_stoi
-	rstoi_flat_aq = rstoi_flat
-	pstoi_flat_aq = pstoi_flat
-	nreac_aq = nreac
-	nprod_aq = nprod
-	reac_coef_aq = reac_coef
-	jac_den_indx_aq = jac_den_indx.astype(int)
-	njac_aq = njac.astype(int)
-	jac_indx_aq = jac_indx
-	jac_indx_aq = jac_indx_aq.astype(int)
+		reac_col = np.append(reac_col, reac_col[-1]+nreac[-1])
+		prod_col = np.append(prod_col, prod_col[-1]+nprod[-1])
+	
+	return(rindx, rstoi, pindx, pstoi, reac_coef, nreac, nprod, jac_stoi, 
+		jac_den_indx, njac, jac_indx, y_arr, y_rind, uni_y_rind, y_pind, 
+		uni_y_pind, reac_col, prod_col, rstoi_flat, pstoi_flat, rr_arr, rr_arr_p, 
+		err_mess)
 
-	return(rindx_g, rstoi_g, pindx_g, pstoi_g, reac_coef_g, 
-			nreac_g, nprod_g, jac_stoi_g, 
-			jac_den_indx_g, njac_g, jac_indx_g, 				
-			y_arr_g, y_rind_g, uni_y_rind_g, y_pind_g, 
-			uni_y_pind_g, reac_col_g, prod_col_g, rstoi_flat_g, pstoi_flat_g, 
-			rr_arr_g, rr_arr_p_g, rindx_aq, rstoi_aq, pindx_aq, pstoi_aq, reac_coef_aq, 
-			nreac_aq, nprod_aq, jac_stoi_aq, 
-			jac_den_indx_aq, njac_aq, jac_indx_aq, 				
-			y_arr_aq, y_rind_aq, uni_y_rind_aq, y_pind_aq, 
-			uni_y_pind_aq, reac_col_aq, prod_col_aq, rstoi_flat_aq, pstoi_flat_aq, 
-			rr_arr_aq, rr_arr_p_aq, comp_namelist, comp_list, Pybel_objects, 
-			comp_num, self)
+def mrk_regex(self):
+
+	# inputs: ----------------------------------------------------------------------------
+	# self.chem_sch_mrk - markers for separating sections of the chemical scheme
+	# ------------------------------------------------------------------------------------
+
+	# . means match with anything except a new line character, when followed by a * 
+	# means match zero or more times, \\ ensures the marker is recognised
+	mrk_re = {}
+	# for finding whether equation or reaction rate coefficient part comes first
+	mrk_re['eqn_start'] = re.compile(str('.*\\' +  self.chem_sch_mrk[10]))
+	mrk_re['rrc_start'] = re.compile(str('.*\\' +  self.chem_sch_mrk[9]))
+	# equation part when it is first (0) or second (1)
+	mrk_re['eqn'] = [re.compile(str('\\' +  self.chem_sch_mrk[10]+ '.*\\' +  self.chem_sch_mrk[9])), 
+		re.compile(str('\\' +  self.chem_sch_mrk[10]+ '.*\\' +  self.chem_sch_mrk[11]))]
+	# reaction rate coefficient part when equation part is first (0) or second (1)
+	mrk_re['rate'] = [re.compile(str('\\' +  self.chem_sch_mrk[9]+ '.*\\' +  self.chem_sch_mrk[11])), 
+		re.compile(str('\\' +  self.chem_sch_mrk[9]+ '.*\\' +  self.chem_sch_mrk[10]))]
+
+	return(mrk_re)
+
+def eqn_line(line, mrk_re):
+
+	# inputs: ----------------------------------------------------------------------------
+	# line - equation line from chemical scheme
+	# mrk_re - regular expressions for markers from mrk_regex
+	# ------------------------------------------------------------------------------------
+
+	err_mess = '' # start by assuming no error
+	
+	[reactants, products, eqn_sec] = eqn_part(line, mrk_re)
+	
+	# rate coefficient expression in a string
+	rate_ex = mrk_re['rate'][eqn_sec].search(line).group(0)[1:-1].strip()
+	
+	# convert fortran-type scientific notation to python type
+	rate_ex = formatting.SN_conversion(rate_ex)
+	# convert the rate coefficient expressions into Python readable commands
+	rate_ex = formatting.convert_rate_mcm(rate_ex)
+	if (rate_ex.find('EXP') != -1):
+		err_mess = str('Error: in the chemical scheme, reaction rate coefficient expression ' + 
+			str(rate_ex) + ' could not be converted to Python, please check the expression')
+	
+	return(reactants, products, rate_ex, err_mess)
+
+def eqn_part(line, mrk_re):
+
+	# inputs: ----------------------------------------------------------------------------
+	# line - equation line from chemical scheme
+	# mrk_re - regular expressions for markers from mrk_regex
+	# ------------------------------------------------------------------------------------
+
+	# work out whether equation or reaction rate coefficient part comes first, 
+	# note span is the property of the match object that gives the location of 
+	# the marker
+	eqn_start_indx = (mrk_re['eqn_start'].match(line)).span()[1]
+	rrc_start_indx = (mrk_re['rrc_start'].match(line)).span()[1]
+	
+	if (eqn_start_indx>rrc_start_indx):
+		eqn_sec = 1 # equation is second part
+	else:
+		eqn_sec = 0 # equation is first part
+	
+	# extract the equation as a string ([1:-1] removes the bounding markers)
+	eqn = mrk_re['eqn'][eqn_sec].search(line).group(0)[1:-1].strip()
+	
+	eqn_split = eqn.split()
+	eqmark_pos = eqn_split.index('=')
+	# reactants with stoichiometry number and omit any photon
+	reactants = [i for i in eqn_split[:eqmark_pos] if i != '+' and i != 'hv']
+	# products with stoichiometry number
+	products = [t for t in eqn_split[eqmark_pos+1:] if t != '+']
+	
+	return(reactants, products, eqn_sec)
+
+def comp_names(eqn_list, aqeqn_list, self):
+
+	# inputs: ----------------------------------------------------------------------------
+	# eqn_list - gas-phase equations in list of strings
+	# aqeqn_list - aqueous-phase equations in list of strings
+	# self.chem_sch_mrk - markers for separating sections of the chemical scheme
+	# ------------------------------------------------------------------------------------
+
+	# chemical scheme names of all reactants and products, e.g. for 
+	# reading only the relevant part of the xml file
+	names = set()
+	if (len(eqn_list)+len(aqeqn_list) == 0):
+		return(names)
+	
+	mrk_re = mrk_regex(self)
+	for line in (eqn_list+aqeqn_list):
+		[reactants, products, eqn_sec] = eqn_part(line, mrk_re)
+		for comp in (reactants+products):
+			names.add(comp[len(stoich_regex.match(comp).group(0))::])
+
+	return(names)
+
+def comp_new(name_only, comp_name_indx, comp_smil, comp_namelist, 
+	comp_list, comp_indx, self):
+
+	# inputs: ----------------------------------------------------------------------------
+	# name_only - chemical scheme name of new component
+	# comp_name_indx - index of components in the xml file by name
+	# comp_smil - SMILES from xml file
+	# comp_namelist - chemical scheme names of components found so far
+	# comp_list - SMILES of components found so far
+	# comp_indx - index of components found so far by name
+	# self - reference to PyCHAM
+	# ------------------------------------------------------------------------------------
+
+	# convert chemical scheme names to SMILES
+	if name_only not in comp_name_indx:
+		err_mess = str('Error: inside eqn_interr, chemical scheme name '+str(name_only)+' not found in xml file')
+		return(-1, err_mess)
+	name_SMILE = comp_smil[comp_name_indx[name_only]] # SMILES of component
+	
+	comp_num = len(comp_namelist) # allocate index to this component
+	comp_namelist.append(name_only) # add to chemical scheme name list
+	comp_list.append(name_SMILE) # list SMILE names
+	comp_indx[name_only] = comp_num
+	
+	# check if alkoxy radical present in this component and that component is organic
+	if ('[O]' in name_SMILE):
+		if ('C' in name_SMILE or 'C' in name_SMILE):
+			# if it is an alkoxy radical (rather than alkyl peroxy radical) add its index to list
+			if ('O[O]' not in name_SMILE and '[O]O' not in name_SMILE): # ensure it's not alkyl peroxy radical
+				self.RO_indx.append(comp_num)
+
+	return(comp_num, '')
+
+def gen_num_up(SMILES_this_eq, name_only_this_eq, nr, comp_indx, self):
+
+	# inputs: ----------------------------------------------------------------------------
+	# SMILES_this_eq - SMILES of reactants then products of this equation
+	# name_only_this_eq - chemical scheme names of reactants then products
+	# nr - number of reactants in this equation
+	# comp_indx - index of components by name
+	# self.gen_num - generation numbers of components
+	# ------------------------------------------------------------------------------------
+
+	ci = -1 # count on components in this equation
+	# reset the generation number for reactants
+	reac_min_gen = 0
+	ap_rad_f = 0 # flag for whether reactants include radicals
+	nzr = 0 # flag for non-zero generation number reactants
+	# prepare to store components that appear first as a reactant rather than product
+	early_comp = []
+
+	# loop through components in this equation
+	for SMILEi in SMILES_this_eq:
+		
+		ci += 1 # count on components in this equation
+		
+		# chemical scheme name of this component
+		name_only = name_only_this_eq[ci]
+		# index of this component
+		name_indx = comp_indx[name_only]
+		# number of carbons in this component
+		numC = SMILEi.count('c')+SMILEi.count('C')
+		# number of oxygens in this component
+		numO = SMILEi.count('o')+SMILEi.count('O')
+
+		if (numC == 0): # if it has no carbon (inorganic)
+			# if generation number not yet included for this component
+			if (len(self.gen_num)-1 < name_indx):
+				self.gen_num.append(0)
+		
+		else:
+			# if it is an unoxidised organic, then say it's 0th-generation
+			if (numO == 0):
+				# if it's not yet accounted for
+				if (len(self.gen_num)-1 < name_indx):
+					self.gen_num.append(0)
+					
+				# minimum generation number of reactant
+				reac_min_gen = min(0, reac_min_gen)
+				continue # continue onto next component in this equation
+
+			# if it is an oxidised organic
+			# then, if it's a reactant, it should already 
+			# have a generation number assigned because it should have
+			# already appeared as a product which are assigned generation 
+			# numbers below
+			if (ci < nr):
+
+				# if first appearance of this componenet is as a reactant, 
+				# then store and wait for when it appears as a product
+				if (name_indx >= len(self.gen_num)):
+					self.gen_num.append(0)
+					early_comp.append(name_only)
+					continue
+
+				# check on whether this component is an alkyl peroxy radical
+				if ('[O]O' in SMILEi or 'O[O]' in SMILEi):
+					ap_rad_f = 1 # flag that an alkyl peroxy radical in reactants
+				
+				# if this component is already assigned a > 0 
+				# generation number,
+				# then identify minimum generation number in this equation
+				if (self.gen_num[name_indx] > 0):
+					# if it's the first non-zero generation number reactant
+					if (nzr == 0):
+						reac_min_gen = self.gen_num[name_indx]
+						nzr = 1
+					reac_min_gen = min(self.gen_num[name_indx], reac_min_gen)
+				continue # continue onto next component in this equation
+			
+			# if a product is being considered
+			if (ci >= nr):
+
+				# check on whether this component is a radical or Criegee Intermediate
+				if ('[o]' in SMILEi or '[O]' in SMILEi or '[O+]' in SMILEi):
+					if (ap_rad_f == 0): # if no alkyl peroxy radicals in reactants
+						prod_gen = reac_min_gen+1 # suggested generation number
+					if (ap_rad_f == 1): # if alkyl peroxy radicals in reactants
+						prod_gen = reac_min_gen # suggested generation number
+				else: # if it's a termination product
+					prod_gen = reac_min_gen # suggested generation number
+				
+				# check if this already has a generation number
+				if (name_indx <= len(self.gen_num)-1):
+					
+					gn_pre = self.gen_num[name_indx]
+					# if this number less than that suggested by reactants, then
+					# no change needed
+					if (gn_pre < prod_gen and name_only not in early_comp):
+						continue # continue to next component in this equation
+					else: # otherwise 
+						self.gen_num[name_indx] = prod_gen
+				else: # if this component is on first appearance during this loop
+					self.gen_num.append(prod_gen)
+
+	return(self)
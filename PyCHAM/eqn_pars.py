@@ -31,10 +31,26 @@ import photo_num
 import RO2_indices
 import write_dydt_rec
 import write_ode_solv
-import write_rate_file
+import rrc_comp
 import write_hyst_eq
 import jac_setup
 import aq_mat_prep
+import mech_cache
+import mol_reg
+
+# names of the parsed mechanism items, in the order returned by mech_pars
+mech_names = ['rindx_g', 'rstoi_g', 'pindx_g', 'pstoi_g', 'reac_coef_g', 
+	'nreac_g', 'nprod_g', 'jac_stoi_g', 'jac_den_indx_g', 'njac_g', 'jac_indx_g', 
+	'y_arr_g', 'y_rind_g', 'uni_y_rind_g', 'y_pind_g', 'uni_y_pind_g', 
+	'reac_col_g', 'prod_col_g', 'rstoi_flat_g', 'pstoi_flat_g', 'rr_arr_g', 
+	'rr_arr_p_g', 'rindx_aq', 'rstoi_aq', 'pindx_aq', 'pstoi_aq', 'reac_coef_aq', 
+	'nreac_aq', 'nprod_aq', 'jac_stoi_aq', 'jac_den_indx_aq', 'njac_aq', 
+	'jac_indx_aq', 'y_arr_aq', 'y_rind_aq', 'uni_y_rind_aq', 'y_pind_aq', 
+	'uni_y_pind_aq', 'reac_col_aq', 'prod_col_aq', 'rstoi_flat_aq', 
+	'pstoi_flat_aq', 'rr_arr_aq', 'rr_arr_p_aq', 'comp_namelist', 'comp_list', 
+	'Pybel_objects', 'comp_num', 'rowvals', 'colptrs', 'jac_part_indx', 
+	'jac_wall_indx', 'jac_extr_indx', 'eqn_num', 'RO2_names', 'comp_name', 
+	'comp_smil']
 
 # define function to extract the chemical mechanism
 def extr_mech(int_tol, num_sb,
@@ -69,19 +85,25 @@ def extr_mech(int_tol, num_sb,
 	erf = 0
 	err_mess = ''
 	
-	f_open_eqn = open(self.sch_name, mode='r') # open the chemical scheme file
-	# read the file and store everything into a list
-	total_list_eqn = f_open_eqn.readlines()
-	f_open_eqn.close() # close file
+	# check for this mechanism in the cache of parsed mechanisms
+	[mech_key, mech] = mech_cache.mech_load(num_sb, self)
 	
-	# interrogate scheme to list equations
-	[eqn_list, aqeqn_list, eqn_num, rrc, rrc_name, 
-		RO2_names] = sch_interr.sch_interr(total_list_eqn, self)
+	if (mech is None): # parse the mechanism
+		[mech, erf, err_mess, self] = mech_pars(num_sb, self)
+		
+		if (erf == 0): # store for repeat runs, without pybel objects
+			mech_sav = list(mech)
+			mech_sav[mech_names.index('Pybel_objects')] = None
+			mech_cache.mech_save(mech_key, [mech_sav, self.RO_indx, 
+				self.gen_num, self.rrc_src], self)
+	
+	else: # use stored mechanism
+		[mech, self.RO_indx, self.gen_num, self.rrc_src] = mech
+		self = rrc_comp.rrc_load(self)
+		# pybel objects are generated from SMILES when needed
+		comp_list = mech[mech_names.index('comp_list')]
+		mech[mech_names.index('Pybel_objects')] = mol_reg.mol_list(comp_list)
 	
-	# interrogate xml to list all component names and SMILES
-	[err_mess_new, comp_smil, comp_name] = xml_interr.xml_interr(self.xml_name)
-
-	# get equation information for chemical reactions
 	[rindx_g, rstoi_g, pindx_g, pstoi_g, reac_coef_g, 
 		nreac_g, nprod_g, jac_stoi_g, 
 		jac_den_indx_g, njac_g, jac_indx_g, 				
@@ -93,27 +115,22 @@ def extr_mech(int_tol, num_sb,
 		y_arr_aq, y_rind_aq, uni_y_rind_aq, y_pind_aq, 
 		uni_y_pind_aq, reac_col_aq, prod_col_aq, rstoi_flat_aq, pstoi_flat_aq, 
 		rr_arr_aq, rr_arr_p_aq, comp_namelist, comp_list, Pybel_objects, 
-		comp_num, self] = eqn_interr.eqn_interr(eqn_num, 
-		eqn_list, aqeqn_list, comp_name, comp_smil, num_sb, self)
-		
-	[rowvals, colptrs, jac_indx_g, jac_indx_aq, jac_part_indx, jac_wall_indx, jac_extr_indx] = jac_setup.jac_setup(jac_den_indx_g, 
-		njac_g, comp_num, num_sb, eqn_num, nreac_g, nprod_g, rindx_g, pindx_g, jac_indx_g, nreac_aq, nprod_aq, rindx_aq, 
-		pindx_aq, jac_indx_aq, (num_sb-self.wall_on), self)
+		comp_num, rowvals, colptrs, jac_part_indx, jac_wall_indx, jac_extr_indx, 
+		eqn_num, RO2_names, comp_name, comp_smil] = mech
 	
-	# prepare aqueous-phase reaction matrices for applying to reaction rate calculation
-	if (eqn_num[1] > 0): # if aqueous-phase reactions present
-		[rindx_aq, rstoi_aq, pindx_aq, pstoi_aq, reac_coef_aq, 
-			nprod_aq, jac_stoi_aq, njac_aq,
-			jac_den_indx_aq, jac_indx_aq, 				
+	if (erf != 0): # mechanism not parsed, so return error message
+		return(rindx_g, pindx_g, rstoi_g, pstoi_g, nreac_g, nprod_g, jac_stoi_g, 
+			njac_g, jac_den_indx_g, jac_indx_g, y_arr_g, y_rind_g,
+			uni_y_rind_g, y_pind_g, uni_y_pind_g, reac_col_g, prod_col_g, 
+			rstoi_flat_g, pstoi_flat_g, rr_arr_g, rr_arr_p_g, rowvals, colptrs, 
+			jac_wall_indx, jac_part_indx, jac_extr_indx, comp_num,comp_list, 
+			Pybel_objects, eqn_num, comp_namelist, 0, 
+			rindx_aq, rstoi_aq, pindx_aq, pstoi_aq, reac_coef_aq, 
+			nreac_aq, nprod_aq, jac_stoi_aq, 
+			jac_den_indx_aq, njac_aq, jac_indx_aq, 				
 			y_arr_aq, y_rind_aq, uni_y_rind_aq, y_pind_aq, 
 			uni_y_pind_aq, reac_col_aq, prod_col_aq, rstoi_flat_aq, pstoi_flat_aq, 
-			rr_arr_aq, rr_arr_p_aq] = aq_mat_prep.aq_mat_prep(rindx_aq, rstoi_aq, 
-			pindx_aq, pstoi_aq, reac_coef_aq, 
-			nprod_aq, jac_stoi_aq, njac_aq, 
-			jac_den_indx_aq, jac_indx_aq, 				
-			y_arr_aq, y_rind_aq, uni_y_rind_aq, y_pind_aq, 
-			uni_y_pind_aq, reac_col_aq, prod_col_aq, rstoi_flat_aq, pstoi_flat_aq, 
-			rr_arr_aq, rr_arr_p_aq, num_sb, eqn_num[1], comp_num, self) 
+			rr_arr_aq, rr_arr_p_aq, comp_name, comp_smil, erf, err_mess, self)
 	
 	# get index of components with constant influx/concentration -----------
 	# empty array for storing index of components with constant influx
@@ -203,9 +220,6 @@ def extr_mech(int_tol, num_sb,
 	write_ode_solv.ode_gen(self.con_infl_indx, int_tol, rowvals, comp_num+2, 
 			(num_sb-self.wall_on), 0, eqn_num, sav_nam, pcont, self)
 
-	# call function to generate reaction rate calculation module
-	write_rate_file.write_rate_file(reac_coef_g, reac_coef_aq, rrc, rrc_name, 0)
-
 	# call function to generate module that tracks change tendencies
 	# of certain components
 	write_dydt_rec.write_dydt_rec()
@@ -235,3 +249,85 @@ def extr_mech(int_tol, num_sb,
 		y_arr_aq, y_rind_aq, uni_y_rind_aq, y_pind_aq, 
 		uni_y_pind_aq, reac_col_aq, prod_col_aq, rstoi_flat_aq, pstoi_flat_aq, 
 		rr_arr_aq, rr_arr_p_aq, comp_name, comp_smil, erf, err_mess, self)
+
+def mech_pars(num_sb, self):
+
+	# inputs: ----------------------------------------------------
+	# num_sb - number of size bins (including any wall)
+	# self - reference to PyCHAM program (see extr_mech)
+	# ------------------------------------------------------------
+	
+	erf = 0
+	err_mess = ''
+	
+	f_open_eqn = open(self.sch_name, mode='r') # open the chemical scheme file
+	# read the file and store everything into a list
+	total_list_eqn = f_open_eqn.readlines()
+	f_open_eqn.close() # close file
+	
+	# interrogate scheme to list equations
+	[eqn_list, aqeqn_list, eqn_num, rrc, rrc_name, 
+		RO2_names] = sch_interr.sch_interr(total_list_eqn, self)
+	
+	# interrogate xml to list names and SMILES of components in the scheme
+	comp_use = eqn_interr.comp_names(eqn_list, aqeqn_list, self)
+	[err_mess, comp_smil, comp_name] = xml_interr.xml_interr(self.xml_name, 
+		comp_use, mech_cache.cache_dir(self))
+	if (err_mess != ''): # return error message without mechanism
+		return([[]]*len(mech_names), 1, err_mess, self)
+
+	# get equation information for chemical reactions
+	[rindx_g, rstoi_g, pindx_g, pstoi_g, reac_coef_g, 
+		nreac_g, nprod_g, jac_stoi_g, 
+		jac_den_indx_g, njac_g, jac_indx_g, 				
+		y_arr_g, y_rind_g, uni_y_rind_g, y_pind_g, 
+		uni_y_pind_g, reac_col_g, prod_col_g, rstoi_flat_g, pstoi_flat_g, 
+		rr_arr_g, rr_arr_p_g, rindx_aq, rstoi_aq, pindx_aq, pstoi_aq, reac_coef_aq, 
+		nreac_aq, nprod_aq, jac_stoi_aq, 
+		jac_den_indx_aq, njac_aq, jac_indx_aq, 				
+		y_arr_aq, y_rind_aq, uni_y_rind_aq, y_pind_aq, 
+		uni_y_pind_aq, reac_col_aq, prod_col_aq, rstoi_flat_aq, pstoi_flat_aq, 
+		rr_arr_aq, rr_arr_p_aq, comp_namelist, comp_list, Pybel_objects, 
+		comp_num, err_mess, self] = eqn_interr.eqn_interr(eqn_num, 
+		eqn_list, aqeqn_list, comp_name, comp_smil, num_sb, self)
+	if (err_mess != ''): # return error message without mechanism
+		return([[]]*len(mech_names), 1, err_mess, self)
+		
+	[rowvals, colptrs, jac_indx_g, jac_indx_aq, jac_part_indx, jac_wall_indx, jac_extr_indx] = jac_setup.jac_setup(jac_den_indx_g, 
+		njac_g, comp_num, num_sb, eqn_num, nreac_g, nprod_g, rindx_g, pindx_g, jac_indx_g, nreac_aq, nprod_aq, rindx_aq, 
+		pindx_aq, jac_indx_aq, (num_sb-self.wall_on), self)
+	
+	# prepare aqueous-phase reaction matrices for applying to reaction rate calculation
+	if (eqn_num[1] > 0): # if aqueous-phase reactions present
+		[rindx_aq, rstoi_aq, pindx_aq, pstoi_aq, reac_coef_aq, 
+			nprod_aq, jac_stoi_aq, njac_aq,
+			jac_den_indx_aq, jac_indx_aq, 				
+			y_arr_aq, y_rind_aq, uni_y_rind_aq, y_pind_aq, 
+			uni_y_pind_aq, reac_col_aq, prod_col_aq, rstoi_flat_aq, pstoi_flat_aq, 
+			rr_arr_aq, rr_arr_p_aq] = aq_mat_prep.aq_mat_prep(rindx_aq, rstoi_aq, 
+			pindx_aq, pstoi_aq, reac_coef_aq, 
+			nprod_aq, jac_stoi_aq, njac_aq, 
+			jac_den_indx_aq, jac_indx_aq, 				
+			y_arr_aq, y_rind_aq, uni_y_rind_aq, y_pind_aq, 
+			uni_y_pind_aq, reac_col_aq, prod_col_aq, rstoi_flat_aq, pstoi_flat_aq, 
+			rr_arr_aq, rr_arr_p_aq, num_sb, eqn_num[1], comp_num, self) 
+	
+	# compile the function for calculating reaction rate coefficients
+	[erf, err_mess, self] = rrc_comp.rrc_comp(reac_coef_g, reac_coef_aq, 
+		rrc, rrc_name, self)
+	
+	mech = [rindx_g, rstoi_g, pindx_g, pstoi_g, reac_coef_g, 
+		nreac_g, nprod_g, jac_stoi_g, 
+		jac_den_indx_g, njac_g, jac_indx_g, 				
+		y_arr_g, y_rind_g, uni_y_rind_g, y_pind_g, 
+		uni_y_pind_g, reac_col_g, prod_col_g, rstoi_flat_g, pstoi_flat_g, 
+		rr_arr_g, rr_arr_p_g, rindx_aq, rstoi_aq, pindx_aq, pstoi_aq, reac_coef_aq, 
+		nreac_aq, nprod_aq, jac_stoi_aq, 
+		jac_den_indx_aq, njac_aq, jac_indx_aq, 				
+		y_arr_aq, y_rind_aq, uni_y_rind_aq, y_pind_aq, 
+		uni_y_pind_aq, reac_col_aq, prod_col_aq, rstoi_flat_aq, pstoi_flat_aq, 
+		rr_arr_aq, rr_arr_p_aq, comp_namelist, comp_list, Pybel_objects, 
+		comp_num, rowvals, colptrs, jac_part_indx, jac_wall_indx, jac_extr_indx, 
+		eqn_num, RO2_names, comp_name, comp_smil]
+
+	return(mech, erf, err_mess, self)
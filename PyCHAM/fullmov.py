@@ -27,59 +27,59 @@
 import scipy.constants as si
 import numpy as np
 
+# scratch array reused between calls for reordering particle-phase
+# concentrations (# molecules/cc (air))
+Cp_buf = np.zeros((0, 0))
+
 def fullmov(num_sb, n0, num_comp, Cp, MV, Vol0, Vbou, rbou): # define module
 
 	# inputs: -----------------------------------------------------
 	# num_sb - number of size bins excluding wall (if present)
-	# n0 - particle number concentration per size bin
+	# n0 - particle number concentration per size bin, reordered
+	#	in place
 	# num_comp - number of components
-	# Cp - particle-phase component concentrations (# molecules/cm3 (air))
+	# Cp - particle-phase component concentrations (# molecules/cm3 (air)),
+	#	reordered in place
 	# MV - molar volume per component (um3/mol)
 	# Vol0 - initial volume per size bin at bin centre (um3)
-	# Vbou - volume bounds between size bins (um3)
+	# Vbou - volume bounds between size bins (um3), updated in place
 	# rbou - radius bounds (um)
 	# -------------------------------------------------------------
-	# particle-phase concentrations	(# molecules/cc (air))
-	Cp = np.transpose(Cp.reshape(num_sb, num_comp))
+	
+	global Cp_buf
+	
 	NA = si.Avogadro # Avogadro's number (molecules/mol)
-	ish = n0[:, 0]>0. # size bins containing particles
-
-
-	nmolC = np.zeros((num_comp, ish.sum())) # empty array for molar concentration
-	# number of moles of each component in a single particle (mol/cm3 (air))
-	nmolC[:, :] = ((Cp[:, ish]/(NA*n0[ish, 0])))
+	# view of particle-phase concentrations with size bins in rows
+	# (# molecules/cc (air))
+	Cpv = Cp.reshape(num_sb, num_comp)
+	ish = n0[:, 0] > 1.e-10 # size bins containing particles
 	
-	Vnew = np.zeros((num_sb)) # empty array for new volumes
-	MVrep = np.repeat(MV, num_sb, axis=1)
+	# if no particles in a size bin, assign starting volume (um3)
+	Vnew = np.array((Vol0[0:num_sb]), dtype = float)
 	# new volume of single particle per size bin (um3), including volume of water
-	Vnew[ish] = np.sum(nmolC*MVrep[:, ish], axis=0)
+	Vnew[ish] = Cpv[ish, :].dot(MV[:, 0])/(NA*n0[ish, 0])
 	
+	# arrange size bins in ascending size order, with ties keeping their
+	# existing order
+	ord_indx = np.argsort(Vnew, kind = 'stable')
 	
-	# if no particles in a size bin, assign starting volume (um3)
-	Vnew[n0[:, 0]<=1.0e-10] = Vol0[0::][n0[:, 0]<=1.0e-10]
-
-	# flatten particle-phase concentrations (molecules/cc (air))
-	Cp = np.ravel(np.transpose(Cp))
-
-	Vnew_ord = sorted(Vnew) # arrange size bins in ascending size order
-	Cpn = np.zeros((len(Cp)))
-	nn = np.zeros((n0.shape[0], n0.shape[1]))
-	# arrange particle-phase concentrations and particle number concentrations similarly
-	for i in range(len(Vnew)):
-		ind = Vnew_ord.index(Vnew[i]) # new index
-		Cpn[(ind)*num_comp:(ind+1)*num_comp] = Cp[(i)*num_comp:(i+1)*num_comp]
-		nn[ind] = n0[i]
-		
-	Vnew_ord = np.array((Vnew_ord)) # transform list to numpy array
+	# arrange particle-phase concentrations and particle number concentrations
+	# similarly, only if size bins have swapped
+	if (any(ord_indx != np.arange(num_sb))):
+		if (Cp_buf.shape != Cpv.shape):
+			Cp_buf = np.zeros((num_sb, num_comp))
+		np.take(Cpv, ord_indx, axis = 0, out = Cp_buf)
+		Cpv[:, :] = Cp_buf
+		n0[:, :] = n0[ord_indx, :]
+		Vnew = Vnew[ord_indx]
 
 	# new volume bounds (um3) between size bin	
-	Vbou[1:-1] = Vnew_ord[0:-1]+(Vnew_ord[1::]-Vnew_ord[0:-1])/2.
+	Vbou[1:-1] = Vnew[0:-1]+(Vnew[1::]-Vnew[0:-1])/2.
 
 	# new radii per size bin (um)
-	x = ((3.*Vnew_ord)/(4.*np.pi))**(1./3.)
+	x = ((3.*Vnew)/(4.*np.pi))**(1./3.)
 		
 	# new radius bounds (um)
 	rbou = ((3.*Vbou)/(4.*np.pi))**(1./3.)
 
-	
-	return(Vnew_ord, x, Cpn, nn, Vbou, rbou)
+	return(Vnew, x, Cpv.reshape(-1), n0, Vbou, rbou)
@@ -63,15 +63,19 @@ def lamp_photo(J, TEMP, self):
 	if (self.af_path == 'nat_act_flux'): # if using modelled solar actinic flux
 		
 		import nat_act_flux
-		naff = 4 # flag for calling module
-		# get wavelengths (nm) and their associated actinic fluxes (photon/cm2/nm/s)
-		
-		# cosine of the solar zenith angle which should be in radians
-		mu0 = np.cos(theta)
-		# loop through top-of-the-atmosphere downward actinic flux 
-		# (photon/cm2/nm/s) per wavelength (nm)
-		for F0 in F_dep_wl:
-			[act_chm] = nat_act_flux.nat_act_flux(A, a, F0, theta, tau, naff, mu0, NL)
+		import zenith
+		
+		# cosine of the solar zenith angle, using any user-specified
+		# value in preference
+		if hasattr(self, 'cosx'):
+			cosx = self.cosx
+		else:
+			(secx, cosx) = zenith.zenith(self)
+		
+		# get wavelengths (nm) and their associated actinic fluxes (photon/cm2/nm/s),
+		# interpolated from the table prepared over solar zenith angles on first call
+		[wl_chm, act_chm] = nat_act_flux.act_flux_interp(cosx, self)
+		act_chm = act_chm*self.tf # account for transmission factor
 	
 	# get UV-C transmission factor now
 	tf_UVCn = self.tf_UVC[(np.sum(self.tf_UVCt<=self.sumt)-1)]
@@ -0,0 +1,139 @@
+##########################################################################################
+#                                                                                        											 #
+#    Copyright (C) 2018-2022 Simon O'Meara : simon.omeara@manchester.ac.uk                  				 #
+#                                                                                       											 #
+#    All Rights Reserved.                                                                									 #
+#    This file is part of PyCHAM                                                         									 #
+#                                                                                        											 #
+#    PyCHAM is free software: you can redistribute it and/or modify it under              						 #
+#    the terms of the GNU General Public License as published by the Free Software       					 #
+#    Foundation, either version 3 of the License, or (at your option) any later          						 #
+#    version.                                                                            										 #
+#                                                                                        											 #
+#    PyCHAM is distributed in the hope that it will be useful, but WITHOUT                						 #
+#    ANY WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS       			 #
+#    FOR A PARTICULAR PURPOSE.  See the GNU General Public License for more              				 #
+#    details.                                                                            										 #
+#                                                                                        											 #
+#    You should have received a copy of the GNU General Public License along with        					 #
+#    PyCHAM.  If not, see <http://www.gnu.org/licenses/>.                                 							 #
+#                                                                                        											 #
+##########################################################################################
+'''content-addressed cache of parsed chemical mechanisms'''
+# parsing the chemical scheme and xml files, and setting up the 
+# Jacobian and aqueous-phase matrices, gives the same result for the 
+# same inputs, so the result is stored in a file named after a hash of 
+# these inputs, and repeat runs (e.g. batch members or grid points of 
+# ozone isopleths) with the same mechanism load it rather than parse 
+# again
+
+import hashlib
+import os
+import pickle
+
+# modules whose code determines the parsed mechanism, the cache is
+# invalidated whenever any of them changes
+pars_mods = ['eqn_pars', 'sch_interr', 'xml_interr', 'eqn_interr', 
+	'jac_setup', 'aq_mat_prep', 'formatting', 'rrc_comp', 'mech_cache']
+
+def mech_key(num_sb, self):
+
+	# inputs: ----------------------------------------------------
+	# num_sb - number of size bins (including any wall)
+	# self.sch_name - file name of chemical scheme
+	# self.xml_name - name of xml file
+	# self.chem_sch_mrk - markers to identify different sections of 
+	# 	the chemical scheme
+	# self.wall_on - marker for whether to include wall partitioning
+	# self.dil_fac - fraction of chamber air extracted/s
+	# ------------------------------------------------------------
+
+	hsh = hashlib.sha256()
+	
+	for fname in [self.sch_name, self.xml_name]:
+		with open(fname, mode='rb') as f:
+			hsh.update(f.read())
+		hsh.update(b'\0')
+	
+	# the Jacobian sparsity depends on whether air is extracted
+	hsh.update(str(self.chem_sch_mrk).encode())
+	hsh.update(str([int(num_sb), int(self.wall_on), 
+		int(self.dil_fac > 0)]).encode())
+	
+	pych_path = os.path.dirname(os.path.abspath(__file__))
+	for mod in pars_mods:
+		with open(os.path.join(pych_path, str(mod + '.py')), mode='rb') as f:
+			hsh.update(f.read())
+	
+	return(hsh.hexdigest())
+
+def cache_dir(self):
+
+	# inputs: ----------------------------------------------------
+	# self.mech_cache_dir - optional path to folder holding the cache
+	# ------------------------------------------------------------
+
+	if hasattr(self, 'mech_cache_dir'):
+		return(self.mech_cache_dir)
+	
+	# default to the cache folder of this user, rather than the PyCHAM
+	# folder, so that generated files are not written into the package
+	if (os.name == 'nt'): # Windows
+		base = os.environ.get('LOCALAPPDATA', os.path.expanduser('~'))
+	else:
+		base = os.environ.get('XDG_CACHE_HOME', 
+			os.path.join(os.path.expanduser('~'), '.cache'))
+	
+	return(os.path.join(base, 'PyCHAM', 'mech_cache'))
+
+def cache_path(key, self):
+
+	# inputs: ----------------------------------------------------
+	# key - hash of mechanism inputs from mech_key
+	# self - reference to PyCHAM
+	# ------------------------------------------------------------
+	
+	return(os.path.join(cache_dir(self), str(key + '.pickle')))
+
+def mech_load(num_sb, self):
+
+	# inputs: ----------------------------------------------------
+	# num_sb - number of size bins (including any wall)
+	# self - reference to PyCHAM
+	# ------------------------------------------------------------
+
+	# returns the hash of the mechanism inputs and the stored mechanism 
+	# (None if not cached)
+	key = mech_key(num_sb, self)
+	
+	try:
+		with open(cache_path(key, self), mode='rb') as f:
+			mech = pickle.load(f)
+	except Exception: # not cached or unreadable
+		mech = None
+	
+	return(key, mech)
+
+def mech_save(key, mech, self):
+
+	# inputs: ----------------------------------------------------
+	# key - hash of mechanism inputs from mech_key
+	# mech - dictionary of parsed mechanism
+	# self - reference to PyCHAM
+	# ------------------------------------------------------------
+
+	fname = cache_path(key, self)
+	
+	# write to a temporary file first so that simultaneous runs never 
+	# read a partly written mechanism, failure to write only means 
+	# that the next run parses again
+	try:
+		os.makedirs(os.path.dirname(fname), exist_ok=True)
+		tname = str(fname + '.' + str(os.getpid()))
+		with open(tname, mode='wb') as f:
+			pickle.dump(mech, f, protocol=pickle.HIGHEST_PROTOCOL)
+		os.replace(tname, fname)
+	except OSError:
+		pass
+	
+	return()
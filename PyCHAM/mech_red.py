@@ -0,0 +1,541 @@
+##########################################################################################
+#                                                                                        											 #
+#    Copyright (C) 2018-2022 Simon O'Meara : simon.omeara@manchester.ac.uk                  				 #
+#                                                                                       											 #
+#    All Rights Reserved.                                                                									 #
+#    This file is part of PyCHAM                                                         									 #
+#                                                                                        											 #
+#    PyCHAM is free software: you can redistribute it and/or modify it under              						 #
+#    the terms of the GNU General Public License as published by the Free Software       					 #
+#    Foundation, either version 3 of the License, or (at your option) any later          						 #
+#    version.                                                                            										 #
+#                                                                                        											 #
+#    PyCHAM is distributed in the hope that it will be useful, but WITHOUT                						 #
+#    ANY WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS       			 #
+#    FOR A PARTICULAR PURPOSE.  See the GNU General Public License for more              				 #
+#    details.                                                                            										 #
+#                                                                                        											 #
+#    You should have received a copy of the GNU General Public License along with        					 #
+#    PyCHAM.  If not, see <http://www.gnu.org/licenses/>.                                 							 #
+#                                                                                        											 #
+##########################################################################################
+'''reduction of the chemical scheme using integrated reaction fluxes'''
+# a reference simulation records the flux through every reaction 
+# integrated over the simulation (flux_rec, called by ode_updater), these 
+# fluxes weight a directed relation graph between components and 
+# components not reachable from the target components (model variable 
+# red_targets) through sufficiently strong relations (red_thresh) are 
+# removed, along with their reactions, the reduced chemical scheme and xml 
+# files are written to a folder called reduced beside the chemical scheme,
+# with _reduced appended to their names, and a simulation with them is 
+# compared against the reference
+# to reduce a chemical scheme without the GUI, call from the PyCHAM home 
+# folder: python PyCHAM/mech_red.py chemical_scheme xml_file model_variables
+
+import collections
+import os
+import pickle
+import re
+import sys
+import numpy as np
+import scipy.sparse as SP
+import sch_interr
+import eqn_interr
+import eqn_pars
+import mech_cache
+import xml_interr
+
+def mech_red(self): # define function
+
+	# inputs: ----------------------------------------------------------
+	# self.sch_name - file name of chemical scheme
+	# self.xml_name - name of xml file
+	# self.red_trgt - chemical scheme names of components whose 
+	#	concentrations the reduced scheme must reproduce, SOA to 
+	#	include secondary particle-phase mass
+	# self.red_thr - threshold (0-1) of the relation between components 
+	#	below which the relation is ignored
+	# self.red_tol - tolerance (fraction of the maximum of the reference) 
+	#	for the deviation of the reduced simulation from the reference
+	# self - reference to PyCHAM, ready for simulation (model variables 
+	#	stored in pickle.pkl)
+	# ------------------------------------------------------------------
+	
+	if (len(self.red_trgt) == 0):
+		yield (str('Error: no target components given for mechanism reduction, please provide them in the red_targets model variable'))
+		return()
+	
+	# check that targets are in the chemical scheme
+	[eqn_list, aqeqn_list, RO2_names] = sch_read(self.sch_name, self)
+	comp_use = eqn_interr.comp_names(eqn_list, aqeqn_list, self)
+	for trgt in self.red_trgt:
+		if (trgt != 'SOA' and trgt not in comp_use):
+			yield (str('Error: target component ' + trgt + ' for mechanism reduction (red_targets model variable) not found in the chemical scheme'))
+			return()
+	
+	# components that model variables refer to must stay in the scheme
+	input_by_sim = str(os.getcwd() + '/PyCHAM/pickle.pkl')
+	with open(input_by_sim, 'rb') as pk:
+		list_vars = pickle.load(pk)
+	# components with initial concentrations (comp0), injected (Compt) 
+	# and number of size bins (num_sb)
+	[comp0, Compt, num_sb] = [list_vars[1], list_vars[18], list_vars[9]]
+	# components used by reaction rate coefficients are also kept
+	comp_keep = (list(self.red_trgt) + list(comp0) + list(Compt) + 
+		list(self.con_infl_nam) + list(self.const_comp) + 
+		list(self.dydt_trak) + ['NO', 'HO2', 'NO3'])
+	comp_keep = [comp for comp in comp_keep if comp in comp_use]
+	
+	# both simulations save results, so check neither folder exists 
+	# before starting
+	for sch_namei in [self.sch_name, red_name(self.sch_name)]:
+		output_by_sim = sav_path(sch_namei, list_vars[0])
+		if (os.path.isdir(output_by_sim)):
+			yield (str('Error - results folder (' + output_by_sim + ') already exists, please use an alternative.  This can be changed by the res_file_name variable in the model variables file, as explained in README.'))
+			return()
+	
+	# reference simulation, recording integrated reaction fluxes
+	sch_name = self.sch_name; xml_name = self.xml_name
+	for prog in red_sim(self, 0.):
+		yield (prog)
+		if (isinstance(prog, str) and prog[0:5] == 'Error'):
+			return()
+	[flux, trak_ref, pmax] = [self.flux_int, np.array(self.red_trak), self.red_pmax]
+	
+	# parsed mechanism of reference simulation
+	[mech_key, mech] = mech_cache.mech_load(num_sb+self.wall_on, self)
+	if (mech is None): # if not cached then parse
+		[mech, erf, err_mess, self] = eqn_pars.mech_pars(num_sb+self.wall_on, self)
+		if (erf != 0):
+			yield (err_mess)
+			return()
+	else: # cached with other outputs of parsing
+		mech = mech[0]
+	mech = dict(zip(eqn_pars.mech_names, mech))
+	comp_namelist = mech['comp_namelist']
+	
+	# components making up secondary particle-phase mass
+	if ('SOA' in self.red_trgt):
+		comp_keep += soa_comp(pmax, comp_namelist, self)
+	
+	# components and reactions to keep
+	[comp_indx, eqn_keep] = drg(flux, mech, RO2_names, 
+		[comp_namelist.index(comp) for comp in comp_keep], self.red_thr)
+	
+	# write reduced chemical scheme and xml files
+	[self.red_sch_name, self.red_xml_name] = red_write(eqn_list, aqeqn_list, 
+		eqn_keep, [comp_namelist[i] for i in comp_indx], comp_use, self)
+	
+	# simulation with reduced scheme
+	self.sch_name = self.red_sch_name; self.xml_name = self.red_xml_name
+	for prog in red_sim(self, 50.):
+		yield (prog)
+		if (isinstance(prog, str) and prog[0:5] == 'Error'):
+			self.sch_name = sch_name; self.xml_name = xml_name
+			return()
+	self.sch_name = sch_name; self.xml_name = xml_name
+	trak_red = np.array(self.red_trak)
+	
+	# deviation of reduced from reference, as fraction of the maximum of 
+	# the reference, per target
+	self.red_dev = np.zeros((len(self.red_trgt)))
+	for i in range(len(self.red_trgt)):
+		trak_redi = np.interp(trak_ref[:, 0], trak_red[:, 0], trak_red[:, i+1])
+		self.red_dev[i] = (np.max(np.abs(trak_redi-trak_ref[:, i+1]))/
+			max(np.max(np.abs(trak_ref[:, i+1])), 1.e-40))
+	
+	mess = str('reduced chemical scheme (' + str(int(sum(eqn_keep))) + ' of ' + 
+		str(len(eqn_keep)) + ' reactions, ' + str(len(comp_indx)) + ' of ' + 
+		str(len(comp_use)) + ' components) saved to ' + self.red_sch_name + 
+		' with xml file ' + self.red_xml_name + ', maximum deviations from reference (fraction of reference maximum): ' + 
+		', '.join(str(self.red_trgt[i] + ' ' + '%.2e' % self.red_dev[i]) for i in range(len(self.red_trgt))))
+	
+	if any(self.red_dev > self.red_tol):
+		yield (str('Error: ' + mess + ', which exceeds the tolerance (red_tol model variable) of ' + str(self.red_tol) + ', a lower threshold (red_thresh model variable) is needed'))
+	else:
+		yield (str('Note: ' + mess))
+	
+	return()
+
+def red_sim(self, prog0):
+
+	# inputs: ----------------------------------------------------------
+	# self - reference to PyCHAM
+	# prog0 - progress (%) of reduction at start of this simulation
+	# ------------------------------------------------------------------
+	
+	# containers for recording by flux_rec
+	self.red_rec = 1 # flag to record
+	self.flux_int = np.zeros((0)) # integrated reaction fluxes
+	self.red_trak = [] # times and target values
+	self.red_pmax = np.zeros((0)) # maximum particle-phase mass per component
+	
+	from middle import middle # prepare to communicate with main program
+	
+	for prog in middle(self): # call on modules to simulate
+		if (isinstance(prog, str)): # pass on messages
+			yield (prog)
+			if (prog[0:5] == 'Error'):
+				break
+		else: # progress through both simulations
+			yield (prog0+prog/2.)
+	
+	self.red_rec = 0 # stop recording
+	
+	return()
+
+def sch_read(sch_name, self):
+
+	# inputs: ----------------------------------------------------------
+	# sch_name - file name of chemical scheme
+	# self - reference to PyCHAM
+	# ------------------------------------------------------------------
+	
+	f_open_eqn = open(sch_name, mode='r') # open the chemical scheme file
+	total_list_eqn = f_open_eqn.readlines()
+	f_open_eqn.close() # close file
+	
+	[eqn_list, aqeqn_list, eqn_num, rrc, rrc_name, 
+		RO2_names] = sch_interr.sch_interr(total_list_eqn, self)
+	
+	return(eqn_list, aqeqn_list, RO2_names)
+
+def rr_calc(y, rrc, rindx, rstoi, y_arr, y_rind, rindx_aq, rstoi_aq, 
+	y_arr_aq, y_rind_aq, eqn_num, num_comp, num_asb):
+
+	# inputs: ----------------------------------------------------------
+	# y - concentrations (# molecules/cm3)
+	# rrc - reaction rate coefficients
+	# rindx - index of gas-phase reactants
+	# rstoi - stoichiometries of gas-phase reactants
+	# y_arr - index for arranging gas-phase reactant concentrations
+	# y_rind - index of y for gas-phase reactants
+	# rindx_aq - index of aqueous-phase reactants (one size bin)
+	# rstoi_aq - stoichiometries of aqueous-phase reactants
+	# y_arr_aq - index for arranging aqueous-phase reactant concentrations
+	# y_rind_aq - index of components in a size bin for aqueous-phase 
+	#	reactants
+	# eqn_num - number of gas- and aqueous-phase reactions
+	# num_comp - number of components
+	# num_asb - number of particle size bins
+	# ------------------------------------------------------------------
+	
+	rr = np.zeros((eqn_num[0]+eqn_num[1]))
+	
+	if (eqn_num[0] > 0): # gas-phase reactions (molecules/cm3/s)
+		rrc_y = np.ones((rindx.shape[0]*rindx.shape[1]))
+		rrc_y[y_arr] = y[y_rind]
+		rrc_y = rrc_y.reshape(rindx.shape[0], rindx.shape[1], order = 'C')
+		rr[0:eqn_num[0]] = rrc[0:eqn_num[0]]*((rrc_y**rstoi).prod(axis=1))
+	
+	if (eqn_num[1] > 0 and num_asb > 0): # summed over particle size bins
+		y_aq = (y[num_comp:num_comp*(num_asb+1)]).reshape(num_asb, num_comp)
+		rrc_y = np.ones((num_asb, rindx_aq.shape[0]*rindx_aq.shape[1]))
+		rrc_y[:, y_arr_aq] = y_aq[:, y_rind_aq]
+		rrc_y = rrc_y.reshape(num_asb, rindx_aq.shape[0], rindx_aq.shape[1], order = 'C')
+		rr[eqn_num[0]::] = (rrc[eqn_num[0]::]*((rrc_y**rstoi_aq).prod(axis=2))).sum(axis=0)
+	
+	return(rr)
+
+def flux_rec(y0, y, tnew, sumt, rrc, rindx, rstoi, y_arr, y_rind, rindx_aq, 
+	rstoi_aq, y_arr_aq, y_rind_aq, eqn_num, num_comp, num_asb, comp_namelist, 
+	y_mw, NA, H2Oi, self):
+
+	# inputs: ----------------------------------------------------------
+	# y0 - concentrations at start of time step (# molecules/cm3)
+	# y - concentrations at end of time step (# molecules/cm3)
+	# tnew - time step (s)
+	# sumt - time through simulation at start of time step (s)
+	# see rr_calc for reaction inputs
+	# comp_namelist - chemical scheme names of components
+	# y_mw - molar mass of components (g/mol)
+	# NA - Avogadro's constant (molecules/mol)
+	# H2Oi - index of water
+	# self.red_trgt - target components (see mech_red)
+	# self.seedi - index of seed components
+	# ------------------------------------------------------------------
+	
+	# integrated flux over time step (# molecules/cm3), from the 
+	# mean of the reaction rates at the start and end of the step
+	rr = (rr_calc(y0, rrc, rindx, rstoi, y_arr, y_rind, rindx_aq, rstoi_aq, 
+		y_arr_aq, y_rind_aq, eqn_num, num_comp, num_asb) + 
+		rr_calc(y, rrc, rindx, rstoi, y_arr, y_rind, rindx_aq, rstoi_aq, 
+		y_arr_aq, y_rind_aq, eqn_num, num_comp, num_asb))/2.
+	if (len(self.flux_int) == 0):
+		self.flux_int = np.zeros((len(rr)))
+	self.flux_int += rr*tnew
+	
+	# particle-phase mass concentration of components (ug/m3), excluding
+	# water and seed
+	pmass = ((y[num_comp:num_comp*(num_asb+1)]).reshape(num_asb, num_comp).sum(axis=0)/
+		NA)*(np.array((y_mw)).reshape(-1))*1.e12
+	pmass[H2Oi] = 0.; pmass[self.seedi] = 0.
+	if (len(self.red_pmax) == 0):
+		self.red_pmax = np.zeros((num_comp))
+	self.red_pmax = np.maximum(self.red_pmax, pmass)
+	
+	# target concentrations (# molecules/cm3 for gas, ug/m3 for SOA)
+	trak = [sumt+tnew]
+	for trgt in self.red_trgt:
+		if (trgt == 'SOA'):
+			trak.append(pmass.sum())
+		else:
+			trak.append(y[comp_namelist.index(trgt)])
+	self.red_trak.append(trak)
+	
+	return(self)
+
+def soa_comp(pmax, comp_namelist, self):
+
+	# inputs: ----------------------------------------------------------
+	# pmax - maximum particle-phase mass concentration of components 
+	#	through reference simulation (ug/m3)
+	# comp_namelist - chemical scheme names of components
+	# self.red_thr - fraction of particle-phase mass that may be lost
+	# ------------------------------------------------------------------
+	
+	if (len(pmax) == 0): # no particle phase
+		return([])
+	
+	# the largest contributors that together account for all but 
+	# the threshold fraction of particle-phase mass
+	pmax = pmax[0:len(comp_namelist)] # components of chemical scheme
+	order = np.argsort(pmax)[::-1]
+	cum = np.cumsum(pmax[order])
+	if (cum[-1] <= 0.):
+		return([])
+	ncomp = int(np.searchsorted(cum, (1.-self.red_thr)*cum[-1]))+1
+	
+	return([comp_namelist[i] for i in order[0:ncomp] if pmax[i] > 0.])
+
+def drg(flux, mech, RO2_names, trgt_indx, thr):
+
+	# inputs: ----------------------------------------------------------
+	# flux - integrated flux through each reaction (# molecules/cm3), 
+	#	gas-phase followed by aqueous-phase
+	# mech - dictionary of the parsed mechanism (see eqn_pars.mech_names)
+	# RO2_names - names of components in the peroxy radical pool
+	# trgt_indx - index of components to keep
+	# thr - threshold of relation between components
+	# ------------------------------------------------------------------
+	
+	comp_num = mech['comp_num']
+	comp_namelist = mech['comp_namelist']
+	eqn_num = mech['eqn_num']
+	neqn = eqn_num[0]+eqn_num[1]
+	
+	# reactant and product index and stoichiometries per reaction
+	# (gas-phase followed by aqueous-phase)
+	r_eqn = []; r_comp = []; r_stoi = []
+	p_eqn = []; p_comp = []; p_stoi = []
+	for [ph, eqn_st, neq] in [['g', 0, eqn_num[0]], ['aq', eqn_num[0], eqn_num[1]]]:
+		nreac = mech[str('nreac_' + ph)]; nprod = mech[str('nprod_' + ph)]
+		for i in range(neq):
+			r_eqn += [eqn_st+i]*int(nreac[i])
+			r_comp += list(mech[str('rindx_' + ph)][i, 0:nreac[i]])
+			r_stoi += list(mech[str('rstoi_' + ph)][i, 0:nreac[i]])
+			p_eqn += [eqn_st+i]*int(nprod[i])
+			p_comp += list(mech[str('pindx_' + ph)][i, 0:nprod[i]])
+			p_stoi += list(mech[str('pstoi_' + ph)][i, 0:nprod[i]])
+	
+	# net stoichiometry of components (rows) in reactions (columns), 
+	# weighted by integrated reaction flux
+	stoi = SP.csr_matrix((np.array(p_stoi+[-s for s in r_stoi]), 
+		(np.array(p_comp+r_comp).astype(int), np.array(p_eqn+r_eqn).astype(int))), 
+		shape=(comp_num, neqn))
+	prod = abs(stoi.multiply(np.abs(flux).reshape(1, -1))).tocsr()
+	
+	# dependence of reactions (rows) on components (columns), as 
+	# reactants or, for reactions with the peroxy radical pool in their 
+	# rate coefficient, as peroxy radicals
+	dep_eqn = list(r_eqn); dep_comp = list(r_comp)
+	RO2_indx = [comp_namelist.index(comp) for comp in RO2_names if comp in comp_namelist]
+	reac_coef = list(mech['reac_coef_g'])+list(mech['reac_coef_aq'])
+	for i in range(neqn):
+		if (re.search(r'\bRO2\b', reac_coef[i]) is not None):
+			dep_eqn += [i]*len(RO2_indx); dep_comp += RO2_indx
+	dep = SP.csr_matrix((np.ones((len(dep_eqn))), (np.array(dep_eqn).astype(int), 
+		np.array(dep_comp).astype(int))), shape=(neqn, comp_num))
+	dep.data[:] = 1. # repeated entries count once
+	
+	# relation of components (rows) to components (columns) they depend
+	# on, as fraction of the flux through the row component
+	rel = (prod.dot(dep)).tocsr()
+	prod_tot = np.array(prod.sum(axis=1)).reshape(-1)
+	prod_tot[prod_tot == 0.] = 1.
+	rel = SP.diags(1./prod_tot).dot(rel).tocsr()
+	rel.data[rel.data < thr] = 0.
+	rel.eliminate_zeros()
+	
+	# reactions (and components) of all reactants and products
+	all_eqn = np.array(r_eqn+p_eqn).astype(int)
+	all_comp = np.array(r_comp+p_comp).astype(int)
+	
+	# components reachable from targets through relations above threshold
+	keep = np.zeros((comp_num)).astype(bool)
+	
+	while True:
+		
+		# search from targets
+		stack = [i for i in trgt_indx if not keep[i]]
+		keep[stack] = True
+		while (len(stack) > 0):
+			i = stack.pop()
+			for j in rel.indices[rel.indptr[i]:rel.indptr[i+1]]:
+				if not keep[j]:
+					keep[j] = True
+					stack.append(j)
+		
+		# reactions with all dependencies kept
+		eqn_keep = (dep.dot((~keep).astype(float)) == 0.)
+		
+		# every kept component must still appear in a kept reaction,
+		# if not then keep the reaction with largest flux that it
+		# appears in, and the dependencies of that reaction
+		in_eqn = np.zeros((comp_num)).astype(bool)
+		in_eqn[all_comp[eqn_keep[all_eqn]]] = True
+		miss = np.where(keep & ~in_eqn)[0]
+		if (len(miss) == 0):
+			break
+		trgt_indx = []
+		for i in miss:
+			eqn_i = all_eqn[all_comp == i]
+			eqn_i = eqn_i[np.argmax(np.abs(flux[eqn_i]))]
+			trgt_indx += list(dep[eqn_i, :].indices)
+	
+	# components in the reduced scheme (reactants and products of kept 
+	# reactions)
+	comp_indx = np.where(in_eqn)[0]
+	
+	return(comp_indx, eqn_keep)
+
+def red_write(eqn_list, aqeqn_list, eqn_keep, comp_red, comp_use, self):
+
+	# inputs: ----------------------------------------------------------
+	# eqn_list - gas-phase reaction lines of the chemical scheme
+	# aqeqn_list - aqueous-phase reaction lines of the chemical scheme
+	# eqn_keep - whether to keep each reaction (gas- then aqueous-phase)
+	# comp_red - names of components in the reduced scheme
+	# comp_use - names of components in the original scheme
+	# self.sch_name - file name of chemical scheme
+	# self.xml_name - name of xml file
+	# ------------------------------------------------------------------
+	
+	# the reduced files have their own names, so that results of the 
+	# simulation with them are saved separately from the reference
+	sch_red = red_name(self.sch_name)
+	xml_red = red_name(self.xml_name)
+	os.makedirs(os.path.dirname(sch_red), exist_ok=True)
+	
+	# reaction lines to remove, counted in case of repeated reactions
+	eqn_all = eqn_list+aqeqn_list
+	drop = collections.Counter([eqn_all[i] for i in range(len(eqn_all)) if not eqn_keep[i]])
+	
+	# copy the chemical scheme without removed reactions, other lines 
+	# (e.g. generic rate coefficients and peroxy radical list) are 
+	# kept, with peroxy radicals not in the reduced scheme ignored on 
+	# reading
+	with open(self.sch_name, mode='r') as f:
+		total_list_eqn = f.readlines()
+	with open(sch_red, mode='w') as f:
+		for line in total_list_eqn:
+			if (drop[line.strip()] > 0):
+				drop[line.strip()] -= 1
+				continue
+			f.write(line)
+	
+	# xml entries of the reduced scheme, and entries not used by the 
+	# original scheme (e.g. seed components)
+	[err_mess, index] = xml_interr.xml_index(self.xml_name, None)
+	comp_red = set(comp_red)
+	with open(xml_red, mode='w') as f:
+		f.write('<?xml version="1.0" encoding="UTF-8"?>\n<mechanism>\n<species_defs>\n')
+		cnt = 1
+		for [name, smil] in index:
+			if (name in comp_use and name not in comp_red):
+				continue
+			f.write(str('<species species_number="s' + str(cnt) + '" species_name="' + name + '">\n'))
+			if smil is not None:
+				f.write(str('<smiles>' + smil + '</smiles>\n'))
+			f.write('</species>\n')
+			cnt += 1
+		f.write('</species_defs>\n</mechanism>\n')
+	
+	return(sch_red, xml_red)
+
+def red_name(file_name):
+
+	# inputs: ----------------------------------------------------------
+	# file_name - path to chemical scheme or xml file
+	# ------------------------------------------------------------------
+	
+	# path to the reduced version, in a folder called reduced beside the
+	# original, with _reduced appended to the name
+	[stem, ext] = os.path.splitext(os.path.basename(file_name))
+	red_dir = os.path.join(os.path.dirname(os.path.abspath(file_name)), 'reduced')
+	
+	return(os.path.join(red_dir, str(stem + '_reduced' + ext)))
+
+def sav_path(sch_name, sav_nam):
+
+	# inputs: ----------------------------------------------------------
+	# sch_name - path to chemical scheme file
+	# sav_nam - name of folder to save results to
+	# ------------------------------------------------------------------
+	
+	# saving path (copied from saving module)
+	dir_path = os.getcwd() # current working directory
+	output_root = 'PyCHAM/output'
+	filename = os.path.basename(sch_name)
+	filename = os.path.splitext(filename)[0]
+	
+	return(os.path.join(dir_path, output_root, filename, sav_nam))
+
+def red_main(sch_name, xml_name, inname):
+
+	# inputs: ----------------------------------------------------------
+	# sch_name - path to chemical scheme file
+	# xml_name - path to xml file
+	# inname - path to model variables file
+	# ------------------------------------------------------------------
+	
+	class PyCHAM_red: # stands in for the GUI as reference to PyCHAM
+		class l80: # setup status label, messages printed instead
+			def setText(mess):
+				print(mess)
+			def setStyleSheet(*args):
+				return()
+	
+	self = PyCHAM_red()
+	
+	# default model variables, updated by those in the model variables 
+	# file, stored in pickle.pkl ready for simulation
+	import def_mod_var
+	import mod_var_read
+	def_mod_var.def_mod_var(0, self)
+	[self.sch_name, self.xml_name, self.inname] = [sch_name, xml_name, inname]
+	mod_var_read.mod_var_read(self)
+	if (self.bd_st == 1 or self.bd_st == 2): # error reading model variables
+		return('Error reading model variables', self)
+	
+	mess = ''
+	prog_last = -10.
+	for prog in mech_red(self): # reduce, reporting messages and progress
+		if (isinstance(prog, str)):
+			mess = prog
+			print(mess)
+			if (mess[0:5] == 'Error'):
+				break
+		elif (prog >= prog_last+10.):
+			prog_last = prog
+			print(str('Mechanism reduction progress: ' + '%.0f' % prog + ' %'))
+	
+	return(mess, self)
+
+if __name__ == '__main__': # reduce chemical scheme given on command line
+	
+	if (len(sys.argv) != 4):
+		print('Please call from the PyCHAM home folder with the paths to the chemical scheme, xml and model variables files: python PyCHAM/mech_red.py chemical_scheme xml_file model_variables')
+	else:
+		red_main(os.path.abspath(sys.argv[1]), os.path.abspath(sys.argv[2]), 
+			os.path.abspath(sys.argv[3]))
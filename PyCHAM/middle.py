@@ -27,6 +27,7 @@ import user_input as ui
 import init_conc
 import prop_calc
 import partit_var_prep
+import prop_db
 import pp_intro
 import time
 import save
@@ -113,6 +114,11 @@ def middle(self): # define function
 	if (err_mess != ''): # if error raised or in testing mode then stop
 		yield err_mess
 	
+	# report use of the component property database
+	mess = prop_db.stats_mess()
+	if (mess != ''):
+		yield mess
+	
 	# prepare particle phase and wall
 	[y, N_perbin, x, Varr, Vbou, rad0, Vol0, rbou, MV, num_sb, nuc_comp, 
 	rbou00, ub_rad_amp, np_sum, C_p2w] = pp_intro.pp_intro(y, num_comp, Pybel_objects, self.TEMP[0],
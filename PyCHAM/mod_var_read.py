@@ -321,7 +321,10 @@ def mod_var_read(self):
 				if (value.strip()): self.lon = float(value.strip())
 
 			if key == 'act_flux_file' and (value.strip()): # for indoor actinic flux
-				self.af_path = str(os.getcwd() + '/PyCHAM/photofiles/' + value.strip())
+				if (value.strip() == 'nat_act_flux'): # modelled natural actinic flux
+					self.af_path = 'nat_act_flux'
+				else:
+					self.af_path = str(os.getcwd() + '/PyCHAM/photofiles/' + value.strip())
 
 			if key == 'DayOfYear' and (value.strip()):
 				self.dayOfYear = int(value.strip())		
@@ -379,6 +382,21 @@ def mod_var_read(self):
 			if key == 'tracked_comp' and (value.strip()): # names of components whose tendency to change will be tracked
 				self.dydt_trak = [str(i).strip() for i in (value.split(','))]
 
+			if key == 'red_targets' and (value.strip()): # names of components the reduced chemical scheme must reproduce
+				self.red_trgt = [str(i).strip() for i in (value.split(','))]
+
+			if key == 'red_thresh' and (value.strip()): # threshold for relations between components in chemical scheme reduction
+				self.red_thr = float(value.strip())
+
+			if key == 'red_tol' and (value.strip()): # tolerance for deviation of reduced simulation from reference
+				self.red_tol = float(value.strip())
+
+			if key == 'vbs_lump' and (value.strip()): # whether to lump particle- and wall-phase organics
+				self.vbs_lump = int(value.strip())
+
+			if key == 'prop_workers' and (value.strip()): # number of processes for estimating component properties
+				self.prop_workers = int(value.strip())
+
 			if key == 'dens_Comp' and (value.strip()):
 				dens_comp = [str(i).strip() for i in (value.split(','))]
 
@@ -433,6 +451,9 @@ def mod_var_read(self):
 			if key == 'coag_on' and (value.strip()): # marker for whether to model coagulation
 				coag_on = int(value.strip())
 
+			if key == 'coag_tol' and (value.strip()): # relative change below which coagulation kernel reused
+				self.coag_tol = float(value.strip())
+
 			if key == 'inflectDp' and (value.strip()): # diameter at which wall deposition of particles inflection occurs
 				inflectDp = float(value.strip())
 
@@ -480,14 +501,6 @@ def mod_var_read(self):
 					erh_str = -1 # will cause error message
 		
 		
-		# UManSysProp check ----------------------------------
-		# for UManSysProp if no update requested, check that there 
-		# is an existing UManSysProp folder
-		if (uman_up == 0): # check for existing umansysprop folder
-			if not os.path.isdir(os.getcwd() + '/umansysprop'): # if no existing folder then force update
-				uman_up = 1
-		# -------------------------------------------
-		
 		# update model variables message in GUI
 		if (err_mess != ''): # if error message occurs
 			# update error message
@@ -0,0 +1,72 @@
+##########################################################################################
+#                                                                                        											 #
+#    Copyright (C) 2018-2022 Simon O'Meara : simon.omeara@manchester.ac.uk                  				 #
+#                                                                                       											 #
+#    All Rights Reserved.                                                                									 #
+#    This file is part of PyCHAM                                                         									 #
+#                                                                                        											 #
+#    PyCHAM is free software: you can redistribute it and/or modify it under              						 #
+#    the terms of the GNU General Public License as published by the Free Software       					 #
+#    Foundation, either version 3 of the License, or (at your option) any later          						 #
+#    version.                                                                            										 #
+#                                                                                        											 #
+#    PyCHAM is distributed in the hope that it will be useful, but WITHOUT                						 #
+#    ANY WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS       			 #
+#    FOR A PARTICULAR PURPOSE.  See the GNU General Public License for more              				 #
+#    details.                                                                            										 #
+#                                                                                        											 #
+#    You should have received a copy of the GNU General Public License along with        					 #
+#    PyCHAM.  If not, see <http://www.gnu.org/licenses/>.                                 							 #
+#                                                                                        											 #
+##########################################################################################
+'''registry of Pybel objects shared by SMILES'''
+# constructing Pybel objects with Open Babel is expensive and most are 
+# only needed for estimating component properties, so objects are 
+# created on first use and held here by SMILES, so that components 
+# (and modules) with the same SMILES share one object
+
+import pybel # for converting SMILE strings to pybel objects
+
+# Pybel objects created so far, keyed by SMILES
+mol_dict = {}
+
+def mol(smiles):
+
+	# inputs: ----------------------------------------------------
+	# smiles - SMILE string of component
+	# ------------------------------------------------------------
+
+	try:
+		return(mol_dict[smiles])
+	except KeyError: # not created yet
+		Pybel_object = pybel.readstring('smi', smiles)
+		mol_dict[smiles] = Pybel_object
+		return(Pybel_object)
+
+class mol_list:
+	'''sequence of Pybel objects for a list of SMILES, with each 
+	object only created when first indexed'''
+
+	def __init__(self, smiles):
+
+		# inputs: ----------------------------------------------------
+		# smiles - SMILE strings of components
+		# ------------------------------------------------------------
+
+		self.smiles = list(smiles)
+
+	def __len__(self):
+		return(len(self.smiles))
+
+	def __getitem__(self, i):
+		
+		if isinstance(i, slice):
+			return([mol(smil) for smil in self.smiles[i]])
+		return(mol(self.smiles[i]))
+
+	def __iter__(self):
+		for smil in self.smiles:
+			yield mol(smil)
+
+	def __reduce__(self): # pickle as SMILES only
+		return(mol_list, (self.smiles,))
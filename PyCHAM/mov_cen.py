@@ -74,23 +74,19 @@ def mov_cen_main(n0, s0, sbn, nc, MW, x, Vol0, t, C0, MV,
 	if (self.wall_on == 1):
 		y[-nc::] = res[-nc::]
 		
-	# empty array for holding new particle number concentrations
-	N_perbin = np.zeros((sbn, 1))
-	
 	# if volume condition met, then redistribute particles and components based on
-	# the new volume
-	for sbi in range(sbn): # size bin loop
-		
-		sbi_new = sum(Vnew[sbi]>s0[1::]) # index of size bin these particles fit now
-		
-		# add number concentration (# particles/cc (air))
-		N_perbin[sbi_new, 0] += n0[sbi]
-		# add components (molecules/cc (air))
-		y[((sbi_new+1)*nc):((sbi_new+2)*nc)] += res[((sbi+1)*nc):((sbi+2)*nc)]
+	# the new volume: index of size bin these particles fit now
+	sbi_new = np.searchsorted(s0[1::], Vnew[0:sbn], side='left')
+	
+	# add number concentration (# particles/cc (air))
+	N_perbin = np.bincount(sbi_new, weights=np.ravel(n0)[0:sbn], 
+		minlength=sbn).reshape(sbn, 1)
+	
+	# add components (molecules/cc (air)), with size bins in rows and components
+	# in columns (a view of y)
+	num_molec_new = y[nc:nc*(sbn+1)].reshape(sbn, nc)
+	np.add.at(num_molec_new, sbi_new, res[nc:nc*(sbn+1)].reshape(sbn, nc))
 	
-	# reshape particle-phase concentrations into components in rows and size bins in
-	# columns
-	num_molec_new = (y[nc:nc*(sbn+1)].reshape(sbn, nc))
 	# need to find new volumes of single particles (um3)
 	# total volume of components 
 	# ((um3 (all particles)/cc (air))/(particle number/cc (air))) 
@@ -100,13 +96,14 @@ def mov_cen_main(n0, s0, sbn, nc, MW, x, Vol0, t, C0, MV,
 	# then sum volume of components per size bin to get ug3 (all particles)/cm3 (air)
 	ish = N_perbin[:, 0]> 0.
 	Vsing = np.zeros((sbn))
-	
-	for sbi in range(sbn): # size bin loop
-		if (N_perbin[sbi, 0] > 0.): # single particle volume (um3) if particles present
-			Vsing[sbi] = np.sum(((y[nc*(sbi+1):nc*(sbi+2)]/(NA*N_perbin[sbi, :]))*(MV[:, 0]*1.e12)), 0)
+	# single particle volume (um3) if particles present
+	Vsing[ish] = num_molec_new[ish, :].dot(MV[:, 0]*1.e12)/(NA*N_perbin[ish, 0])
 	
 	Vsing[N_perbin[:, 0]<1.e-20] = Vol0[N_perbin[:, 0]<1.e-20] # assume volume at size bin centre
 	
 	rad = ((3.*Vsing)/(4.*np.pi))**(1./3.) # new radius per size bin (um)
 		   
+	# new particle number concentration per size bin (# particles/cc (air)), single
+	# particle volumes (um3), concentrations (molecules/cc (air)), radii (um) and 
+	# time step flags
 	return(N_perbin, Vsing, y, rad, redt, t, ic_red)
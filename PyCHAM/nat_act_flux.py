@@ -197,7 +197,7 @@ def nat_act_flux(A, a, F0, theta, tau, callf, mu0, NL, g, Pfunc_text):
 	f = open('PyCHAM/scatt_Pfunc.py', mode='w')
 	f.write('##########################################################################################\n')
 	f.write('#                                                                                        											 #\n')
-	f.write('#    Copyright (C) 2018-2022 Simon O'Meara : simon.omeara@manchester.ac.uk                  				 #\n')
+	f.write('#    Copyright (C) 2018-2022 Simon O\'Meara : simon.omeara@manchester.ac.uk                  				 #\n')
 	f.write('#                                                                                       											 #\n')
 	f.write('#    All Rights Reserved.                                                                									 #\n')
 	f.write('#    This file is part of PyCHAM                                                         									 #\n')
@@ -552,4 +552,217 @@ def nat_act_flux(A, a, F0, theta, tau, callf, mu0, NL, g, Pfunc_text):
 		
 		return(Fdown, Fup, Gdown)
 	
-	return(L, atmosA)
\ No newline at end of file
+	return(L, atmosA)
+
+def act_flux_calc(A, a, F0, tau, g, mu0):
+
+	# inputs: ---------------------------------------------
+	# A - surface (ground) albedo (fraction 0-1)
+	# a - single scattering albedo per vertical layer (fraction 0-1)
+	#	with one column per vertical layer (top of atmosphere first) and
+	#	either one row or one row per wavelength
+	# F0 - top-of-the-atmosphere actinic flux per wavelength 
+	#	(photon/cm2/nm/s)
+	# tau - optical depth of each vertical layer of atmosphere 
+	#	(not cumulative), with one row per wavelength and one column 
+	#	per vertical layer (top of atmosphere first)
+	# g - scattering asymmetry factor per vertical layer, with the same
+	#	shape options as a
+	# mu0 - cosine of solar zenith angles (1D array)
+	# -------------------------------------------------------
+	
+	# the two-stream solution of Shettle and Weinman (1970) for all
+	# solar zenith angles and wavelengths at once, note that their
+	# incident flux is pi*F0, whilst F0 here is the flux
+	# arriving perpendicular to the beam, hence the division by pi
+	# below
+
+	NL = tau.shape[1] # number of vertical layers
+	nwl = tau.shape[0] # number of wavelengths
+	nmu = len(mu0) # number of solar zenith angles
+	
+	# ensure layer properties have a row per wavelength
+	a = np.ones((nwl, NL))*a
+	g = np.ones((nwl, NL))*g
+	
+	# shape everything as (zenith angle, wavelength, layer)
+	mu = mu0.reshape(-1, 1, 1)
+	Fi = (F0/np.pi).reshape(1, -1, 1)
+	# cumulative optical depth at the bottom of each layer
+	tau_c = (np.cumsum(tau, axis=1)).reshape(1, nwl, NL)
+	
+	# direct (unscattered) actinic flux at Earth surface (photon/cm2/nm/s)
+	act_dir = F0.reshape(1, -1)*np.exp(-tau_c[:, :, -1]/mu0.reshape(-1, 1))
+
+	if (np.all(a == 1.)): # conservative atmosphere
+		
+		# Eq. 18 of Shettle and Weinman (1970), integrated over 
+		# atmosphere depth
+		T = (np.cumsum((1.-g)*tau, axis=1))[:, -1].reshape(1, -1)
+		mu = mu0.reshape(-1, 1)
+		Fi = Fi[:, :, 0]
+		tau_s = tau_c[:, :, -1]
+		# Eq. 17a of Shettle and Weinman (1970)
+		B2 = (3.*mu*Fi*(1.-A)*(2.+3.*mu+(2.-3.*mu)*np.exp(-tau_s/mu)))/(4.*(4.+3.*(1.-A)*T))
+		# Eq. 17b of Shettle and Weinman (1970)
+		B1 = ((3.*mu**2.)/4.+mu/2.)*Fi-2.*B2/3.
+		# Eq. 16a of Shettle and Weinman (1970) for radiance at surface
+		I0 = B1-(3./4.)*mu**2.*Fi*np.exp(-tau_s/mu)-B2*T
+		
+	else: # non-conservative atmosphere
+		
+		# avoid the singularity of a = 1 in the non-conservative solution
+		a = np.minimum(a, 1.-1.e-9).reshape(1, nwl, NL)
+		g = g.reshape(1, nwl, NL)
+	
+		# constants below Eq. 12 of Shettle and Weinman (1970)
+		k = (3.*(1.-a)*(1.-a*g))**(1./2.)
+		p = (3.*(1.-a)/(1.-a*g))**(1./2.)
+		# avoid the singularity where k*mu0 = 1
+		den = 4.*(1.-k**2.*mu**2.)
+		den[np.abs(den) < 1.e-12] = 1.e-12
+		alp = 3.*a*Fi*mu**2.*(1.+g*(1.-a))/den
+		bet = 3.*a*Fi*mu*(1.+3.*g*(1.-a)*mu**2)/den
+		
+		# batched matrices for the Ax=B problem (one per zenith 
+		# angle and wavelength), unknowns are C1 and C2 per layer
+		Amat = np.zeros((nmu, nwl, NL*2, NL*2))
+		Barr = np.zeros((nmu, nwl, NL*2))
+		
+		# Eq. 13 Shettle and Weinman (1970) for top of atmosphere
+		Amat[:, :, 0, 0] = 1.+2.*p[:, :, 0]/3.
+		Amat[:, :, 0, 1] = 1.-2.*p[:, :, 0]/3.
+		Barr[:, :, 0] = alp[:, :, 0]+2.*bet[:, :, 0]/3.
+		
+		# Eqs. 12a, 12b and 15a Shettle and Weinman (1970) for 
+		# continuity across the boundaries between layers
+		for NLi in range(NL-1):
+			
+			tb = tau_c[:, :, NLi] # optical depth at this boundary
+			eab = np.exp(-tb/mu[:, :, 0]) # direct beam attenuation
+			r = NLi*2+1 # matrix row for this boundary
+			
+			Amat[:, :, r, NLi*2] = np.exp(-k[:, :, NLi]*tb)
+			Amat[:, :, r, NLi*2+1] = np.exp(k[:, :, NLi]*tb)
+			Amat[:, :, r, NLi*2+2] = -np.exp(-k[:, :, NLi+1]*tb)
+			Amat[:, :, r, NLi*2+3] = -np.exp(k[:, :, NLi+1]*tb)
+			Barr[:, :, r] = (alp[:, :, NLi]-alp[:, :, NLi+1])*eab
+			
+			Amat[:, :, r+1, NLi*2] = p[:, :, NLi]*np.exp(-k[:, :, NLi]*tb)
+			Amat[:, :, r+1, NLi*2+1] = -p[:, :, NLi]*np.exp(k[:, :, NLi]*tb)
+			Amat[:, :, r+1, NLi*2+2] = -p[:, :, NLi+1]*np.exp(-k[:, :, NLi+1]*tb)
+			Amat[:, :, r+1, NLi*2+3] = p[:, :, NLi+1]*np.exp(k[:, :, NLi+1]*tb)
+			Barr[:, :, r+1] = (bet[:, :, NLi]-bet[:, :, NLi+1])*eab
+		
+		# Eq. 14 Shettle and Weinman (1970) for Earth surface
+		ts = tau_c[:, :, -1] # optical depth at surface
+		Amat[:, :, -1, -2] = (1.-A-2.*(1.+A)*p[:, :, -1]/3.)*np.exp(-k[:, :, -1]*ts)
+		Amat[:, :, -1, -1] = (1.-A+2.*(1.+A)*p[:, :, -1]/3.)*np.exp(k[:, :, -1]*ts)
+		Barr[:, :, -1] = ((1.-A)*alp[:, :, -1]-2.*(1.+A)*bet[:, :, -1]/3.+A*mu[:, :, 0]*Fi[:, :, 0])*np.exp(-ts/mu[:, :, 0])
+		
+		# solve all simultaneous equations in one call
+		x = np.linalg.solve(Amat, Barr[..., np.newaxis])[..., 0]
+		
+		# Eq. 12a Shettle and Weinman (1970) for radiance at surface
+		I0 = x[:, :, -2]*np.exp(-k[:, :, -1]*ts)+x[:, :, -1]*np.exp(k[:, :, -1]*ts)-alp[:, :, -1]*np.exp(-ts/mu[:, :, 0])
+	
+	# total actinic flux at surface (photon/cm2/nm/s), with the diffuse 
+	# part being 4pi times the isotropic radiance of the Eddington 
+	# approximation (Madronich (1987))
+	act = act_dir+4.*np.pi*np.maximum(I0, 0.)
+	
+	return(act)
+
+def act_flux_tab(self):
+
+	# inputs: ---------------------------------------------
+	# self - reference to PyCHAM, attributes below are optional and 
+	#	overwrite the defaults used here:
+	# self.nat_act_wl - wavelengths (nm)
+	# self.nat_act_F0 - top-of-the-atmosphere actinic flux per 
+	#	wavelength (photon/cm2/nm/s)
+	# self.nat_act_tau - optical depth per wavelength (rows) and
+	#	vertical layer (columns)
+	# self.nat_act_A - surface albedo (fraction 0-1)
+	# self.nat_act_a - single scattering albedo per vertical layer
+	# self.nat_act_g - scattering asymmetry factor per vertical layer
+	# -------------------------------------------------------
+	
+	# tabulates natural actinic flux at Earth surface over a grid of
+	# solar zenith angles, so that during simulations the actinic flux
+	# is found by interpolation rather than radiative transfer
+	
+	if hasattr(self, 'nat_act_wl'):
+		wl = np.array((self.nat_act_wl)).reshape(-1)
+	else: # wavelengths relevant to tropospheric photolysis (nm)
+		wl = np.arange(280., 701.)
+	
+	if hasattr(self, 'nat_act_F0'):
+		F0 = np.array((self.nat_act_F0)).reshape(-1)
+	else:
+		# top-of-the-atmosphere spectrum approximated by a black 
+		# body at the solar effective temperature (5778 K), scaled to 
+		# the Earth-Sun distance (photon/cm2/nm/s)
+		h = 6.62607015e-34 # Planck constant (J.s)
+		c = 2.99792458e8 # speed of light (m/s)
+		kB = 1.380649e-23 # Boltzmann constant (J/K)
+		wlm = wl*1.e-9 # wavelength (m)
+		# spectral photon radiance (photon/m2/m/s/sr)
+		Lp = (2.*c/wlm**4.)/(np.exp(h*c/(wlm*kB*5778.))-1.)
+		# solid angle of Sun from Earth (sr) then conversion to 
+		# photon/cm2/nm/s
+		F0 = Lp*6.794e-5*1.e-4*1.e-9
+	
+	if hasattr(self, 'nat_act_tau'):
+		tau = np.array((self.nat_act_tau))
+		if (tau.ndim == 1):
+			tau = tau.reshape(-1, 1)
+	else:
+		# single layer with Rayleigh optical depth (wavelength in um)
+		tau = (0.0088*(wl*1.e-3)**(-4.05)).reshape(-1, 1)
+	
+	A = getattr(self, 'nat_act_A', 0.1)
+	a = np.array((getattr(self, 'nat_act_a', 1.)))
+	g = np.array((getattr(self, 'nat_act_g', 0.)))
+	
+	# zenith angle grid (radians), stopping just short of 90 degrees 
+	# where the two-stream approximation breaks down
+	theta_grid = np.linspace(0., 89.5, 180)*np.pi/180.
+	
+	act_tab = act_flux_calc(A, a, F0, tau, g, np.cos(theta_grid))
+	
+	# store table with its inputs
+	self.nat_act_tab = [theta_grid, wl, act_tab]
+	
+	return(self)
+
+def act_flux_interp(cosx, self):
+
+	# inputs: ---------------------------------------------
+	# cosx - cosine of current solar zenith angle
+	# self - reference to PyCHAM
+	# -------------------------------------------------------
+	
+	# prepare the table if not yet done for this simulation
+	if not hasattr(self, 'nat_act_tab'):
+		self = act_flux_tab(self)
+	
+	[theta_grid, wl, act_tab] = self.nat_act_tab
+	
+	if (cosx <= 0.): # sun below horizon
+		return(wl, np.zeros((len(wl))))
+	
+	theta = np.arccos(min(cosx, 1.)) # solar zenith angle (radians)
+	
+	# beyond table, fall back to final angle, scaled down to zero
+	# at the horizon
+	if (theta >= theta_grid[-1]):
+		fac = (np.pi/2.-theta)/(np.pi/2.-theta_grid[-1])
+		return(wl, act_tab[-1, :]*fac)
+	
+	# linear interpolation between neighbouring zenith angles
+	ti = np.searchsorted(theta_grid, theta, side='right')-1
+	w = (theta-theta_grid[ti])/(theta_grid[ti+1]-theta_grid[ti])
+	act = act_tab[ti, :]*(1.-w)+act_tab[ti+1, :]*w
+	
+	return(wl, act)
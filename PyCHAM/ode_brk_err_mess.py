@@ -146,15 +146,16 @@ def ode_brk_err_mess(y0, neg_names, rindx, y_arr, y_rind, rstoi,
 	if (eqn_num[1] > 0):# if particle-phase reactions present
 
 		# particle-phase reactions -------------------------
-		# tile aqueous-phase reaction rate coefficients
-		rr_aq = np.tile(rrc[rindx.shape[0]::], num_asb)
+		# particle-phase concentrations with size bins in rows and 
+		# components in columns
+		y_aq = (y0[num_comp:num_comp*(num_asb+1)]).reshape(num_asb, num_comp)
 		# prepare for aqueous-phase concentrations
-		rrc_y = np.ones((rindx_aq.shape[0]*rindx_aq.shape[1]))
-		rrc_y[y_arr_aq] = y0[y_rind_aq]
-		rrc_y = rrc_y.reshape(rindx_aq.shape[0], rindx_aq.shape[1], order = 'C')
-		# reaction rate (molecules/cc/s) 
-		rr = rr_aq*((rrc_y**rstoi_aq).prod(axis=1))
-		rr = rr.reshape(-1, 1) # allow multiplication across multiple columns
+		rrc_y = np.ones((num_asb, rindx_aq.shape[0]*rindx_aq.shape[1]))
+		rrc_y[:, y_arr_aq] = y_aq[:, y_rind_aq]
+		rrc_y = rrc_y.reshape(num_asb, rindx_aq.shape[0], rindx_aq.shape[1], order = 'C')
+		# reaction rate (molecules/cc/s), size bins in rows
+		rr = rrc[rindx.shape[0]::]*((rrc_y**rstoi_aq).prod(axis=2))
+		rr = rr.reshape(num_asb, -1, 1) # allow multiplication across multiple columns
 		# loss of reactants
 		reac_loss_rate = rr*rstoi_aq # prepare loss values
 		# gain of products
@@ -164,8 +165,8 @@ def ode_brk_err_mess(y0, neg_names, rindx, y_arr, y_rind, rstoi,
 		f.write('Particle-phase reaction fluxes with both size bin numbers and equation numbers starting at 1 (# molecules/cm3/s):\n')
 		for sbi in range(num_asb): # loop through size bins
 			for i in range(eqn_num[1]): # loop through equations
-				f.write(str('size bin ' + str(sbi+1) + ', eq. ' + str(i+1) + ', reac: ' + str(reac_loss_rate[sbi*eqn_num[1]+i, 0:nreac_aq[i]]) + '\n'))
-				f.write(str('size bin ' + str(sbi+1) + ', eq. ' + str(i+1)  + ', prod: ' + str(prod_gain_rate[sbi*eqn_num[1]+i, 0:nprod_aq[i]]) + '\n'))
+				f.write(str('size bin ' + str(sbi+1) + ', eq. ' + str(i+1) + ', reac: ' + str(reac_loss_rate[sbi, i, 0:nreac_aq[i]]) + '\n'))
+				f.write(str('size bin ' + str(sbi+1) + ', eq. ' + str(i+1)  + ', prod: ' + str(prod_gain_rate[sbi, i, 0:nprod_aq[i]]) + '\n'))
 	
 	if (self.wall_on == 1): # include fluxes of trouble components to wall if wall is considered
 		
@@ -44,6 +44,8 @@ except: # in case of a bad function
 		os.remove(ode_solv)
 import ode_solv_wat
 import dydt_rec
+import mech_red
+import vbs_lump
 import importlib
 import save
 import time
@@ -290,6 +292,16 @@ def ode_updater(y, rindx,
 	# start timer
 	st_time = time.time()
 
+	# no coagulation kernel from any previous simulation reused
+	self.coag_cache = {}
+	self.coag_stats = [0, 0, 0] # kernels reused, partially updated and fully calculated
+	# nor particle deposition rates to walls
+	self.wl_cache = {}
+	self.wl_stats = [0, 0, 0] # rates reused, partially updated and fully calculated
+	# nor gas-particle partitioning coefficients and low condensability mask
+	self.kimt_cache = {}
+	self.cutoff_cache = {}
+
 	step_no = 0 # track number of time steps
 	sumt = 0. # track time through simulation (s)
 	self.sumt = 0. # track time through simulation (s)
@@ -367,6 +379,12 @@ def ode_updater(y, rindx,
 	importlib.reload(ode_solv_wat) # import most recent version
 	importlib.reload(dydt_rec) # import most recent version
 
+	# if particle- and wall-phase organics lumped into volatility basis set
+	# bins, prepare the lumped state
+	if (self.vbs_lump == 1 and num_sb > 0):
+		self = vbs_lump.lump_setup(Psat_Pa_rec, y_mw, H2Oi, rindx_aq, pindx_aq, 
+			nreac_aq, nprod_aq, num_comp, num_sb, self)
+
 	while (self.tot_time-sumt) > (self.tot_time/1.e10):
 		
 		# remembering variables at the start of the integration step ------------------------------------------
@@ -575,6 +593,10 @@ def ode_updater(y, rindx,
 				# water gas-particle partitioning
 				kimt[:, H2Oi] = 0.
 			
+			# map components to lumped state
+			if (self.vbs_lump == 1 and num_sb > 0):
+				self = vbs_lump.lump_map(y, self)
+			
 			# model component concentration changes to get new concentrations
 			# (# molecules/cm3 (air))
 			[y, res_t] = ode_solv.ode_solv(y, tnew, rindx, pindx, rstoi, pstoi,
@@ -594,6 +616,10 @@ def ode_updater(y, rindx,
 				H2Oi, comp_namelist, Psat_Pa, Cinfl_nowp_indx, 
 				Cinfl_nowp, self)
 			
+			# disaggregate lumps into their members
+			if (self.vbs_lump == 1 and num_sb > 0):
+				y = vbs_lump.lump_out(y, self)
+			
 			# if any components set to have constant gas-phase 
 			# concentration
 			if (any(self.con_C_indx)): # then keep constant
@@ -646,6 +672,14 @@ def ode_updater(y, rindx,
 				# reset fraction of newly injected seed particles
 				pconcn_frac = 0.
 				gpp_stab = 1 # change to stable flag
+				
+				# if reducing the chemical scheme, record integrated 
+				# reaction fluxes
+				if (self.red_rec == 1):
+					self = mech_red.flux_rec(y0, y, tnew, sumt, rrc, rindx, 
+						rstoi, y_arr, y_rind, rindx_aq, rstoi_aq, y_arr_aq, 
+						y_rind_aq, eqn_num, num_comp, (num_sb-self.wall_on), 
+						comp_namelist, y_mw, NA, H2Oi, self)
 			
 		# end of integration stability condition section ----------------------------
 		step_no += 1 # track number of steps
@@ -710,7 +744,7 @@ def ode_updater(y, rindx,
  							x*2.0e-6, y_mw, 
 							Varr*1.0e-18, (num_sb-self.wall_on), num_comp, temp_now, update_count, 
 							inflectDp, pwl_xpre, pwl_xpro, inflectk, chamR, McMurry_flag, 
-							0, p_char, e_field, (num_sb-self.wall_on), C_p2w)
+							0, p_char, e_field, (num_sb-self.wall_on), C_p2w, self)
 			
 				if (nucv1 > 0.): # nucleation
 					
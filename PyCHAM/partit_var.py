@@ -26,6 +26,7 @@
 import numpy as np
 from part_prop import part_prop
 import scipy.constants as si
+import accom_coeff_calc
 
 def kimt_calc(y, mfp, num_sb, num_comp, accom_coeff, y_mw, surfT, R_gas, TEMP, NA, 
 		y_dens, N_perbin, radius, Psat, therm_sp,
@@ -82,28 +83,13 @@ def kimt_calc(y, mfp, num_sb, num_comp, accom_coeff, y_mw, surfT, R_gas, TEMP, N
 					N_perbin)
 	
 	
-		# Knudsen number (dimensionless)
-		Kn = np.repeat(mfp, (num_sb-self.wall_on), 1)/np.repeat(radius, num_comp, 0)
-	
-		# update accommodation coefficients if necessary
-		# note, using __import__ rather than import allows opening in run time, thereby using
-		# updated module
-		accom_coeff_calc = __import__('accom_coeff_calc')
+		# update accommodation coefficients if necessary, note that 
+		# accom_coeff_calc is reloaded by partit_var_prep when generated
 		accom_coeff_now = accom_coeff_calc.accom_coeff_func(accom_coeff, radius)
 
-		# Non-continuum regime correction 
-		# calculate a correction factor according to the continuum versus non-continuum 
-		# regimes
-		# expression taken from Jacobson et al (2000), page 457, or Jacobson (2005), page 530 
-		# (eq. 16.19).
-		# They reference:
-		# Fuchs and Sutugin 1971
-		# Pruppacher and Klett 1997
-		Inverse_Kn = Kn**-1.
-		correct_1 = (1.33+0.71*Inverse_Kn)/(1.+Inverse_Kn)
-		correct_2 = (4.*(1.-accom_coeff_now))/(3.*accom_coeff_now)
-		correct_3 = 1.e0+(correct_1+correct_2)*Kn
-		correction = correct_3**-1.
+		# gas-phase diffusion coefficient*Fuch-Sutugin correction*particle 
+		# surface (cm3/s), components in rows and size bins in columns
+		kimt = kimt_cache(mfp, DStar_org, radius, N_perbin, accom_coeff_now, self)
 	
 		# kelvin factor for each size bin (excluding wall), eq. 16.33 Jacobson et al. (2005)
 		# note that avMW has units g/mol, surfT (g/s2==mN/m==dyn/cm), R_gas is multiplied by 
@@ -112,15 +98,6 @@ def kimt_calc(y, mfp, num_sb, num_comp, accom_coeff, y_mw, surfT, R_gas, TEMP, N
 		kelv = np.zeros((num_sb-self.wall_on, 1))
 		kelv[ish, 0] = np.exp((2.e0*avMW[ish]*surfT)/(R_gas*1.e7*TEMP*radius[0, ish]*1.e2*tot_rho[ish]))
 	
-		# ------------------------------------------------
-		# gas-phase diffusion coefficient*Fuch-Sutugin correction (cm2/s)
-		# eq. 5 Zaveri et al. (2008)
-		kimt = (DStar_org)*correction
-		# final partitioning coefficient (converting radius from m to cm)
-		# eq. 16.2 of Jacobson (2005) and eq. 5 Zaveri et al. (2008)
-		# components in rows and size bins in columns (/s)
-		kimt = (4.*np.pi*(radius*1.e2)*N_perbin.reshape(1, -1))*kimt
-
 		# zero partitioning coefficient for particle size bins with 
 		# such little number concentration or radius that partitioning 
 		# is relatively tiny
@@ -156,12 +133,8 @@ def kimt_calc(y, mfp, num_sb, num_comp, accom_coeff, y_mw, surfT, R_gas, TEMP, N
 		# zero partitioning to particles for any components with low condensability
 		if (partit_cutoff): # if a value provided (default is empty list)
 
-			# convert partit_cutoff from Pa to molecules/cm3 (air), note README states
-			# that just one value accepted for partit_cutoff input
-			partit_cutoff_Pa = partit_cutoff[0]*(NA/((R_gas*1.e6)*TEMP))
-			highVPi = (Psat*act_coeff) > partit_cutoff_Pa
-			highVPi[:, H2Oi] = 0 # mask water to allow its partitioning
-			kimt[highVPi] = 0.
+			kimt[cutoff_mask(partit_cutoff, NA, R_gas, TEMP, Psat, act_coeff, 
+				H2Oi, self)] = 0.
 	
 	else: # if no particles
 		kimt = np.zeros((num_sb-self.wall_on, num_comp))
@@ -180,4 +153,101 @@ def kimt_calc(y, mfp, num_sb, num_comp, accom_coeff, y_mw, surfT, R_gas, TEMP, N
 	else:
 		kw = kwf
 
-	return(kimt, kelv, kw)
\ No newline at end of file
+	return(kimt, kelv, kw)
+
+# partitioning coefficients reused for size bins with unchanged radius, number
+# concentration and accommodation coefficients
+def kimt_cache(mfp, DStar_org, radius, N_perbin, accom_coeff_now, self):
+
+	# inputs:---------------------------------------------------------------------------
+	# mfp - mean free path of gas molecules (m) (num_comp, 1)
+	# DStar_org - gas-phase diffusion coefficients of components (cm2/s)
+	# radius - particle radius (m)
+	# N_perbin - number of particles per size bin (excluding wall)
+	# accom_coeff_now - accommodation coefficients of components in each size bin
+	# self.kimt_cache - the cached partitioning coefficients and the inputs they
+	#	were calculated with
+	# ------------------------------------------------------------------------------------
+	
+	if not hasattr(self, 'kimt_cache'): # first call
+		self.kimt_cache = {}
+	
+	cc = self.kimt_cache
+	rad = np.array((radius)).reshape(-1)
+	N = np.array((N_perbin)).reshape(-1)
+	accom = np.broadcast_to(accom_coeff_now, (mfp.shape[0], len(rad)))
+	
+	# terms depending only on component properties and temperature, 
+	# recalculated if these have changed
+	if (len(cc) == 0 or cc['rad'].shape != rad.shape or 
+		not np.array_equal(cc['mfp'], mfp) or not np.array_equal(cc['DStar'], DStar_org)):
+		
+		self.kimt_cache = cc = {'mfp': np.array((mfp)), 'DStar': np.array((DStar_org)),
+			# 4*pi*gas-phase diffusion coefficient (cm2/s)
+			'Dfac': 4.*np.pi*np.array((DStar_org)).reshape(-1, 1),
+			'rad': np.array((rad)), 'N': np.array((N)), 'accom': np.array((accom)),
+			'kimt': np.zeros((mfp.shape[0], len(rad)))}
+		ch = np.ones((len(rad))).astype('bool') # all size bins calculated
+	
+	else: # size bins whose radius, number or accommodation coefficients changed
+		ch = (rad != cc['rad'])+(N != cc['N'])+(accom != cc['accom']).any(axis=0)
+		cc['rad'][ch] = rad[ch]
+		cc['N'][ch] = N[ch]
+		cc['accom'][:, ch] = accom[:, ch]
+	
+	if any(ch):
+		# Knudsen number (dimensionless)
+		Kn = mfp.reshape(-1, 1)/rad[ch].reshape(1, -1)
+	
+		# Non-continuum regime correction 
+		# calculate a correction factor according to the continuum versus non-continuum 
+		# regimes
+		# expression taken from Jacobson et al (2000), page 457, or Jacobson (2005), page 530 
+		# (eq. 16.19).
+		# They reference:
+		# Fuchs and Sutugin 1971
+		# Pruppacher and Klett 1997
+		Inverse_Kn = Kn**-1.
+		correct_1 = (1.33+0.71*Inverse_Kn)/(1.+Inverse_Kn)
+		correct_2 = (4.*(1.-accom[:, ch]))/(3.*accom[:, ch])
+		correct_3 = 1.e0+(correct_1+correct_2)*Kn
+		correction = correct_3**-1.
+		
+		# final partitioning coefficient (converting radius from m to cm)
+		# eq. 16.2 of Jacobson (2005) and eq. 5 Zaveri et al. (2008)
+		# components in rows and size bins in columns (/s)
+		cc['kimt'][:, ch] = (cc['Dfac']*correction)*(rad[ch]*1.e2*N[ch]).reshape(1, -1)
+
+	return(cc['kimt'].copy())
+
+# components whose partitioning to particles is zeroed due to low condensability
+def cutoff_mask(partit_cutoff, NA, R_gas, TEMP, Psat, act_coeff, H2Oi, self):
+
+	# inputs:---------------------------------------------------------------------------
+	# partit_cutoff - the product of Psat and act_coeff above which gas-particle 
+	# 		partitioning assumed zero (Pa)
+	# NA - Avogadro's constant (molecules/mol) 
+	# R_gas - the universal gas constant (cm3.Pa/K.mol)
+	# TEMP - current temperature in chamber (K)
+	# Psat - liquid-phase saturation vapour pressures of components (# molecules/cm3 (air))	
+	# act_coeff - activity coefficient of components (dimensionless)
+	# H2Oi - water index (integer)
+	# self.cutoff_cache - the cached mask and the inputs it was calculated with
+	# ------------------------------------------------------------------------------------
+	
+	cc = getattr(self, 'cutoff_cache', {})
+	
+	if (len(cc) > 0 and cc['TEMP'] == TEMP and cc['cutoff'] == partit_cutoff[0] and 
+		np.array_equal(cc['Psat'], Psat) and np.array_equal(cc['act'], act_coeff)):
+		return(cc['mask'])
+	
+	# convert partit_cutoff from Pa to molecules/cm3 (air), note README states
+	# that just one value accepted for partit_cutoff input
+	partit_cutoff_Pa = partit_cutoff[0]*(NA/((R_gas*1.e6)*TEMP))
+	highVPi = (Psat*act_coeff) > partit_cutoff_Pa
+	highVPi[:, H2Oi] = 0 # mask water to allow its partitioning
+	
+	self.cutoff_cache = {'TEMP': TEMP, 'cutoff': partit_cutoff[0], 
+		'Psat': np.array((Psat)), 'act': np.array((act_coeff)), 'mask': highVPi}
+	
+	return(highVPi)
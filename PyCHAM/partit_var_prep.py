@@ -27,6 +27,8 @@
 import numpy as np
 import scipy.constants as si
 import diff_vol_est
+import importlib
+import accom_coeff_calc
 
 def prep(y_mw, TEMP, num_speci, Cw, act_comp, act_user, acc_comp, 
 	accom_coeff_user, comp_namelist, num_sb, num_asb, Pnow, 
@@ -81,8 +83,8 @@ def prep(y_mw, TEMP, num_speci, Cw, act_comp, act_user, acc_comp,
 
 	nv = (Pnow/(si.R*TEMP))*si.N_A # concentration of molecules (# molecules/m3)
 	
-	# get diffusion volumes
-	diff_vol = diff_vol_est.diff_vol_est(Pybel_object)
+	# get diffusion volumes, from the property database if previously estimated
+	diff_vol = diff_vol_est.diff_vol_est(Pybel_object, self)
 	
 	# append water and core (water from Table 4.1 of the Taylor (1993) textbook 
 	# Multicomponent Mass Transfer, ISBN: 0-471-57417-1)
@@ -211,6 +213,7 @@ def prep(y_mw, TEMP, num_speci, Cw, act_comp, act_user, acc_comp,
 	f.write('\n')
 	f.write('	return(accom_coeff)\n')
 	f.close()
+	importlib.reload(accom_coeff_calc) # import most recent version
 	
 	# activity coefficient of components - affects the particle- and wall-phase
 	act_coeff = np.ones((1, num_speci))
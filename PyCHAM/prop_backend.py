@@ -0,0 +1,257 @@
+##########################################################################################
+#                                                                                        											 #
+#    Copyright (C) 2018-2022 Simon O'Meara : simon.omeara@manchester.ac.uk                  				 #
+#                                                                                       											 #
+#    All Rights Reserved.                                                                									 #
+#    This file is part of PyCHAM                                                         									 #
+#                                                                                        											 #
+#    PyCHAM is free software: you can redistribute it and/or modify it under              						 #
+#    the terms of the GNU General Public License as published by the Free Software       					 #
+#    Foundation, either version 3 of the License, or (at your option) any later          						 #
+#    version.                                                                            										 #
+#                                                                                        											 #
+#    PyCHAM is distributed in the hope that it will be useful, but WITHOUT                						 #
+#    ANY WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS       			 #
+#    FOR A PARTICULAR PURPOSE.  See the GNU General Public License for more              				 #
+#    details.                                                                            										 #
+#                                                                                        											 #
+#    You should have received a copy of the GNU General Public License along with        					 #
+#    PyCHAM.  If not, see <http://www.gnu.org/licenses/>.                                 							 #
+#                                                                                        											 #
+##########################################################################################
+'''resolved, version-pinned UManSysProp backend for property estimation'''
+# UManSysProp (used for boiling points, vapour pressures and liquid 
+# densities) is imported once per process, from the umansysprop folder 
+# in the PyCHAM home folder (or current working directory), or else from 
+# an installed umansysprop package, so that simulations do not clone 
+# repositories or alter folders; the umansysprop folder is created, or 
+# changed to the version pinned in umansysprop_pin.txt, by the separate 
+# maintenance command (from the PyCHAM home folder):
+# python PyCHAM/prop_backend.py refresh [commit, or latest]
+# the commit checked out in the umansysprop folder is compared against 
+# the pin (by pin_check, called by ui_check) by reading the folder's git
+# files, so that no git call is needed
+
+import os
+import sys
+import shutil
+import stat
+import prop_db
+
+# address of the UManSysProp repository
+git_url = 'https://github.com/loftytopping/UManSysProp_public.git'
+
+# UManSysProp modules once imported: boiling_points, vapour_pressures and
+# liquid_densities
+mods = []
+
+# methods of the property database estimated by UManSysProp
+db_methods = ['nannoolal_bp', 'nannoolal_vp', 'girolami']
+
+# explanation at the top of the pin file, lines starting with # are 
+# ignored when reading the pin
+pin_head = str('# commit of UManSysProp (' + git_url + ') used by PyCHAM,\n' + 
+	'# set by calling python PyCHAM/prop_backend.py refresh [commit, or latest]\n' + 
+	'# from the PyCHAM home folder\n')
+
+def home():
+
+	# returns the PyCHAM home folder (above the PyCHAM __main__ file)
+	return(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+def pin_path():
+
+	# returns path of the file stating the pinned UManSysProp commit
+	return(os.path.join(home(), 'umansysprop_pin.txt'))
+
+def pinned():
+
+	# returns the pinned UManSysProp commit, or None if not pinned
+	try:
+		with open(pin_path(), mode='r') as f:
+			lines = [line.strip() for line in f.readlines()]
+	except OSError:
+		return(None)
+	
+	# first line that is not a comment
+	lines = [line for line in lines if (line != '' and line[0] != '#')]
+	if (len(lines) == 0):
+		return(None)
+	
+	return(lines[0])
+
+def local_fold():
+
+	# returns the umansysprop folder that load imports from, in order of
+	# preference, or None if neither exists (so that an installed 
+	# umansysprop package is used)
+	folds = [os.path.join(fold, 'umansysprop') for fold in [home(), os.getcwd()]]
+	folds = [fold for fold in folds if os.path.isdir(os.path.join(fold, 'umansysprop'))]
+	
+	if (len(folds) > 0):
+		return(folds[0])
+	
+	return(None)
+
+def checked_out(fold):
+
+	# inputs: ----------------------------------------------------
+	# fold - path to git working folder
+	# ------------------------------------------------------------
+
+	# returns the commit checked out in fold, read from its .git/HEAD 
+	# file (following a branch reference to its loose or packed ref), 
+	# or None if it cannot be read
+	git_dir = os.path.join(fold, '.git')
+	try:
+		with open(os.path.join(git_dir, 'HEAD'), mode='r') as f:
+			head = f.read().strip()
+	except OSError:
+		return(None)
+	
+	if not head.startswith('ref:'): # detached head, i.e. a commit
+		return(head)
+	
+	ref = head[4::].strip() # e.g. refs/heads/master
+	try:
+		with open(os.path.join(git_dir, ref), mode='r') as f:
+			return(f.read().strip())
+	except OSError:
+		pass
+	
+	try: # references packed after cloning
+		with open(os.path.join(git_dir, 'packed-refs'), mode='r') as f:
+			for line in f.readlines():
+				line = line.strip().split(' ')
+				if (len(line) == 2 and line[1] == ref):
+					return(line[0])
+	except OSError:
+		pass
+	
+	return(None)
+
+def pin_check():
+
+	# returns a message comparing the UManSysProp that load imports 
+	# against the pin ('' if they agree) and its flag (1 for a note, 
+	# 2 for an error), for display by ui_check
+	
+	commit = pinned()
+	if commit is None:
+		return(str('Error - the version of UManSysProp is not pinned (no commit in ' + 
+			pin_path() + '), please call python PyCHAM/prop_backend.py refresh ' + 
+			'from the PyCHAM home folder, which pins the commit it checks out'), 2)
+	
+	fold = local_fold()
+	if fold is None: # installed package, whose commit is unknown
+		return(str('Note - UManSysProp is imported from an installed package, ' + 
+			'so its version cannot be checked against the pinned commit (' + 
+			commit + '), to use the pinned commit please call python ' + 
+			'PyCHAM/prop_backend.py refresh from the PyCHAM home folder\n'), 1)
+	
+	head = checked_out(fold)
+	if head is None:
+		return(str('Error - the commit of UManSysProp in ' + fold + ' could not be ' + 
+			'read from its .git folder, please call python PyCHAM/prop_backend.py ' + 
+			'refresh from the PyCHAM home folder to check out the pinned commit (' + 
+			commit + ')'), 2)
+	
+	if (head != commit):
+		return(str('Error - UManSysProp in ' + fold + ' is at commit ' + head + 
+			', but the pinned commit is ' + commit + ', please call python ' + 
+			'PyCHAM/prop_backend.py refresh from the PyCHAM home folder to check ' + 
+			'out the pinned commit'), 2)
+	
+	return('', 0)
+
+def load():
+
+	# returns the UManSysProp modules for boiling points, vapour pressures
+	# and liquid densities, raising ImportError if UManSysProp cannot be 
+	# found
+
+	if (len(mods) > 0): # already imported by this process
+		return(mods)
+	
+	# folder containing a umansysprop package
+	fold = local_fold()
+	if fold is not None:
+		sys.path.insert(1, fold)
+	
+	try:
+		from umansysprop import boiling_points
+		from umansysprop import vapour_pressures
+		from umansysprop import liquid_densities
+	except ImportError:
+		raise ImportError(str('UManSysProp not found, please call python ' + 
+			'PyCHAM/prop_backend.py refresh from the PyCHAM home folder to ' + 
+			'create the umansysprop folder'))
+	
+	mods.extend([boiling_points, vapour_pressures, liquid_densities])
+	
+	return(mods)
+
+def refresh(ref = None):
+
+	# inputs: ----------------------------------------------------
+	# ref - commit of UManSysProp to use, 'latest' for the latest 
+	#	version, or None for the pinned commit (latest if none 
+	#	pinned)
+	# ------------------------------------------------------------
+
+	# returns the commit now in the umansysprop folder, which is
+	# also pinned
+	
+	from git import Repo # only needed here
+	
+	fold = os.path.join(home(), 'umansysprop')
+	
+	# commit previously pinned
+	commit0 = pinned()
+	if ref is None:
+		ref = commit0
+	
+	def handleRemoveReadonly(func, path, exc):
+		if not os.access(path, os.W_OK):
+			# change permission if an access error
+			os.chmod(path, stat.S_IWUSR)
+			func(path)
+		else:
+			raise
+	
+	# clone to a new folder, so that the existing folder remains until the 
+	# clone is complete
+	fold_new = str(fold + '_new')
+	if os.path.isdir(fold_new):
+		shutil.rmtree(fold_new, ignore_errors=False, onerror=handleRemoveReadonly)
+	repo = Repo.clone_from(git_url, fold_new)
+	if ref is not None and ref != 'latest':
+		repo.git.checkout(ref)
+	commit = repo.head.commit.hexsha
+	repo.close()
+	
+	if os.path.isdir(fold):
+		shutil.rmtree(fold, ignore_errors=False, onerror=handleRemoveReadonly)
+	os.replace(fold_new, fold)
+	
+	with open(pin_path(), mode='w') as f:
+		f.write(str(pin_head + commit + '\n'))
+	
+	# stored estimates from a different version are removed from the
+	# property database
+	if (commit != commit0):
+		class PyCHAM_obj: # stand in for PyCHAM, for the default database
+			pass
+		prop_db.clear(db_methods, PyCHAM_obj())
+	
+	return(commit)
+
+if __name__ == '__main__': # maintenance command
+	
+	if (len(sys.argv) < 2 or sys.argv[1] != 'refresh'):
+		print('usage: python PyCHAM/prop_backend.py refresh [commit, or latest]')
+		sys.exit(1)
+	
+	commit = refresh(sys.argv[2] if (len(sys.argv) > 2) else None)
+	print(str('UManSysProp in ' + os.path.join(home(), 'umansysprop') + 
+		' at commit ' + commit + ' (pinned in ' + pin_path() + ')'))
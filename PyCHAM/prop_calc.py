@@ -26,14 +26,12 @@
 # user settings
 
 import numpy as np
-import sys
-import os
-from git import Repo
-import shutil
 import scipy.constants as si
-import errno
-import stat
 from water_calc import water_calc
+import concurrent.futures
+import prop_db
+import prop_backend
+import volat_calc
 
 def prop_calc(rel_SMILES, Pybel_objects, TEMP, H2Oi, num_comp, Psat_water, vol_Comp, 
 			volP, testf, corei, pconc, umansysprop_update, core_dens, spec_namelist,
@@ -51,7 +49,8 @@ def prop_calc(rel_SMILES, Pybel_objects, TEMP, H2Oi, num_comp, Psat_water, vol_C
 	# testf - flag for whether in normal mode (0) or testing mode (1)
 	# corei - index of seed particle component
 	# pconc - initial number concentration of particles (# particles/cm3 (air))
-	# umansysprop_update - marker for cloning UManSysProp so that latest version used
+	# umansysprop_update - marker for cloning UManSysProp, no longer used as 
+	#	UManSysProp is updated by the prop_backend refresh command
 	# core_dens - density of core material (g/cm3 (liquid/solid density))
 	# spec_namelist - list of component names in chemical equation file
 	# ode_gen_flag - whether or not called from middle or ode_gen
@@ -70,35 +69,15 @@ def prop_calc(rel_SMILES, Pybel_objects, TEMP, H2Oi, num_comp, Psat_water, vol_C
 	if (testf == 1):
 		return(0, 0, 0) # return dummies
 		
-	cwd = os.getcwd() # address of current working directory
+	# UManSysProp modules, imported once (see prop_backend for updating UManSysProp)
+	[boiling_points, vapour_pressures, liquid_densities] = prop_backend.load()
 	
-	# if update required, note this update flag is set when model variables are checked
-	if (umansysprop_update == 1):
-		# download latest version of umansysprop
-		
-		# check if there is an existing umansysprop folder
-		if os.path.isdir(cwd + '/umansysprop'): 
-			def handleRemoveReadonly(func, path, exc):
-				excvalue = exc[1]
-				if not os.access(path, os.W_OK):
-					# Is the error an access error ?
-					os.chmod(path, stat.S_IWUSR)
-					func(path)
-				else:
-					raise
-			# remove existing folder, onerror will change permission of directory if 
-			# needed
-			shutil.rmtree(cwd + '/umansysprop', ignore_errors=False, onerror=handleRemoveReadonly)
-		
-		git_url = 'https://github.com/loftytopping/UManSysProp_public.git'
-		Repo.clone_from(git_url, (cwd + '/umansysprop'))
-	
-	# point to umansysprop folder
-	sys.path.insert(1, (cwd + '/umansysprop')) # address for updated version
-	
-	from umansysprop import boiling_points
-	from umansysprop import vapour_pressures
-	from umansysprop import liquid_densities
+	# estimate properties of components not in the property database 
+	# across worker processes, storing them in the database for the 
+	# loops below
+	if (self.prop_workers > 1 and ode_gen_flag == 0):
+		prop_par([rel_SMILES[i] for i in range(num_comp) if (i != H2Oi and 
+			i != corei[0])], TEMP, self)
 
 	NA = si.Avogadro # Avogadro's number (molecules/mol)
 	y_dens = np.zeros((num_comp, 1)) # components' liquid density (kg/m3)
@@ -113,11 +92,22 @@ def prop_calc(rel_SMILES, Pybel_objects, TEMP, H2Oi, num_comp, Psat_water, vol_C
 	self.nom_mass = np.zeros((1, num_comp))
 
 	
+	# indices of components with manually assigned densities and vapour 
+	# pressures, which are not estimated, so that their Pybel objects are 
+	# not needed for these estimates
+	dens_indx = []
+	vol_indx = []
+	if (ode_gen_flag == 0):
+		dens_indx = [spec_namelist.index(comp) for comp in dens_comp]
+		vol_indx = [spec_namelist.index(comp) for comp in vol_Comp]
+
 	if (ode_gen_flag == 0): # estimate densities if called from middle
 		
 		for i in range (num_comp): # loop through components
 			
 			# density estimation ---------------------------------------------------------
+			if (i in dens_indx): # manually assigned below
+				continue
 			if (i == H2Oi): # liquid-phase density of water
 				y_dens[i] = 1.*1.e3 # (kg/m3 (particle))
 				continue
@@ -129,8 +119,10 @@ def prop_calc(rel_SMILES, Pybel_objects, TEMP, H2Oi, num_comp, Psat_water, vol_C
 				# liquid density code does not like H2, so manually input kg/m3
 				y_dens[i] = 1.e3
 			else:
-				# density (convert from g/cm3 to kg/m3)
-				y_dens[i] = liquid_densities.girolami(Pybel_objects[i])*1.e3
+				# density (convert from g/cm3 to kg/m3), from the property 
+				# database if previously estimated
+				y_dens[i] = prop_db.prop(rel_SMILES[i], 'girolami', 
+					lambda: liquid_densities.girolami(Pybel_objects[i]), self)*1.e3
 			# ----------------------------------------------------------------------------
 		
 	# account for any manually assigned component densities (kg/m3)
@@ -147,6 +139,17 @@ def prop_calc(rel_SMILES, Pybel_objects, TEMP, H2Oi, num_comp, Psat_water, vol_C
 	# this module
 	Psat_Pa_rec = np.zeros((num_comp))
 	
+	# parameters for updating vapour pressures on temperature change
+	# (volat_calc.Psat_T): boiling point (K) of components estimated by
+	# Nannoolal et al. (2008) (zero for other components) and the
+	# coefficient (4.1012+dB) of eq. 6 of that reference (log10(atm)),
+	# along with index of ozone and a flag for whether the parameters
+	# reproduce the estimates
+	self.Psat_Tb = np.zeros((num_comp))
+	self.Psat_A = np.zeros((num_comp))
+	self.Psat_O3i = []
+	self.Psat_fit = 1
+	
 	# estimate vapour pressures (log10(atm)) and O:C ratio
 	# note when the O:C ratio and vapour pressure at 298.15 K are
 	# combined, one can produce the two-dimensional volatility
@@ -187,6 +190,7 @@ def prop_calc(rel_SMILES, Pybel_objects, TEMP, H2Oi, num_comp, Psat_water, vol_C
 			OC[0, i] = 0.
 			self.HC[0, i] = 0.
 			self.nom_mass[0, i] = 0.*1.+3.*16.
+			self.Psat_O3i.append(i)
 			continue
 
 		# possibly use different method for vapour pressure (log10(atm)) of HOMs
@@ -201,34 +205,38 @@ def prop_calc(rel_SMILES, Pybel_objects, TEMP, H2Oi, num_comp, Psat_water, vol_C
 				#Psat_Pa_rec[i] = -0.1*rel_SMILES[i].count('O') + rel_SMILES[i].count('C')*-0.2+0.5
 				#Psat_Pa_rec[i] = ((vapour_pressures.myrdal_and_yalkowsky(Pybel_objects[i], 298.15, boiling_points.nannoolal(Pybel_objects[i]))))
 		
-		else: # for non-HOM components
+		elif (i not in vol_indx): # for non-HOM components without assigned value
 			# vapour pressure (log10(atm)) (eq. 6 of Nannoolal et al. (2008), with dB of 
-			# that equation given by eq. 7 of same reference)
-			Psatnow = ((vapour_pressures.nannoolal(Pybel_objects[i], TEMP, 
-						boiling_points.nannoolal(Pybel_objects[i]))))
+			# that equation given by eq. 7 of same reference), from the property
+			# database if previously estimated
+			Psatnow = Psat_nannoolal(rel_SMILES[i], Pybel_objects[i], TEMP, 
+				boiling_points, vapour_pressures, self)
 
 			# in case you want to ensure small molecules don't contribute to particle mass
 			#if rel_SMILES[i].count('C')<=5:
 			#	 Psatnow += 10 # ensure no condensation of small molecules
 			
-			try: # in case array
-				Psat[0, i] = Psatnow[0]
-			except: # in case float
-				Psat[0, i] = Psatnow
+			Psat[0, i] = Psatnow
 			
 			if (TEMP == 298.15):
-				try: # in case array
-					Psat_Pa_rec[i] = Psatnow[0] # note transfer to Pa is below
-				except: # in case float
-					Psat[0, i] = Psatnow # note transfer to Pa is below
+				Psat_Pa_rec[i] = Psatnow # note transfer to Pa is below
 			else: 
-				Psatnow= ((vapour_pressures.nannoolal(Pybel_objects[i], 298.15, 
-						boiling_points.nannoolal(Pybel_objects[i]))))
+				Psat_Pa_rec[i] = Psat_nannoolal(rel_SMILES[i], Pybel_objects[i], 
+					298.15, boiling_points, vapour_pressures, self)
 			
-				try: # in case array
-					Psat_Pa_rec[i]  = Psatnow[0]
-				except: # in case float
-					Psat_Pa_rec[i] = Psatnow
+			# temperature dependence parameters, with the coefficient from 
+			# whichever of the two estimates has reduced temperature furthest 
+			# from one
+			self.Psat_Tb[i] = prop_db.prop(rel_SMILES[i], 'nannoolal_bp', 
+				lambda: boiling_points.nannoolal(Pybel_objects[i]), self)
+			Psat_est = np.array((Psat[0, i], Psat_Pa_rec[i]))
+			Tfac = volat_calc.Psat_Tfac(np.array((TEMP, 298.15)), self.Psat_Tb[i])
+			j = np.argmax(np.abs(Tfac))
+			if (Tfac[j] != 0.):
+				self.Psat_A[i] = Psat_est[j]/Tfac[j]
+			# check that parameters give both estimates
+			if (any(np.abs(self.Psat_A[i]*Tfac-Psat_est) > 1.e-6*(1.+np.abs(Psat_est)))):
+				self.Psat_fit = 0
 
 		# if component is chlorine, then H:C is 0 and can continue
 		if (rel_SMILES[i] == 'ClCl'):
@@ -236,28 +244,11 @@ def prop_calc(rel_SMILES, Pybel_objects, TEMP, H2Oi, num_comp, Psat_water, vol_C
 			self.nom_mass[0, i] = 70.
 			continue
 
-		# if hydrogen is present in this molecule
-		if ('H' in Pybel_objects[i].formula):
-
-			
-
-			Hindx_start = Pybel_objects[i].formula.index('H')+1
-			Hindx_end = Hindx_start
-			for Hnum_test in Pybel_objects[i].formula[Hindx_start::]:
-				try:
-					float(Hnum_test) # only continue if this character is a number
-					Hindx_end += 1
-					if (Hindx_end == len(Pybel_objects[i].formula)):
-						Hcount = float(Pybel_objects[i].formula[Hindx_start:Hindx_end])
-				except:
-					if (Hindx_end != Hindx_start):
-						Hcount = float(Pybel_objects[i].formula[Hindx_start:Hindx_end])
-					else:
-						Hcount = 1. # if no number then Hydrogen must be alone
-					break
-
-		else: # if no hydrocarbons
-			Hcount = 0.
+		# number of hydrogens in this molecule, from the property database if
+		# previously counted
+		Hcount = prop_db.prop(rel_SMILES[i], 'Hcount', 
+			lambda: H_count(Pybel_objects[i].formula), self)
+		if (Hcount == 0.): # if no hydrocarbons
 			self.HC[0, i] = 0.
 
 		self.nom_mass[0, i] = Hcount*1.+rel_SMILES[i].count('O')*16.+rel_SMILES[i].count('C')*12.+rel_SMILES[i].count('N')*14.+rel_SMILES[i].count('S')*32.
@@ -295,9 +286,12 @@ def prop_calc(rel_SMILES, Pybel_objects, TEMP, H2Oi, num_comp, Psat_water, vol_C
 	# ensure if nucleating component is core that it is involatile
 	if (nuc_comp == 'core'):
 		Psat[0, nuci] = 0.
+		self.Psat_Tb[nuci] = 0.
 	
 	Psat_Pa = np.zeros((1, num_comp)) # for storing vapour pressures in Pa (Pa)
 	Psat_Pa[0, :] = Psat[0, :]
+	# vapour pressures (Pa) of components not updated on temperature change
+	self.Psat_Pa0 = np.array((Psat_Pa[0, :]))
     
 	# convert saturation vapour pressures from Pa to # molecules/cm3 (air) using ideal
 	# gas law, R has units cc.Pa/K.mol
@@ -305,5 +299,140 @@ def prop_calc(rel_SMILES, Pybel_objects, TEMP, H2Oi, num_comp, Psat_water, vol_C
 	# now, in preparation for ode solver, repeat over number of size bins
 	if (num_asb > 0):
 		Psat = np.repeat(Psat, num_asb, axis=0)
+
+	# store any new estimates in the property database
+	prop_db.commit(self)
+
+	return(Psat, y_dens, Psat_Pa, Psat_Pa_rec, OC, self)
+
+# vapour pressure (log10(atm)) by the Nannoolal et al. (2008) method, with
+# boiling point and vapour pressure taken from the property database
+# where previously estimated
+def Psat_nannoolal(smiles, Pybel_object, TEMP, boiling_points, vapour_pressures,
+	self):
+
+	# inputs: --------------------------------------------------------
+	# smiles - SMILE string of component
+	# Pybel_object - Pybel object of component
+	# TEMP - temperature (K)
+	# boiling_points - boiling point module of UManSysProp
+	# vapour_pressures - vapour pressure module of UManSysProp
+	# self - reference to PyCHAM
+	# ----------------------------------------------------------------
+
+	def Psat_est(): # estimate when not in database
+		Tb = prop_db.prop(smiles, 'nannoolal_bp',
+			lambda: boiling_points.nannoolal(Pybel_object), self)
+		# may be returned as array or float
+		return(np.ravel(vapour_pressures.nannoolal(Pybel_object, TEMP, Tb))[0])
+
+	return(prop_db.prop(smiles, 'nannoolal_vp', Psat_est, self, TEMP))
+
+# number of hydrogens given by the chemical formula of a component
+def H_count(formula):
+
+	# inputs: --------------------------------------------------------
+	# formula - chemical formula of component (from Pybel)
+	# ----------------------------------------------------------------
+
+	Hcount = 0.
+
+	# if hydrogen is present in this molecule
+	if ('H' in formula):
+
+		Hindx_start = formula.index('H')+1
+		Hindx_end = Hindx_start
+		for Hnum_test in formula[Hindx_start::]:
+			try:
+				float(Hnum_test) # only continue if this character is a number
+				Hindx_end += 1
+				if (Hindx_end == len(formula)):
+					Hcount = float(formula[Hindx_start:Hindx_end])
+			except:
+				if (Hindx_end != Hindx_start):
+					Hcount = float(formula[Hindx_start:Hindx_end])
+				else:
+					Hcount = 1. # if no number then Hydrogen must be alone
+				break
+		# note that if the formula ends with a lone H the count is
+		# one
+		if (Hindx_end == Hindx_start and Hcount == 0.):
+			Hcount = 1.
+
+	return(Hcount)
+
+# estimate properties of components across worker processes, so that
+# first use of a large chemical scheme is not limited to one processor
+def prop_par(smiles, TEMP, self):
+
+	# inputs: --------------------------------------------------------
+	# smiles - SMILE strings of components
+	# TEMP - temperature (K) at start of simulation
+	# self.prop_workers - number of worker processes
+	# ----------------------------------------------------------------
+
+	# properties (method and temperature (K)) estimated per component
+	methods = [['girolami', 0.], ['nannoolal_bp', 0.], ['nannoolal_vp', TEMP], 
+		['nannoolal_vp', 298.15], ['Hcount', 0.], ['fuller_dv', 0.]]
+
+	# components with any property not stored, without repeats
+	smiles = list(dict.fromkeys(smil for smil in smiles if any(
+		prop_db.stored(smil, meth[0], self, meth[1]) is None for meth in methods)))
+	if (len(smiles) == 0):
+		return()
+	
+	# SMILE strings (rather than Pybel objects) are passed to workers, 
+	# in several chunks per worker to share the work evenly
+	nchunk = min(len(smiles), self.prop_workers*4)
+	chunks = [smiles[i::nchunk] for i in range(nchunk)]
+	
+	with concurrent.futures.ProcessPoolExecutor(max_workers = self.prop_workers) as ex:
+		for rows in ex.map(prop_est, chunks, [TEMP]*nchunk):
+			prop_db.store(rows, self)
+	
+	prop_db.commit(self)
+	
+	return()
+
+# properties of components, called by worker processes of prop_par
+def prop_est(smiles, TEMP):
+
+	# inputs: --------------------------------------------------------
+	# smiles - SMILE strings of components
+	# TEMP - temperature (K) at start of simulation
+	# ----------------------------------------------------------------
+
+	[boiling_points, vapour_pressures, liquid_densities] = prop_backend.load()
+	import mol_reg
+	import diff_vol_est
+	
+	rows = [] # (smiles, method, temperature (K), value)
+	
+	# estimates failing here are left for prop_calc, which reports the error
+	for smil in smiles:
+		
+		Pybel_object = mol_reg.mol(smil)
+		
+		try:
+			rows.append((smil, 'girolami', 0., liquid_densities.girolami(Pybel_object)))
+		except Exception:
+			pass
+		try:
+			Tb = boiling_points.nannoolal(Pybel_object)
+			rows.append((smil, 'nannoolal_bp', 0., Tb))
+			for temp in [TEMP, 298.15]: # as in Psat_nannoolal
+				rows.append((smil, 'nannoolal_vp', temp, np.ravel(
+					vapour_pressures.nannoolal(Pybel_object, temp, Tb))[0]))
+		except Exception:
+			pass
+		try:
+			rows.append((smil, 'Hcount', 0., H_count(Pybel_object.formula)))
+		except Exception:
+			pass
+		try:
+			rows.append((smil, 'fuller_dv', 0., 
+				diff_vol_est.diff_vol_est([Pybel_object])[0]))
+		except Exception:
+			pass
 	
-	return(Psat, y_dens, Psat_Pa, Psat_Pa_rec, OC, self)
\ No newline at end of file
+	return(rows)
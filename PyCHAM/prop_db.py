@@ -0,0 +1,246 @@
+##########################################################################################
+#                                                                                        											 #
+#    Copyright (C) 2018-2022 Simon O'Meara : simon.omeara@manchester.ac.uk                  				 #
+#                                                                                       											 #
+#    All Rights Reserved.                                                                									 #
+#    This file is part of PyCHAM                                                         									 #
+#                                                                                        											 #
+#    PyCHAM is free software: you can redistribute it and/or modify it under              						 #
+#    the terms of the GNU General Public License as published by the Free Software       					 #
+#    Foundation, either version 3 of the License, or (at your option) any later          						 #
+#    version.                                                                            										 #
+#                                                                                        											 #
+#    PyCHAM is distributed in the hope that it will be useful, but WITHOUT                						 #
+#    ANY WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS       			 #
+#    FOR A PARTICULAR PURPOSE.  See the GNU General Public License for more              				 #
+#    details.                                                                            										 #
+#                                                                                        											 #
+#    You should have received a copy of the GNU General Public License along with        					 #
+#    PyCHAM.  If not, see <http://www.gnu.org/licenses/>.                                 							 #
+#                                                                                        											 #
+##########################################################################################
+'''persistent database of component properties keyed by SMILES'''
+# group-contribution estimates (boiling point, vapour pressure, liquid 
+# density and diffusion volume) and the number of hydrogens depend only 
+# on the SMILES of a component, the method and, for 
+# vapour pressure, temperature, so they are stored in an SQLite database 
+# (in the user's cache folder, beside the parsed mechanisms, and so
+# never in the PyCHAM package) and only estimated when not already there, 
+# with counts of values found and estimated kept per method, note that 
+# of the composition properties only the number of hydrogens (which 
+# needs a Pybel object) is stored, since the oxygen to carbon ratio and 
+# nominal molar mass follow from counting characters of the SMILES in 
+# prop_calc, which costs less than a database query
+
+import os
+import sqlite3
+import mech_cache
+
+# open connections to databases, keyed by path
+conn = {}
+
+# use of database since last reported: method: [found, estimated]
+stats = {}
+
+# keys (smiles, method, temp) of values estimated elsewhere (e.g. by 
+# worker processes) and stored, which count as estimated when first found
+new = set()
+
+# values held in memory when the database cannot be opened, keyed by
+# (smiles, method, temp)
+mem = {}
+
+def db_path(self):
+
+	# inputs: ----------------------------------------------------
+	# self.prop_db_path - optional path to database file
+	# ------------------------------------------------------------
+
+	if hasattr(self, 'prop_db_path'):
+		return(self.prop_db_path)
+	
+	# same folder as parsed mechanisms (see mech_cache.cache_dir)
+	return(os.path.join(mech_cache.cache_dir(self), 'prop_db.sqlite'))
+
+def db_conn(self):
+
+	# inputs: ----------------------------------------------------
+	# self - reference to PyCHAM
+	# ------------------------------------------------------------
+
+	# returns connection to database, or None if it cannot be opened
+	# (in which case properties are always estimated)
+	fname = db_path(self)
+	
+	if fname not in conn:
+		try:
+			os.makedirs(os.path.dirname(fname), exist_ok=True)
+			# wait for any other run writing to the database
+			conn[fname] = sqlite3.connect(fname, timeout = 60.)
+			conn[fname].execute(str('CREATE TABLE IF NOT EXISTS prop (smiles TEXT, ' + 
+				'method TEXT, temp REAL, value REAL, PRIMARY KEY (smiles, method, temp))'))
+			conn[fname].commit()
+		except (OSError, sqlite3.Error):
+			conn[fname] = None
+	
+	return(conn[fname])
+
+def props(smiles, methods, func, self, temp = 0.):
+
+	# inputs: ----------------------------------------------------
+	# smiles - SMILE string of component
+	# methods - names of properties (methods of estimation)
+	# func - function without arguments that estimates the properties
+	#	in the order of methods
+	# self - reference to PyCHAM
+	# temp - temperature the properties are for (K), 0 for properties
+	#	independent of temperature
+	# ------------------------------------------------------------
+
+	value = []
+	for meth in methods:
+		val = stored(smiles, meth, self, temp)
+		if val is None: # not stored
+			break
+		value.append(val)
+	
+	if (len(value) == len(methods)): # all found
+		for meth in methods:
+			key = (smiles, meth, float(temp))
+			if key in new: # first use of value estimated elsewhere
+				new.discard(key)
+				stats.setdefault(meth, [0, 0])[1] += 1
+			else:
+				stats.setdefault(meth, [0, 0])[0] += 1
+		return(value)
+	
+	# estimate and store
+	value = [float(val) for val in func()]
+	for meth in methods:
+		stats.setdefault(meth, [0, 0])[1] += 1
+	
+	store([(smiles, methods[i], float(temp), value[i]) for i in range(len(methods))], 
+		self, 0)
+	
+	return(value)
+
+def stored(smiles, method, self, temp = 0.):
+
+	# inputs: ----------------------------------------------------
+	# smiles - SMILE string of component
+	# method - name of property (method of estimation)
+	# self - reference to PyCHAM
+	# temp - temperature the property is for (K)
+	# ------------------------------------------------------------
+
+	# returns stored value, or None if not stored
+	key = (smiles, method, float(temp))
+	if key in mem: # held in memory
+		return(mem[key])
+	
+	db = db_conn(self)
+	if db is None:
+		return(None)
+	
+	row = db.execute('SELECT value FROM prop WHERE smiles=? AND method=? AND temp=?',
+		(smiles, method, float(temp))).fetchone()
+	if row is None:
+		return(None)
+	
+	return(row[0])
+
+def store(rows, self, new_flag = 1):
+
+	# inputs: ----------------------------------------------------
+	# rows - (smiles, method, temp, value) of values to store
+	# self - reference to PyCHAM
+	# new_flag - 1 if values estimated elsewhere (counted as
+	#	estimated when first found), 0 otherwise
+	# ------------------------------------------------------------
+
+	db = db_conn(self)
+	
+	rows = [(row[0], row[1], float(row[2]), float(row[3])) for row in rows]
+	
+	if db is not None:
+		try:
+			db.executemany('INSERT OR REPLACE INTO prop VALUES (?, ?, ?, ?)', rows)
+		except sqlite3.Error: # e.g. read-only database
+			for row in rows:
+				mem[row[0:3]] = row[3]
+	else:
+		for row in rows:
+			mem[row[0:3]] = row[3]
+	
+	if (new_flag == 1):
+		new.update(row[0:3] for row in rows)
+	
+	return()
+
+def prop(smiles, method, func, self, temp = 0.):
+
+	# inputs: ----------------------------------------------------
+	# smiles - SMILE string of component
+	# method - name of property (method of estimation)
+	# func - function without arguments that estimates the property
+	# self - reference to PyCHAM
+	# temp - temperature the property is for (K), 0 for properties
+	#	independent of temperature
+	# ------------------------------------------------------------
+
+	return(props(smiles, [method], lambda: [func()], self, temp)[0])
+
+def commit(self):
+
+	# inputs: ----------------------------------------------------
+	# self - reference to PyCHAM
+	# ------------------------------------------------------------
+
+	db = db_conn(self)
+	
+	if db is not None:
+		try:
+			db.commit()
+		except sqlite3.Error: # failure to store only means estimating again
+			db.rollback()
+	
+	return()
+
+def clear(methods, self):
+
+	# inputs: ----------------------------------------------------
+	# methods - names of properties to remove (e.g. following an
+	#	update of the estimation methods)
+	# self - reference to PyCHAM
+	# ------------------------------------------------------------
+
+	for key in [key for key in mem if key[1] in methods]:
+		del mem[key]
+	
+	db = db_conn(self)
+	
+	if db is not None:
+		try:
+			db.executemany('DELETE FROM prop WHERE method=?', [(meth,) for meth in methods])
+			db.commit()
+		except sqlite3.Error:
+			db.rollback()
+	
+	return()
+
+def stats_mess():
+
+	# returns message of values found in and estimated for the database
+	# since the last message, and resets the counts
+	if (len(stats) == 0):
+		return('')
+	
+	found = sum(stats[meth][0] for meth in stats)
+	est = sum(stats[meth][1] for meth in stats)
+	mess = str('Note: component property database: ' + str(found) + 
+		' values found and ' + str(est) + ' estimated (' + 
+		', '.join(str(meth + ' ' + str(stats[meth][0]) + '/' + 
+		str(stats[meth][1])) for meth in sorted(stats)) + ')')
+	stats.clear()
+	
+	return(mess)
@@ -1,2111 +0,0 @@
-##########################################################################################
-#                                                                                        											 #
-#    Copyright (C) 2018-2022 Simon O'Meara : simon.omeara@manchester.ac.uk                  				 #
-#                                                                                       											 #
-#    All Rights Reserved.                                                                									 #
-#    This file is part of PyCHAM                                                         									 #
-#                                                                                        											 #
-#    PyCHAM is free software: you can redistribute it and/or modify it under              						 #
-#    the terms of the GNU General Public License as published by the Free Software       					 #
-#    Foundation, either version 3 of the License, or (at your option) any later          						 #
-#    version.                                                                            										 #
-#                                                                                        											 #
-#    PyCHAM is distributed in the hope that it will be useful, but WITHOUT                						 #
-#    ANY WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS       			 #
-#    FOR A PARTICULAR PURPOSE.  See the GNU General Public License for more              				 #
-#    details.                                                                            										 #
-#                                                                                        											 #
-#    You should have received a copy of the GNU General Public License along with        					 #
-#    PyCHAM.  If not, see <http://www.gnu.org/licenses/>.                                 							 #
-#                                                                                        											 #
-##########################################################################################
-'''module for calculating reaction rate coefficients (automatically generated)'''
-# module to hold expressions for calculating rate coefficients # 
-# created at 2022-07-08 10:05:29.844437
-
-import numpy
-import photolysisRates
-
-def evaluate_rates(RO2, H2O, TEMP, lightm, time, M, N2, O2, Jlen, NO, HO2, NO3, sumt, self):
-
-	# inputs: ------------------------------------------------------------------
-	# RO2 - total concentration of alkyl peroxy radicals (molecules/cm3) 
-	# M - third body concentration (molecules/cm3 (air))
-	# N2 - nitrogen concentration (molecules/cm3 (air))
-	# O2 - oxygen concentration (molecules/cm3 (air))
-	# H2O, TEMP: given by the user
-	# lightm: given by the user and is 0 for lights off and 1 for on
-	# reaction rate coefficients and their names parsed in eqn_parser.py 
-	# Jlen - number of photolysis reactions
-	# self.tf - sunlight transmission factor
-	# NO - NO concentration (# molecules/cm3 (air))
-	# HO2 - HO2 concentration (# molecules/cm3 (air))
-	# NO3 - NO3 concentration (# molecules/cm3 (air))
-	# self.tf_UVC - transmission factor for 254 nm wavelength light (0-1) 
-	# ------------------------------------------------------------------------
-
-	erf = 0; err_mess = '' # begin assuming no errors
-	# calculate any generic reaction rate coefficients given by chemical scheme
-	try:
-		KRO2NO=2.7e-12*numpy.exp(360/TEMP) 
-		KRO2HO2=2.91e-13*numpy.exp(1300/TEMP) 
-		KAPHO2=5.2e-13*numpy.exp(980/TEMP) 
-		KAPNO=7.5e-12*numpy.exp(290/TEMP) 
-		KRO2NO3=2.3e-12 
-		KNO3AL=1.44e-12*numpy.exp(-1862/TEMP) 
-		KDEC=1.00e+06 
-		KROPRIM=2.50e-14*numpy.exp(-300/TEMP) 
-		KROSEC=2.50e-14*numpy.exp(-300/TEMP) 
-		KCH3O2=1.03e-13*numpy.exp(365/TEMP) 
-		K298CH3O2=3.5e-13 
-		K14ISOM1=3.00e7*numpy.exp(-5300/TEMP) 
-		KD0=1.10e-05*M*numpy.exp(-10100/TEMP) 
-		KDI=1.90e17*numpy.exp(-14100/TEMP) 
-		KRD=KD0/KDI 
-		FCD=0.30 
-		NCD=0.75-1.27*(numpy.log10(FCD)) 
-		FD=10**(numpy.log10(FCD)/(1+(numpy.log10(KRD)/NCD)**2)) 
-		KBPAN=(KD0*KDI)*FD/(KD0+KDI) 
-		KC0=3.28e-28*M*(TEMP/300)**-6.87 
-		KCI=1.125e-11*(TEMP/300)**-1.105 
-		KRC=KC0/KCI 
-		FCC=0.30 
-		NC=0.75-1.27*(numpy.log10(FCC)) 
-		FC=10**(numpy.log10(FCC)/(1+(numpy.log10(KRC)/NC)**2)) 
-		KFPAN=(KC0*KCI)*FC/(KC0+KCI) 
-		K10=1.0e-31*M*(TEMP/300)**-1.6 
-		K1I=5.0e-11*(TEMP/300)**-0.3 
-		KR1=K10/K1I 
-		FC1=0.85 
-		NC1=0.75-1.27*(numpy.log10(FC1)) 
-		F1=10**(numpy.log10(FC1)/(1+(numpy.log10(KR1)/NC1)**2)) 
-		KMT01=(K10*K1I)*F1/(K10+K1I) 
-		K20=1.3e-31*M*(TEMP/300)**-1.5 
-		K2I=2.3e-11*(TEMP/300)**0.24 
-		KR2=K20/K2I 
-		FC2=0.6 
-		NC2=0.75-1.27*(numpy.log10(FC2)) 
-		F2=10**(numpy.log10(FC2)/(1+(numpy.log10(KR2)/NC2)**2)) 
-		KMT02=(K20*K2I)*F2/(K20+K2I) 
-		K30=3.6e-30*M*(TEMP/300)**-4.1 
-		K3I=1.9e-12*(TEMP/300)**0.2 
-		KR3=K30/K3I 
-		FC3=0.35 
-		NC3=0.75-1.27*(numpy.log10(FC3)) 
-		F3=10**(numpy.log10(FC3)/(1+(numpy.log10(KR3)/NC3)**2)) 
-		KMT03=(K30*K3I)*F3/(K30+K3I) 
-		K40=1.3e-3*M*(TEMP/300)**-3.5*numpy.exp(-11000/TEMP) 
-		K4I=9.7e+14*(TEMP/300)**0.1*numpy.exp(-11080/TEMP) 
-		KR4=K40/K4I 
-		FC4=0.35 
-		NC4=0.75-1.27*(numpy.log10(FC4)) 
-		F4=10**(numpy.log10(FC4)/(1+(numpy.log10(KR4)/NC4)**2)) 
-		KMT04=(K40*K4I)*F4/(K40+K4I) 
-		KMT05=1.44e-13*(1+(M/4.2e+19)) 
-		KMT06=1+(1.40e-21*numpy.exp(2200/TEMP)*H2O) 
-		K70=7.4e-31*M*(TEMP/300)**-2.4 
-		K7I=3.3e-11*(TEMP/300)**-0.3 
-		KR7=K70/K7I 
-		FC7=0.81 
-		NC7=0.75-1.27*(numpy.log10(FC7)) 
-		F7=10**(numpy.log10(FC7)/(1+(numpy.log10(KR7)/NC7)**2)) 
-		KMT07=(K70*K7I)*F7/(K70+K7I) 
-		K80=3.2e-30*M*(TEMP/300)**-4.5 
-		K8I=3.0e-11 
-		KR8=K80/K8I 
-		FC8=0.41 
-		NC8=0.75-1.27*(numpy.log10(FC8)) 
-		F8=10**(numpy.log10(FC8)/(1+(numpy.log10(KR8)/NC8)**2)) 
-		KMT08=(K80*K8I)*F8/(K80+K8I) 
-		K90=1.4e-31*M*(TEMP/300)**-3.1 
-		K9I=4.0e-12 
-		KR9=K90/K9I 
-		FC9=0.4 
-		NC9=0.75-1.27*(numpy.log10(FC9)) 
-		F9=10**(numpy.log10(FC9)/(1+(numpy.log10(KR9)/NC9)**2)) 
-		KMT09=(K90*K9I)*F9/(K90+K9I) 
-		K100=4.10e-05*M*numpy.exp(-10650/TEMP) 
-		K10I=6.0e+15*numpy.exp(-11170/TEMP) 
-		KR10=K100/K10I 
-		FC10=0.4 
-		NC10=0.75-1.27*(numpy.log10(FC10)) 
-		F10=10**(numpy.log10(FC10)/(1+(numpy.log10(KR10)/NC10)**2)) 
-		KMT10=(K100*K10I)*F10/(K100+K10I) 
-		K1=2.40e-14*numpy.exp(460/TEMP) 
-		K3=6.50e-34*numpy.exp(1335/TEMP) 
-		K4=2.70e-17*numpy.exp(2199/TEMP) 
-		K2=(K3*M)/(1+(K3*M/K4)) 
-		KMT11=K1+K2 
-		K120=2.5e-31*M*(TEMP/300)**-2.6 
-		K12I=2.0e-12 
-		KR12=K120/K12I 
-		FC12=0.53 
-		NC12=0.75-1.27*(numpy.log10(FC12)) 
-		F12=10**(numpy.log10(FC12)/(1.0+(numpy.log10(KR12)/NC12)**2)) 
-		KMT12=(K120*K12I*F12)/(K120+K12I) 
-		K130=2.5e-30*M*(TEMP/300)**-5.5 
-		K13I=1.8e-11 
-		KR13=K130/K13I 
-		FC13=0.36 
-		NC13=0.75-1.27*(numpy.log10(FC13)) 
-		F13=10**(numpy.log10(FC13)/(1+(numpy.log10(KR13)/NC13)**2)) 
-		KMT13=(K130*K13I)*F13/(K130+K13I) 
-		K140=9.0e-5*numpy.exp(-9690/TEMP)*M 
-		K14I=1.1e+16*numpy.exp(-10560/TEMP) 
-		KR14=K140/K14I 
-		FC14=0.36 
-		NC14=0.75-1.27*(numpy.log10(FC14)) 
-		F14=10**(numpy.log10(FC14)/(1+(numpy.log10(KR14)/NC14)**2)) 
-		KMT14=(K140*K14I)*F14/(K140+K14I) 
-		K150=8.6e-29*M*(TEMP/300)**-3.1 
-		K15I=9.0e-12*(TEMP/300)**-0.85 
-		KR15=K150/K15I 
-		FC15=0.48 
-		NC15=0.75-1.27*(numpy.log10(FC15)) 
-		F15=10**(numpy.log10(FC15)/(1+(numpy.log10(KR15)/NC15)**2)) 
-		KMT15=(K150*K15I)*F15/(K150+K15I) 
-		K160=8e-27*M*(TEMP/300)**-3.5 
-		K16I=3.0e-11*(TEMP/300)**-1 
-		KR16=K160/K16I 
-		FC16=0.5 
-		NC16=0.75-1.27*(numpy.log10(FC16)) 
-		F16=10**(numpy.log10(FC16)/(1+(numpy.log10(KR16)/NC16)**2)) 
-		KMT16=(K160*K16I)*F16/(K160+K16I) 
-		K170=5.0e-30*M*(TEMP/300)**-1.5 
-		K17I=1.0e-12 
-		KR17=K170/K17I 
-		FC17=0.17*numpy.exp(-51/TEMP)+numpy.exp(-TEMP/204) 
-		NC17=0.75-1.27*(numpy.log10(FC17)) 
-		F17=10**(numpy.log10(FC17)/(1.0+(numpy.log10(KR17)/NC17)**2)) 
-		KMT17=(K170*K17I*F17)/(K170+K17I) 
-		KMT18=9.5e-39*O2*numpy.exp(5270/TEMP)/(1+7.5e-29*O2*numpy.exp(5610/TEMP)) 
-		KPPN0=1.7e-03*numpy.exp(-11280/TEMP)*M 
-		KPPNI=8.3e+16*numpy.exp(-13940/TEMP) 
-		KRPPN=KPPN0/KPPNI 
-		FCPPN=0.36 
-		NCPPN=0.75-1.27*(numpy.log10(FCPPN)) 
-		FPPN=10**(numpy.log10(FCPPN)/(1+(numpy.log10(KRPPN)/NCPPN)**2)) 
-		KBPPN=(KPPN0*KPPNI)*FCPPN/(KPPN0+KPPNI) 
-		KNO=KRO2NO*NO 
-		KHO2=KRO2HO2*HO2*0.706 
-		KRO2=1.26e-12*RO2 
-		KNO3=KRO2NO3*NO3 
-		KTR=KNO+KHO2+KRO2+KNO3 
-		K16ISOM=(KTR*5.18e-04*numpy.exp(1308/TEMP))+(2.76e07*numpy.exp(-6759/TEMP)) 
-		#%1.0e-6:NO2= 
-		#%2.0e-6:O3= 
-		#%3.0e1:OH= 
-		#%1.0e-15:NO2+NO2=NO+NO 
-		#%1.0e-7:OH+OH= 
-		#%3.0e-12:NO2+HO2=NO+HO2 
-		#%5.0e-16:NO2+NO2=HONO+HNO3 
-		#%0.0e-16:HONO+HONO=NO+NO2 
-		#%2.0e-14:HONO+HNO3=NO+NO 
-		#%1.0e-3:HNO3=HONO+O 
-
-	except:
-		erf = 1 # flag error
-		err_mess = 'Error: reaction rates failed to be calculated, please check chemical scheme and associated chemical scheme markers, which are stated in the model variables input file' # error message
-
-	# estimate and append photolysis rates
-	J = photolysisRates.PhotolysisCalculation(TEMP, Jlen, sumt, self)
-
-	if (lightm == 0):
-		J = [0]*len(J)
-	rate_values = numpy.zeros((942))
-	
-	# reac_coef has been formatted so that python can recognize it
-	# gas-phase reactions
-	gprn = 0 # keep count on reaction number
-	try:
-		gprn += 1 # keep count on reaction number
-		rate_values[0] = 5.6e-34*N2*(TEMP/300)**-2.6*O2
-		gprn += 1 # keep count on reaction number
-		rate_values[1] = 6.0e-34*O2*(TEMP/300)**-2.6*O2
-		gprn += 1 # keep count on reaction number
-		rate_values[2] = 8.0e-12*numpy.exp(-2060/TEMP)
-		gprn += 1 # keep count on reaction number
-		rate_values[3] = KMT01
-		gprn += 1 # keep count on reaction number
-		rate_values[4] = 5.5e-12*numpy.exp(188/TEMP)
-		gprn += 1 # keep count on reaction number
-		rate_values[5] = KMT02
-		gprn += 1 # keep count on reaction number
-		rate_values[6] = 3.2e-11*numpy.exp(67/TEMP)*O2
-		gprn += 1 # keep count on reaction number
-		rate_values[7] = 2.0e-11*numpy.exp(130/TEMP)*N2
-		gprn += 1 # keep count on reaction number
-		rate_values[8] = 1.4e-12*numpy.exp(-1310/TEMP)
-		gprn += 1 # keep count on reaction number
-		rate_values[9] = 1.4e-13*numpy.exp(-2470/TEMP)
-		gprn += 1 # keep count on reaction number
-		rate_values[10] = 3.3e-39*numpy.exp(530/TEMP)*O2
-		gprn += 1 # keep count on reaction number
-		rate_values[11] = 1.8e-11*numpy.exp(110/TEMP)
-		gprn += 1 # keep count on reaction number
-		rate_values[12] = 4.50e-14*numpy.exp(-1260/TEMP)
-		gprn += 1 # keep count on reaction number
-		rate_values[13] = KMT03
-		gprn += 1 # keep count on reaction number
-		rate_values[14] = 2.14e-10*H2O
-		gprn += 1 # keep count on reaction number
-		rate_values[15] = 1.70e-12*numpy.exp(-940/TEMP)
-		gprn += 1 # keep count on reaction number
-		rate_values[16] = 7.7e-12*numpy.exp(-2100/TEMP)
-		gprn += 1 # keep count on reaction number
-		rate_values[17] = KMT05
-		gprn += 1 # keep count on reaction number
-		rate_values[18] = 2.9e-12*numpy.exp(-160/TEMP)
-		gprn += 1 # keep count on reaction number
-		rate_values[19] = 2.03e-16*(TEMP/300)**4.57*numpy.exp(693/TEMP)
-		gprn += 1 # keep count on reaction number
-		rate_values[20] = 4.8e-11*numpy.exp(250/TEMP)
-		gprn += 1 # keep count on reaction number
-		rate_values[21] = 2.20e-13*KMT06*numpy.exp(600/TEMP)
-		gprn += 1 # keep count on reaction number
-		rate_values[22] = 1.90e-33*M*KMT06*numpy.exp(980/TEMP)
-		gprn += 1 # keep count on reaction number
-		rate_values[23] = KMT07
-		gprn += 1 # keep count on reaction number
-		rate_values[24] = KMT08
-		gprn += 1 # keep count on reaction number
-		rate_values[25] = 2.0e-11
-		gprn += 1 # keep count on reaction number
-		rate_values[26] = 3.45e-12*numpy.exp(270/TEMP)
-		gprn += 1 # keep count on reaction number
-		rate_values[27] = KMT09
-		gprn += 1 # keep count on reaction number
-		rate_values[28] = 3.2e-13*numpy.exp(690/TEMP)*1.0
-		gprn += 1 # keep count on reaction number
-		rate_values[29] = 4.0e-12
-		gprn += 1 # keep count on reaction number
-		rate_values[30] = 2.5e-12*numpy.exp(260/TEMP)
-		gprn += 1 # keep count on reaction number
-		rate_values[31] = KMT11
-		gprn += 1 # keep count on reaction number
-		rate_values[32] = 4.0e-32*numpy.exp(-1000/TEMP)*M
-		gprn += 1 # keep count on reaction number
-		rate_values[33] = KMT12
-		gprn += 1 # keep count on reaction number
-		rate_values[34] = 1.3e-12*numpy.exp(-330/TEMP)*O2
-		gprn += 1 # keep count on reaction number
-		rate_values[35] = 6.00e-06
-		gprn += 1 # keep count on reaction number
-		rate_values[36] = 4.00e-04
-		gprn += 1 # keep count on reaction number
-		rate_values[37] = 1.20e-15*H2O
-		gprn += 1 # keep count on reaction number
-		rate_values[38] = J[1]
-		gprn += 1 # keep count on reaction number
-		rate_values[39] = J[2]
-		gprn += 1 # keep count on reaction number
-		rate_values[40] = J[3]
-		gprn += 1 # keep count on reaction number
-		rate_values[41] = J[4]
-		gprn += 1 # keep count on reaction number
-		rate_values[42] = J[5]
-		gprn += 1 # keep count on reaction number
-		rate_values[43] = J[6]
-		gprn += 1 # keep count on reaction number
-		rate_values[44] = J[7]
-		gprn += 1 # keep count on reaction number
-		rate_values[45] = J[8]
-		gprn += 1 # keep count on reaction number
-		rate_values[46] = KMT04
-		gprn += 1 # keep count on reaction number
-		rate_values[47] = KMT10
-		gprn += 1 # keep count on reaction number
-		rate_values[48] = 1.2e-12*numpy.exp(490/TEMP)*0.65
-		gprn += 1 # keep count on reaction number
-		rate_values[49] = 1.2e-12*numpy.exp(490/TEMP)*0.35
-		gprn += 1 # keep count on reaction number
-		rate_values[50] = 8.05e-16*numpy.exp(-640/TEMP)*0.6
-		gprn += 1 # keep count on reaction number
-		rate_values[51] = 8.05e-16*numpy.exp(-640/TEMP)*0.4
-		gprn += 1 # keep count on reaction number
-		rate_values[52] = 1.2e-11*numpy.exp(440/TEMP)*0.572
-		gprn += 1 # keep count on reaction number
-		rate_values[53] = 1.2e-11*numpy.exp(440/TEMP)*0.353
-		gprn += 1 # keep count on reaction number
-		rate_values[54] = 1.2e-11*numpy.exp(440/TEMP)*0.075
-		gprn += 1 # keep count on reaction number
-		rate_values[55] = 6.6e-12*numpy.exp(-1240/TEMP)
-		gprn += 1 # keep count on reaction number
-		rate_values[56] = 1.85e-12*numpy.exp(-1690/TEMP)
-		gprn += 1 # keep count on reaction number
-		rate_values[57] = KRO2HO2*0.914
-		gprn += 1 # keep count on reaction number
-		rate_values[58] = KRO2NO
-		gprn += 1 # keep count on reaction number
-		rate_values[59] = KRO2NO3
-		gprn += 1 # keep count on reaction number
-		rate_values[60] = 6.70e-15*0.1*RO2
-		gprn += 1 # keep count on reaction number
-		rate_values[61] = 6.70e-15*0.9*RO2
-		gprn += 1 # keep count on reaction number
-		rate_values[62] = KRO2HO2*0.914
-		gprn += 1 # keep count on reaction number
-		rate_values[63] = KRO2NO
-		gprn += 1 # keep count on reaction number
-		rate_values[64] = KRO2NO3
-		gprn += 1 # keep count on reaction number
-		rate_values[65] = 2.50e-13*0.1*RO2
-		gprn += 1 # keep count on reaction number
-		rate_values[66] = 2.50e-13*0.8*RO2
-		gprn += 1 # keep count on reaction number
-		rate_values[67] = 2.50e-13*0.1*RO2
-		gprn += 1 # keep count on reaction number
-		rate_values[68] = KDEC*0.55
-		gprn += 1 # keep count on reaction number
-		rate_values[69] = KDEC*0.45
-		gprn += 1 # keep count on reaction number
-		rate_values[70] = KDEC*0.50
-		gprn += 1 # keep count on reaction number
-		rate_values[71] = KDEC*0.50
-		gprn += 1 # keep count on reaction number
-		rate_values[72] = KRO2HO2*0.914
-		gprn += 1 # keep count on reaction number
-		rate_values[73] = KRO2NO*0.230
-		gprn += 1 # keep count on reaction number
-		rate_values[74] = KRO2NO*0.770
-		gprn += 1 # keep count on reaction number
-		rate_values[75] = KRO2NO3
-		gprn += 1 # keep count on reaction number
-		rate_values[76] = 9.20e-14*RO2*0.7
-		gprn += 1 # keep count on reaction number
-		rate_values[77] = 9.20e-14*RO2*0.3
-		gprn += 1 # keep count on reaction number
-		rate_values[78] = KRO2HO2*0.914
-		gprn += 1 # keep count on reaction number
-		rate_values[79] = KRO2NO*0.230
-		gprn += 1 # keep count on reaction number
-		rate_values[80] = KRO2NO*0.770
-		gprn += 1 # keep count on reaction number
-		rate_values[81] = KRO2NO3
-		gprn += 1 # keep count on reaction number
-		rate_values[82] = 8.80e-13*RO2*0.2
-		gprn += 1 # keep count on reaction number
-		rate_values[83] = 8.80e-13*RO2*0.6
-		gprn += 1 # keep count on reaction number
-		rate_values[84] = 8.80e-13*RO2*0.2
-		gprn += 1 # keep count on reaction number
-		rate_values[85] = KRO2HO2*0.914
-		gprn += 1 # keep count on reaction number
-		rate_values[86] = KRO2NO*0.125
-		gprn += 1 # keep count on reaction number
-		rate_values[87] = KRO2NO*0.875
-		gprn += 1 # keep count on reaction number
-		rate_values[88] = KRO2NO3
-		gprn += 1 # keep count on reaction number
-		rate_values[89] = 6.70e-15*RO2*0.7
-		gprn += 1 # keep count on reaction number
-		rate_values[90] = 6.70e-15*RO2*0.3
-		gprn += 1 # keep count on reaction number
-		rate_values[91] = 2.3e-12*numpy.exp(360/TEMP)*0.001
-		gprn += 1 # keep count on reaction number
-		rate_values[92] = 2.3e-12*numpy.exp(360/TEMP)*0.999
-		gprn += 1 # keep count on reaction number
-		rate_values[93] = KMT13
-		gprn += 1 # keep count on reaction number
-		rate_values[94] = 1.2e-12
-		gprn += 1 # keep count on reaction number
-		rate_values[95] = 2*KCH3O2*RO2*7.18*numpy.exp(-885/TEMP)
-		gprn += 1 # keep count on reaction number
-		rate_values[96] = 2*KCH3O2*RO2*0.5*(1-7.18*numpy.exp(-885/TEMP))
-		gprn += 1 # keep count on reaction number
-		rate_values[97] = 2*KCH3O2*RO2*0.5*(1-7.18*numpy.exp(-885/TEMP))
-		gprn += 1 # keep count on reaction number
-		rate_values[98] = 6.87e-12
-		gprn += 1 # keep count on reaction number
-		rate_values[99] = J[41]
-		gprn += 1 # keep count on reaction number
-		rate_values[100] = KDEC
-		gprn += 1 # keep count on reaction number
-		rate_values[101] = 3.64e-12
-		gprn += 1 # keep count on reaction number
-		rate_values[102] = 1.90e-12*numpy.exp(190/TEMP)
-		gprn += 1 # keep count on reaction number
-		rate_values[103] = 1.23e-11
-		gprn += 1 # keep count on reaction number
-		rate_values[104] = J[41]
-		gprn += 1 # keep count on reaction number
-		rate_values[105] = KROSEC*O2
-		gprn += 1 # keep count on reaction number
-		rate_values[106] = 4.00e+05
-		gprn += 1 # keep count on reaction number
-		rate_values[107] = 5.50e-12
-		gprn += 1 # keep count on reaction number
-		rate_values[108] = 5.55e-12
-		gprn += 1 # keep count on reaction number
-		rate_values[109] = J[55]
-		gprn += 1 # keep count on reaction number
-		rate_values[110] = KRO2HO2*0.914
-		gprn += 1 # keep count on reaction number
-		rate_values[111] = KRO2NO
-		gprn += 1 # keep count on reaction number
-		rate_values[112] = KRO2NO3
-		gprn += 1 # keep count on reaction number
-		rate_values[113] = 9.20e-14*0.7*RO2
-		gprn += 1 # keep count on reaction number
-		rate_values[114] = 9.20e-14*0.3*RO2
-		gprn += 1 # keep count on reaction number
-		rate_values[115] = KRO2HO2*0.914
-		gprn += 1 # keep count on reaction number
-		rate_values[116] = KRO2NO
-		gprn += 1 # keep count on reaction number
-		rate_values[117] = KRO2NO3
-		gprn += 1 # keep count on reaction number
-		rate_values[118] = 2.00e-12*RO2*0.05
-		gprn += 1 # keep count on reaction number
-		rate_values[119] = 2.00e-12*RO2*0.90
-		gprn += 1 # keep count on reaction number
-		rate_values[120] = 2.00e-12*RO2*0.05
-		gprn += 1 # keep count on reaction number
-		rate_values[121] = 1.20e-15
-		gprn += 1 # keep count on reaction number
-		rate_values[122] = 1.00e-14
-		gprn += 1 # keep count on reaction number
-		rate_values[123] = 1.00e-15
-		gprn += 1 # keep count on reaction number
-		rate_values[124] = 7.00e-14
-		gprn += 1 # keep count on reaction number
-		rate_values[125] = 1.40e-17*H2O
-		gprn += 1 # keep count on reaction number
-		rate_values[126] = 2.00e-18*H2O
-		gprn += 1 # keep count on reaction number
-		rate_values[127] = KRO2HO2*0.890
-		gprn += 1 # keep count on reaction number
-		rate_values[128] = KRO2NO*0.157
-		gprn += 1 # keep count on reaction number
-		rate_values[129] = KRO2NO*0.843
-		gprn += 1 # keep count on reaction number
-		rate_values[130] = KRO2NO3
-		gprn += 1 # keep count on reaction number
-		rate_values[131] = 1.30e-12*0.6*RO2
-		gprn += 1 # keep count on reaction number
-		rate_values[132] = 1.30e-12*0.2*RO2
-		gprn += 1 # keep count on reaction number
-		rate_values[133] = 1.30e-12*0.2*RO2
-		gprn += 1 # keep count on reaction number
-		rate_values[134] = 1.83e-11
-		gprn += 1 # keep count on reaction number
-		rate_values[135] = J[41]
-		gprn += 1 # keep count on reaction number
-		rate_values[136] = KDEC
-		gprn += 1 # keep count on reaction number
-		rate_values[137] = 1.49e-11
-		gprn += 1 # keep count on reaction number
-		rate_values[138] = 3.28e-11
-		gprn += 1 # keep count on reaction number
-		rate_values[139] = J[41]
-		gprn += 1 # keep count on reaction number
-		rate_values[140] = KDEC
-		gprn += 1 # keep count on reaction number
-		rate_values[141] = 8.18e-12
-		gprn += 1 # keep count on reaction number
-		rate_values[142] = 1.03e-10
-		gprn += 1 # keep count on reaction number
-		rate_values[143] = J[41]
-		gprn += 1 # keep count on reaction number
-		rate_values[144] = 9.87e-11
-		gprn += 1 # keep count on reaction number
-		rate_values[145] = J[55]
-		gprn += 1 # keep count on reaction number
-		rate_values[146] = KDEC
-		gprn += 1 # keep count on reaction number
-		rate_values[147] = 9.91e-11
-		gprn += 1 # keep count on reaction number
-		rate_values[148] = J[41]
-		gprn += 1 # keep count on reaction number
-		rate_values[149] = 5.3e-12*numpy.exp(190/TEMP)*0.6
-		gprn += 1 # keep count on reaction number
-		rate_values[150] = 5.3e-12*numpy.exp(190/TEMP)*0.4
-		gprn += 1 # keep count on reaction number
-		rate_values[151] = J[11]
-		gprn += 1 # keep count on reaction number
-		rate_values[152] = J[12]
-		gprn += 1 # keep count on reaction number
-		rate_values[153] = 5.5e-16
-		gprn += 1 # keep count on reaction number
-		rate_values[154] = 5.4e-12*numpy.exp(135/TEMP)
-		gprn += 1 # keep count on reaction number
-		rate_values[155] = J[51]
-		gprn += 1 # keep count on reaction number
-		rate_values[156] = 4.0e-13*numpy.exp(-845/TEMP)
-		gprn += 1 # keep count on reaction number
-		rate_values[157] = 7.2e-14*numpy.exp(-1080/TEMP)*O2
-		gprn += 1 # keep count on reaction number
-		rate_values[158] = KMT14
-		gprn += 1 # keep count on reaction number
-		rate_values[159] = 2.85e-12*numpy.exp(-345/TEMP)
-		gprn += 1 # keep count on reaction number
-		rate_values[160] = 2.0e-14
-		gprn += 1 # keep count on reaction number
-		rate_values[161] = 5.2e-12*numpy.exp(600/TEMP)*0.772
-		gprn += 1 # keep count on reaction number
-		rate_values[162] = 5.2e-12*numpy.exp(600/TEMP)*0.228
-		gprn += 1 # keep count on reaction number
-		rate_values[163] = J[15]
-		gprn += 1 # keep count on reaction number
-		rate_values[164] = KRO2HO2*0.914
-		gprn += 1 # keep count on reaction number
-		rate_values[165] = KRO2NO
-		gprn += 1 # keep count on reaction number
-		rate_values[166] = KRO2NO3
-		gprn += 1 # keep count on reaction number
-		rate_values[167] = 6.70e-15*RO2
-		gprn += 1 # keep count on reaction number
-		rate_values[168] = KAPHO2*0.44
-		gprn += 1 # keep count on reaction number
-		rate_values[169] = KAPHO2*0.41
-		gprn += 1 # keep count on reaction number
-		rate_values[170] = KAPHO2*0.15
-		gprn += 1 # keep count on reaction number
-		rate_values[171] = KAPNO
-		gprn += 1 # keep count on reaction number
-		rate_values[172] = KFPAN
-		gprn += 1 # keep count on reaction number
-		rate_values[173] = KRO2NO3*1.74
-		gprn += 1 # keep count on reaction number
-		rate_values[174] = 1.00e-11*0.7*RO2
-		gprn += 1 # keep count on reaction number
-		rate_values[175] = 1.00e-11*0.3*RO2
-		gprn += 1 # keep count on reaction number
-		rate_values[176] = 3.01e-11
-		gprn += 1 # keep count on reaction number
-		rate_values[177] = J[41]
-		gprn += 1 # keep count on reaction number
-		rate_values[178] = J[15]
-		gprn += 1 # keep count on reaction number
-		rate_values[179] = KDEC
-		gprn += 1 # keep count on reaction number
-		rate_values[180] = 2.66e-11
-		gprn += 1 # keep count on reaction number
-		rate_values[181] = J[15]
-		gprn += 1 # keep count on reaction number
-		rate_values[182] = 5.47e-11
-		gprn += 1 # keep count on reaction number
-		rate_values[183] = J[41]
-		gprn += 1 # keep count on reaction number
-		rate_values[184] = J[15]
-		gprn += 1 # keep count on reaction number
-		rate_values[185] = J[22]
-		gprn += 1 # keep count on reaction number
-		rate_values[186] = KDEC*0.80
-		gprn += 1 # keep count on reaction number
-		rate_values[187] = KDEC*0.20
-		gprn += 1 # keep count on reaction number
-		rate_values[188] = 5.47e-11
-		gprn += 1 # keep count on reaction number
-		rate_values[189] = J[34]
-		gprn += 1 # keep count on reaction number
-		rate_values[190] = J[15]
-		gprn += 1 # keep count on reaction number
-		rate_values[191] = 4.45e-11
-		gprn += 1 # keep count on reaction number
-		rate_values[192] = J[22]
-		gprn += 1 # keep count on reaction number
-		rate_values[193] = J[15]
-		gprn += 1 # keep count on reaction number
-		rate_values[194] = 6.65e-12
-		gprn += 1 # keep count on reaction number
-		rate_values[195] = J[22]
-		gprn += 1 # keep count on reaction number
-		rate_values[196] = 1.90e-12*numpy.exp(190/TEMP)
-		gprn += 1 # keep count on reaction number
-		rate_values[197] = 1.30e-11
-		gprn += 1 # keep count on reaction number
-		rate_values[198] = J[41]
-		gprn += 1 # keep count on reaction number
-		rate_values[199] = J[22]
-		gprn += 1 # keep count on reaction number
-		rate_values[200] = 2.88e-12
-		gprn += 1 # keep count on reaction number
-		rate_values[201] = J[53]
-		gprn += 1 # keep count on reaction number
-		rate_values[202] = J[22]
-		gprn += 1 # keep count on reaction number
-		rate_values[203] = 4.20e+10*numpy.exp(-3523/TEMP)
-		gprn += 1 # keep count on reaction number
-		rate_values[204] = 7.67e-12
-		gprn += 1 # keep count on reaction number
-		rate_values[205] = J[22]
-		gprn += 1 # keep count on reaction number
-		rate_values[206] = KNO3AL*8.5
-		gprn += 1 # keep count on reaction number
-		rate_values[207] = 2.64e-11
-		gprn += 1 # keep count on reaction number
-		rate_values[208] = J[15]
-		gprn += 1 # keep count on reaction number
-		rate_values[209] = J[21]
-		gprn += 1 # keep count on reaction number
-		rate_values[210] = 1.19e-10
-		gprn += 1 # keep count on reaction number
-		rate_values[211] = KRO2HO2*0.820
-		gprn += 1 # keep count on reaction number
-		rate_values[212] = KRO2NO*0.278
-		gprn += 1 # keep count on reaction number
-		rate_values[213] = KRO2NO*0.722
-		gprn += 1 # keep count on reaction number
-		rate_values[214] = KRO2NO3
-		gprn += 1 # keep count on reaction number
-		rate_values[215] = 2.50e-13*RO2*0.6
-		gprn += 1 # keep count on reaction number
-		rate_values[216] = 2.50e-13*RO2*0.2
-		gprn += 1 # keep count on reaction number
-		rate_values[217] = 2.50e-13*RO2*0.2
-		gprn += 1 # keep count on reaction number
-		rate_values[218] = KRO2HO2*0.914
-		gprn += 1 # keep count on reaction number
-		rate_values[219] = KRO2NO*0.050
-		gprn += 1 # keep count on reaction number
-		rate_values[220] = KRO2NO*0.950
-		gprn += 1 # keep count on reaction number
-		rate_values[221] = KRO2NO3
-		gprn += 1 # keep count on reaction number
-		rate_values[222] = 6.70e-15*0.7*RO2
-		gprn += 1 # keep count on reaction number
-		rate_values[223] = 6.70e-15*0.3*RO2
-		gprn += 1 # keep count on reaction number
-		rate_values[224] = 5.94e-12
-		gprn += 1 # keep count on reaction number
-		rate_values[225] = J[41]
-		gprn += 1 # keep count on reaction number
-		rate_values[226] = KDEC
-		gprn += 1 # keep count on reaction number
-		rate_values[227] = 9.73e-12
-		gprn += 1 # keep count on reaction number
-		rate_values[228] = J[41]
-		gprn += 1 # keep count on reaction number
-		rate_values[229] = J[22]
-		gprn += 1 # keep count on reaction number
-		rate_values[230] = 3.66e-12
-		gprn += 1 # keep count on reaction number
-		rate_values[231] = KBPAN
-		gprn += 1 # keep count on reaction number
-		rate_values[232] = KRO2HO2*0.914
-		gprn += 1 # keep count on reaction number
-		rate_values[233] = KRO2NO*0.125
-		gprn += 1 # keep count on reaction number
-		rate_values[234] = KRO2NO*0.875
-		gprn += 1 # keep count on reaction number
-		rate_values[235] = KRO2NO3
-		gprn += 1 # keep count on reaction number
-		rate_values[236] = 6.70e-15*0.7*RO2
-		gprn += 1 # keep count on reaction number
-		rate_values[237] = 6.70e-15*0.3*RO2
-		gprn += 1 # keep count on reaction number
-		rate_values[238] = KAPHO2*0.44
-		gprn += 1 # keep count on reaction number
-		rate_values[239] = KAPHO2*0.15
-		gprn += 1 # keep count on reaction number
-		rate_values[240] = KAPHO2*0.41
-		gprn += 1 # keep count on reaction number
-		rate_values[241] = KAPNO
-		gprn += 1 # keep count on reaction number
-		rate_values[242] = KFPAN
-		gprn += 1 # keep count on reaction number
-		rate_values[243] = KRO2NO3*1.74
-		gprn += 1 # keep count on reaction number
-		rate_values[244] = 1.00e-11*RO2*0.7
-		gprn += 1 # keep count on reaction number
-		rate_values[245] = 1.00e-11*RO2*0.3
-		gprn += 1 # keep count on reaction number
-		rate_values[246] = KAPHO2*0.41
-		gprn += 1 # keep count on reaction number
-		rate_values[247] = KAPHO2*0.44
-		gprn += 1 # keep count on reaction number
-		rate_values[248] = KAPHO2*0.15
-		gprn += 1 # keep count on reaction number
-		rate_values[249] = KAPNO
-		gprn += 1 # keep count on reaction number
-		rate_values[250] = KFPAN
-		gprn += 1 # keep count on reaction number
-		rate_values[251] = KRO2NO3*1.74
-		gprn += 1 # keep count on reaction number
-		rate_values[252] = 1.00e-11*RO2*0.7
-		gprn += 1 # keep count on reaction number
-		rate_values[253] = 1.00e-11*RO2*0.3
-		gprn += 1 # keep count on reaction number
-		rate_values[254] = KRO2HO2*0.890
-		gprn += 1 # keep count on reaction number
-		rate_values[255] = KRO2NO
-		gprn += 1 # keep count on reaction number
-		rate_values[256] = KRO2NO3
-		gprn += 1 # keep count on reaction number
-		rate_values[257] = 1.30e-12*RO2
-		gprn += 1 # keep count on reaction number
-		rate_values[258] = KRO2HO2*0.890
-		gprn += 1 # keep count on reaction number
-		rate_values[259] = KRO2NO
-		gprn += 1 # keep count on reaction number
-		rate_values[260] = KRO2NO3
-		gprn += 1 # keep count on reaction number
-		rate_values[261] = 6.70e-15*0.7*RO2
-		gprn += 1 # keep count on reaction number
-		rate_values[262] = 6.70e-15*0.3*RO2
-		gprn += 1 # keep count on reaction number
-		rate_values[263] = KAPHO2*0.56
-		gprn += 1 # keep count on reaction number
-		rate_values[264] = KAPHO2*0.44
-		gprn += 1 # keep count on reaction number
-		rate_values[265] = KAPNO
-		gprn += 1 # keep count on reaction number
-		rate_values[266] = KFPAN
-		gprn += 1 # keep count on reaction number
-		rate_values[267] = KRO2NO3*1.74
-		gprn += 1 # keep count on reaction number
-		rate_values[268] = 1.00e-11*RO2
-		gprn += 1 # keep count on reaction number
-		rate_values[269] = KRO2HO2*0.859
-		gprn += 1 # keep count on reaction number
-		rate_values[270] = KRO2NO
-		gprn += 1 # keep count on reaction number
-		rate_values[271] = KRO2NO3
-		gprn += 1 # keep count on reaction number
-		rate_values[272] = 6.70e-15*RO2
-		gprn += 1 # keep count on reaction number
-		rate_values[273] = 1.36e-13*numpy.exp(1250/TEMP)*0.15
-		gprn += 1 # keep count on reaction number
-		rate_values[274] = 1.36e-13*numpy.exp(1250/TEMP)*0.85
-		gprn += 1 # keep count on reaction number
-		rate_values[275] = KRO2NO
-		gprn += 1 # keep count on reaction number
-		rate_values[276] = KRO2NO3
-		gprn += 1 # keep count on reaction number
-		rate_values[277] = 2*(K298CH3O2*8.0e-12)**0.5*RO2*0.2
-		gprn += 1 # keep count on reaction number
-		rate_values[278] = 2*(K298CH3O2*8.0e-12)**0.5*RO2*0.6
-		gprn += 1 # keep count on reaction number
-		rate_values[279] = 2*(K298CH3O2*8.0e-12)**0.5*RO2*0.2
-		gprn += 1 # keep count on reaction number
-		rate_values[280] = KAPHO2*0.15
-		gprn += 1 # keep count on reaction number
-		rate_values[281] = KAPHO2*0.41
-		gprn += 1 # keep count on reaction number
-		rate_values[282] = KAPHO2*0.44
-		gprn += 1 # keep count on reaction number
-		rate_values[283] = 7.5e-12*numpy.exp(290/TEMP)
-		gprn += 1 # keep count on reaction number
-		rate_values[284] = KFPAN
-		gprn += 1 # keep count on reaction number
-		rate_values[285] = 4.0e-12
-		gprn += 1 # keep count on reaction number
-		rate_values[286] = 1.00e-11*0.3*RO2
-		gprn += 1 # keep count on reaction number
-		rate_values[287] = 1.00e-11*0.7*RO2
-		gprn += 1 # keep count on reaction number
-		rate_values[288] = KRO2HO2*0.820
-		gprn += 1 # keep count on reaction number
-		rate_values[289] = KRO2NO*0.042
-		gprn += 1 # keep count on reaction number
-		rate_values[290] = KRO2NO*0.958
-		gprn += 1 # keep count on reaction number
-		rate_values[291] = KRO2NO3
-		gprn += 1 # keep count on reaction number
-		rate_values[292] = 9.20e-14*RO2*0.7
-		gprn += 1 # keep count on reaction number
-		rate_values[293] = 9.20e-14*RO2*0.3
-		gprn += 1 # keep count on reaction number
-		rate_values[294] = 1.27e-10
-		gprn += 1 # keep count on reaction number
-		rate_values[295] = J[41]
-		gprn += 1 # keep count on reaction number
-		rate_values[296] = 9.60e-11
-		gprn += 1 # keep count on reaction number
-		rate_values[297] = J[54]
-		gprn += 1 # keep count on reaction number
-		rate_values[298] = KROSEC*O2
-		gprn += 1 # keep count on reaction number
-		rate_values[299] = 1.09e-10
-		gprn += 1 # keep count on reaction number
-		rate_values[300] = 2.75e-11
-		gprn += 1 # keep count on reaction number
-		rate_values[301] = J[41]
-		gprn += 1 # keep count on reaction number
-		rate_values[302] = J[15]
-		gprn += 1 # keep count on reaction number
-		rate_values[303] = 2.25e-11
-		gprn += 1 # keep count on reaction number
-		rate_values[304] = J[55]
-		gprn += 1 # keep count on reaction number
-		rate_values[305] = J[15]
-		gprn += 1 # keep count on reaction number
-		rate_values[306] = KDEC
-		gprn += 1 # keep count on reaction number
-		rate_values[307] = 2.41e-11
-		gprn += 1 # keep count on reaction number
-		rate_values[308] = J[22]
-		gprn += 1 # keep count on reaction number
-		rate_values[309] = KRO2HO2*0.914
-		gprn += 1 # keep count on reaction number
-		rate_values[310] = KRO2NO
-		gprn += 1 # keep count on reaction number
-		rate_values[311] = KRO2NO3
-		gprn += 1 # keep count on reaction number
-		rate_values[312] = 6.70e-15*RO2
-		gprn += 1 # keep count on reaction number
-		rate_values[313] = 6.28e-11
-		gprn += 1 # keep count on reaction number
-		rate_values[314] = J[41]
-		gprn += 1 # keep count on reaction number
-		rate_values[315] = J[35]
-		gprn += 1 # keep count on reaction number
-		rate_values[316] = 2.85e-11
-		gprn += 1 # keep count on reaction number
-		rate_values[317] = J[55]
-		gprn += 1 # keep count on reaction number
-		rate_values[318] = J[35]
-		gprn += 1 # keep count on reaction number
-		rate_values[319] = KDEC
-		gprn += 1 # keep count on reaction number
-		rate_values[320] = 5.93e-11
-		gprn += 1 # keep count on reaction number
-		rate_values[321] = J[35]
-		gprn += 1 # keep count on reaction number
-		rate_values[322] = KDEC*0.80
-		gprn += 1 # keep count on reaction number
-		rate_values[323] = KDEC*0.20
-		gprn += 1 # keep count on reaction number
-		rate_values[324] = 2.69e-11
-		gprn += 1 # keep count on reaction number
-		rate_values[325] = J[15]
-		gprn += 1 # keep count on reaction number
-		rate_values[326] = 3.00e-11
-		gprn += 1 # keep count on reaction number
-		rate_values[327] = J[41]
-		gprn += 1 # keep count on reaction number
-		rate_values[328] = J[15]
-		gprn += 1 # keep count on reaction number
-		rate_values[329] = 2.52e-11
-		gprn += 1 # keep count on reaction number
-		rate_values[330] = KBPAN
-		gprn += 1 # keep count on reaction number
-		rate_values[331] = 9.16e-12
-		gprn += 1 # keep count on reaction number
-		rate_values[332] = J[41]
-		gprn += 1 # keep count on reaction number
-		rate_values[333] = J[22]
-		gprn += 1 # keep count on reaction number
-		rate_values[334] = 5.70e-12
-		gprn += 1 # keep count on reaction number
-		rate_values[335] = J[22]
-		gprn += 1 # keep count on reaction number
-		rate_values[336] = 5.56e-12
-		gprn += 1 # keep count on reaction number
-		rate_values[337] = KBPAN
-		gprn += 1 # keep count on reaction number
-		rate_values[338] = 2.36e-11
-		gprn += 1 # keep count on reaction number
-		rate_values[339] = J[41]
-		gprn += 1 # keep count on reaction number
-		rate_values[340] = J[22]
-		gprn += 1 # keep count on reaction number
-		rate_values[341] = 4.20e+10*numpy.exp(-3523/TEMP)
-		gprn += 1 # keep count on reaction number
-		rate_values[342] = 1.05e-11
-		gprn += 1 # keep count on reaction number
-		rate_values[343] = J[41]
-		gprn += 1 # keep count on reaction number
-		rate_values[344] = J[22]
-		gprn += 1 # keep count on reaction number
-		rate_values[345] = KDEC
-		gprn += 1 # keep count on reaction number
-		rate_values[346] = 7.20e-12
-		gprn += 1 # keep count on reaction number
-		rate_values[347] = J[22]
-		gprn += 1 # keep count on reaction number
-		rate_values[348] = 1.02e-11
-		gprn += 1 # keep count on reaction number
-		rate_values[349] = J[41]
-		gprn += 1 # keep count on reaction number
-		rate_values[350] = J[22]
-		gprn += 1 # keep count on reaction number
-		rate_values[351] = 6.60e-12
-		gprn += 1 # keep count on reaction number
-		rate_values[352] = KBPAN
-		gprn += 1 # keep count on reaction number
-		rate_values[353] = 1.29e-11
-		gprn += 1 # keep count on reaction number
-		rate_values[354] = J[41]
-		gprn += 1 # keep count on reaction number
-		rate_values[355] = J[22]
-		gprn += 1 # keep count on reaction number
-		rate_values[356] = KDEC
-		gprn += 1 # keep count on reaction number
-		rate_values[357] = KDEC
-		gprn += 1 # keep count on reaction number
-		rate_values[358] = 1.90e-12*numpy.exp(190/TEMP)
-		gprn += 1 # keep count on reaction number
-		rate_values[359] = 8.39e-12
-		gprn += 1 # keep count on reaction number
-		rate_values[360] = J[22]
-		gprn += 1 # keep count on reaction number
-		rate_values[361] = J[41]
-		gprn += 1 # keep count on reaction number
-		rate_values[362] = 1.6e-12*numpy.exp(305/TEMP)
-		gprn += 1 # keep count on reaction number
-		rate_values[363] = J[22]
-		gprn += 1 # keep count on reaction number
-		rate_values[364] = J[34]
-		gprn += 1 # keep count on reaction number
-		rate_values[365] = KNO3AL*2.4
-		gprn += 1 # keep count on reaction number
-		rate_values[366] = 1.9e-12*numpy.exp(575/TEMP)
-		gprn += 1 # keep count on reaction number
-		rate_values[367] = 8.00e-13
-		gprn += 1 # keep count on reaction number
-		rate_values[368] = 3.70e-12
-		gprn += 1 # keep count on reaction number
-		rate_values[369] = J[41]
-		gprn += 1 # keep count on reaction number
-		rate_values[370] = 3e-14
-		gprn += 1 # keep count on reaction number
-		rate_values[371] = KBPAN
-		gprn += 1 # keep count on reaction number
-		rate_values[372] = 7.06e-11
-		gprn += 1 # keep count on reaction number
-		rate_values[373] = J[41]
-		gprn += 1 # keep count on reaction number
-		rate_values[374] = 1.26e-11
-		gprn += 1 # keep count on reaction number
-		rate_values[375] = KDEC
-		gprn += 1 # keep count on reaction number
-		rate_values[376] = 6.72e-11
-		gprn += 1 # keep count on reaction number
-		rate_values[377] = KNO3AL*5.5
-		gprn += 1 # keep count on reaction number
-		rate_values[378] = 6.70e-11
-		gprn += 1 # keep count on reaction number
-		rate_values[379] = J[35]
-		gprn += 1 # keep count on reaction number
-		rate_values[380] = KRO2HO2*0.914
-		gprn += 1 # keep count on reaction number
-		rate_values[381] = KRO2NO*0.125
-		gprn += 1 # keep count on reaction number
-		rate_values[382] = KRO2NO*0.875
-		gprn += 1 # keep count on reaction number
-		rate_values[383] = KRO2NO3
-		gprn += 1 # keep count on reaction number
-		rate_values[384] = 6.70e-15*0.7*RO2
-		gprn += 1 # keep count on reaction number
-		rate_values[385] = 6.70e-15*0.3*RO2
-		gprn += 1 # keep count on reaction number
-		rate_values[386] = 8.03e-12
-		gprn += 1 # keep count on reaction number
-		rate_values[387] = J[41]
-		gprn += 1 # keep count on reaction number
-		rate_values[388] = KDEC
-		gprn += 1 # keep count on reaction number
-		rate_values[389] = KRO2HO2*0.820
-		gprn += 1 # keep count on reaction number
-		rate_values[390] = KRO2NO*0.278
-		gprn += 1 # keep count on reaction number
-		rate_values[391] = KRO2NO*0.722
-		gprn += 1 # keep count on reaction number
-		rate_values[392] = KRO2NO3
-		gprn += 1 # keep count on reaction number
-		rate_values[393] = 2.50e-13*0.6*RO2
-		gprn += 1 # keep count on reaction number
-		rate_values[394] = 2.50e-13*0.2*RO2
-		gprn += 1 # keep count on reaction number
-		rate_values[395] = 2.50e-13*0.2*RO2
-		gprn += 1 # keep count on reaction number
-		rate_values[396] = KAPHO2*0.41
-		gprn += 1 # keep count on reaction number
-		rate_values[397] = KAPHO2*0.44
-		gprn += 1 # keep count on reaction number
-		rate_values[398] = KAPHO2*0.15
-		gprn += 1 # keep count on reaction number
-		rate_values[399] = KAPNO
-		gprn += 1 # keep count on reaction number
-		rate_values[400] = KFPAN
-		gprn += 1 # keep count on reaction number
-		rate_values[401] = KRO2NO3*1.74
-		gprn += 1 # keep count on reaction number
-		rate_values[402] = 1.00e-11*RO2*0.7
-		gprn += 1 # keep count on reaction number
-		rate_values[403] = 1.00e-11*RO2*0.3
-		gprn += 1 # keep count on reaction number
-		rate_values[404] = KRO2HO2*0.859
-		gprn += 1 # keep count on reaction number
-		rate_values[405] = KRO2NO*0.104
-		gprn += 1 # keep count on reaction number
-		rate_values[406] = KRO2NO*0.896
-		gprn += 1 # keep count on reaction number
-		rate_values[407] = KRO2NO3
-		gprn += 1 # keep count on reaction number
-		rate_values[408] = 6.70e-15*RO2*0.7
-		gprn += 1 # keep count on reaction number
-		rate_values[409] = 6.70e-15*RO2*0.3
-		gprn += 1 # keep count on reaction number
-		rate_values[410] = 2*KNO3AL*5.5
-		gprn += 1 # keep count on reaction number
-		rate_values[411] = 1.33e-10
-		gprn += 1 # keep count on reaction number
-		rate_values[412] = J[15]*2
-		gprn += 1 # keep count on reaction number
-		rate_values[413] = KRO2HO2*0.890
-		gprn += 1 # keep count on reaction number
-		rate_values[414] = KRO2NO
-		gprn += 1 # keep count on reaction number
-		rate_values[415] = KRO2NO3
-		gprn += 1 # keep count on reaction number
-		rate_values[416] = 6.70e-15*RO2
-		gprn += 1 # keep count on reaction number
-		rate_values[417] = KRO2HO2*0.890
-		gprn += 1 # keep count on reaction number
-		rate_values[418] = KRO2NO*0.118
-		gprn += 1 # keep count on reaction number
-		rate_values[419] = KRO2NO*0.882
-		gprn += 1 # keep count on reaction number
-		rate_values[420] = KRO2NO3
-		gprn += 1 # keep count on reaction number
-		rate_values[421] = 6.70e-15*0.7*RO2
-		gprn += 1 # keep count on reaction number
-		rate_values[422] = 6.70e-15*0.3*RO2
-		gprn += 1 # keep count on reaction number
-		rate_values[423] = KRO2HO2*0.859
-		gprn += 1 # keep count on reaction number
-		rate_values[424] = KRO2NO
-		gprn += 1 # keep count on reaction number
-		rate_values[425] = KRO2NO3
-		gprn += 1 # keep count on reaction number
-		rate_values[426] = 6.70e-15*RO2
-		gprn += 1 # keep count on reaction number
-		rate_values[427] = KNO3AL*5.5
-		gprn += 1 # keep count on reaction number
-		rate_values[428] = 8.92e-11*0.232
-		gprn += 1 # keep count on reaction number
-		rate_values[429] = 8.92e-11*0.768
-		gprn += 1 # keep count on reaction number
-		rate_values[430] = J[15]
-		gprn += 1 # keep count on reaction number
-		rate_values[431] = KAPHO2*0.56
-		gprn += 1 # keep count on reaction number
-		rate_values[432] = KAPHO2*0.44
-		gprn += 1 # keep count on reaction number
-		rate_values[433] = KAPNO
-		gprn += 1 # keep count on reaction number
-		rate_values[434] = KFPAN
-		gprn += 1 # keep count on reaction number
-		rate_values[435] = KRO2NO3*1.74
-		gprn += 1 # keep count on reaction number
-		rate_values[436] = 1.00e-11*RO2
-		gprn += 1 # keep count on reaction number
-		rate_values[437] = KAPHO2*0.44
-		gprn += 1 # keep count on reaction number
-		rate_values[438] = KAPHO2*0.56
-		gprn += 1 # keep count on reaction number
-		rate_values[439] = KAPNO
-		gprn += 1 # keep count on reaction number
-		rate_values[440] = KFPAN
-		gprn += 1 # keep count on reaction number
-		rate_values[441] = KRO2NO3*1.74
-		gprn += 1 # keep count on reaction number
-		rate_values[442] = 1.00e-11*RO2
-		gprn += 1 # keep count on reaction number
-		rate_values[443] = 8.01e-11
-		gprn += 1 # keep count on reaction number
-		rate_values[444] = J[41]
-		gprn += 1 # keep count on reaction number
-		rate_values[445] = J[15]
-		gprn += 1 # keep count on reaction number
-		rate_values[446] = 7.03e-11
-		gprn += 1 # keep count on reaction number
-		rate_values[447] = J[55]
-		gprn += 1 # keep count on reaction number
-		rate_values[448] = J[15]
-		gprn += 1 # keep count on reaction number
-		rate_values[449] = KDEC
-		gprn += 1 # keep count on reaction number
-		rate_values[450] = 7.66e-11
-		gprn += 1 # keep count on reaction number
-		rate_values[451] = J[15]
-		gprn += 1 # keep count on reaction number
-		rate_values[452] = KRO2HO2*0.820
-		gprn += 1 # keep count on reaction number
-		rate_values[453] = KRO2NO
-		gprn += 1 # keep count on reaction number
-		rate_values[454] = KRO2NO3
-		gprn += 1 # keep count on reaction number
-		rate_values[455] = 2.50e-13*RO2
-		gprn += 1 # keep count on reaction number
-		rate_values[456] = 2.00e-10
-		gprn += 1 # keep count on reaction number
-		rate_values[457] = J[41]
-		gprn += 1 # keep count on reaction number
-		rate_values[458] = J[35]
-		gprn += 1 # keep count on reaction number
-		rate_values[459] = 2.23e-11
-		gprn += 1 # keep count on reaction number
-		rate_values[460] = J[54]
-		gprn += 1 # keep count on reaction number
-		rate_values[461] = J[35]
-		gprn += 1 # keep count on reaction number
-		rate_values[462] = KROSEC*O2
-		gprn += 1 # keep count on reaction number
-		rate_values[463] = 1.26e-10
-		gprn += 1 # keep count on reaction number
-		rate_values[464] = J[35]
-		gprn += 1 # keep count on reaction number
-		rate_values[465] = 1.04e-11
-		gprn += 1 # keep count on reaction number
-		rate_values[466] = J[41]
-		gprn += 1 # keep count on reaction number
-		rate_values[467] = KRO2HO2*0.859
-		gprn += 1 # keep count on reaction number
-		rate_values[468] = KRO2NO*0.138
-		gprn += 1 # keep count on reaction number
-		rate_values[469] = KRO2NO*0.862
-		gprn += 1 # keep count on reaction number
-		rate_values[470] = KRO2NO3
-		gprn += 1 # keep count on reaction number
-		rate_values[471] = 1.30e-12*RO2*0.2
-		gprn += 1 # keep count on reaction number
-		rate_values[472] = 1.30e-12*RO2*0.6
-		gprn += 1 # keep count on reaction number
-		rate_values[473] = 1.30e-12*RO2*0.2
-		gprn += 1 # keep count on reaction number
-		rate_values[474] = 7.29e-12
-		gprn += 1 # keep count on reaction number
-		rate_values[475] = 6.77e-12
-		gprn += 1 # keep count on reaction number
-		rate_values[476] = KBPAN
-		gprn += 1 # keep count on reaction number
-		rate_values[477] = 3.61e-11
-		gprn += 1 # keep count on reaction number
-		rate_values[478] = J[41]
-		gprn += 1 # keep count on reaction number
-		rate_values[479] = J[15]
-		gprn += 1 # keep count on reaction number
-		rate_values[480] = 2.56e-11
-		gprn += 1 # keep count on reaction number
-		rate_values[481] = J[55]
-		gprn += 1 # keep count on reaction number
-		rate_values[482] = J[15]
-		gprn += 1 # keep count on reaction number
-		rate_values[483] = 2.70e+14*numpy.exp(-6643/TEMP)
-		gprn += 1 # keep count on reaction number
-		rate_values[484] = 2.86e-11
-		gprn += 1 # keep count on reaction number
-		rate_values[485] = J[15]
-		gprn += 1 # keep count on reaction number
-		rate_values[486] = KRO2HO2*0.625
-		gprn += 1 # keep count on reaction number
-		rate_values[487] = KRO2NO
-		gprn += 1 # keep count on reaction number
-		rate_values[488] = KRO2NO3
-		gprn += 1 # keep count on reaction number
-		rate_values[489] = 2.00e-12*RO2
-		gprn += 1 # keep count on reaction number
-		rate_values[490] = 1.29e-11
-		gprn += 1 # keep count on reaction number
-		rate_values[491] = J[41]
-		gprn += 1 # keep count on reaction number
-		rate_values[492] = J[22]
-		gprn += 1 # keep count on reaction number
-		rate_values[493] = KDEC
-		gprn += 1 # keep count on reaction number
-		rate_values[494] = 2.05e-11
-		gprn += 1 # keep count on reaction number
-		rate_values[495] = J[41]
-		gprn += 1 # keep count on reaction number
-		rate_values[496] = J[35]
-		gprn += 1 # keep count on reaction number
-		rate_values[497] = 5.37e-12
-		gprn += 1 # keep count on reaction number
-		rate_values[498] = J[55]
-		gprn += 1 # keep count on reaction number
-		rate_values[499] = J[35]
-		gprn += 1 # keep count on reaction number
-		rate_values[500] = KDEC
-		gprn += 1 # keep count on reaction number
-		rate_values[501] = 1.69e-11
-		gprn += 1 # keep count on reaction number
-		rate_values[502] = J[35]
-		gprn += 1 # keep count on reaction number
-		rate_values[503] = 3.45e-11
-		gprn += 1 # keep count on reaction number
-		rate_values[504] = J[41]
-		gprn += 1 # keep count on reaction number
-		rate_values[505] = J[15]
-		gprn += 1 # keep count on reaction number
-		rate_values[506] = KDEC
-		gprn += 1 # keep count on reaction number
-		rate_values[507] = KAPHO2*0.44
-		gprn += 1 # keep count on reaction number
-		rate_values[508] = KAPHO2*0.15
-		gprn += 1 # keep count on reaction number
-		rate_values[509] = KAPHO2*0.41
-		gprn += 1 # keep count on reaction number
-		rate_values[510] = KAPNO
-		gprn += 1 # keep count on reaction number
-		rate_values[511] = KFPAN
-		gprn += 1 # keep count on reaction number
-		rate_values[512] = KRO2NO3*1.74
-		gprn += 1 # keep count on reaction number
-		rate_values[513] = 1.00e-11*RO2*0.7
-		gprn += 1 # keep count on reaction number
-		rate_values[514] = 1.00e-11*RO2*0.3
-		gprn += 1 # keep count on reaction number
-		rate_values[515] = KRO2HO2*0.770
-		gprn += 1 # keep count on reaction number
-		rate_values[516] = KRO2NO
-		gprn += 1 # keep count on reaction number
-		rate_values[517] = KRO2NO3
-		gprn += 1 # keep count on reaction number
-		rate_values[518] = 2.00e-12*RO2*0.2
-		gprn += 1 # keep count on reaction number
-		rate_values[519] = 2.00e-12*RO2*0.6
-		gprn += 1 # keep count on reaction number
-		rate_values[520] = 2.00e-12*RO2*0.2
-		gprn += 1 # keep count on reaction number
-		rate_values[521] = 4.75e-12
-		gprn += 1 # keep count on reaction number
-		rate_values[522] = J[41]
-		gprn += 1 # keep count on reaction number
-		rate_values[523] = J[35]
-		gprn += 1 # keep count on reaction number
-		rate_values[524] = KRO2HO2*0.770
-		gprn += 1 # keep count on reaction number
-		rate_values[525] = KRO2NO
-		gprn += 1 # keep count on reaction number
-		rate_values[526] = KRO2NO3
-		gprn += 1 # keep count on reaction number
-		rate_values[527] = 2.00e-12*RO2
-		gprn += 1 # keep count on reaction number
-		rate_values[528] = 8.83e-13
-		gprn += 1 # keep count on reaction number
-		rate_values[529] = KBPAN
-		gprn += 1 # keep count on reaction number
-		rate_values[530] = 7.55e-11
-		gprn += 1 # keep count on reaction number
-		rate_values[531] = J[41]
-		gprn += 1 # keep count on reaction number
-		rate_values[532] = J[22]
-		gprn += 1 # keep count on reaction number
-		rate_values[533] = J[15]
-		gprn += 1 # keep count on reaction number
-		rate_values[534] = 7.19e-11
-		gprn += 1 # keep count on reaction number
-		rate_values[535] = KBPAN
-		gprn += 1 # keep count on reaction number
-		rate_values[536] = KRO2HO2*0.820
-		gprn += 1 # keep count on reaction number
-		rate_values[537] = KRO2NO
-		gprn += 1 # keep count on reaction number
-		rate_values[538] = KRO2NO3
-		gprn += 1 # keep count on reaction number
-		rate_values[539] = 8.80e-13*0.6*RO2
-		gprn += 1 # keep count on reaction number
-		rate_values[540] = 8.80e-13*0.2*RO2
-		gprn += 1 # keep count on reaction number
-		rate_values[541] = 8.80e-13*0.2*RO2
-		gprn += 1 # keep count on reaction number
-		rate_values[542] = 3.25e-11
-		gprn += 1 # keep count on reaction number
-		rate_values[543] = J[41]
-		gprn += 1 # keep count on reaction number
-		rate_values[544] = 4.00e+04
-		gprn += 1 # keep count on reaction number
-		rate_values[545] = KROSEC*O2
-		gprn += 1 # keep count on reaction number
-		rate_values[546] = 1.70e-11
-		gprn += 1 # keep count on reaction number
-		rate_values[547] = J[41]
-		gprn += 1 # keep count on reaction number
-		rate_values[548] = 3.29e-12
-		gprn += 1 # keep count on reaction number
-		rate_values[549] = J[53]
-		gprn += 1 # keep count on reaction number
-		rate_values[550] = KDEC
-		gprn += 1 # keep count on reaction number
-		rate_values[551] = KNO3AL*8.5
-		gprn += 1 # keep count on reaction number
-		rate_values[552] = 2.63e-11
-		gprn += 1 # keep count on reaction number
-		rate_values[553] = J[15]
-		gprn += 1 # keep count on reaction number
-		rate_values[554] = 7.89e-12
-		gprn += 1 # keep count on reaction number
-		rate_values[555] = KRO2HO2*0.914
-		gprn += 1 # keep count on reaction number
-		rate_values[556] = KRO2NO*0.104
-		gprn += 1 # keep count on reaction number
-		rate_values[557] = KRO2NO*0.896
-		gprn += 1 # keep count on reaction number
-		rate_values[558] = KRO2NO3
-		gprn += 1 # keep count on reaction number
-		rate_values[559] = 6.70e-15*RO2*0.7
-		gprn += 1 # keep count on reaction number
-		rate_values[560] = 6.70e-15*RO2*0.3
-		gprn += 1 # keep count on reaction number
-		rate_values[561] = 8.33e-11
-		gprn += 1 # keep count on reaction number
-		rate_values[562] = J[41]
-		gprn += 1 # keep count on reaction number
-		rate_values[563] = J[22]
-		gprn += 1 # keep count on reaction number
-		rate_values[564] = J[15]
-		gprn += 1 # keep count on reaction number
-		rate_values[565] = KDEC
-		gprn += 1 # keep count on reaction number
-		rate_values[566] = KRO2HO2*0.890
-		gprn += 1 # keep count on reaction number
-		rate_values[567] = KRO2NO
-		gprn += 1 # keep count on reaction number
-		rate_values[568] = KRO2NO3
-		gprn += 1 # keep count on reaction number
-		rate_values[569] = 6.70e-15*RO2
-		gprn += 1 # keep count on reaction number
-		rate_values[570] = 3.22e-12
-		gprn += 1 # keep count on reaction number
-		rate_values[571] = J[22]
-		gprn += 1 # keep count on reaction number
-		rate_values[572] = KRO2HO2*0.770
-		gprn += 1 # keep count on reaction number
-		rate_values[573] = KRO2NO*0.098
-		gprn += 1 # keep count on reaction number
-		rate_values[574] = KRO2NO*0.902
-		gprn += 1 # keep count on reaction number
-		rate_values[575] = KRO2NO3
-		gprn += 1 # keep count on reaction number
-		rate_values[576] = 8.80e-13*0.2*RO2
-		gprn += 1 # keep count on reaction number
-		rate_values[577] = 8.80e-13*0.6*RO2
-		gprn += 1 # keep count on reaction number
-		rate_values[578] = 8.80e-13*0.2*RO2
-		gprn += 1 # keep count on reaction number
-		rate_values[579] = KRO2HO2*0.706
-		gprn += 1 # keep count on reaction number
-		rate_values[580] = KRO2NO
-		gprn += 1 # keep count on reaction number
-		rate_values[581] = KRO2NO3
-		gprn += 1 # keep count on reaction number
-		rate_values[582] = 8.80e-13*RO2
-		gprn += 1 # keep count on reaction number
-		rate_values[583] = 2.39e-11
-		gprn += 1 # keep count on reaction number
-		rate_values[584] = J[22]*2
-		gprn += 1 # keep count on reaction number
-		rate_values[585] = 2.70e-11
-		gprn += 1 # keep count on reaction number
-		rate_values[586] = J[41]
-		gprn += 1 # keep count on reaction number
-		rate_values[587] = J[22]*2
-		gprn += 1 # keep count on reaction number
-		rate_values[588] = 2.29e-11
-		gprn += 1 # keep count on reaction number
-		rate_values[589] = KBPAN
-		gprn += 1 # keep count on reaction number
-		rate_values[590] = 3.23e-11
-		gprn += 1 # keep count on reaction number
-		rate_values[591] = J[41]
-		gprn += 1 # keep count on reaction number
-		rate_values[592] = J[22]*2
-		gprn += 1 # keep count on reaction number
-		rate_values[593] = KDEC
-		gprn += 1 # keep count on reaction number
-		rate_values[594] = 3.55e-11
-		gprn += 1 # keep count on reaction number
-		rate_values[595] = J[34]
-		gprn += 1 # keep count on reaction number
-		rate_values[596] = 2.54e-11*0.890
-		gprn += 1 # keep count on reaction number
-		rate_values[597] = 2.54e-11*0.110
-		gprn += 1 # keep count on reaction number
-		rate_values[598] = J[22]*2
-		gprn += 1 # keep count on reaction number
-		rate_values[599] = 1.01e-11
-		gprn += 1 # keep count on reaction number
-		rate_values[600] = J[41]
-		gprn += 1 # keep count on reaction number
-		rate_values[601] = J[35]
-		gprn += 1 # keep count on reaction number
-		rate_values[602] = KDEC
-		gprn += 1 # keep count on reaction number
-		rate_values[603] = KNO3AL*5.5
-		gprn += 1 # keep count on reaction number
-		rate_values[604] = 1.33e-11
-		gprn += 1 # keep count on reaction number
-		rate_values[605] = J[34]
-		gprn += 1 # keep count on reaction number
-		rate_values[606] = 2*KNO3AL*4.0
-		gprn += 1 # keep count on reaction number
-		rate_values[607] = 3.39e-11
-		gprn += 1 # keep count on reaction number
-		rate_values[608] = J[15]
-		gprn += 1 # keep count on reaction number
-		rate_values[609] = J[34]
-		gprn += 1 # keep count on reaction number
-		rate_values[610] = 1.20e-10
-		gprn += 1 # keep count on reaction number
-		rate_values[611] = J[41]
-		gprn += 1 # keep count on reaction number
-		rate_values[612] = J[15]
-		gprn += 1 # keep count on reaction number
-		rate_values[613] = KDEC
-		gprn += 1 # keep count on reaction number
-		rate_values[614] = 1.25e-12
-		gprn += 1 # keep count on reaction number
-		rate_values[615] = J[55]
-		gprn += 1 # keep count on reaction number
-		rate_values[616] = KRO2HO2*0.859
-		gprn += 1 # keep count on reaction number
-		rate_values[617] = KRO2NO
-		gprn += 1 # keep count on reaction number
-		rate_values[618] = KRO2NO3
-		gprn += 1 # keep count on reaction number
-		rate_values[619] = 9.20e-14*RO2*0.7
-		gprn += 1 # keep count on reaction number
-		rate_values[620] = 9.20e-14*RO2*0.3
-		gprn += 1 # keep count on reaction number
-		rate_values[621] = KAPHO2*0.41
-		gprn += 1 # keep count on reaction number
-		rate_values[622] = KAPHO2*0.44
-		gprn += 1 # keep count on reaction number
-		rate_values[623] = KAPHO2*0.15
-		gprn += 1 # keep count on reaction number
-		rate_values[624] = KAPNO
-		gprn += 1 # keep count on reaction number
-		rate_values[625] = KFPAN
-		gprn += 1 # keep count on reaction number
-		rate_values[626] = KRO2NO3*1.74
-		gprn += 1 # keep count on reaction number
-		rate_values[627] = 1.00e-11*RO2*0.7
-		gprn += 1 # keep count on reaction number
-		rate_values[628] = 1.00e-11*RO2*0.3
-		gprn += 1 # keep count on reaction number
-		rate_values[629] = KRO2HO2*0.820
-		gprn += 1 # keep count on reaction number
-		rate_values[630] = KRO2NO
-		gprn += 1 # keep count on reaction number
-		rate_values[631] = KRO2NO3
-		gprn += 1 # keep count on reaction number
-		rate_values[632] = 1.30e-12*RO2
-		gprn += 1 # keep count on reaction number
-		rate_values[633] = 8.35e-11
-		gprn += 1 # keep count on reaction number
-		rate_values[634] = J[41]
-		gprn += 1 # keep count on reaction number
-		rate_values[635] = J[15]
-		gprn += 1 # keep count on reaction number
-		rate_values[636] = 4.96e-11
-		gprn += 1 # keep count on reaction number
-		rate_values[637] = J[55]
-		gprn += 1 # keep count on reaction number
-		rate_values[638] = J[15]
-		gprn += 1 # keep count on reaction number
-		rate_values[639] = 2.70e+14*numpy.exp(-6643/TEMP)
-		gprn += 1 # keep count on reaction number
-		rate_values[640] = 8.00e-11
-		gprn += 1 # keep count on reaction number
-		rate_values[641] = J[15]
-		gprn += 1 # keep count on reaction number
-		rate_values[642] = KAPHO2*0.15
-		gprn += 1 # keep count on reaction number
-		rate_values[643] = KAPHO2*0.41
-		gprn += 1 # keep count on reaction number
-		rate_values[644] = KAPHO2*0.44
-		gprn += 1 # keep count on reaction number
-		rate_values[645] = KAPNO
-		gprn += 1 # keep count on reaction number
-		rate_values[646] = KFPAN
-		gprn += 1 # keep count on reaction number
-		rate_values[647] = KRO2NO3*1.74
-		gprn += 1 # keep count on reaction number
-		rate_values[648] = 1.00e-11*0.3*RO2
-		gprn += 1 # keep count on reaction number
-		rate_values[649] = 1.00e-11*0.7*RO2
-		gprn += 1 # keep count on reaction number
-		rate_values[650] = 1.51e-11
-		gprn += 1 # keep count on reaction number
-		rate_values[651] = J[41]
-		gprn += 1 # keep count on reaction number
-		rate_values[652] = J[22]
-		gprn += 1 # keep count on reaction number
-		rate_values[653] = KDEC
-		gprn += 1 # keep count on reaction number
-		rate_values[654] = KRO2HO2*0.625
-		gprn += 1 # keep count on reaction number
-		rate_values[655] = KRO2NO
-		gprn += 1 # keep count on reaction number
-		rate_values[656] = KRO2NO3
-		gprn += 1 # keep count on reaction number
-		rate_values[657] = 2.00e-12*0.6*RO2
-		gprn += 1 # keep count on reaction number
-		rate_values[658] = 2.00e-12*0.2*RO2
-		gprn += 1 # keep count on reaction number
-		rate_values[659] = 2.00e-12*0.2*RO2
-		gprn += 1 # keep count on reaction number
-		rate_values[660] = KAPHO2*0.44
-		gprn += 1 # keep count on reaction number
-		rate_values[661] = KAPHO2*0.15
-		gprn += 1 # keep count on reaction number
-		rate_values[662] = KAPHO2*0.41
-		gprn += 1 # keep count on reaction number
-		rate_values[663] = KAPNO
-		gprn += 1 # keep count on reaction number
-		rate_values[664] = KFPAN
-		gprn += 1 # keep count on reaction number
-		rate_values[665] = KRO2NO3*1.74
-		gprn += 1 # keep count on reaction number
-		rate_values[666] = 1.00e-11*0.7*RO2
-		gprn += 1 # keep count on reaction number
-		rate_values[667] = 1.00e-11*0.3*RO2
-		gprn += 1 # keep count on reaction number
-		rate_values[668] = 8.69e-11
-		gprn += 1 # keep count on reaction number
-		rate_values[669] = J[41]
-		gprn += 1 # keep count on reaction number
-		rate_values[670] = J[35]
-		gprn += 1 # keep count on reaction number
-		rate_values[671] = 71.11e-12
-		gprn += 1 # keep count on reaction number
-		rate_values[672] = J[35]
-		gprn += 1 # keep count on reaction number
-		rate_values[673] = KDEC
-		gprn += 1 # keep count on reaction number
-		rate_values[674] = 3.78e-11
-		gprn += 1 # keep count on reaction number
-		rate_values[675] = J[35]
-		gprn += 1 # keep count on reaction number
-		rate_values[676] = 7.49e-11
-		gprn += 1 # keep count on reaction number
-		rate_values[677] = J[41]
-		gprn += 1 # keep count on reaction number
-		rate_values[678] = J[15]
-		gprn += 1 # keep count on reaction number
-		rate_values[679] = KDEC
-		gprn += 1 # keep count on reaction number
-		rate_values[680] = KAPHO2*0.15
-		gprn += 1 # keep count on reaction number
-		rate_values[681] = KAPHO2*0.41
-		gprn += 1 # keep count on reaction number
-		rate_values[682] = KAPHO2*0.44
-		gprn += 1 # keep count on reaction number
-		rate_values[683] = KAPNO
-		gprn += 1 # keep count on reaction number
-		rate_values[684] = KFPAN
-		gprn += 1 # keep count on reaction number
-		rate_values[685] = KRO2NO3*1.74
-		gprn += 1 # keep count on reaction number
-		rate_values[686] = 1.00e-11*RO2*0.3
-		gprn += 1 # keep count on reaction number
-		rate_values[687] = 1.00e-11*RO2*0.7
-		gprn += 1 # keep count on reaction number
-		rate_values[688] = KRO2HO2*0.625
-		gprn += 1 # keep count on reaction number
-		rate_values[689] = KRO2NO*0.017
-		gprn += 1 # keep count on reaction number
-		rate_values[690] = KRO2NO*0.983
-		gprn += 1 # keep count on reaction number
-		rate_values[691] = KRO2NO3
-		gprn += 1 # keep count on reaction number
-		rate_values[692] = 2.00e-12*0.2*RO2
-		gprn += 1 # keep count on reaction number
-		rate_values[693] = 2.00e-12*0.6*RO2
-		gprn += 1 # keep count on reaction number
-		rate_values[694] = 2.00e-12*0.2*RO2
-		gprn += 1 # keep count on reaction number
-		rate_values[695] = KAPHO2*0.44
-		gprn += 1 # keep count on reaction number
-		rate_values[696] = KAPHO2*0.56
-		gprn += 1 # keep count on reaction number
-		rate_values[697] = KAPNO
-		gprn += 1 # keep count on reaction number
-		rate_values[698] = KFPAN
-		gprn += 1 # keep count on reaction number
-		rate_values[699] = KRO2NO3*1.74
-		gprn += 1 # keep count on reaction number
-		rate_values[700] = 1.00e-11*RO2
-		gprn += 1 # keep count on reaction number
-		rate_values[701] = KAPHO2*0.56
-		gprn += 1 # keep count on reaction number
-		rate_values[702] = KAPHO2*0.44
-		gprn += 1 # keep count on reaction number
-		rate_values[703] = KAPNO
-		gprn += 1 # keep count on reaction number
-		rate_values[704] = KFPAN
-		gprn += 1 # keep count on reaction number
-		rate_values[705] = KRO2NO3*1.74
-		gprn += 1 # keep count on reaction number
-		rate_values[706] = 1.00e-11*RO2
-		gprn += 1 # keep count on reaction number
-		rate_values[707] = KRO2HO2*0.520
-		gprn += 1 # keep count on reaction number
-		rate_values[708] = KRO2NO
-		gprn += 1 # keep count on reaction number
-		rate_values[709] = KRO2NO3
-		gprn += 1 # keep count on reaction number
-		rate_values[710] = 2.00e-12*RO2
-		gprn += 1 # keep count on reaction number
-		rate_values[711] = KRO2HO2*0.820
-		gprn += 1 # keep count on reaction number
-		rate_values[712] = KRO2NO
-		gprn += 1 # keep count on reaction number
-		rate_values[713] = KRO2NO3
-		gprn += 1 # keep count on reaction number
-		rate_values[714] = 8.80e-13*RO2
-		gprn += 1 # keep count on reaction number
-		rate_values[715] = 1.09e-11
-		gprn += 1 # keep count on reaction number
-		rate_values[716] = J[41]
-		gprn += 1 # keep count on reaction number
-		rate_values[717] = KDEC
-		gprn += 1 # keep count on reaction number
-		rate_values[718] = 7.42e-12
-		gprn += 1 # keep count on reaction number
-		rate_values[719] = 9.65e-12
-		gprn += 1 # keep count on reaction number
-		rate_values[720] = J[41]
-		gprn += 1 # keep count on reaction number
-		rate_values[721] = 6.57e-12
-		gprn += 1 # keep count on reaction number
-		rate_values[722] = 2.96e-12
-		gprn += 1 # keep count on reaction number
-		rate_values[723] = KBPAN
-		gprn += 1 # keep count on reaction number
-		rate_values[724] = 1.27e-11
-		gprn += 1 # keep count on reaction number
-		rate_values[725] = J[41]
-		gprn += 1 # keep count on reaction number
-		rate_values[726] = KDEC
-		gprn += 1 # keep count on reaction number
-		rate_values[727] = KRO2HO2*0.706
-		gprn += 1 # keep count on reaction number
-		rate_values[728] = KRO2NO*0.129
-		gprn += 1 # keep count on reaction number
-		rate_values[729] = KRO2NO*0.871
-		gprn += 1 # keep count on reaction number
-		rate_values[730] = KRO2NO3
-		gprn += 1 # keep count on reaction number
-		rate_values[731] = 2.50e-13*RO2*0.6
-		gprn += 1 # keep count on reaction number
-		rate_values[732] = 2.50e-13*RO2*0.2
-		gprn += 1 # keep count on reaction number
-		rate_values[733] = 2.50e-13*RO2*0.2
-		gprn += 1 # keep count on reaction number
-		rate_values[734] = J[15]
-		gprn += 1 # keep count on reaction number
-		rate_values[735] = 2.14e-11
-		gprn += 1 # keep count on reaction number
-		rate_values[736] = J[41]
-		gprn += 1 # keep count on reaction number
-		rate_values[737] = J[15]
-		gprn += 1 # keep count on reaction number
-		rate_values[738] = 2.49e-11
-		gprn += 1 # keep count on reaction number
-		rate_values[739] = KRO2HO2*0.387
-		gprn += 1 # keep count on reaction number
-		rate_values[740] = KRO2NO
-		gprn += 1 # keep count on reaction number
-		rate_values[741] = KRO2NO3
-		gprn += 1 # keep count on reaction number
-		rate_values[742] = 2.00e-12*0.2*RO2
-		gprn += 1 # keep count on reaction number
-		rate_values[743] = 2.00e-12*0.6*RO2
-		gprn += 1 # keep count on reaction number
-		rate_values[744] = 2.00e-12*0.2*RO2
-		gprn += 1 # keep count on reaction number
-		rate_values[745] = KBPAN
-		gprn += 1 # keep count on reaction number
-		rate_values[746] = 2.10e-11
-		gprn += 1 # keep count on reaction number
-		rate_values[747] = KRO2HO2*0.770
-		gprn += 1 # keep count on reaction number
-		rate_values[748] = KRO2NO
-		gprn += 1 # keep count on reaction number
-		rate_values[749] = KRO2NO3
-		gprn += 1 # keep count on reaction number
-		rate_values[750] = 8.80e-13*RO2
-		gprn += 1 # keep count on reaction number
-		rate_values[751] = J[41]
-		gprn += 1 # keep count on reaction number
-		rate_values[752] = J[35]
-		gprn += 1 # keep count on reaction number
-		rate_values[753] = 1.90e-12*numpy.exp(190/TEMP)
-		gprn += 1 # keep count on reaction number
-		rate_values[754] = 5.99e-12
-		gprn += 1 # keep count on reaction number
-		rate_values[755] = KDEC
-		gprn += 1 # keep count on reaction number
-		rate_values[756] = J[35]
-		gprn += 1 # keep count on reaction number
-		rate_values[757] = 2.69e-12
-		gprn += 1 # keep count on reaction number
-		rate_values[758] = J[34]
-		gprn += 1 # keep count on reaction number
-		rate_values[759] = J[35]
-		gprn += 1 # keep count on reaction number
-		rate_values[760] = KNO3AL*4.0
-		gprn += 1 # keep count on reaction number
-		rate_values[761] = 1.23e-11
-		gprn += 1 # keep count on reaction number
-		rate_values[762] = 2.73e-12
-		gprn += 1 # keep count on reaction number
-		rate_values[763] = 6.19e-12
-		gprn += 1 # keep count on reaction number
-		rate_values[764] = J[41]
-		gprn += 1 # keep count on reaction number
-		rate_values[765] = 1.12e-12
-		gprn += 1 # keep count on reaction number
-		rate_values[766] = KBPAN
-		gprn += 1 # keep count on reaction number
-		rate_values[767] = J[15]
-		gprn += 1 # keep count on reaction number
-		rate_values[768] = J[35]
-		gprn += 1 # keep count on reaction number
-		rate_values[769] = KNO3AL*5.5
-		gprn += 1 # keep count on reaction number
-		rate_values[770] = 6.65e-11
-		gprn += 1 # keep count on reaction number
-		rate_values[771] = J[15]*2
-		gprn += 1 # keep count on reaction number
-		rate_values[772] = 2*KNO3AL*2.4
-		gprn += 1 # keep count on reaction number
-		rate_values[773] = 4.29e-11
-		gprn += 1 # keep count on reaction number
-		rate_values[774] = 2.34e-11
-		gprn += 1 # keep count on reaction number
-		rate_values[775] = J[22]
-		gprn += 1 # keep count on reaction number
-		rate_values[776] = 2.65e-11
-		gprn += 1 # keep count on reaction number
-		rate_values[777] = J[41]
-		gprn += 1 # keep count on reaction number
-		rate_values[778] = J[22]
-		gprn += 1 # keep count on reaction number
-		rate_values[779] = 7.60e-12
-		gprn += 1 # keep count on reaction number
-		rate_values[780] = KBPAN
-		gprn += 1 # keep count on reaction number
-		rate_values[781] = J[41]
-		gprn += 1 # keep count on reaction number
-		rate_values[782] = 5.77e-11
-		gprn += 1 # keep count on reaction number
-		rate_values[783] = J[56]*0.91
-		gprn += 1 # keep count on reaction number
-		rate_values[784] = 2.23e-12
-		gprn += 1 # keep count on reaction number
-		rate_values[785] = KDEC
-		gprn += 1 # keep count on reaction number
-		rate_values[786] = J[15]
-		gprn += 1 # keep count on reaction number
-		rate_values[787] = KNO3AL*4.0
-		gprn += 1 # keep count on reaction number
-		rate_values[788] = 2.45e-11
-		gprn += 1 # keep count on reaction number
-		rate_values[789] = J[22]
-		gprn += 1 # keep count on reaction number
-		rate_values[790] = 1.88e-11
-		gprn += 1 # keep count on reaction number
-		rate_values[791] = J[41]
-		gprn += 1 # keep count on reaction number
-		rate_values[792] = J[15]
-		gprn += 1 # keep count on reaction number
-		rate_values[793] = 4.23e-12
-		gprn += 1 # keep count on reaction number
-		rate_values[794] = KBPAN
-		gprn += 1 # keep count on reaction number
-		rate_values[795] = 3.12e-13
-		gprn += 1 # keep count on reaction number
-		rate_values[796] = 1.63e-11
-		gprn += 1 # keep count on reaction number
-		rate_values[797] = J[41]
-		gprn += 1 # keep count on reaction number
-		rate_values[798] = J[34]
-		gprn += 1 # keep count on reaction number
-		rate_values[799] = 1.27e-11
-		gprn += 1 # keep count on reaction number
-		rate_values[800] = KBPAN
-		gprn += 1 # keep count on reaction number
-		rate_values[801] = 2.41e-11
-		gprn += 1 # keep count on reaction number
-		rate_values[802] = J[41]
-		gprn += 1 # keep count on reaction number
-		rate_values[803] = J[34]
-		gprn += 1 # keep count on reaction number
-		rate_values[804] = KDEC
-		gprn += 1 # keep count on reaction number
-		rate_values[805] = 1.85e-11
-		gprn += 1 # keep count on reaction number
-		rate_values[806] = J[41]
-		gprn += 1 # keep count on reaction number
-		rate_values[807] = KDEC
-		gprn += 1 # keep count on reaction number
-		rate_values[808] = KRO2HO2*0.859
-		gprn += 1 # keep count on reaction number
-		rate_values[809] = KRO2NO*0.104
-		gprn += 1 # keep count on reaction number
-		rate_values[810] = KRO2NO*0.896
-		gprn += 1 # keep count on reaction number
-		rate_values[811] = KRO2NO3
-		gprn += 1 # keep count on reaction number
-		rate_values[812] = 6.70e-15*RO2*0.7
-		gprn += 1 # keep count on reaction number
-		rate_values[813] = 6.70e-15*RO2*0.3
-		gprn += 1 # keep count on reaction number
-		rate_values[814] = KRO2HO2*0.820
-		gprn += 1 # keep count on reaction number
-		rate_values[815] = KRO2NO
-		gprn += 1 # keep count on reaction number
-		rate_values[816] = KRO2NO3
-		gprn += 1 # keep count on reaction number
-		rate_values[817] = 6.70e-15*RO2
-		gprn += 1 # keep count on reaction number
-		rate_values[818] = 1.10e-10
-		gprn += 1 # keep count on reaction number
-		rate_values[819] = J[41]
-		gprn += 1 # keep count on reaction number
-		rate_values[820] = J[15]*2
-		gprn += 1 # keep count on reaction number
-		rate_values[821] = 4.33e-11
-		gprn += 1 # keep count on reaction number
-		rate_values[822] = J[54]
-		gprn += 1 # keep count on reaction number
-		rate_values[823] = J[15]*2
-		gprn += 1 # keep count on reaction number
-		rate_values[824] = 1.80e-14*numpy.exp(-260/TEMP)*O2
-		gprn += 1 # keep count on reaction number
-		rate_values[825] = 6.99e-11
-		gprn += 1 # keep count on reaction number
-		rate_values[826] = J[15]*2
-		gprn += 1 # keep count on reaction number
-		rate_values[827] = 2.91e-11
-		gprn += 1 # keep count on reaction number
-		rate_values[828] = 1.90e-12*numpy.exp(190/TEMP)
-		gprn += 1 # keep count on reaction number
-		rate_values[829] = J[41]
-		gprn += 1 # keep count on reaction number
-		rate_values[830] = J[15]
-		gprn += 1 # keep count on reaction number
-		rate_values[831] = KDEC
-		gprn += 1 # keep count on reaction number
-		rate_values[832] = J[31]
-		gprn += 1 # keep count on reaction number
-		rate_values[833] = J[33]
-		gprn += 1 # keep count on reaction number
-		rate_values[834] = J[32]
-		gprn += 1 # keep count on reaction number
-		rate_values[835] = KNO3AL
-		gprn += 1 # keep count on reaction number
-		rate_values[836] = 3.1e-12*numpy.exp(340/TEMP)
-		gprn += 1 # keep count on reaction number
-		rate_values[837] = KNO3AL
-		gprn += 1 # keep count on reaction number
-		rate_values[838] = 1.00e-11*0.200
-		gprn += 1 # keep count on reaction number
-		rate_values[839] = 1.00e-11*0.800
-		gprn += 1 # keep count on reaction number
-		rate_values[840] = J[15]
-		gprn += 1 # keep count on reaction number
-		rate_values[841] = 1.00e-10
-		gprn += 1 # keep count on reaction number
-		rate_values[842] = J[41]
-		gprn += 1 # keep count on reaction number
-		rate_values[843] = J[22]
-		gprn += 1 # keep count on reaction number
-		rate_values[844] = KDEC
-		gprn += 1 # keep count on reaction number
-		rate_values[845] = 7.00e11*numpy.exp(-3160/TEMP)
-		gprn += 1 # keep count on reaction number
-		rate_values[846] = 5.00e-12*O2
-		gprn += 1 # keep count on reaction number
-		rate_values[847] = 5.00e-12*O2*3.2*(1-numpy.exp(-550/TEMP))
-		gprn += 1 # keep count on reaction number
-		rate_values[848] = 5.00e-12*O2*3.2*numpy.exp(-550/TEMP)
-		gprn += 1 # keep count on reaction number
-		rate_values[849] = KAPHO2*0.56
-		gprn += 1 # keep count on reaction number
-		rate_values[850] = KAPHO2*0.44
-		gprn += 1 # keep count on reaction number
-		rate_values[851] = KAPNO
-		gprn += 1 # keep count on reaction number
-		rate_values[852] = KFPAN
-		gprn += 1 # keep count on reaction number
-		rate_values[853] = KRO2NO3*1.74
-		gprn += 1 # keep count on reaction number
-		rate_values[854] = 1.00e-11*RO2
-		gprn += 1 # keep count on reaction number
-		rate_values[855] = 5.77e-11
-		gprn += 1 # keep count on reaction number
-		rate_values[856] = J[15]*2
-		gprn += 1 # keep count on reaction number
-		rate_values[857] = KAPHO2*0.44
-		gprn += 1 # keep count on reaction number
-		rate_values[858] = KAPHO2*0.56
-		gprn += 1 # keep count on reaction number
-		rate_values[859] = KAPNO
-		gprn += 1 # keep count on reaction number
-		rate_values[860] = KFPAN
-		gprn += 1 # keep count on reaction number
-		rate_values[861] = KRO2NO3*1.74
-		gprn += 1 # keep count on reaction number
-		rate_values[862] = 1.00e-11*RO2
-		gprn += 1 # keep count on reaction number
-		rate_values[863] = 1.86e-11
-		gprn += 1 # keep count on reaction number
-		rate_values[864] = J[41]
-		gprn += 1 # keep count on reaction number
-		rate_values[865] = J[34]
-		gprn += 1 # keep count on reaction number
-		rate_values[866] = 7.82e-12
-		gprn += 1 # keep count on reaction number
-		rate_values[867] = J[55]
-		gprn += 1 # keep count on reaction number
-		rate_values[868] = J[34]
-		gprn += 1 # keep count on reaction number
-		rate_values[869] = KDEC
-		gprn += 1 # keep count on reaction number
-		rate_values[870] = 1.75e-11
-		gprn += 1 # keep count on reaction number
-		rate_values[871] = J[34]
-		gprn += 1 # keep count on reaction number
-		rate_values[872] = 3.31e-11
-		gprn += 1 # keep count on reaction number
-		rate_values[873] = J[41]
-		gprn += 1 # keep count on reaction number
-		rate_values[874] = KDEC
-		gprn += 1 # keep count on reaction number
-		rate_values[875] = KNO3AL*5.5
-		gprn += 1 # keep count on reaction number
-		rate_values[876] = 2.37e-11
-		gprn += 1 # keep count on reaction number
-		rate_values[877] = J[15]
-		gprn += 1 # keep count on reaction number
-		rate_values[878] = J[35]
-		gprn += 1 # keep count on reaction number
-		rate_values[879] = KAPHO2*0.15
-		gprn += 1 # keep count on reaction number
-		rate_values[880] = KAPHO2*0.41
-		gprn += 1 # keep count on reaction number
-		rate_values[881] = KAPHO2*0.44
-		gprn += 1 # keep count on reaction number
-		rate_values[882] = KAPNO
-		gprn += 1 # keep count on reaction number
-		rate_values[883] = KFPAN
-		gprn += 1 # keep count on reaction number
-		rate_values[884] = KRO2NO3*1.74
-		gprn += 1 # keep count on reaction number
-		rate_values[885] = 1.00e-11*0.7*RO2
-		gprn += 1 # keep count on reaction number
-		rate_values[886] = 1.00e-11*0.3*RO2
-		gprn += 1 # keep count on reaction number
-		rate_values[887] = J[22]
-		gprn += 1 # keep count on reaction number
-		rate_values[888] = J[41]
-		gprn += 1 # keep count on reaction number
-		rate_values[889] = 7.34e-12
-		gprn += 1 # keep count on reaction number
-		rate_values[890] = KBPAN
-		gprn += 1 # keep count on reaction number
-		rate_values[891] = 3.74e-12
-		gprn += 1 # keep count on reaction number
-		rate_values[892] = 1.68e-11
-		gprn += 1 # keep count on reaction number
-		rate_values[893] = J[41]
-		gprn += 1 # keep count on reaction number
-		rate_values[894] = 1.32e-11
-		gprn += 1 # keep count on reaction number
-		rate_values[895] = KBPAN
-		gprn += 1 # keep count on reaction number
-		rate_values[896] = 6.69e-11
-		gprn += 1 # keep count on reaction number
-		rate_values[897] = J[34]
-		gprn += 1 # keep count on reaction number
-		rate_values[898] = J[15]
-		gprn += 1 # keep count on reaction number
-		rate_values[899] = KRO2HO2*0.706
-		gprn += 1 # keep count on reaction number
-		rate_values[900] = KRO2NO
-		gprn += 1 # keep count on reaction number
-		rate_values[901] = KRO2NO3
-		gprn += 1 # keep count on reaction number
-		rate_values[902] = 8.8e-13*RO2
-		gprn += 1 # keep count on reaction number
-		rate_values[903] = KRO2HO2*0.625
-		gprn += 1 # keep count on reaction number
-		rate_values[904] = KRO2NO
-		gprn += 1 # keep count on reaction number
-		rate_values[905] = KRO2NO3
-		gprn += 1 # keep count on reaction number
-		rate_values[906] = 8.80e-13*RO2
-		gprn += 1 # keep count on reaction number
-		rate_values[907] = KAPHO2*0.44
-		gprn += 1 # keep count on reaction number
-		rate_values[908] = KAPHO2*0.56
-		gprn += 1 # keep count on reaction number
-		rate_values[909] = KAPNO
-		gprn += 1 # keep count on reaction number
-		rate_values[910] = KFPAN
-		gprn += 1 # keep count on reaction number
-		rate_values[911] = KRO2NO3*1.74
-		gprn += 1 # keep count on reaction number
-		rate_values[912] = 1.00e-11*RO2
-		gprn += 1 # keep count on reaction number
-		rate_values[913] = KRO2HO2*0.625
-		gprn += 1 # keep count on reaction number
-		rate_values[914] = KRO2NO
-		gprn += 1 # keep count on reaction number
-		rate_values[915] = KRO2NO3
-		gprn += 1 # keep count on reaction number
-		rate_values[916] = 2.00e-12*RO2
-		gprn += 1 # keep count on reaction number
-		rate_values[917] = J[34]
-		gprn += 1 # keep count on reaction number
-		rate_values[918] = 1.23e-11
-		gprn += 1 # keep count on reaction number
-		rate_values[919] = J[41]
-		gprn += 1 # keep count on reaction number
-		rate_values[920] = J[15]
-		gprn += 1 # keep count on reaction number
-		rate_values[921] = 1.58e-11
-		gprn += 1 # keep count on reaction number
-		rate_values[922] = J[22]
-		gprn += 1 # keep count on reaction number
-		rate_values[923] = J[41]
-		gprn += 1 # keep count on reaction number
-		rate_values[924] = 3.38e-11
-		gprn += 1 # keep count on reaction number
-		rate_values[925] = KDEC
-		gprn += 1 # keep count on reaction number
-		rate_values[926] = 7.46e-11
-		gprn += 1 # keep count on reaction number
-		rate_values[927] = J[41]
-		gprn += 1 # keep count on reaction number
-		rate_values[928] = KDEC
-		gprn += 1 # keep count on reaction number
-		rate_values[929] = 6.55e-12
-		gprn += 1 # keep count on reaction number
-		rate_values[930] = J[41]
-		gprn += 1 # keep count on reaction number
-		rate_values[931] = J[35]
-		gprn += 1 # keep count on reaction number
-		rate_values[932] = 2.92e-12
-		gprn += 1 # keep count on reaction number
-		rate_values[933] = KBPAN
-		gprn += 1 # keep count on reaction number
-		rate_values[934] = 9.61e-12
-		gprn += 1 # keep count on reaction number
-		rate_values[935] = J[41]
-		gprn += 1 # keep count on reaction number
-		rate_values[936] = J[35]
-		gprn += 1 # keep count on reaction number
-		rate_values[937] = KDEC
-		gprn += 1 # keep count on reaction number
-		rate_values[938] = 1.44e-11
-		gprn += 1 # keep count on reaction number
-		rate_values[939] = J[34]
-		gprn += 1 # keep count on reaction number
-		rate_values[940] = J[35]
-		gprn += 1 # keep count on reaction number
-		rate_values[941] = 0.0
-	except:
-		erf = 1 # flag error
-		err_mess = str('Error: estimating reaction rate for reaction number ' + str(gprn) + ' failed, please check chemical scheme (including whether definitions for generic rate coefficients have been included), and associated chemical scheme markers, which are stated in the model variables input file') # error message
-	
-	# aqueous-phase reactions
-	
-	return(rate_values, erf, err_mess)
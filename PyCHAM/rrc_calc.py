@@ -21,24 +21,16 @@
 ##########################################################################################
 '''module to link to calculation of reaction coefficients'''
 # this module sets up the final details for calculating
-# reaction rate coefficient, which is done via the called module Rate_coeffs 
+# reaction rate coefficient, which is done via the function 
+# compiled by rrc_comp
 
 
 import numpy as np
 import scipy.constants as si
-try:
-	import rate_coeffs
-except:
-	import os
-	if os.path.exists('rate_coeffs'): # remove any bad functions
-		os.remove(rate_coeffs)
-import importlib
 
 
 def rrc_calc(H2O, TEMP, lightm, y, PInit, Jlen, NO, HO2, NO3, sumt, self):
 
-	import rate_coeffs # in case failure to import previous version using import command above
-
 	# ---------------------------------------------
 	# inputs:
 	# self.RO2_indices - indices of RO2 components
@@ -59,6 +51,7 @@ def rrc_calc(H2O, TEMP, lightm, y, PInit, Jlen, NO, HO2, NO3, sumt, self):
 	# HO2 - concentration of HO2 (# molecules/cm3)
 	# NO3 - concentration of NO3 (# molecules/cm3)
 	# self.tf_UVC - transmission factor for 254 nm wavelength light (0-1)
+	# self.rrc_func - rate coefficient function compiled by rrc_comp
 	# ---------------------------------------------
 	
 	time = self.daytime+sumt # time of day (for natural light photolysis) (s)
@@ -83,16 +76,42 @@ def rrc_calc(H2O, TEMP, lightm, y, PInit, Jlen, NO, HO2, NO3, sumt, self):
 	N2_val = M_val*0.7809
 	O2_val = M_val*0.2095
 		
-	importlib.reload(rate_coeffs) # ensure latest version uploaded
 	# calculate the new rate coefficient array (/s) 
-	[rrc, erf, err_mess] = rate_coeffs.evaluate_rates(RO2, H2O, TEMP, lightm, time, 
+	[rrc, erf, err_mess] = self.rrc_func(RO2, H2O, TEMP, lightm, time, 
+					M_val, N2_val, O2_val, Jlen, NO, HO2, NO3, sumt, self)
+	
+	return(rrc, erf, err_mess)
+
+def rrc_calc_arr(H2O, TEMP, lightm, y, PInit, Jlen, NO, HO2, NO3, sumt, self):
+
+	# ---------------------------------------------
+	# inputs:
+	# as for rrc_calc, except that TEMP (K) and PInit (Pa) are 1D 
+	# arrays with one element per condition (e.g. for parameter sweeps 
+	# and isopleths), and H2O, NO, HO2 and NO3 may be scalars or 1D 
+	# arrays with one element per condition
+	# ---------------------------------------------
+	
+	time = self.daytime+sumt # time of day (for natural light photolysis) (s)
+	
+	TEMP = np.array((TEMP)).reshape(-1)
+	PInit = np.ones((len(TEMP)))*PInit
+	
+	# calculate total RO2 concentration
+	if (self.RO2_indices.size == 0):
+		RO2 = 0
+	else:
+		RO2 = np.sum(y[self.RO2_indices[:, 1]])
+	
+	# concentrations of third body (M), nitrogen and oxygen 
+	# per condition (# molecules/cm3 (air)), as in rrc_calc
+	M_val = (PInit/(8.3144621*TEMP)*si.N_A)*1.e-6
+	N2_val = M_val*0.7809
+	O2_val = M_val*0.2095
+	
+	# calculate the rate coefficient array (/s) with conditions in rows 
+	# and reactions in columns
+	[rrc, erf, err_mess] = self.rrc_func(RO2, H2O, TEMP, lightm, time, 
 					M_val, N2_val, O2_val, Jlen, NO, HO2, NO3, sumt, self)
-	#except:
-	#	import os
-	#	if os.path.exists('rate_coeffs'):
-	#		os.remove(rate_coeffs)
-	#	erf = 1
-	#	err_mess = 'Error: bad reaction rate calculation, please check chemical scheme and associated chemical scheme markers which are stated in the model variables input file'
-	#	rrc = [] # filler
 	
-	return(rrc, erf, err_mess)
\ No newline at end of file
+	return(rrc, erf, err_mess)
@@ -0,0 +1,432 @@
+##########################################################################################
+#                                                                                        											 #
+#    Copyright (C) 2018-2022 Simon O'Meara : simon.omeara@manchester.ac.uk                  				 #
+#                                                                                       											 #
+#    All Rights Reserved.                                                                									 #
+#    This file is part of PyCHAM                                                         									 #
+#                                                                                        											 #
+#    PyCHAM is free software: you can redistribute it and/or modify it under              						 #
+#    the terms of the GNU General Public License as published by the Free Software       					 #
+#    Foundation, either version 3 of the License, or (at your option) any later          						 #
+#    version.                                                                            										 #
+#                                                                                        											 #
+#    PyCHAM is distributed in the hope that it will be useful, but WITHOUT                						 #
+#    ANY WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS       			 #
+#    FOR A PARTICULAR PURPOSE.  See the GNU General Public License for more              				 #
+#    details.                                                                            										 #
+#                                                                                        											 #
+#    You should have received a copy of the GNU General Public License along with        					 #
+#    PyCHAM.  If not, see <http://www.gnu.org/licenses/>.                                 							 #
+#                                                                                        											 #
+##########################################################################################
+'''compiles reaction rate coefficient expressions into one callable'''
+# the rate coefficient expressions given by the chemical scheme (after 
+# conversion by formatting.py) are parsed into expression trees, 
+# checked against the names and functions allowed in rate 
+# coefficients, simplified by constant folding and common 
+# subexpression elimination across reactions and then compiled in 
+# memory to a single function that evaluates all reactions for 
+# either one or many sets of chamber conditions, so that no module 
+# needs to be written into the PyCHAM folder
+
+import ast
+import math
+import operator
+import sys
+import numpy
+
+# names that rate coefficient expressions can refer to, these are
+# the inputs of the compiled function
+var_names = ['RO2', 'H2O', 'TEMP', 'lightm', 'time', 'M', 'N2', 'O2', 
+	'Jlen', 'NO', 'HO2', 'NO3', 'sumt']
+
+# names used inside the compiled function that generic rate 
+# coefficients must not overwrite
+resv_names = ['J', 'numpy', 'photolysisRates', 'self', 'erf', 
+	'err_mess', 'rate_values', 'abs']
+
+# binary operators allowed in expressions, their python symbols and 
+# functions for folding constants
+bin_ops = {ast.Add : ['+', operator.add], ast.Sub : ['-', operator.sub], 
+	ast.Mult : ['*', operator.mul], ast.Div : ['/', operator.truediv], 
+	ast.Pow : ['**', operator.pow]}
+
+def rrc_comp(reac_coef_g, reac_coef_aq, rrc, rrc_name, self):
+
+	# inputs: ----------------------------------------------------------------------------
+	# reac_coef_g - gas-phase reaction rate coefficient expressions (python format)
+	# reac_coef_aq - aqueous-phase reaction rate coefficient expressions (python format)
+	# rrc - expressions for generic reaction rate coefficients (name=expression)
+	# rrc_name - names given to generic reaction rate coefficients
+	# self - reference to PyCHAM
+	# ------------------------------------------------------------------------------------
+
+	erf = 0; err_mess = '' # begin assuming no errors
+	
+	# names with a known value, either variable (None) or constant
+	env = {}
+	for name in var_names:
+		env[name] = None
+	
+	# generic rate coefficients, in the order given, that need 
+	# evaluation when the function is called
+	rrc_ir = []
+	
+	for line in rrc:
+		name = (line.split('=')[0]).strip()
+		expr = line[line.index('=')+1::]
+		
+		if (not name.isidentifier() or name in resv_names or name[0] == '_'):
+			erf = 1
+			err_mess = str('Error: the name of generic rate coefficient ' + name + ' is not allowed, please rename it in the chemical scheme')
+			return(erf, err_mess, self)
+		try:
+			e = expr_ir(expr, env)
+		except (SyntaxError, ValueError) as err:
+			erf = 1
+			err_mess = str('Error: the generic rate coefficient ' + line.strip() + ' could not be interpreted (' + str(err) + '), please check chemical scheme and associated chemical scheme markers, which are stated in the model variables input file')
+			return(erf, err_mess, self)
+		
+		if (e[0] == 'c'): # constant values are substituted wherever used
+			env[name] = e
+		else:
+			env[name] = None
+			rrc_ir.append((name, e))
+	
+	# expression trees of all reactions, gas-phase first
+	reac_ir = []
+	for i in range(len(reac_coef_g)+len(reac_coef_aq)):
+		if (i < len(reac_coef_g)):
+			expr = reac_coef_g[i]
+			phase = 'gas-phase reaction number ' + str(i+1)
+		else:
+			expr = reac_coef_aq[i-len(reac_coef_g)]
+			phase = 'aqueous-phase reaction number ' + str(i-len(reac_coef_g)+1)
+		try:
+			reac_ir.append(expr_ir(str(expr), env))
+		except (SyntaxError, ValueError) as err:
+			erf = 1
+			err_mess = str('Error: the rate coefficient of ' + phase + ' (' + str(expr).strip() + ') could not be interpreted (' + str(err) + '), please check chemical scheme (including whether definitions for generic rate coefficients have been included), and associated chemical scheme markers, which are stated in the model variables input file')
+			return(erf, err_mess, self)
+	
+	# generate source for the function and compile it
+	self.rrc_src = rrc_src(rrc_ir, reac_ir)
+	self = rrc_load(self)
+	
+	return(erf, err_mess, self)
+
+def rrc_load(self):
+
+	# inputs: ----------------------------------------------------------------------------
+	# self.rrc_src - source of rate coefficient function generated by rrc_comp
+	# ------------------------------------------------------------------------------------
+
+	# the source contains only expressions that passed validation in 
+	# expr_ir, so is compiled and executed in its own namespace
+	nsp = {}
+	exec(compile(self.rrc_src, '<rate coefficients>', 'exec'), nsp)
+	self.rrc_func = nsp['evaluate_rates']
+
+	return(self)
+
+def expr_ir(expr, env):
+
+	# inputs: ----------------------------------------------------------------------------
+	# expr - rate coefficient expression (python format)
+	# env - dictionary of allowed names, with value None if variable or 
+	#	the constant expression tree if constant
+	# ------------------------------------------------------------------------------------
+
+	# expression trees are held as tuples: ('c', value) for constants,
+	# ('n', name) for names, ('j', index) for photolysis rates, 
+	# ('b', operator, left, right) for binary operations, ('u', '-', operand) 
+	# for negation and ('f', function, (arguments)) for function calls, 
+	# which makes them hashable for grouping and elimination of common 
+	# subexpressions
+	node = ast.parse(expr.strip(), mode='eval')
+	
+	return(node_ir(node.body, env))
+
+def node_ir(node, env):
+
+	# inputs: ----------------------------------------------------------------------------
+	# node - node of python abstract syntax tree
+	# env - allowed names (see expr_ir)
+	# ------------------------------------------------------------------------------------
+
+	val = num_val(node)
+	if (val is not None):
+		return(('c', val))
+	
+	if isinstance(node, ast.Name):
+		if (node.id not in env):
+			raise ValueError(str('name ' + node.id + ' not recognised'))
+		if (env[node.id] is not None):
+			return(env[node.id])
+		return(('n', node.id))
+	
+	if isinstance(node, ast.Subscript): # photolysis rate
+		sl = node.slice
+		if (sys.version_info < (3, 9) and isinstance(sl, ast.Index)):
+			sl = sl.value
+		indx = num_val(sl)
+		if (not (isinstance(node.value, ast.Name) and node.value.id == 'J') 
+			or not isinstance(indx, int) or indx < 0):
+			raise ValueError('only photolysis rates (J[n] with integer n) can be indexed')
+		return(('j', indx))
+	
+	if isinstance(node, ast.UnaryOp):
+		e = node_ir(node.operand, env)
+		if isinstance(node.op, ast.UAdd):
+			return(e)
+		if not isinstance(node.op, ast.USub):
+			raise ValueError('operator not allowed')
+		if (e[0] == 'c'):
+			return(('c', -e[1]))
+		return(('u', '-', e))
+	
+	if isinstance(node, ast.BinOp):
+		if (type(node.op) not in bin_ops):
+			raise ValueError('operator not allowed')
+		[op, opf] = bin_ops[type(node.op)]
+		l = node_ir(node.left, env)
+		r = node_ir(node.right, env)
+		if (l[0] == 'c' and r[0] == 'c'): # fold constants
+			try:
+				val = opf(l[1], r[1])
+			except ZeroDivisionError:
+				raise ValueError('division by zero')
+			except OverflowError:
+				raise ValueError('numerical overflow')
+			if isinstance(val, complex):
+				raise ValueError('complex number')
+			if (isinstance(val, int) or math.isfinite(val)):
+				return(('c', val))
+		return(('b', op, l, r))
+	
+	if isinstance(node, ast.Attribute): # numpy constants
+		if (isinstance(node.value, ast.Name) and node.value.id == 'numpy' 
+			and node.attr in ['pi', 'e']):
+			return(('c', float(getattr(numpy, node.attr))))
+		raise ValueError('attribute not allowed')
+	
+	if isinstance(node, ast.Call):
+		if (node.keywords or any(isinstance(a, ast.Starred) for a in node.args)):
+			raise ValueError('keyword or starred arguments not allowed')
+		func = node.func
+		if (isinstance(func, ast.Name) and func.id == 'abs'):
+			fname = 'abs'; ufunc = numpy.abs
+		elif (isinstance(func, ast.Attribute) and isinstance(func.value, ast.Name) 
+			and func.value.id == 'numpy' and 
+			isinstance(getattr(numpy, func.attr, None), numpy.ufunc)):
+			fname = str('numpy.' + func.attr); ufunc = getattr(numpy, func.attr)
+		else:
+			raise ValueError('function not allowed')
+		if (len(node.args) != ufunc.nin):
+			raise ValueError(str('wrong number of arguments to ' + fname))
+		args = tuple(node_ir(a, env) for a in node.args)
+		if all(a[0] == 'c' for a in args): # fold constants
+			with numpy.errstate(all='ignore'):
+				val = ufunc(*[a[1] for a in args])
+			val = numpy.array(val).item()
+			if (isinstance(val, float) and math.isfinite(val)):
+				return(('c', val))
+		return(('f', fname, args))
+	
+	raise ValueError('expression not allowed')
+
+def num_val(node):
+
+	# inputs: ----------------------------------------------------------------------------
+	# node - node of python abstract syntax tree
+	# ------------------------------------------------------------------------------------
+
+	# returns the value of numeric constant nodes or None otherwise
+	if (sys.version_info < (3, 8)):
+		if isinstance(node, ast.Num):
+			return(node.n)
+		return(None)
+	if (isinstance(node, ast.Constant) and type(node.value) in [int, float]):
+		return(node.value)
+	return(None)
+
+def ir_src(e, temps):
+
+	# inputs: ----------------------------------------------------------------------------
+	# e - expression tree
+	# temps - dictionary of subexpressions already assigned to temporaries
+	# ------------------------------------------------------------------------------------
+
+	if e in temps:
+		return(temps[e])
+	if (e[0] == 'c'):
+		if (e[1] < 0):
+			return(str('(' + repr(e[1]) + ')'))
+		return(repr(e[1]))
+	if (e[0] == 'n'):
+		return(e[1])
+	if (e[0] == 'j'):
+		return(str('J[' + str(e[1]) + ']'))
+	if (e[0] == 'u'):
+		return(str('(-' + ir_src(e[2], temps) + ')'))
+	if (e[0] == 'b'):
+		return(str('(' + ir_src(e[2], temps) + e[1] + ir_src(e[3], temps) + ')'))
+	
+	return(str(e[1] + '(' + ', '.join([ir_src(a, temps) for a in e[2]]) + ')'))
+
+def sub_count(e, cnt):
+
+	# inputs: ----------------------------------------------------------------------------
+	# e - expression tree
+	# cnt - dictionary counting occurrences of operations
+	# ------------------------------------------------------------------------------------
+
+	if (e[0] not in ['b', 'u', 'f']):
+		return(cnt)
+	cnt[e] = cnt.get(e, 0)+1
+	if (cnt[e] > 1): # nested operations already counted
+		return(cnt)
+	if (e[0] == 'b'):
+		cnt = sub_count(e[2], cnt)
+		cnt = sub_count(e[3], cnt)
+	if (e[0] == 'u'):
+		cnt = sub_count(e[2], cnt)
+	if (e[0] == 'f'):
+		for a in e[2]:
+			cnt = sub_count(a, cnt)
+	
+	return(cnt)
+
+def hoist(e, cnt, temps, lines):
+
+	# inputs: ----------------------------------------------------------------------------
+	# e - expression tree
+	# cnt - occurrences of operations across reactions
+	# temps - subexpressions already assigned to temporaries
+	# lines - source lines of the function
+	# ------------------------------------------------------------------------------------
+
+	# assign operations occurring more than once to temporaries,
+	# innermost first
+	if (e[0] not in ['b', 'u', 'f'] or e in temps):
+		return(temps, lines)
+	if (e[0] == 'b'):
+		[temps, lines] = hoist(e[2], cnt, temps, lines)
+		[temps, lines] = hoist(e[3], cnt, temps, lines)
+	if (e[0] == 'u'):
+		[temps, lines] = hoist(e[2], cnt, temps, lines)
+	if (e[0] == 'f'):
+		for a in e[2]:
+			[temps, lines] = hoist(a, cnt, temps, lines)
+	if (cnt[e] > 1):
+		tname = str('_t' + str(len(temps)))
+		lines.append(str('		' + tname + ' = ' + ir_src(e, temps)))
+		temps[e] = tname
+	
+	return(temps, lines)
+
+def factors(e):
+
+	# inputs: ----------------------------------------------------------------------------
+	# e - expression tree
+	# ------------------------------------------------------------------------------------
+
+	# factors of a product
+	if (e[0] == 'b' and e[1] == '*'):
+		return(factors(e[2])+factors(e[3]))
+	return([e])
+
+def rrc_src(rrc_ir, reac_ir):
+
+	# inputs: ----------------------------------------------------------------------------
+	# rrc_ir - names and expression trees of generic rate coefficients
+	# reac_ir - expression trees of reaction rate coefficients
+	# ------------------------------------------------------------------------------------
+
+	nreac = len(reac_ir)
+
+	# separate each reaction into a constant coefficient and a
+	# variable kernel, reactions sharing a kernel are evaluated together
+	const_indx = []; const_val = [] # constant reactions
+	kern = {} # kernel: [reaction indices, coefficients]
+	for i in range(nreac):
+		coef = 1.; var = None
+		for f in factors(reac_ir[i]):
+			if (f[0] == 'c'):
+				coef = coef*f[1]
+			elif (var is None):
+				var = f
+			else:
+				var = ('b', '*', var, f)
+		if (var is None):
+			const_indx.append(i); const_val.append(coef)
+			continue
+		if var not in kern:
+			kern[var] = [[], []]
+		kern[var][0].append(i); kern[var][1].append(coef)
+	
+	# operations occurring in more than one kernel
+	cnt = {}
+	for var in kern:
+		cnt = sub_count(var, cnt)
+
+	head = ['\'\'\'reaction rate coefficients, generated by rrc_comp from the chemical scheme\'\'\'', 
+		'', 'import numpy', 'import photolysisRates', '']
+	
+	lines = ['', 'def evaluate_rates(RO2, H2O, TEMP, lightm, time, M, N2, O2, Jlen, NO, HO2, NO3, sumt, self):', '',
+		'	# inputs: ------------------------------------------------------------------',
+		'	# as listed in rrc_calc, TEMP, M, N2 and O2 are either scalars',
+		'	# or 1D arrays with one element per condition, in which case',
+		'	# reactions are in columns of the returned array',
+		'	# ------------------------------------------------------------------------', '',
+		'	erf = 0; err_mess = \'\' # begin assuming no errors', '',
+		'	rate_values = numpy.zeros((numpy.shape(TEMP)+(%i,)))' %(nreac), '']
+	
+	if rrc_ir:
+		lines.append('	try: # generic reaction rate coefficients')
+		for [name, e] in rrc_ir:
+			lines.append(str('		' + name + ' = ' + ir_src(e, {})))
+		lines += ['	except:', '		erf = 1 # flag error',
+		'		err_mess = \'Error: reaction rates failed to be calculated, please check chemical scheme and associated chemical scheme markers, which are stated in the model variables input file\' # error message',
+		'		return(rate_values, erf, err_mess)', '']
+	
+	lines += ['	# photolysis rates',
+		'	if (numpy.ndim(TEMP) == 0): # single set of conditions',
+		'		J = photolysisRates.PhotolysisCalculation(TEMP, Jlen, sumt, self)',
+		'		if (lightm == 0):',
+		'			J = [0]*len(J)',
+		'	else: # photochemical reactions in rows and conditions in columns',
+		'		J = numpy.zeros((Jlen, len(TEMP)))',
+		'		if (lightm != 0):',
+		'			if (self.af_path == \'no\'): # independent of temperature',
+		'				J[:, :] = (numpy.array((photolysisRates.PhotolysisCalculation(TEMP[0], Jlen, sumt, self)))).reshape(-1, 1)',
+		'			else: # cross-sections may depend on temperature',
+		'				for ci in range(len(TEMP)):',
+		'					J[:, ci] = photolysisRates.PhotolysisCalculation(TEMP[ci], Jlen, sumt, self)',
+		'']
+	
+	lines.append('	try: # reaction rate coefficients')
+	if const_indx:
+		head += [str('_ic = numpy.array((' + repr(const_indx) + '))'), 
+			str('_vc = numpy.array((' + repr(const_val) + '))')]
+		lines.append('		rate_values[..., _ic] = _vc')
+	temps = {}
+	for ki, var in enumerate(kern):
+		[temps, lines] = hoist(var, cnt, temps, lines)
+		[indx, coef] = kern[var]
+		if (len(indx) == 1):
+			if (coef[0] == 1.):
+				lines.append(str('		rate_values[..., ' + str(indx[0]) + '] = ' + ir_src(var, temps)))
+			else:
+				lines.append(str('		rate_values[..., ' + str(indx[0]) + '] = ' + ir_src(var, temps) + '*' + ir_src(('c', coef[0]), {})))
+		else:
+			head += [str('_i' + str(ki) + ' = numpy.array((' + repr(indx) + '))'), 
+				str('_c' + str(ki) + ' = numpy.array((' + repr(coef) + '))')]
+			lines.append(str('		rate_values[..., _i' + str(ki) + '] = numpy.multiply.outer(' + ir_src(var, temps) + ', _c' + str(ki) + ')'))
+	if (not const_indx and not kern):
+		lines.append('		pass')
+	lines += ['	except:', '		erf = 1 # flag error',
+		'		err_mess = \'Error: estimating reaction rate coefficients failed, please check chemical scheme (including whether definitions for generic rate coefficients have been included), and associated chemical scheme markers, which are stated in the model variables input file\' # error message',
+		'', '	return(rate_values, erf, err_mess)', '']
+
+	return('\n'.join(head+lines))
@@ -79,6 +79,10 @@ def saving(y_mat, Nresult_dry, Nresult_wet, t_out, savefolder, num_comp,
 	# self.HC - hydrogen to carbon ratio of components
 	# H2Oi - index of water
 	# self.seedi - index of seed components
+	# self.coag_stats - number of coagulation kernels reused, partially updated and
+	#	fully calculated
+	# self.wl_stats - number of times particle deposition rates to walls reused,
+	#	partially updated and fully calculated
 	# siz_str - the size structure
 	# cham_env - chamber environmental conditions (temperature (K), 
 	# pressure (Pa) and relative humidity
@@ -137,6 +141,8 @@ def saving(y_mat, Nresult_dry, Nresult_wet, t_out, savefolder, num_comp,
 	const["index_of_water"] = H2Oi
 	const["index_of_seed_components"] = self.seedi.tolist()
 	const["size_structure_0_for_moving_centre_1_for_full_moving"] = siz_str
+	const["coagulation_kernels_reused_partially_updated_fully_calculated"] = self.coag_stats
+	const["particle_wall_loss_rates_reused_partially_updated_fully_calculated"] = self.wl_stats
 	const["output_by_sim_sch_ext"] = output_by_sim_sch_ext
 	const["output_by_sim_mv_ext"] = output_by_sim_mv_ext
 
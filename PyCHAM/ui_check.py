@@ -27,6 +27,7 @@ import sys
 import numpy as np
 import pickle
 import chem_sch_SMILES
+import prop_backend
 from PyQt5.QtWidgets import *
 from PyQt5.QtGui import  *
 from PyQt5.QtCore import *
@@ -265,29 +266,36 @@ def ui_check(self):
 	
 	# check on UManSysProp ---------------------------------------------------
 
-	# note that whilst conditionally setting uman_up below is required for this section to work, it does not
-	# change the input to the model, rather this is done, if needed (and it's needed when umansysprop 
-	# needs downloading even when the user hasn't specified this), by mod_var_read
-
-	# for UManSysProp if no update requested, check that there 
-	# is an existing UManSysProp folder
-	if (uman_up == 0): # check for existing umansysprop folder
-		if not os.path.isdir(os.getcwd() + '/umansysprop'): # if no existing folder then force update
-			uman_up = 1
-	
-	if (uman_up == 1): # test whether UManSysProp can be updated
-		import urllib.request # module for checking internet connection
-		# function for testing internet connection
-		def connect(host='https://github.com/loftytopping/UManSysProp_public.git'):
-			try:
-				urllib.request.urlopen(host) #Python 3.x
-				return True
-			except:
-				return False
-		# test internet connection
-		if (connect() == False and em_flag < 2):
-			err_mess = str('Error - either user has requested cloning of UManSysProp via the model variables input file or no existing UManSysProp folder has been found, but connection to the page failed, possibly due to no internet connection (UManSysProp repository site: https://github.com/loftytopping/UManSysProp_public.git)')
+	# UManSysProp is not cloned by simulations, rather it must be available 
+	# from the umansysprop folder made by the prop_backend refresh command
+	# (or installed)
+	try:
+		prop_backend.load()
+	except ImportError as err:
+		if (em_flag < 2):
+			err_mess = str('Error - ' + str(err) + ' (UManSysProp repository site: https://github.com/loftytopping/UManSysProp_public.git)')
 			em_flag = 2
+	
+	# check that the version of UManSysProp is the pinned one
+	[err_mess_n, em_flag_n] = prop_backend.pin_check()
+	if (em_flag_n == 2 and em_flag < 2):
+		err_mess = err_mess_n
+		em_flag = 2
+	if (em_flag_n == 1 and em_flag < 2):
+		if (em_flag == 0):
+			err_mess = err_mess_n
+		else:
+			err_mess = str(err_mess+err_mess_n)
+		em_flag = 1 # error message flag for a note
+	
+	# simulations no longer update UManSysProp
+	if (uman_up == 1 and em_flag < 2):
+		err_mess_n = str('Note - umansysprop_update is set to 1, but simulations no longer update UManSysProp, to update it please call python PyCHAM/prop_backend.py refresh latest from the PyCHAM home folder\n')
+		if (em_flag == 0):
+			err_mess = err_mess_n
+		else:
+			err_mess = str(err_mess+err_mess_n)
+		em_flag = 1 # error message flag for a note
 	# ----------------------------------------------------------------------------
 
 	
@@ -366,7 +374,7 @@ def ui_check(self):
 	# ----------------------------------------------------------
 	# check on presence of actinic flux file for photolysis - note this has to 
 	# be before chemical scheme check to stop that check crashing when actinic flux file has a problem
-	if hasattr(self, 'af_path') and self.af_path != []  and self.af_path != 'no': # if file provided
+	if hasattr(self, 'af_path') and self.af_path != []  and self.af_path != 'no' and self.af_path != 'nat_act_flux': # if file provided
 		try: # try opening as in lamp_photo module
 			f = open(self.af_path, 'r') # open file
 			f.close() # close excel file
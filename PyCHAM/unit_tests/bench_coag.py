@@ -0,0 +1,47 @@
+'''benchmark for the scaling of the coagulation kernel with number of size bins'''
+# times the coagulation kernel for 10 to 1000 size bins and records the 
+# peak memory allocated while calculating it, relative to that of the 
+# kernel itself (one array of number of size bins squared), for the kernel 
+# evaluated in blocks of rows (the default) and all at once
+# assumes calling from the PyCHAM home folder
+print('benchmark of coagulation kernel scaling with number of size bins, assumed calling from the PyCHAM home folder')
+
+import os
+import sys
+import time
+import tracemalloc
+dir_path = os.getcwd() # current working directory
+# temporarily add the PyCHAM folder to path
+sys.path.append(str(dir_path+'/PyCHAM'))
+
+import numpy as np
+import coag
+
+# define function
+def bench_coag():
+
+	blk_max = coag.blk_max # default block size
+	
+	for sbn in [10, 30, 100, 300, 1000]:
+	
+		# size bin radii (m) and single particle masses (g) for unit density
+		sbr = np.logspace(-9., -5., sbn)
+		Mp = ((4./3.)*np.pi*sbr**3.)*1.e6
+		
+		res = []
+		for coag.blk_max in [blk_max, 0]:
+			tracemalloc.start()
+			st_time = time.time()
+			Beta = coag.kernel(0.5, 298.15, sbr, sbr, Mp, Mp, 1.e5, 0, 0, None)[0]
+			tim = time.time()-st_time
+			peak = tracemalloc.get_traced_memory()[1]
+			tracemalloc.stop()
+			res.append(str('%.4f' % tim + ' s, peak memory ' + '%.1f' % (peak/Beta.nbytes) + ' kernels'))
+		
+		print(str(str(sbn) + ' size bins: in blocks ' + res[0] + '; at once ' + res[1]))
+	
+	coag.blk_max = blk_max
+	
+	return()
+
+bench_coag() # call on benchmark
@@ -0,0 +1,48 @@
+'''benchmark for the scaling of eqn_interr with mechanism size'''
+# times the interrogation of synthetic chemical schemes of 100 to 20000
+# gas-phase reactions, the time per reaction should be roughly constant
+# assumes calling from the PyCHAM home folder
+print('benchmark of eqn_interr scaling with number of reactions, assumed calling from the PyCHAM home folder')
+
+import os
+import sys
+import time
+dir_path = os.getcwd() # current working directory
+# temporarily add the PyCHAM folder to path
+sys.path.append(str(dir_path+'/PyCHAM'))
+
+import eqn_interr
+
+# define function
+def bench_eqn_interr():
+
+	class testobj: # stand in for the PyCHAM object
+		chem_sch_mrk = ['%', 'RO2', '+', '', '', ';', '+', ';', '$', '%', ':', ';']
+	
+	for neqn in [100, 1000, 5000, 20000]:
+	
+		self = testobj()
+		
+		# synthetic scheme: each alkane is oxidised by OH to a peroxy 
+		# radical which reacts with NO to give the next alkane, so the 
+		# number of components grows with the number of reactions
+		ncomp = int(neqn/2)
+		comp_name = ['OH', 'NO', 'NO2', 'HO2']
+		comp_smil = ['[OH]', '[N]=O', '[O]N=O', '[O]O']
+		eqn_list = []
+		for i in range(ncomp):
+			comp_name += [str('ALK' + str(i)), str('ALK' + str(i) + 'O2')]
+			comp_smil += [str('C'*(1+i%20)), str('C'*(1+i%20) + 'O[O]')]
+			eqn_list.append(str('% 1.0D-11*EXP(-300/TEMP) : ALK' + str(i) + 
+				' + OH = ALK' + str(i) + 'O2 ;'))
+			eqn_list.append(str('% KRO2NO*0.9 : ALK' + str(i) + 'O2 + NO = ALK' + 
+				str((i+1)%ncomp) + ' + 0.9NO2 + 0.1HO2 ;'))
+
+		st_time = time.time()
+		eqn_interr.eqn_interr([neqn, 0], eqn_list, [], comp_name, comp_smil, 1, self)
+		tim = time.time()-st_time
+		print(str(str(neqn) + ' reactions: ' + str(tim) + ' s (' + str(tim/neqn*1.e6) + ' us per reaction)'))
+
+	return()
+
+bench_eqn_interr() # call on benchmark
@@ -0,0 +1,101 @@
+'''benchmark for the full-moving size structure against the per size bin loop'''
+# times fullmov for 50 to 500 size bins against the previous implementation
+# (reproduced below), which reordered size bins with a loop over size bins,
+# for particles that have grown so that half of the size bins have swapped
+# places and for particles that remain in order, and checks that both give
+# the same result
+# assumes calling from the PyCHAM home folder
+print('benchmark of full-moving size structure, assumed calling from the PyCHAM home folder')
+
+import os
+import sys
+import time
+dir_path = os.getcwd() # current working directory
+# temporarily add the PyCHAM folder to path
+sys.path.append(str(dir_path+'/PyCHAM'))
+
+import numpy as np
+import scipy.constants as si
+import fullmov
+
+def fullmov_loop(num_sb, n0, num_comp, Cp, MV, Vol0, Vbou, rbou): # previous implementation
+
+	Cp = np.transpose(Cp.reshape(num_sb, num_comp))
+	NA = si.Avogadro
+	ish = n0[:, 0]>0.
+	nmolC = np.zeros((num_comp, ish.sum()))
+	nmolC[:, :] = ((Cp[:, ish]/(NA*n0[ish, 0])))
+	Vnew = np.zeros((num_sb))
+	MVrep = np.repeat(MV, num_sb, axis=1)
+	Vnew[ish] = np.sum(nmolC*MVrep[:, ish], axis=0)
+	Vnew[n0[:, 0]<=1.0e-10] = Vol0[0::][n0[:, 0]<=1.0e-10]
+	Cp = np.ravel(np.transpose(Cp))
+	Vnew_ord = sorted(Vnew)
+	Cpn = np.zeros((len(Cp)))
+	nn = np.zeros((n0.shape[0], n0.shape[1]))
+	for i in range(len(Vnew)):
+		ind = Vnew_ord.index(Vnew[i])
+		Cpn[(ind)*num_comp:(ind+1)*num_comp] = Cp[(i)*num_comp:(i+1)*num_comp]
+		nn[ind] = n0[i]
+	Vnew_ord = np.array((Vnew_ord))
+	Vbou[1:-1] = Vnew_ord[0:-1]+(Vnew_ord[1::]-Vnew_ord[0:-1])/2.
+	x = ((3.*Vnew_ord)/(4.*np.pi))**(1./3.)
+	rbou = ((3.*Vbou)/(4.*np.pi))**(1./3.)
+	return(Vnew_ord, x, Cpn, nn, Vbou, rbou)
+
+# define function
+def bench_fullmov():
+
+	num_comp = 200 # number of components
+	nrep = 20 # number of calls timed
+	MV = np.random.uniform(1.e11, 3.e11, (num_comp, 1)) # molar volumes (um3/mol)
+	
+	for num_sb in [50, 100, 200, 500]:
+		
+		# starting volumes at size bin centres (um3) and bounds (um3)
+		Vol0 = np.logspace(-6., 0., num_sb)
+		Vbou0 = np.logspace(-6.2, 0.2, num_sb+1)
+		rbou0 = ((3.*Vbou0)/(4.*np.pi))**(1./3.)
+		n0 = np.ones((num_sb, 1))*1.e3 # number concentrations (#/cc)
+		n0[1::7] = 0. # some empty size bins
+		
+		res = []
+		for swap in [1, 0]: # with and without swapped size bins
+			
+			# particle-phase concentrations (# molecules/cc) giving
+			# particle volumes just above the starting volumes (so that
+			# volumes differ from those of empty size bins), with every
+			# other pair of neighbouring size bins swapped
+			Vp = Vol0*1.01
+			if (swap == 1):
+				Vp[0:-1:4], Vp[1::4][0:len(Vp[0:-1:4])] = Vp[1::4][0:len(Vp[0:-1:4])], Vp[0:-1:4].copy()
+			frac = np.random.uniform(0., 1., (num_sb, num_comp))
+			frac = frac/(frac.dot(MV[:, 0])).reshape(-1, 1)
+			Cp = (frac*(Vp*si.Avogadro*n0[:, 0]).reshape(-1, 1)).reshape(-1)
+			
+			tim = []
+			out = []
+			for func in [fullmov_loop, fullmov.fullmov]:
+				st_time = time.time()
+				for i in range(nrep):
+					# each call starts from the same concentrations
+					y = np.concatenate((np.zeros((num_comp)), Cp))
+					N_perbin = np.array((n0))
+					res_now = func(num_sb, N_perbin, num_comp, y[num_comp::], MV, 
+						Vol0, np.array((Vbou0)), rbou0)
+				tim.append((time.time()-st_time)/nrep)
+				out.append(res_now)
+			
+			# largest relative difference between implementations
+			diff = max([np.max(np.abs(out[0][i]-out[1][i])/np.maximum(np.abs(out[0][i]), 1.e-30)) 
+				for i in range(len(out[0]))])
+			
+			res.append(str('loop ' + '%.5f' % tim[0] + ' s, vectorized ' + '%.5f' % tim[1] + 
+				' s (max. relative difference ' + '%.1e' % diff + ')'))
+		
+		print(str(str(num_sb) + ' size bins, ' + str(num_comp) + ' components: swapped ' + 
+			res[0] + '; in order ' + res[1]))
+	
+	return()
+
+bench_fullmov() # call on benchmark
@@ -0,0 +1,172 @@
+'''benchmark for the scaling of simulation setup with mechanism size'''
+# times parsing of synthetic chemical schemes (written by synth_mech.py) of
+# 1000 to 20000 reactions, the Jacobian setup (part of parsing), generation
+# of the ODE solver module, one evaluation of the ODEs (right-hand side), one
+# evaluation of the Jacobian and integration over a fixed 60 s with two
+# particle size bins, so that any part of setup or solution that scales
+# worse than linearly with mechanism size is visible, each size is timed
+# for gas-phase reactions with lights off, with photolysis reactions and
+# lights on and with aqueous-phase reactions in both particle size bins
+# note that, like a simulation, this overwrites the generated modules
+# (e.g. ode_solv.py) and pickle.pkl in the PyCHAM folder
+# assumes calling from the PyCHAM home folder
+print('benchmark of setup scaling with mechanism size, assumed calling from the PyCHAM home folder')
+
+import os
+import sys
+import time
+import shutil
+import tempfile
+import importlib
+dir_path = os.getcwd() # current working directory
+# temporarily add the PyCHAM and unit test folders to path
+sys.path.append(str(dir_path+'/PyCHAM'))
+sys.path.append(str(dir_path+'/PyCHAM/unit_tests'))
+
+import numpy as np
+import def_mod_var
+import eqn_pars
+import jac_setup
+import write_ode_solv
+import rrc_calc
+import synth_mech
+
+# time spent per stage (s)
+tim = {}
+
+def timed(mod, fname, key): # wrap a module function so that its time is recorded
+	func = getattr(mod, fname)
+	def wrap(*args, **kwargs):
+		st_time = time.time()
+		res = func(*args, **kwargs)
+		tim[key] = tim.get(key, 0.)+time.time()-st_time
+		return(res)
+	setattr(mod, fname, wrap)
+
+# define function
+def bench_setup():
+
+	class testobj: # stand in for the PyCHAM object
+		pass
+
+	# record times of Jacobian setup and ODE solver module generation
+	timed(jac_setup, 'jac_setup', 'jac_setup')
+	timed(write_ode_solv, 'ode_gen', 'code generation')
+
+	tmp_dir = tempfile.mkdtemp()
+
+	# cases of photolysis fraction of gas-phase reactions, whether
+	# natural light on (1) or off (0) and aqueous-phase fraction of reactions
+	cases = [['gas-phase, lights off', 0., 0, 0.],
+		['photolysis, lights on', 0.1, 1, 0.],
+		['aqueous-phase', 0., 0, 0.1]]
+
+	for [ncomp, neqn] in [[300, 1000], [1500, 5000], [6000, 20000]]:
+		for casei, [case, photo_frac, lightm, aq_frac] in enumerate(cases):
+
+			tim.clear()
+
+			[sch_name, xml_name, chem_sch_mrk] = synth_mech.synth_mech(
+				str(tmp_dir + '/synth' + str(neqn) + '_' + str(casei)), ncomp,
+				neqn, fan_out=3, photo_frac=photo_frac, aq_frac=aq_frac)
+
+			# default model variables, with synthetic scheme
+			self = testobj()
+			out = def_mod_var.def_mod_var(0, self)
+			[sav_nam, int_tol, drh_str, erh_str, pcont, self] = [out[0], out[36],
+				out[55], out[56], out[57], out[-1]]
+			self.sch_name = sch_name; self.xml_name = xml_name
+			self.chem_sch_mrk = chem_sch_mrk
+			self.mech_cache_dir = tmp_dir # not used for repeats as each scheme new
+			self.wall_on = 0
+			num_sb = 2 # number of size bins
+
+			st_time = time.time()
+			[rindx, pindx, rstoi, pstoi, nreac, nprod, jac_stoi,
+				njac, jac_den_indx, jac_indx, y_arr, y_rind,
+				uni_y_rind, y_pind, uni_y_pind, reac_col, prod_col,
+				rstoi_flat, pstoi_flat, rr_arr, rr_arr_p, rowvals, colptrs,
+				jac_wall_indx, jac_part_indx, jac_extr_indx, comp_num, comp_list,
+				Pybel_objects, eqn_num, comp_namelist, Jlen,
+				rindx_aq, rstoi_aq, pindx_aq, pstoi_aq, reac_coef_aq,
+				nreac_aq, nprod_aq, jac_stoi_aq,
+				jac_den_indx_aq, njac_aq, jac_indx_aq,
+				y_arr_aq, y_rind_aq, uni_y_rind_aq, y_pind_aq,
+				uni_y_pind_aq, reac_col_aq, prod_col_aq, rstoi_flat_aq, pstoi_flat_aq,
+				rr_arr_aq, rr_arr_p_aq, comp_name, comp_smil, erf, err_mess,
+				self] = eqn_pars.extr_mech(int_tol, num_sb, drh_str, erh_str,
+				sav_nam, pcont, self)
+			tim['parse'] = time.time()-st_time-tim['code generation']
+			if (erf != 0):
+				print(err_mess)
+				return()
+
+			# initial concentrations (# molecules/cm3), organics and particles
+			# all the same
+			num_comp = comp_num+2 # including water and core
+			H2Oi = comp_num; self.seedi = np.array((comp_num+1)).reshape(1)
+			y = np.ones((num_comp*(num_sb+1)))*1.e3
+			y[0:comp_num] = 1.e9
+			for [comp, conc] in [['O3', 1.e12], ['NO', 1.e10], ['NO2', 1.e10],
+				['OH', 1.e6], ['HO2', 1.e8]]:
+				y[comp_namelist.index(comp)] = conc
+			y[H2Oi] = 3.e17
+
+			# reaction rate coefficients, with natural light on or off, 
+			# starting at midday when on
+			self.daytime = 12.*3600.*lightm
+			[rrc, erf, err_mess] = rrc_calc.rrc_calc(y[H2Oi], 298.15, lightm, y, 1.e5,
+				Jlen, y[comp_namelist.index('NO')], y[comp_namelist.index('HO2')],
+				y[comp_namelist.index('NO3')], 0., self)
+
+			# partitioning inputs, all the same
+			Psat = np.ones((num_sb, num_comp))*1.e10
+			Psat_Pa = np.zeros((1, num_comp))
+			act_coeff = np.ones((num_sb, num_comp))
+			kimt = np.ones((num_sb, num_comp))*1.e-3
+			kelv_fac = np.ones((num_sb, 1))
+			N_perbin = np.ones((num_sb, 1))*1.e3
+
+			# time one evaluation of the ODEs and Jacobian inside the generated
+			# solver, then integrate
+			import ode_solv
+			ode_solv = importlib.reload(ode_solv)
+			solve_ivp = ode_solv.solve_ivp
+			def solve_timed(fun, t_span, y0, **kwargs):
+				st_time = time.time()
+				fun(0., y0.reshape(-1, 1))
+				tim['RHS'] = time.time()-st_time
+				st_time = time.time()
+				kwargs['jac'](0., y0.reshape(-1, 1))
+				tim['Jacobian'] = time.time()-st_time
+				return(solve_ivp(fun, t_span, y0, **kwargs))
+			ode_solv.solve_ivp = solve_timed
+
+			st_time = time.time()
+			ode_solv.ode_solv(y, 60., rindx, pindx, rstoi, pstoi,
+				nreac, nprod, rrc, jac_stoi, njac, jac_den_indx, jac_indx,
+				np.zeros((0, 1)), y_arr, y_rind, uni_y_rind, y_pind, uni_y_pind,
+				reac_col, prod_col, rstoi_flat,
+				pstoi_flat, rr_arr, rr_arr_p, rowvals, colptrs, num_comp,
+				num_sb, Psat, 0., act_coeff, 0., jac_wall_indx,
+				1., kelv_fac, kimt, num_sb, jac_part_indx, jac_extr_indx,
+				rindx_aq, pindx_aq, rstoi_aq, pstoi_aq,
+				nreac_aq, nprod_aq, jac_stoi_aq, njac_aq, jac_den_indx_aq, jac_indx_aq,
+				y_arr_aq, y_rind_aq, uni_y_rind_aq, y_pind_aq, uni_y_pind_aq,
+				reac_col_aq, prod_col_aq, rstoi_flat_aq,
+				pstoi_flat_aq, rr_arr_aq, rr_arr_p_aq, eqn_num, 0,
+				np.zeros((0)).astype(int), -1*np.ones((num_sb)).astype(int), N_perbin,
+				np.zeros((0)).astype(int), H2Oi, comp_namelist, Psat_Pa, [],
+				np.zeros((0, 1)), self)
+			tim['integration'] = time.time()-st_time-tim['RHS']-tim['Jacobian']
+
+			print(str(str(neqn) + ' reactions (' + str(comp_num) + ' components, ' +
+				case + '): ' +
+				', '.join(str(key + ' ' + '%.3f' % tim[key] + ' s') for key in ['parse',
+				'jac_setup', 'code generation', 'RHS', 'Jacobian', 'integration'])))
+
+	shutil.rmtree(tmp_dir)
+
+	return()
+
+bench_setup() # call on benchmark
@@ -0,0 +1,170 @@
+'''generator of synthetic chemical schemes'''
+# writes a random, but chemically well-formed, chemical scheme in the
+# format of the PyCHAM example schemes (markers: %, RO2, +, , , ;, +, ;,
+# $, %, :, ;) with a matching xml file of component names and SMILES, so
+# that the scaling of PyCHAM with mechanism size can be examined without
+# sharing production schemes
+# components are organised in families of an alkane, its peroxy radical
+# and the hydroperoxide, alcohol, nitrate and carbonyl products of that
+# radical, with reactions following the usual oxidation pathways
+
+import numpy as np
+
+# inorganic components and their SMILES
+inorg = {'OH' : '[OH]', 'HO2' : '[O]O', 'NO' : '[N]=O', 'NO2' : '[O]N=O',
+	'NO3' : '[N+](=O)([O-])[O]', 'O3' : '[O-][O+]=O', 'CO' : '[C-]#[O+]'}
+
+# members of each family: suffix of chemical scheme name and
+# function giving SMILES from number of carbons
+fam_mem = [['H', lambda nC: 'C'*nC],
+	['O2', lambda nC: str('C'*nC + 'O[O]')],
+	['OOH', lambda nC: str('C'*nC + 'OO')],
+	['OH', lambda nC: str('C'*nC + 'O')],
+	['NO3', lambda nC: str('C'*nC + 'ON(=O)=O')],
+	['CHO', lambda nC: str('C'*(nC-1) + 'C=O')]]
+
+# photolysis channels (MCM numbering) for hydroperoxides, nitrates and
+# carbonyls
+J_OOH = [41]
+J_NO3 = [51, 52, 53, 54, 55, 56, 57]
+J_CHO = [11, 12, 13, 14, 15, 16, 17, 18, 19, 21, 22, 23, 24]
+
+# define function
+def synth_mech(fname, ncomp, neqn, fan_out=2, photo_frac=0.1, aq_frac=0.,
+	seed=0):
+
+	# inputs: ------------------------------------------------------------
+	# fname - path and start of file names, the chemical scheme is written
+	#	to fname+'_scheme.txt' and the xml to fname+'_xml.xml'
+	# ncomp - number of organic components
+	# neqn - number of reactions
+	# fan_out - number of organic products per reaction
+	# photo_frac - fraction of gas-phase reactions that are photolysis
+	# aq_frac - fraction of reactions that are aqueous-phase
+	# seed - seed of random number generator
+	# --------------------------------------------------------------------
+
+	rs = np.random.RandomState(seed)
+
+	# number of families, with members given by fam_mem
+	nfam = max(int(np.ceil(ncomp/len(fam_mem))), 1)
+	# number of carbons per family (1-12)
+	nC = 1+np.arange(nfam)%12
+
+	def name(fi, mi): # chemical scheme name of family member
+		return(str('F' + str(fi) + fam_mem[mi][0]))
+
+	def prods(fi, main): # products of a reaction of family fi
+		# main products followed by further organic products from this family
+		# or a smaller family (fragmentation), with branching ratios summing
+		# to one
+		pl = list(main)
+		while (len(pl) < fan_out):
+			fj = rs.randint(max(fi-12, 0), fi+1)
+			pl.append(name(fj, rs.choice([1, 3, 5])))
+		br = rs.dirichlet(np.ones(len(pl)))
+		# combine any repeated products
+		pd = {}
+		for i in range(len(pl)):
+			pd[pl[i]] = pd.get(pl[i], 0.)+br[i]
+		return(' + '.join(str('%.3f' % pd[nam] + nam) for nam in pd))
+
+	def k_arr(): # Arrhenius rate coefficient
+		return(str('%.2fD-%d*EXP(%d/TEMP)' % (rs.uniform(1., 9.9),
+			rs.randint(11, 14), rs.randint(-600, 600))))
+
+	eqn_g = []; eqn_aq = []
+
+	for ei in range(neqn):
+
+		fi = ei%nfam # cycle through families so all components are used
+
+		if (rs.uniform() < aq_frac): # aqueous-phase reactions
+			if (rs.uniform() < 0.5): # hydration of carbonyl to alcohol
+				eqn_aq.append(str('$% ' + '%.2fD-%d' % (rs.uniform(1., 9.9),
+					rs.randint(3, 6)) + ' : ' + name(fi, 5) + ' = ' +
+					name(fi, 3) + ' ;'))
+			else: # reaction of alcohol with hydroperoxide
+				eqn_aq.append(str('$% ' + '%.2fD-%d' % (rs.uniform(1., 9.9),
+					rs.randint(14, 18)) + ' : ' + name(fi, 3) + ' + ' +
+					name(rs.randint(0, nfam), 2) + ' = ' + prods(fi, []) + ' ;'))
+			continue
+
+		if (rs.uniform() < photo_frac): # photolysis
+			mi = rs.choice([2, 4, 5])
+			if (mi == 2): # hydroperoxide
+				eqn_g.append(str('% J(' + str(rs.choice(J_OOH)) + ') : ' +
+					name(fi, 2) + ' = ' + prods(fi, [name(fi, 5)]) + ' + OH + HO2 ;'))
+			if (mi == 4): # nitrate
+				eqn_g.append(str('% J(' + str(rs.choice(J_NO3)) + ') : ' +
+					name(fi, 4) + ' = ' + prods(fi, [name(fi, 5)]) + ' + NO2 + HO2 ;'))
+			if (mi == 5): # carbonyl
+				eqn_g.append(str('% J(' + str(rs.choice(J_CHO)) + ')*' +
+					'%.2f' % rs.uniform(0.1, 1.) + ' : ' + name(fi, 5) + ' = ' +
+					prods(fi, [name(max(fi-1, 0), 1)]) + ' + HO2 + CO ;'))
+			continue
+
+		# bimolecular reactions
+		ri = rs.randint(0, 8)
+		if (ri < 3): # alkane oxidation by OH, O3 or NO3
+			ox = ['OH', 'O3', 'NO3'][ri]
+			eqn_g.append(str('% ' + k_arr() + ' : ' + name(fi, 0) + ' + ' +
+				ox + ' = ' + prods(fi, [name(fi, 1)]) + ' ;'))
+		if (ri == 3): # peroxy radical with NO
+			eqn_g.append(str('% KRO2NO*' + '%.2f' % rs.uniform(0.1, 1.) +
+				' : ' + name(fi, 1) + ' + NO = ' + prods(fi, [name(fi, 5),
+				name(fi, 4)]) + ' + NO2 + HO2 ;'))
+		if (ri == 4): # peroxy radical with HO2
+			eqn_g.append(str('% KRO2HO2*' + '%.2f' % rs.uniform(0.5, 1.) +
+				' : ' + name(fi, 1) + ' + HO2 = ' + name(fi, 2) + ' ;'))
+		if (ri == 5): # peroxy radical with the peroxy radical pool
+			eqn_g.append(str('% 2.00D-13*RO2*' + '%.2f' % rs.uniform(0.1, 1.) +
+				' : ' + name(fi, 1) + ' = ' + prods(fi, [name(fi, 3)]) + ' ;'))
+		if (ri == 6): # hydroperoxide, alcohol or nitrate with OH
+			mi = rs.choice([2, 3, 4])
+			eqn_g.append(str('% ' + k_arr() + ' : ' + name(fi, mi) +
+				' + OH = ' + prods(fi, [name(fi, 1)]) + ' ;'))
+		if (ri == 7): # carbonyl with OH, fragmenting to smaller radical
+			eqn_g.append(str('% ' + k_arr() + ' : ' + name(fi, 5) +
+				' + OH = ' + prods(fi, [name(max(fi-1, 0), 1)]) + ' + CO ;'))
+
+	# inorganic chemistry, so that oxidants are produced and consumed
+	eqn_g += ['% J(1) : O3 = OH + OH ;', '% 1.70D-12*EXP(-940/TEMP) : OH + O3 = HO2 ;',
+		'% 3.45D-12*EXP(270/TEMP) : HO2 + NO = OH + NO2 ;',
+		'% J(4) : NO2 = NO + O3 ;', '% 1.40D-13*EXP(-2470/TEMP) : NO2 + O3 = NO3 ;',
+		'% J(6) : NO3 = NO2 + O3 ;']
+
+	# scheme file
+	f = open(str(fname + '_scheme.txt'), mode='w')
+	f.write('* synthetic chemical scheme written by synth_mech.py ;\n')
+	f.write('* Generic Rate Coefficients ;\n')
+	f.write('KRO2NO = 2.7D-12*EXP(360/TEMP) ;\n')
+	f.write('KRO2HO2 = 2.91D-13*EXP(1300/TEMP) ;\n')
+	f.write('* Peroxy radicals. ;\n')
+	f.write(str('RO2 = ' + ' + '.join(name(fi, 1) for fi in range(nfam)) + ' ;\n'))
+	f.write('* Reaction definitions. ;\n')
+	for eqn in (eqn_g+eqn_aq):
+		f.write(str(eqn + '\n'))
+	f.close()
+
+	# xml file
+	f = open(str(fname + '_xml.xml'), mode='w')
+	f.write('<?xml version="1.0" encoding="UTF-8"?>\n<mechanism>\n<species_defs>\n')
+	cnt = 1
+	for nam in inorg:
+		f.write(str('<species species_number="s' + str(cnt) + '" species_name="' +
+			nam + '">\n<smiles>' + inorg[nam] + '</smiles>\n</species>\n'))
+		cnt += 1
+	for fi in range(nfam):
+		for mi in range(len(fam_mem)):
+			f.write(str('<species species_number="s' + str(cnt) + '" species_name="' +
+				name(fi, mi) + '">\n<smiles>' + fam_mem[mi][1](nC[fi]) +
+				'</smiles>\n</species>\n'))
+			cnt += 1
+	f.write('</species_defs>\n</mechanism>\n')
+	f.close()
+
+	# markers for the chemical scheme
+	chem_sch_mrk = ['%', 'RO2', '+', '', '', ';', '+', ';', '$', '%', ':', ';']
+
+	return(str(fname + '_scheme.txt'), str(fname + '_xml.xml'), chem_sch_mrk)
@@ -0,0 +1,80 @@
+'''unit test for the tabulated natural actinic flux in nat_act_flux'''
+# the functions to be tested - act_flux_tab and act_flux_interp of
+# nat_act_flux are responsible for tabulating the actinic flux at Earth
+# surface over solar zenith angles and interpolating it during simulations,
+# here the interpolated flux at zenith angles between the tabulated angles
+# is compared against a direct solution by act_flux_calc, for both
+# conservative and absorbing atmospheres, and the flux is checked to be
+# zero when the sun is below the horizon
+# assumes calling from the PyCHAM home folder
+print('unit test for the tabulated natural actinic flux, assumed calling from the PyCHAM home folder')
+
+import os
+import sys
+dir_path = os.getcwd() # current working directory
+# temporarily add the PyCHAM folder to path
+sys.path.append(str(dir_path+'/PyCHAM'))
+
+import numpy as np
+import nat_act_flux
+
+# define function
+def test_act_flux_interp():
+
+	class testobj: # stand in for the PyCHAM object
+		pass
+
+	# solar zenith angles (degrees) that are not on the table grid
+	theta = np.array((0.2, 23.7, 47.3, 71.9, 86.1))
+
+	# single conservative (non-absorbing) layer, then two absorbing and
+	# forward scattering layers
+	for case in ['conservative', 'absorbing']:
+
+		self = testobj()
+		self.nat_act_wl = np.arange(290., 701., 10.) # wavelengths (nm)
+		# top-of-the-atmosphere actinic flux (photon/cm2/nm/s)
+		self.nat_act_F0 = np.ones((len(self.nat_act_wl)))*1.e14
+		self.nat_act_A = 0.2 # surface albedo
+		if (case == 'conservative'):
+			# Rayleigh optical depth (wavelength in um)
+			self.nat_act_tau = (0.0088*(self.nat_act_wl*1.e-3)**(-4.05)).reshape(-1, 1)
+			self.nat_act_a = np.array((1.))
+			self.nat_act_g = np.array((0.))
+		else:
+			self.nat_act_tau = np.ones((len(self.nat_act_wl), 2))*[0.1, 0.3]
+			self.nat_act_a = np.array((0.95, 0.9)).reshape(1, -1)
+			self.nat_act_g = np.array((0.7, 0.6)).reshape(1, -1)
+
+		for thetai in theta:
+
+			cosx = np.cos(thetai*np.pi/180.)
+			[wl, act_interp] = nat_act_flux.act_flux_interp(cosx, self)
+
+			# direct solution at this zenith angle
+			act_direct = nat_act_flux.act_flux_calc(self.nat_act_A,
+				self.nat_act_a, self.nat_act_F0, self.nat_act_tau,
+				self.nat_act_g, np.array((cosx)).reshape(1))[0, :]
+
+			if (any(wl != self.nat_act_wl)):
+				print(str('wavelengths of interpolated actinic flux incorrect for ' + 
+					case + ' atmosphere'))
+
+			# linear interpolation over the 0.5 degree grid, with error 
+			# largest where flux curves most, towards the horizon
+			rel_err = np.max(np.abs(act_interp-act_direct)/act_direct)
+			if (rel_err > 5.e-3):
+				print(str('interpolated actinic flux differs from direct solution by ' +
+					'%.2e' % rel_err + ' (fraction) at zenith angle ' + str(thetai) +
+					' degrees for ' + case + ' atmosphere'))
+
+		# sun at and below horizon
+		for cosx in [0., -0.3, -1.]:
+			[wl, act] = nat_act_flux.act_flux_interp(cosx, self)
+			if (any(act != 0.)):
+				print(str('actinic flux not zero for sun below horizon (cosine of zenith angle ' +
+					str(cosx) + ') for ' + case + ' atmosphere'))
+
+	return()
+
+test_act_flux_interp() # call function
@@ -0,0 +1,109 @@
+'''unit test for the cached coagulation kernel of coag'''
+# the function to be tested - kernel_cache of coag reuses the coagulation
+# kernel between calls, recalculating only the rows and columns of size
+# bins whose radius or single particle mass has changed, here the cached
+# kernel is compared against a full calculation by kernel after
+# perturbing a few size bins, a change to temperature, pressure or
+# relative humidity is checked to give a full calculation, changes below
+# the tolerance are checked to reuse the kernel, and the counts of reused,
+# partially updated and fully calculated kernels are checked
+# assumes calling from the PyCHAM home folder
+print('unit test for the cached coagulation kernel, assumed calling from the PyCHAM home folder')
+
+import os
+import sys
+import shutil
+import tempfile
+dir_path = os.getcwd() # current working directory
+# temporarily add the PyCHAM folder to path
+sys.path.append(str(dir_path+'/PyCHAM'))
+
+import numpy as np
+import coag
+
+# define function
+def test_coag_cache():
+
+	class testobj: # stand in for the PyCHAM object
+		pass
+
+	tmp_dir = tempfile.mkdtemp()
+
+	sbn = 20 # number of size bins
+	sbr = np.logspace(-8., -5.5, sbn) # radius (m)
+	# single particle mass of unit density (g)
+	Mp = (4./3.)*np.pi*sbr**3.*1.e6
+	cond = [0.5, 298.15, 1.e5] # RH (fraction), T (K) and pressure (Pa)
+
+	for vdWon in [0, 1]: # without and with van der Waals correction
+
+		self = testobj()
+		self.coag_tol = 0.
+		self.mech_cache_dir = tmp_dir # for the van der Waals table
+
+		def check(sbr, rint, Mpi, Mpj, cond, stats, case):
+
+			[RH, T, PInit] = cond
+			[Beta, Gi, eta_ai] = coag.kernel_cache(RH, T, sbr, rint, Mpi, Mpj,
+				PInit, vdWon, self)
+			[Beta_f, Gi_f, eta_ai_f] = coag.kernel(RH, T, sbr, rint, Mpi, Mpj,
+				PInit, vdWon, 0, self)
+			if (any((Beta != Beta_f).ravel()) or any(Gi != Gi_f) or eta_ai != eta_ai_f):
+				print(str('cached kernel differs from full calculation for ' + case +
+					' (van der Waals flag ' + str(vdWon) + ')'))
+			if (self.coag_stats != stats):
+				print(str('counts of reused, partially updated and fully calculated ' +
+					'kernels incorrect for ' + case + ' (van der Waals flag ' +
+					str(vdWon) + '): ' + str(self.coag_stats) + ' instead of ' +
+					str(stats)))
+
+		sbr_i = np.array(sbr); Mp_i = np.array(Mp)
+		check(sbr_i, sbr, Mp_i, Mp, cond, [0, 0, 1], 'first call')
+		check(sbr_i, sbr, Mp_i, Mp, cond, [1, 0, 1], 'no change')
+
+		# a few size bins grow (rows and columns both change, as for
+		# coagulation of size bins with themselves)
+		sbr_i = np.array(sbr_i); Mp_i = np.array(Mp_i)
+		sbr_i[[3, 11]] *= 1.02; Mp_i[[3, 11]] *= 1.02**3.
+		check(sbr_i, sbr_i, Mp_i, Mp_i, cond, [1, 1, 1], 'radius and mass change')
+
+		# mass only (e.g. change in density) of one size bin
+		Mp_i = np.array(Mp_i); Mp_i[7] *= 1.1
+		check(sbr_i, sbr_i, Mp_i, Mp_i, cond, [1, 2, 1], 'mass change')
+
+		# columns only change
+		rint = np.array(sbr_i); Mpj = np.array(Mp_i)
+		rint[15] *= 0.99; Mpj[15] *= 0.99**3.
+		check(sbr_i, rint, Mp_i, Mpj, cond, [1, 3, 1], 'column change')
+
+		# chamber conditions force full calculation
+		nfull = 1
+		for ci in range(3):
+			cond_n = list(cond); cond_n[ci] *= 1.001
+			nfull += 1
+			check(sbr_i, rint, Mp_i, Mpj, cond_n, [1, 3, nfull],
+				str(['relative humidity', 'temperature', 'pressure'][ci] + ' change'))
+			cond = cond_n
+
+		# many size bins changing forces full calculation
+		sbr_n = sbr_i*1.01; Mp_n = Mp_i*1.01**3.
+		nfull += 1
+		check(sbr_n, sbr_n, Mp_n, Mp_n, cond, [1, 3, nfull], 'most size bins change')
+
+		# changes below tolerance reuse the kernel of the previous inputs
+		self.coag_tol = 1.e-3
+		[RH, T, PInit] = cond
+		[Beta0, Gi0, eta_ai0] = coag.kernel_cache(RH, T, sbr_n, sbr_n, Mp_n, Mp_n,
+			PInit, vdWon, self)
+		sbr_t = sbr_n*(1.+1.e-4)
+		[Beta, Gi, eta_ai] = coag.kernel_cache(RH*(1.+1.e-4), T, sbr_t, sbr_t, Mp_n,
+			Mp_n, PInit, vdWon, self)
+		if (any((Beta != Beta0).ravel()) or self.coag_stats != [3, 3, nfull]):
+			print(str('kernel not reused for changes below tolerance (van der Waals flag ' +
+				str(vdWon) + ')'))
+
+	shutil.rmtree(tmp_dir)
+
+	print('coagulation kernel cache unit test complete')
+
+test_coag_cache() # call on test
@@ -0,0 +1,65 @@
+'''unit test for coag_vdW'''
+# the module to be tested - coag_vdW is responsible for the table of van der
+# Waals/viscous collision correction factors used in coagulation kernels,
+# here the interpolated factors are compared with direct integration and
+# the reuse of the table stored on disk is tested
+# assumes calling from the PyCHAM home folder
+print('unit test for the tabulated van der Waals coagulation correction, assumed calling from the PyCHAM home folder')
+
+import os
+import sys
+import shutil
+import tempfile
+dir_path = os.getcwd() # current working directory
+# temporarily add the PyCHAM folder to path
+sys.path.append(str(dir_path+'/PyCHAM'))
+
+import numpy as np
+import coag_vdW
+
+# define function
+def test_coag_vdW():
+
+	class testobj: # stand in for the PyCHAM object
+		pass
+
+	self = testobj()
+	tmp_dir = tempfile.mkdtemp()
+	self.mech_cache_dir = tmp_dir
+
+	# table integrated (in parallel) and stored
+	coag_vdW.tab = None
+	coag_vdW.tab_load(self)
+	if not os.path.exists(os.path.join(tmp_dir, 'coag_vdW.npz')):
+		print('table not stored')
+	if (coag_vdW.tab_err > 1.e-3):
+		print(str('interpolation of table inaccurate between grid points (maximum relative error ' + str(coag_vdW.tab_err) + ')'))
+
+	# interpolated and directly integrated factors agree at arbitrary radius ratios
+	q = np.array((-4.37, -1.234, -0.01, 0.3333, 2.71))
+	W = coag_vdW.W_int(q)
+	if (np.max(np.abs(coag_vdW.W_interp(q)-W)/W) > 1.e-3):
+		print('interpolated correction factors do not agree with direct integration')
+
+	# and with factors from integration over radii in metres (as previously in
+	# coag), for pairs of similar size (where the absolute tolerance of that
+	# integration did not limit accuracy)
+	W = coag_vdW.W_interp(np.log10(np.array((1., 10., 0.1))))
+	if (np.max(np.abs(W-np.array(((1.32394855, 5.22263462), (1.14122530, 2.54469174), 
+		(1.20587546, 2.54469174))))/W) > 1.e-2):
+		print('correction factors do not agree with those of direct integration in metres')
+
+	# table loaded from disk rather than integrated again
+	tab = coag_vdW.tab
+	coag_vdW.tab = None
+	coag_vdW.W_par = None # would fail if called
+	coag_vdW.tab_load(self)
+	if not np.array_equal(coag_vdW.tab, tab):
+		print('table from disk differs from that integrated')
+
+	shutil.rmtree(tmp_dir)
+
+	print('coag_vdW unit test complete')
+
+if __name__ == '__main__': # as worker processes import this module
+	test_coag_vdW() # call on test
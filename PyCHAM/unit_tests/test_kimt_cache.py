@@ -0,0 +1,136 @@
+'''unit test for the cached gas-particle partitioning coefficients of partit_var'''
+# the function to be tested - kimt_calc of partit_var reuses gas-particle
+# partitioning coefficients of size bins whose radius, number concentration
+# and accommodation coefficients are unchanged (kimt_cache) and the mask of
+# components with low condensability (cutoff_mask), here the result of
+# kimt_calc is compared against the direct (uncached) formula over calls
+# that change each of the inputs the caches depend on, then for a second
+# simulation with a different number of components
+# assumes calling from the PyCHAM home folder
+print('unit test for the cached gas-particle partitioning coefficients, assumed calling from the PyCHAM home folder')
+
+import os
+import sys
+dir_path = os.getcwd() # current working directory
+# temporarily add the PyCHAM folder to path
+sys.path.append(str(dir_path+'/PyCHAM'))
+
+import numpy as np
+import scipy.constants as si
+import partit_var
+
+# partitioning coefficients (size bins in rows, components in columns) by
+# the direct formula
+def kimt_direct(mfp, accom, DStar_org, radius, N_perbin, partit_cutoff, NA,
+	R_gas, TEMP, Psat, act_coeff, H2Oi):
+
+	# Knudsen number and Fuchs-Sutugin correction, eq. 16.19 of
+	# Jacobson (2005)
+	Kn = np.repeat(mfp, radius.shape[1], 1)/np.repeat(radius, mfp.shape[0], 0)
+	Inverse_Kn = Kn**-1.
+	correct_1 = (1.33+0.71*Inverse_Kn)/(1.+Inverse_Kn)
+	correct_2 = (4.*(1.-accom))/(3.*accom)
+	correct_3 = 1.e0+(correct_1+correct_2)*Kn
+	correction = correct_3**-1.
+
+	# eq. 16.2 of Jacobson (2005) and eq. 5 Zaveri et al. (2008)
+	kimt = (DStar_org)*correction
+	kimt = (4.*np.pi*(radius*1.e2)*N_perbin.reshape(1, -1))*kimt
+	kimt = np.transpose(kimt)
+
+	if (partit_cutoff):
+		partit_cutoff_Pa = partit_cutoff[0]*(NA/((R_gas*1.e6)*TEMP))
+		highVPi = (Psat*act_coeff) > partit_cutoff_Pa
+		highVPi[:, H2Oi] = 0
+		kimt[highVPi] = 0.
+
+	return(kimt)
+
+# define function
+def test_kimt_cache():
+
+	class testobj: # stand in for the PyCHAM object
+		wall_on = 0
+
+	self = testobj()
+	NA = si.N_A; R_gas = si.R; surfT = 72.; H2Oi = 0
+	sbn = 6 # number of size bins
+
+	for num_comp in [5, 8]: # two simulations with different components
+
+		# inputs for this simulation
+		rng = np.random.default_rng(num_comp)
+		TEMP = 298.15
+		mfp = rng.uniform(1.e-8, 1.e-7, (num_comp, 1)) # mean free path (m)
+		DStar_org = rng.uniform(0.05, 0.1, (num_comp, 1)) # (cm2/s)
+		accom = np.ones((num_comp, sbn))*rng.uniform(0.1, 1., (num_comp, 1))
+		radius = np.logspace(-8., -6., sbn).reshape(1, -1) # (m)
+		N_perbin = np.ones((sbn, 1))*1.e3 # (#/cm3)
+		# Psat (molecules/cm3), spanning the cutoff
+		Psat = np.ones((sbn, 1))*np.logspace(5., 15., num_comp).reshape(1, -1)
+		act_coeff = np.ones((sbn, num_comp))
+		partit_cutoff = [1.e-3] # (Pa)
+		y_mw = np.ones((num_comp, 1))*100.; y_mw[H2Oi] = 18.
+		y_dens = np.ones((num_comp, 1))*1.e3
+		therm_sp = np.ones((num_comp, 1))*200.
+		y = np.ones((num_comp*(sbn+1)))*1.e8
+
+		# changes between calls, each applied after the previous
+		for case in ['first call', 'no change', 'radius of one size bin',
+			'number of two size bins', 'accommodation coefficient in one size bin',
+			'mean free path', 'diffusion coefficient', 'vapour pressure',
+			'activity coefficient', 'temperature', 'cutoff', 'no cutoff']:
+
+			if (case == 'radius of one size bin'):
+				radius = np.array((radius)); radius[0, 2] *= 1.05
+			if (case == 'number of two size bins'):
+				N_perbin = np.array((N_perbin)); N_perbin[[0, 4], 0] *= 0.5
+			if (case == 'accommodation coefficient in one size bin'):
+				accom = np.array((accom)); accom[1, 3] *= 0.5
+			if (case == 'mean free path'):
+				mfp = mfp*1.01
+			if (case == 'diffusion coefficient'):
+				DStar_org = DStar_org*0.99
+			if (case == 'vapour pressure'):
+				Psat = np.array((Psat)); Psat[:, 3] *= 1.e5
+			if (case == 'activity coefficient'):
+				act_coeff = np.array((act_coeff)); act_coeff[:, 1] *= 1.e6
+			if (case == 'temperature'):
+				TEMP = 310.
+			if (case == 'cutoff'):
+				partit_cutoff = [1.e-6]
+			if (case == 'no cutoff'):
+				partit_cutoff = []
+
+			[kimt, kelv, kw] = partit_var.kimt_calc(y, mfp, sbn, num_comp, accom,
+				y_mw, surfT, R_gas, TEMP, NA, y_dens, N_perbin, radius, Psat,
+				therm_sp, H2Oi, act_coeff, 1, partit_cutoff, 1.e5, DStar_org, 0.,
+				1., 1., 0., self)
+			kimt_d = kimt_direct(mfp, accom, DStar_org, radius, N_perbin,
+				partit_cutoff, NA, R_gas, TEMP, Psat, act_coeff, H2Oi)
+
+			# the cached calculation orders operations differently, so
+			# agreement is to round-off
+			if (kimt.shape != kimt_d.shape or
+				np.max(np.abs(kimt-kimt_d)/np.maximum(np.abs(kimt_d), 1.e-300)) > 1.e-13):
+				print(str('partitioning coefficients differ from direct formula after change of ' +
+					case + ' (' + str(num_comp) + ' components)'))
+			if (any(((kimt == 0.) != (kimt_d == 0.)).ravel())):
+				print(str('components with partitioning zeroed differ from direct formula after change of ' +
+					case + ' (' + str(num_comp) + ' components)'))
+
+		# the second simulation above reused the caches of the first, now
+		# check a call after resetting them as ode_updater does
+		if (num_comp == 8):
+			self.kimt_cache = {}
+			self.cutoff_cache = {}
+			[kimt, kelv, kw] = partit_var.kimt_calc(y, mfp, sbn, num_comp, accom,
+				y_mw, surfT, R_gas, TEMP, NA, y_dens, N_perbin, radius, Psat,
+				therm_sp, H2Oi, act_coeff, 1, partit_cutoff, 1.e5, DStar_org, 0.,
+				1., 1., 0., self)
+			if (np.max(np.abs(kimt-kimt_d)/kimt_d) > 1.e-13):
+				print('partitioning coefficients differ from direct formula after caches reset')
+
+	print('partitioning coefficient cache unit test complete')
+
+test_kimt_cache() # call on test
@@ -0,0 +1,157 @@
+'''unit test for mech_red'''
+# the module to be tested - mech_red is responsible for reducing the
+# chemical scheme using integrated reaction fluxes from a reference
+# simulation, here the reduction and writing of the reduced scheme are
+# tested with fluxes given directly, then the whole reduction (reference
+# simulation recording fluxes, reduction and simulation with the reduced 
+# scheme) is tested on the example gas-phase chemical scheme
+# note that, like a simulation, this overwrites the generated modules
+# (e.g. ode_solv.py) and pickle.pkl in the PyCHAM folder
+# assumes calling from the PyCHAM home folder
+print('unit test for chemical scheme reduction, assumed calling from the PyCHAM home folder')
+
+import os
+import sys
+dir_path = os.getcwd() # current working directory
+# temporarily add the PyCHAM folder to path
+sys.path.append(str(dir_path+'/PyCHAM'))
+
+import shutil
+import tempfile
+import numpy as np
+import mech_red
+
+# define function
+def test_mech_red():
+
+	class testobj: # stand in for the PyCHAM object
+		chem_sch_mrk = ['%', 'RO2', '+', '', '', ';', '+', ';', '$', '%', ':', ';']
+
+	self = testobj()
+	
+	# chemical scheme with components A, OH, B, C, O3, D, E, R1 and R2, 
+	# where R1 and R2 are peroxy radicals
+	eqns = ['% 1.0D-11 : A + OH = B ;', '% 1.0D-11 : B + OH = C ;', 
+		'% 1.0D-17 : A + O3 = D ;', '% 1.0D-3 : D = E ;', 
+		'% 2.0D-13*RO2 : R1 = B ;', '% 1.0D-11 : R2 + OH = E ;']
+	comp = ['A', 'OH', 'B', 'C', 'O3', 'D', 'E', 'R1', 'R2']
+	reac = [[0, 1], [2, 1], [0, 4], [5], [7], [8, 1]]
+	prod = [[2], [3], [5], [6], [2], [6]]
+	# integrated reaction fluxes (# molecules/cm3)
+	flux = np.array((100., 90., 0.1, 0.1, 50., 1.))
+	
+	mech = {'comp_num' : len(comp), 'comp_namelist' : comp, 
+		'eqn_num' : np.array((len(eqns), 0)), 
+		'nreac_g' : np.array([len(i) for i in reac]), 
+		'nprod_g' : np.array([len(i) for i in prod]),
+		'rindx_g' : np.array([i+[0]*(2-len(i)) for i in reac]), 
+		'rstoi_g' : np.array([[1.]*len(i)+[0.]*(2-len(i)) for i in reac]),
+		'pindx_g' : np.array(prod), 'pstoi_g' : np.ones((len(prod), 1)), 
+		'reac_coef_g' : [i.split(':')[0][1::].strip() for i in eqns], 
+		'nreac_aq' : [], 'nprod_aq' : [], 'rindx_aq' : np.zeros((0, 1)), 
+		'rstoi_aq' : np.zeros((0, 1)), 'pindx_aq' : np.zeros((0, 1)), 
+		'pstoi_aq' : np.zeros((0, 1)), 'reac_coef_aq' : []}
+	
+	# with C the target, the reaction of A with O3 carries too little of
+	# the flux through A for O3 to be kept, whilst R2 is kept as part of
+	# the peroxy radical pool in the rate coefficient of R1
+	[comp_indx, eqn_keep] = mech_red.drg(flux, mech, ['R1', 'R2'], [3], 1.e-2)
+	if (list(eqn_keep) != [True, True, False, False, True, True]):
+		print('unexpected reactions kept: ', eqn_keep)
+	if ([comp[i] for i in comp_indx] != ['A', 'OH', 'B', 'C', 'E', 'R1', 'R2']):
+		print('unexpected components kept: ', [comp[i] for i in comp_indx])
+	
+	# a lower threshold keeps O3 and therefore its reaction with A, D is 
+	# then a product but its reaction is not needed
+	[comp_indx, eqn_keep] = mech_red.drg(flux, mech, ['R1', 'R2'], [3], 1.e-4)
+	if (list(eqn_keep) != [True, True, True, False, True, True]):
+		print('unexpected reactions kept with lower threshold: ', eqn_keep)
+	
+	# write reduced chemical scheme and xml file
+	tmp_dir = tempfile.mkdtemp()
+	self.sch_name = os.path.join(tmp_dir, 'test_scheme.txt')
+	self.xml_name = os.path.join(tmp_dir, 'test_xml.xml')
+	with open(self.sch_name, mode='w') as f:
+		f.write('RO2 = R1 + R2 ;\n')
+		for eqn in eqns:
+			f.write(str(eqn + '\n'))
+	with open(self.xml_name, mode='w') as f:
+		f.write('<?xml version="1.0" encoding="UTF-8"?>\n<mechanism>\n<species_defs>\n')
+		for name in (comp+['core']):
+			f.write(str('<species species_number="s1" species_name="' + name + 
+				'">\n<smiles>C</smiles>\n</species>\n'))
+		f.write('</species_defs>\n</mechanism>\n')
+	
+	[eqn_list, aqeqn_list, RO2_names] = mech_red.sch_read(self.sch_name, self)
+	if (RO2_names != ['R1', 'R2']):
+		print('unexpected peroxy radicals: ', RO2_names)
+	[sch_red, xml_red] = mech_red.red_write(eqn_list, aqeqn_list, eqn_keep, 
+		[comp[i] for i in comp_indx], set(comp), self)
+	[eqn_red, aqeqn_red, RO2_red] = mech_red.sch_read(sch_red, self)
+	if (eqn_red != [eqns[i] for i in [0, 1, 2, 4, 5]] or RO2_red != RO2_names):
+		print('unexpected reduced chemical scheme: ', eqn_red, RO2_red)
+	import xml_interr
+	[err_mess, comp_smil, comp_name] = xml_interr.xml_interr(xml_red)
+	if (comp_name != ['A', 'OH', 'B', 'C', 'O3', 'D', 'E', 'R1', 'R2', 'core']):
+		print('unexpected components in reduced xml file: ', comp_name)
+	
+	shutil.rmtree(tmp_dir)
+
+	print('mech_red unit test complete')
+
+# define function
+def test_mech_red_sim():
+
+	# example gas-phase chemical scheme and xml file, under a name that 
+	# gives their own results folders
+	tmp_dir = tempfile.mkdtemp()
+	ex_dir = str(dir_path + '/PyCHAM/input/gas-phase_ex/')
+	sch_name = os.path.join(tmp_dir, 'test_mech_red_scheme.txt')
+	xml_name = os.path.join(tmp_dir, 'test_mech_red_xml.xml')
+	shutil.copyfile(str(ex_dir + 'ex_chem_scheme.txt'), sch_name)
+	shutil.copyfile(str(ex_dir + 'ex_xml.xml'), xml_name)
+	inname = os.path.join(tmp_dir, 'test_mech_red_model_var.txt')
+	with open(inname, mode='w') as f:
+		f.write('res_file_name = test_mech_red_res\n')
+		f.write('total_model_time = 600.\nupdate_step = 60.\nrecording_time_step = 60.\n')
+		f.write('number_size_bins = 0\ntemperature = 288.\ntempt = 0.\n')
+		f.write('p_init = 101300\nrh = 0.65\nrht = 0\nlight_status = 0\n')
+		f.write('C0 = 25., 30.\nComp0 = O3, APINENE\n')
+		f.write('red_targets = O3\nred_thresh = 1.e-2\nred_tol = 5.e-2\n')
+	
+	# results folders of reference and reduced simulations
+	out_dirs = [os.path.join(dir_path, 'PyCHAM/output', fold) for fold in 
+		['test_mech_red_scheme', 'test_mech_red_scheme_reduced']]
+	for out_dir in out_dirs:
+		shutil.rmtree(out_dir, ignore_errors=True)
+	
+	[mess, self] = mech_red.red_main(sch_name, xml_name, inname)
+	if (mess[0:4] != 'Note'):
+		print('mechanism reduction unsuccessful: ', mess)
+	
+	# fluxes recorded through every reaction of the reduced scheme
+	[eqn_red, aqeqn_red, RO2_red] = mech_red.sch_read(self.red_sch_name, self)
+	if (len(self.flux_int) != len(eqn_red) or not any(self.flux_int > 0.)):
+		print('unexpected fluxes recorded by reduced simulation: ', self.flux_int)
+	[eqn_list, aqeqn_list, RO2_names] = mech_red.sch_read(sch_name, self)
+	if (len(eqn_red) >= len(eqn_list) or any(self.red_dev > self.red_tol)):
+		print('scheme not reduced within tolerance: ', len(eqn_red), self.red_dev)
+	
+	# both simulations saved separately
+	for out_dir in out_dirs:
+		if not os.path.isdir(os.path.join(out_dir, 'test_mech_red_res')):
+			print('results not saved to ', out_dir)
+	
+	# repeating stops before simulating as results folders exist
+	[mess, self] = mech_red.red_main(sch_name, xml_name, inname)
+	if (mess[0:22] != 'Error - results folder'):
+		print('existing results folders not found: ', mess)
+	
+	for out_dir in out_dirs:
+		shutil.rmtree(out_dir, ignore_errors=True)
+	shutil.rmtree(tmp_dir)
+	
+	print('mech_red simulation unit test complete')
+
+test_mech_red() # call on test
+test_mech_red_sim() # call on test
@@ -0,0 +1,47 @@
+'''unit test for mol_reg'''
+# the module to be tested - mol_reg is responsible for creating Pybel 
+# objects on first use and sharing them between components with the 
+# same SMILES
+# assumes calling from the PyCHAM home folder
+print('unit test for the registry of Pybel objects, assumed calling from the PyCHAM home folder')
+
+import os
+import sys
+dir_path = os.getcwd() # current working directory
+# temporarily add the PyCHAM folder to path
+sys.path.append(str(dir_path+'/PyCHAM'))
+
+import pickle
+import mol_reg
+
+# define function
+def test_mol_reg():
+
+	smiles = ['CC1=CCC2CC1C2(C)C', 'O', 'CC1=CCC2CC1C2(C)C', 'C=O']
+	Pybel_objects = mol_reg.mol_list(smiles)
+	
+	# nothing should be created before indexing
+	if (len(Pybel_objects) != 4 or 'C=O' in mol_reg.mol_dict):
+		print('Pybel objects created before use')
+	
+	# components with the same SMILES share one object
+	if (Pybel_objects[0] is not Pybel_objects[2]):
+		print('Pybel object not shared between components with same SMILES')
+	if (abs(Pybel_objects[1].molwt-18.015) > 1.e-2):
+		print('unexpected molar mass of water: ', Pybel_objects[1].molwt)
+	if ([i.formula for i in Pybel_objects] != ['C10H16', 'H2O', 'C10H16', 'CH2O']):
+		print('unexpected formulae: ', [i.formula for i in Pybel_objects])
+	
+	# the list of SMILES is copied, so later additions to the SMILES 
+	# list (e.g. water and core in init_conc) do not change it
+	smiles.append('HOH')
+	if (len(Pybel_objects) != 4):
+		print('Pybel objects changed by addition to SMILES list')
+	
+	# only SMILES are pickled
+	if (pickle.loads(pickle.dumps(Pybel_objects)).smiles != Pybel_objects.smiles):
+		print('pickled Pybel objects differ')
+
+	print('mol_reg unit test complete')
+
+test_mol_reg() # call on test
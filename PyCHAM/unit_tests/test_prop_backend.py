@@ -0,0 +1,80 @@
+'''unit test for the UManSysProp version pin of prop_backend'''
+# the module to be tested - prop_backend is responsible for importing
+# UManSysProp, here the commit checked out in a umansysprop folder is read
+# from its git files (branch reference, packed reference and detached head)
+# and compared against the pinned commit, with a temporary folder
+# standing in for the PyCHAM home folder
+# assumes calling from the PyCHAM home folder
+print('unit test for the UManSysProp version pin, assumed calling from the PyCHAM home folder')
+
+import os
+import sys
+import shutil
+import tempfile
+dir_path = os.getcwd() # current working directory
+# temporarily add the PyCHAM folder to path
+sys.path.append(str(dir_path+'/PyCHAM'))
+
+import prop_backend
+
+# define function
+def test_prop_backend():
+
+	tmp_dir = tempfile.mkdtemp()
+	prop_backend.home = lambda: tmp_dir # stand in for PyCHAM home folder
+
+	commit0 = '1'*40; commit1 = '2'*40
+
+	# no pin file, then a pin file with only its explanation
+	if (prop_backend.pin_check()[1] != 2):
+		print('missing pin not reported as error')
+	with open(prop_backend.pin_path(), mode='w') as f:
+		f.write(prop_backend.pin_head)
+	if (prop_backend.pinned() is not None or prop_backend.pin_check()[1] != 2):
+		print('empty pin not reported as error')
+
+	with open(prop_backend.pin_path(), mode='w') as f:
+		f.write(str(prop_backend.pin_head + commit0 + '\n'))
+	if (prop_backend.pinned() != commit0):
+		print('pinned commit not read')
+
+	# umansysprop folder without git files
+	fold = os.path.join(tmp_dir, 'umansysprop')
+	git_dir = os.path.join(fold, '.git')
+	os.makedirs(os.path.join(fold, 'umansysprop'))
+	if (prop_backend.local_fold() != fold):
+		print('umansysprop folder not found')
+	if (prop_backend.pin_check()[1] != 2):
+		print('unreadable commit not reported as error')
+
+	# branch reference, packed reference and detached head
+	os.makedirs(os.path.join(git_dir, 'refs', 'heads'))
+	with open(os.path.join(git_dir, 'HEAD'), mode='w') as f:
+		f.write('ref: refs/heads/master\n')
+	for head in ['loose', 'packed', 'detached']:
+		for commit in [commit0, commit1]:
+			if (head == 'loose'):
+				with open(os.path.join(git_dir, 'refs', 'heads', 'master'), mode='w') as f:
+					f.write(str(commit + '\n'))
+			if (head == 'packed'):
+				if os.path.exists(os.path.join(git_dir, 'refs', 'heads', 'master')):
+					os.remove(os.path.join(git_dir, 'refs', 'heads', 'master'))
+				with open(os.path.join(git_dir, 'packed-refs'), mode='w') as f:
+					f.write(str('# pack-refs with: peeled fully-peeled sorted\n' +
+						'3'*40 + ' refs/heads/other\n' + commit + ' refs/heads/master\n'))
+			if (head == 'detached'):
+				with open(os.path.join(git_dir, 'HEAD'), mode='w') as f:
+					f.write(str(commit + '\n'))
+			if (prop_backend.checked_out(fold) != commit):
+				print(str('commit not read from ' + head + ' reference'))
+			[mess, flag] = prop_backend.pin_check()
+			if (commit == commit0 and (mess != '' or flag != 0)):
+				print(str('pinned commit reported as different for ' + head + ' reference'))
+			if (commit == commit1 and (flag != 2 or commit1 not in mess)):
+				print(str('commit different to pin not reported for ' + head + ' reference'))
+
+	shutil.rmtree(tmp_dir)
+
+	print('prop_backend unit test complete')
+
+test_prop_backend() # call on test
@@ -0,0 +1,95 @@
+'''unit test for prop_db'''
+# the module to be tested - prop_db is responsible for storing estimates of
+# component properties keyed by SMILES, here storage and retrieval, the
+# separation by method and temperature, persistence between connections and
+# the use of the database for diffusion volumes are tested
+# assumes calling from the PyCHAM home folder
+print('unit test for the component property database, assumed calling from the PyCHAM home folder')
+
+import os
+import sys
+import shutil
+import tempfile
+dir_path = os.getcwd() # current working directory
+# temporarily add the PyCHAM folder to path
+sys.path.append(str(dir_path+'/PyCHAM'))
+
+import numpy as np
+import prop_db
+import mol_reg
+import diff_vol_est
+
+# define function
+def test_prop_db():
+
+	class testobj: # stand in for the PyCHAM object
+		pass
+
+	self = testobj()
+	tmp_dir = tempfile.mkdtemp()
+	self.prop_db_path = os.path.join(tmp_dir, 'prop_db.sqlite')
+
+	ncall = [0] # number of estimates made
+	def est(val): # estimation method
+		ncall[0] += 1
+		return(val)
+
+	# first request estimates, second finds stored value
+	prop_db.stats_mess() # reset counts
+	for i in range(2):
+		val = prop_db.prop('CCO', 'meth', lambda: est(1.5), self)
+	if (val != 1.5 or ncall[0] != 1):
+		print('stored value not returned')
+	if (prop_db.stats_mess() != 'Note: component property database: 1 values found and 1 estimated (meth 1/1)'):
+		print('counts of values found and estimated incorrect')
+
+	# properties for different methods and temperatures are separate
+	val = prop_db.prop('CCO', 'meth', lambda: est(2.5), self, 300.)
+	val2 = prop_db.prop('CCO', 'meth2', lambda: est(3.5), self)
+	if (val != 2.5 or val2 != 3.5 or ncall[0] != 3):
+		print('properties not separated by method and temperature')
+
+	# several properties together, only estimated if any not stored
+	val = prop_db.props('CCO', ['meth', 'meth3'], lambda: est([4.5, 5.5]), self)
+	if (val != [4.5, 5.5] or ncall[0] != 4):
+		print('properties not estimated together')
+
+	# stored values persist once committed, and are removed by clear
+	prop_db.commit(self)
+	prop_db.conn.clear()
+	val = prop_db.prop('CCO', 'meth3', lambda: est(0.), self)
+	if (val != 5.5 or ncall[0] != 4):
+		print('stored value not persistent')
+	prop_db.clear(['meth3'], self)
+	val = prop_db.prop('CCO', 'meth3', lambda: est(0.), self)
+	if (val != 0. or ncall[0] != 5):
+		print('cleared value returned')
+
+	# values estimated elsewhere (e.g. by worker processes) are counted
+	# as estimated when first found
+	prop_db.stats_mess() # reset counts
+	prop_db.store([('CCC', 'meth', 0., 6.5)], self)
+	for i in range(2):
+		val = prop_db.prop('CCC', 'meth', lambda: est(0.), self)
+	if (val != 6.5 or ncall[0] != 5):
+		print('value stored from elsewhere not returned')
+	if (prop_db.stats_mess() != 'Note: component property database: 1 values found and 1 estimated (meth 1/1)'):
+		print('counts of values stored from elsewhere incorrect')
+
+	# diffusion volumes with and without the database agree
+	Pybel_object = mol_reg.mol_list(['CC', 'c1ccccc1', 'O=C=O', 'CC1=CCC2CC1C2(C)C'])
+	diff_vol = diff_vol_est.diff_vol_est(list(Pybel_object)) # without reuse
+	for i in range(2): # estimate then find
+		diff_vol_est.memo.clear() # so that the database is used
+		diff_vol2 = diff_vol_est.diff_vol_est(Pybel_object, self)
+		if (any(np.abs(diff_vol2-diff_vol) > 1.e-10*diff_vol)):
+			print('diffusion volumes from database do not agree with estimates')
+	if ('fuller_dv 4/4' not in prop_db.stats_mess()):
+		print('diffusion volumes not found in database')
+
+	prop_db.conn.clear()
+	shutil.rmtree(tmp_dir)
+
+	print('prop_db unit test complete')
+
+test_prop_db() # call on test
@@ -0,0 +1,81 @@
+'''unit test for the estimation of component properties across worker processes'''
+# the function to be tested - prop_par of prop_calc estimates properties
+# of components across worker processes and stores them in the property
+# database for prop_calc, here the properties given by prop_calc (and the
+# diffusion volumes of diff_vol_est) with two worker processes are compared
+# against those with estimation in the calling process only, with each run
+# having its own temporary cache folder (and so property database)
+# assumes calling from the PyCHAM home folder
+print('unit test for property estimation across worker processes, assumed calling from the PyCHAM home folder')
+
+import os
+import sys
+import shutil
+import tempfile
+dir_path = os.getcwd() # current working directory
+# temporarily add the PyCHAM folder to path
+sys.path.append(str(dir_path+'/PyCHAM'))
+
+import numpy as np
+import prop_calc
+import prop_db
+import mol_reg
+import diff_vol_est
+
+# define function
+def test_prop_par():
+
+	class testobj: # stand in for the PyCHAM object
+		pass
+
+	# small chemical scheme, with water and seed (core) components
+	spec_namelist = ['O3', 'APINENE', 'PINONIC', 'H2O', 'C4H9OH', 'NO2', 'core']
+	rel_SMILES = ['[O-][O+]=O', 'CC1=CCC2CC1C2(C)C', 'CC(=O)C1CC(CC(=O)O)C1(C)C',
+		'O', 'CCCCO', 'N(=O)[O]', 'core']
+	num_comp = len(spec_namelist)
+	H2Oi = spec_namelist.index('H2O')
+	corei = [spec_namelist.index('core')]
+	TEMP = 293.15 # (K), differing from 298.15 K so both vapour pressures estimated
+
+	# properties with estimation in the calling process (1 worker) and
+	# across worker processes (2 workers)
+	res = {}
+	for prop_workers in [1, 2]:
+
+		self = testobj()
+		self.prop_workers = prop_workers
+		tmp_dir = tempfile.mkdtemp()
+		self.mech_cache_dir = tmp_dir
+
+		[Psat, y_dens, Psat_Pa, Psat_Pa_rec, OC, self] = prop_calc.prop_calc(
+			rel_SMILES, mol_reg.mol_list(rel_SMILES), TEMP, H2Oi, num_comp, -1.5,
+			[], [], 0, corei, 0., 0, 1.5, spec_namelist, 0, 0, '', 2, [], [],
+			['core'], np.ones((num_comp, 1))*100., self)
+
+		# workers store all properties, including diffusion volumes, which
+		# prop_calc does not estimate itself
+		if (prop_workers > 1):
+			for smil in rel_SMILES:
+				if (smil == 'O' or smil == 'core'):
+					continue
+				if (prop_db.stored(smil, 'fuller_dv', self) is None):
+					print(str('diffusion volume of ' + smil + ' not stored by worker processes'))
+
+		diff_vol_est.memo.clear() # so that the database of this run is used
+		diff_vol = diff_vol_est.diff_vol_est(mol_reg.mol_list(rel_SMILES[0:-1]), self)
+
+		res[prop_workers] = {'density': y_dens, 'vapour pressure': Psat_Pa,
+			'vapour pressure at 298.15 K': Psat_Pa_rec, 'boiling point': self.Psat_Tb,
+			'H:C ratio': self.HC, 'diffusion volume': diff_vol}
+
+		prop_db.conn.pop(prop_db.db_path(self)).close()
+		shutil.rmtree(tmp_dir)
+
+	for prop in res[1]:
+		if (not np.array_equal(res[1][prop], res[2][prop])):
+			print(str(prop + ' with worker processes differs from estimation in the ' +
+				'calling process: ' + str(res[2][prop]) + ' instead of ' + str(res[1][prop])))
+
+	print('prop_par unit test complete')
+
+test_prop_par() # call on test
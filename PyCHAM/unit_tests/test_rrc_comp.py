@@ -0,0 +1,78 @@
+'''unit test for rrc_comp'''
+# the module to be tested - rrc_comp is responsible for compiling the rate
+# coefficient expressions of the chemical scheme into one function
+# assumes calling from the PyCHAM home folder
+print('unit test for compiling reaction rate coefficient expressions, assumed calling from the PyCHAM home folder')
+
+import os
+import sys
+dir_path = os.getcwd() # current working directory
+# temporarily add the PyCHAM folder to path
+sys.path.append(str(dir_path+'/PyCHAM'))
+
+import numpy
+import rrc_comp
+import rrc_calc
+
+# define function
+def test_rrc_comp():
+
+	class testobj: # stand in for the PyCHAM object
+		af_path = 'no'
+		photo_path = str(dir_path + '/PyCHAM/photofiles/MCMv3.2')
+		secx = 1.; cosx = 1.; tf = 1. # overhead sun
+
+	self = testobj()
+
+	# generic rate coefficients and reaction rate coefficients in the 
+	# format given by formatting.py
+	rrc = ['KRO2NO=2.7e-12*numpy.exp(360/TEMP)', 'FCD=0.30', 
+		'NCD=0.75-1.27*(numpy.log10(FCD))', 'K10=1.0e-31*M*(TEMP/300)**-1.6', 
+		'K1I=5.0e-11*(TEMP/300)**-0.3', 'KMT01=(K10*K1I)*NCD/(K10+K1I)']
+	reac_coef = ['KRO2NO*0.9', 'KRO2NO*0.1', '2.3e-12', 'KMT01', 
+		'6.3e-16*numpy.exp(-580/TEMP)*0.57', '6.3e-16*numpy.exp(-580/TEMP)*0.37', 
+		'2.14e-10*H2O', '5.6e-34*N2*(TEMP/300)**-2.6*O2']
+	
+	[erf, err_mess, self] = rrc_comp.rrc_comp(reac_coef, [], rrc, [], self)
+	if (erf != 0):
+		print(err_mess)
+	
+	# reference values from evaluating the expressions directly
+	for TEMP in [250., 298.15, numpy.array((270., 290., 310.))]:
+		M = 2.5e19*298.15/TEMP; N2 = M*0.7809; O2 = M*0.2095; H2O = 1.e17
+		nsp = {'numpy' : numpy, 'TEMP' : TEMP, 'M' : M, 'N2' : N2, 'O2' : O2, 'H2O' : H2O}
+		for line in rrc:
+			exec(line, nsp)
+		ref = numpy.array([numpy.ones(numpy.shape(TEMP))*eval(rc, nsp) for rc in reac_coef])
+		[rate_values, erf, err_mess] = self.rrc_func(0., H2O, TEMP, 0, 0., M, 
+			N2, O2, 62, 0., 0., 0., 0., self)
+		if (numpy.ndim(TEMP) > 0):
+			rate_values = rate_values.transpose()
+		if (numpy.max(numpy.abs(rate_values-ref)/ref) > 1.e-14):
+			print('rate coefficients differ from direct evaluation at temperature ', TEMP)
+	
+	# rate coefficients for an array of conditions (rows) must match 
+	# those calculated one condition at a time
+	self.RO2_indices = numpy.zeros((0, 2)).astype(int); self.daytime = 0.
+	TEMP = numpy.array((260., 280., 298.15, 315.))
+	PInit = numpy.array((7.e4, 9.e4, 1.01325e5, 1.05e5))
+	H2O = numpy.array((1.e16, 5.e16, 3.e17, 6.e17))
+	y = numpy.zeros((3))
+	[rate_arr, erf, err_mess] = rrc_calc.rrc_calc_arr(H2O, TEMP, 0, y, PInit, 
+		62, 0., 0., 0., 0., self)
+	for ci in range(len(TEMP)):
+		[rate_values, erf, err_mess] = rrc_calc.rrc_calc(H2O[ci], TEMP[ci], 0, y, 
+			PInit[ci], 62, 0., 0., 0., 0., self)
+		if (numpy.max(numpy.abs(rate_arr[ci, :]-rate_values)/rate_values) > 1.e-14):
+			print('rate coefficients for array of conditions differ from those for single condition at temperature ', TEMP[ci])
+	
+	# expressions outside those allowed in rate coefficients must be 
+	# reported at compilation
+	for bad in ['__import__("os").getcwd()', 'KUNDEF*2.', '1./0.', 'J[1.5]']:
+		[erf, err_mess, self] = rrc_comp.rrc_comp([bad], [], [], [], self)
+		if (erf != 1):
+			print('expression ', bad, ' not rejected')
+
+	print('rrc_comp unit test complete')
+
+test_rrc_comp() # call on test
@@ -0,0 +1,91 @@
+'''unit test for vbs_lump'''
+# the module to be tested - vbs_lump is responsible for lumping particle- 
+# and wall-phase organics into volatility basis set bins during integration,
+# here the bins of components, the mapping to and from the lumped state and
+# the disaggregation of lumps are tested
+# assumes calling from the PyCHAM home folder
+print('unit test for volatility basis set lumping, assumed calling from the PyCHAM home folder')
+
+import os
+import sys
+dir_path = os.getcwd() # current working directory
+# temporarily add the PyCHAM folder to path
+sys.path.append(str(dir_path+'/PyCHAM'))
+
+import numpy as np
+import vbs_lump
+
+# define function
+def test_vbs_lump():
+
+	class testobj: # stand in for the PyCHAM object
+		pass
+
+	self = testobj()
+	
+	rs = np.random.RandomState(0)
+	num_comp = 40 # number of components, with water and seed last
+	num_sb = 3 # number of size bins (including wall)
+	H2Oi = num_comp-2; self.seedi = np.array((num_comp-1)).reshape(1)
+	
+	Psat_Pa = 10**rs.uniform(-12., 4., num_comp) # vapour pressures (Pa)
+	Psat_Pa[self.seedi] = 0.
+	y_mw = rs.uniform(50., 300., num_comp) # molecular weights (g/mol)
+	
+	# volatility basis set bins should be decadal in saturation 
+	# concentration (ug/m3), with the extremes open-ended
+	Cst = (1.e6*y_mw)*(Psat_Pa/101325.)/(8.2057e-5*298.15)
+	vbin = vbs_lump.vbs_bin(Psat_Pa, y_mw, 298.15)
+	for i in range(len(vbs_lump.sc)):
+		indx = (np.ones((num_comp)).astype(bool) if (i == len(vbs_lump.sc)-1) 
+			else (Cst < 10**(vbs_lump.sc[i]+0.5)))
+		if (i > 0):
+			indx = indx*(Cst >= 10**(vbs_lump.sc[i-1]+0.5))
+		if (any(indx != (vbin == i))):
+			print('unexpected components in volatility basis set bin ', i)
+	
+	# one particle-phase reaction, whose components keep their own 
+	# concentrations
+	rindx_aq = np.array(([[0, 1]])); pindx_aq = np.array(([[2]]))
+	nreac_aq = np.array(([2])); nprod_aq = np.array(([1]))
+	self = vbs_lump.lump_setup(Psat_Pa, y_mw, H2Oi, rindx_aq, pindx_aq, 
+		nreac_aq, nprod_aq, num_comp, num_sb, self)
+	
+	# lumped components are those up to the saturation concentration 
+	# limit, other than water, seed and those of particle-phase reactions
+	lump = ((vbs_lump.sc[vbin]+0.5) <= vbs_lump.lump_Cmax)
+	lump[[0, 1, 2, H2Oi, self.seedi[0]]] = False
+	if (any(self.lump_memb[num_comp:num_comp*2] != lump)):
+		print('unexpected members of lumps')
+	if (self.lump_n != num_comp+num_sb*(sum(~lump)+len(np.unique(vbin[lump])))):
+		print('unexpected length of lumped state: ', self.lump_n)
+	
+	# concentrations (# molecules/cm3), with an empty size bin
+	y = 10**rs.uniform(3., 9., num_comp*(num_sb+1))
+	y[num_comp:num_comp*2] = 0.
+	self = vbs_lump.lump_map(y, self)
+	
+	# mapping to the lumped state and back should give the concentrations,
+	# except for the empty size bin, where lumps are shared in proportion
+	# to gas-phase concentrations
+	yl = self.lump_P.dot(y)
+	if (any(np.abs(self.lump_Q.dot(yl)-y) > 1.e-10*y)):
+		print('mapping to and from lumped state does not preserve concentrations')
+	if (any(np.abs(self.lump_P.dot(self.lump_Q.dot(yl))-yl) > 1.e-10*np.abs(yl))):
+		print('mapping from and to lumped state does not preserve lumped state')
+	
+	# after a change to the lumped state, members share the change in 
+	# proportion to their rates of change, without becoming negative
+	yl[self.lump_n-1] *= 0.5; yl[num_comp] += 1.e6
+	self.lump_dd = rs.uniform(-1., 1., len(y))*y
+	y1 = vbs_lump.lump_out(self.lump_Q.dot(yl), self)
+	if (any(np.abs(self.lump_P.dot(y1)-yl) > 1.e-10*np.abs(yl))):
+		print('disaggregation does not conserve lumps')
+	if (any(y1 < 0.)):
+		print('disaggregation gives negative concentrations')
+	if (any(y1[~self.lump_memb] != (self.lump_Q.dot(yl))[~self.lump_memb])):
+		print('disaggregation changes components outside lumps')
+
+	print('vbs_lump unit test complete')
+
+test_vbs_lump() # call on test
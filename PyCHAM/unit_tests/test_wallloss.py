@@ -0,0 +1,72 @@
+'''unit test for wallloss'''
+# the module to be tested - wallloss is responsible for particle deposition
+# to walls, here the first order Debye function is compared against
+# numerical integration, and the reuse of deposition rates for unchanged 
+# size bins and the transfer of particle-phase components to the wall 
+# are tested
+# assumes calling from the PyCHAM home folder
+print('unit test for particle loss to walls, assumed calling from the PyCHAM home folder')
+
+import os
+import sys
+dir_path = os.getcwd() # current working directory
+# temporarily add the PyCHAM folder to path
+sys.path.append(str(dir_path+'/PyCHAM'))
+
+import numpy as np
+from scipy import integrate
+import wallloss
+
+# define function
+def test_wallloss():
+
+	class testobj: # stand in for the PyCHAM object
+		pass
+
+	# first order Debye function against numerical integration
+	z = np.array((-800., -3., -1.e-3, 1.e-9, 5.e-2, 0.5, 10., 600.))
+	D = wallloss.Debye1(z)
+	for i in range(len(z)):
+		D_int = integrate.quad(lambda t: t/np.expm1(t), 0., z[i], 
+			epsabs=0., epsrel=1.e-12)[0]/z[i]
+		if (np.abs(D[i]-D_int) > 1.e-12*D_int):
+			print(str('Debye function incorrect for ' + str(z[i])))
+
+	# particles of unit density (1.e6 g/m3) in 10 size bins with one 
+	# component, two size bins empty
+	sbn = 10; nc = 1
+	Dp = np.logspace(-8., -5., sbn) # diameters (m)
+	Varr = (np.pi/6.)*Dp**3. # single particle volumes (m3)
+	MW = np.ones((nc))*100. # molecular weight (g/mol)
+	Pn = np.ones((sbn, 1))*1.e3 # number concentrations (#/cc)
+	Pn[[2, 6]] = 0.
+	Cn = ((Varr*1.e6/MW[0])*6.02214076e23*Pn[:, 0]).reshape(-1) # (molecules/cc)
+	Gi = 1.+1.36e-7/Dp # slip correction
+	
+	self = testobj()
+	Beta = []
+	for i in range(3): # calculate, reuse and partially update
+		if (i == 2):
+			Dp[4] *= 1.01
+		Beta.append(wallloss.wallloss(Pn, Cn, Gi, 1.8e-2, Dp, MW, Varr, sbn, nc, 
+			298.15, 60., 1.e-7, 0.5, -1.5, 1.e-4, 1., 1, 1, 10., 20., sbn, 0., self))
+	if (self.wl_stats != [1, 1, 1]):
+		print('deposition rates not reused and partially updated as expected')
+	Beta_new = wallloss.wallloss(Pn, Cn, Gi, 1.8e-2, Dp, MW, Varr, sbn, nc, 298.15, 
+		60., 1.e-7, 0.5, -1.5, 1.e-4, 1., 1, 1, 10., 20., sbn, 0., None)
+	if (any(Beta[1] != Beta[0]) or any(Beta[2] != Beta_new)):
+		print('reused deposition rates differ from those calculated')
+	
+	# components lost from particles are deposited on the wall
+	C_p2w = np.zeros((sbn*nc))
+	Cn0 = np.array((Cn))
+	[Pn, Cn] = wallloss.wallloss(Pn, Cn, Gi, 1.8e-2, Dp, MW, Varr, sbn, nc, 
+		298.15, 60., 1.e-7, 0.5, -1.5, 1.e-4, 1., 1, 0, 10., 20., sbn, C_p2w, self)
+	if (any(np.abs(Cn+C_p2w-Cn0) > 1.e-12*Cn0)):
+		print('components not conserved between particles and wall')
+	if (any(C_p2w[Pn[:, 0] > 0.] <= 0.)):
+		print('no deposition of components to wall')
+	
+	print('wallloss unit test complete')
+
+test_wallloss() # call on test
@@ -49,7 +49,7 @@ def var_checker(Jlen, err_mess, erf, self): # define function
 
 	if (self.testf == 4): # checking on estimated photolysis rates throughout simulation
 		
-		# following the method used in rate_coeffs
+		# following the method used in rrc_comp
 		import photolysisRates
 		
 		sumt = 0 # time through experiment (s)
@@ -0,0 +1,196 @@
+##########################################################################################
+#                                                                                        											 #
+#    Copyright (C) 2018-2022 Simon O'Meara : simon.omeara@manchester.ac.uk                  				 #
+#                                                                                       											 #
+#    All Rights Reserved.                                                                									 #
+#    This file is part of PyCHAM                                                         									 #
+#                                                                                        											 #
+#    PyCHAM is free software: you can redistribute it and/or modify it under              						 #
+#    the terms of the GNU General Public License as published by the Free Software       					 #
+#    Foundation, either version 3 of the License, or (at your option) any later          						 #
+#    version.                                                                            										 #
+#                                                                                        											 #
+#    PyCHAM is distributed in the hope that it will be useful, but WITHOUT                						 #
+#    ANY WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS       			 #
+#    FOR A PARTICULAR PURPOSE.  See the GNU General Public License for more              				 #
+#    details.                                                                            										 #
+#                                                                                        											 #
+#    You should have received a copy of the GNU General Public License along with        					 #
+#    PyCHAM.  If not, see <http://www.gnu.org/licenses/>.                                 							 #
+#                                                                                        											 #
+##########################################################################################
+'''lumping of particle- and wall-phase organics into volatility basis set bins'''
+# the particle- and wall-phase concentrations of organic components are 
+# represented during integration by their sums over the volatility basis set 
+# bins (decadal bins of saturation concentration at 298.15 K, as plotted by 
+# vol_contr_analys) up to lump_Cmax, whilst the gas-phase keeps all 
+# components, the matrix P maps from components to the lumped state and Q 
+# maps back (with members of a lump in fixed proportion during an 
+# integration step), after integration lumps are disaggregated using the 
+# rates of change of their members
+
+import numpy as np
+import scipy.sparse as SP
+
+# centres of volatility basis set bins (log10(C* (ug/m3))), where the 
+# lowest and highest bins are open-ended
+sc = np.arange(-2.5, 7.5, 1.)
+# upper limit of saturation concentration of lumped components 
+# (log10(C* (ug/m3))), more volatile components (intermediate and volatile
+# organics) remain largely in the gas-phase and are quick to equilibrate, 
+# so that lumping them gives fictitious partitioning that slows integration
+lump_Cmax = 3.
+
+# define function
+def vbs_bin(Psat_Pa, y_mw, TEMP):
+
+	# inputs: ------------------------------------------------------------
+	# Psat_Pa - pure component saturation vapour pressures (Pa)
+	# y_mw - molecular weights of components (g/mol)
+	# TEMP - temperature of vapour pressures (K)
+	# --------------------------------------------------------------------
+	
+	# convert vapour pressures in Pa to saturation concentrations in ug/m3
+	# using eq. 1 of O'Meara et al. 2014
+	Psat_Cst = (1.e6*y_mw)*(Psat_Pa/101325.)/(8.2057e-5*TEMP)
+	
+	# index of volatility basis set bin, with saturation concentrations 
+	# on a boundary belonging to the upper bin
+	with np.errstate(divide='ignore'):
+		vbin = np.digitize(np.log10(Psat_Cst), sc[0:-1]+0.5)
+	
+	return(vbin)
+
+def lump_setup(Psat_Pa_rec, y_mw, H2Oi, rindx_aq, pindx_aq, nreac_aq, 
+	nprod_aq, num_comp, num_sb, self):
+
+	# inputs: ------------------------------------------------------------
+	# Psat_Pa_rec - pure component saturation vapour pressures at 
+	#	298.15 K (Pa)
+	# y_mw - molecular weights of components (g/mol)
+	# H2Oi - index of water
+	# rindx_aq - index of aqueous-phase reactants
+	# pindx_aq - index of aqueous-phase products
+	# nreac_aq - number of reactants per aqueous-phase reaction
+	# nprod_aq - number of products per aqueous-phase reaction
+	# num_comp - number of components
+	# num_sb - number of size bins (including wall)
+	# self.seedi - index of seed components
+	# self - reference to PyCHAM
+	# --------------------------------------------------------------------
+	
+	# volatility basis set bin of components
+	vbin = vbs_bin(np.array(Psat_Pa_rec).reshape(-1), 
+		np.array(y_mw).reshape(-1), 298.15)
+	
+	# water, seed, components of particle-phase reactions and volatile
+	# components keep their own concentrations
+	lump = (sc[vbin]+0.5) <= lump_Cmax
+	lump[H2Oi] = False
+	lump[self.seedi] = False
+	for i in range(len(nreac_aq)):
+		lump[rindx_aq[i, 0:nreac_aq[i]]] = False
+		lump[pindx_aq[i, 0:nprod_aq[i]]] = False
+	
+	# position of components in the lumped state of a size bin, with
+	# components keeping their own concentration first, followed by 
+	# occupied volatility basis set bins
+	pos = np.zeros((num_comp)).astype(int)
+	pos[~lump] = np.arange(sum(~lump))
+	uni_bin = np.unique(vbin[lump])
+	pos[lump] = sum(~lump)+np.searchsorted(uni_bin, vbin[lump])
+	n_per = sum(~lump)+len(uni_bin) # length of lumped state per size bin
+	
+	# row of lumped state for each element of the state (gas-phase
+	# followed by size bins and wall)
+	self.lump_rowi = np.concatenate((np.arange(num_comp), 
+		(num_comp+np.arange(num_sb).reshape(-1, 1)*n_per+
+		pos.reshape(1, -1)).flatten()))
+	# elements of the state that are members of lumps
+	self.lump_memb = np.concatenate((np.zeros((num_comp)).astype(bool), 
+		np.tile(lump, num_sb)))
+	self.lump_mi = np.where(self.lump_memb)[0]
+	# gas-phase element of the component of each element of the state
+	self.lump_gasi = np.tile(np.arange(num_comp), num_sb+1)
+	self.lump_n = num_comp+num_sb*n_per # length of lumped state
+	
+	return(self)
+
+def lump_map(y, self):
+
+	# inputs: ------------------------------------------------------------
+	# y - concentrations at start of integration step (# molecules/cm3)
+	# self.lump_rowi - row of lumped state for elements of state
+	# self.lump_mi - elements of the state that are members of lumps
+	# self.lump_gasi - gas-phase element of each element of the state
+	# self.lump_n - length of lumped state
+	# self - reference to PyCHAM
+	# --------------------------------------------------------------------
+	
+	rowi = self.lump_rowi
+	mi = self.lump_mi
+	n_full = len(y)
+	
+	# mapping from components to lumped state
+	self.lump_P = SP.csr_matrix((np.ones((n_full)), (rowi, np.arange(n_full))), 
+		shape = (self.lump_n, n_full))
+	
+	# fraction of lumps per member, from particle- (or wall-) phase 
+	# concentrations, or for empty lumps from gas-phase concentrations 
+	# (as condensation is in proportion to these), and otherwise evenly 
+	# split
+	L = self.lump_P.dot(y)[rowi[mi]]
+	Lg = np.bincount(rowi[mi], weights = y[self.lump_gasi[mi]], 
+		minlength = self.lump_n)[rowi[mi]]
+	f = np.ones((n_full))
+	f[mi] = 1./(np.bincount(rowi[mi], minlength = self.lump_n)[rowi[mi]])
+	f[mi[Lg > 0.]] = y[self.lump_gasi[mi]][Lg > 0.]/Lg[Lg > 0.]
+	f[mi[L > 0.]] = y[mi][L > 0.]/L[L > 0.]
+	
+	# mapping from lumped state to components
+	self.lump_Q = SP.csc_matrix((f, (np.arange(n_full), rowi)), 
+		shape = (n_full, self.lump_n))
+	
+	self.lump_y0 = np.zeros((n_full)); self.lump_y0[:] = y[:]
+	
+	return(self)
+
+def lump_out(y, self):
+
+	# inputs: ------------------------------------------------------------
+	# y - concentrations following integration of the lumped state, with
+	#	members of lumps in the proportions of the start of the step
+	#	(# molecules/cm3)
+	# self.lump_y0 - concentrations at start of integration step 
+	#	(# molecules/cm3)
+	# self.lump_dd - sum of rates of change of components at start and
+	#	end of integration step (# molecules/cm3/s)
+	# self - reference to PyCHAM
+	# --------------------------------------------------------------------
+	
+	rowi = self.lump_rowi
+	mi = self.lump_mi
+	
+	# change to lumps over integration step (# molecules/cm3)
+	L = self.lump_P.dot(y)
+	dL = (L-self.lump_P.dot(self.lump_y0))[rowi[mi]]
+	# sum of rates of change of members per lump
+	R = (np.bincount(rowi[mi], weights = self.lump_dd[mi], 
+		minlength = self.lump_n))[rowi[mi]]
+	
+	# share the change to lumps between members by their rates of change
+	# (trapezoidal estimate of their change), otherwise keep the fixed 
+	# proportions used in integration
+	ish = (R != 0.)*(np.sign(R) == np.sign(dL))
+	ym = y[mi]
+	ym[ish] = self.lump_y0[mi][ish]+dL[ish]*(self.lump_dd[mi][ish]/R[ish])
+	
+	# no member may be negative, and members must sum to their lump,
+	# where this is not possible (e.g. negative lump from instability)
+	# the fixed proportions are kept
+	ym[ym < 0.] = 0.
+	S = np.bincount(rowi[mi], weights = ym, minlength = self.lump_n)[rowi[mi]]
+	ym[S > 0.] = ym[S > 0.]*(L[rowi[mi]][S > 0.]/S[S > 0.])
+	y[mi[S > 0.]] = ym[S > 0.]
+	
+	return(y)
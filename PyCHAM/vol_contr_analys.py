@@ -39,6 +39,7 @@ from matplotlib.colors import LinearSegmentedColormap # for customised colormap
 import matplotlib.ticker as ticker # set colormap tick labels to standard notation
 import scipy.constants as si
 import retr_out
+import vbs_lump
 
 def plotter_wiw(caller, dir_path, self, now): # define function
 
@@ -103,20 +104,18 @@ def plotter_wiw(caller, dir_path, self, now): # define function
 	# standard temperature for pure component saturation vapour pressures (K)
 	TEMP = 298.15
 
-	# convert standard (at 298.15 K) vapour pressures in Pa to 
-	# saturation concentrations in ug/m3
-	# using eq. 1 of O'Meara et al. 2014
-	Psat_Cst = (1.e6*y_mw)*(PsatPa/101325.)/(8.2057e-5*TEMP)
+	# volatility basis set bins of components from standard (at 298.15 K) 
+	# vapour pressures in Pa
+	vbin = vbs_lump.vbs_bin(PsatPa, y_mw, TEMP)
 	
 	# tile over size bins
-	Psat_Cst  = np.tile(Psat_Cst, num_asb)
+	vbin  = np.tile(vbin, num_asb)
 	# remove excess dimension
-	Psat_Cst = Psat_Cst.squeeze()
+	vbin = vbin.squeeze()
 
 	# the saturation concentrations to consider (log10(C* (ug/m3)))
 	# note these will be values at the centre of the volatility size bins
-	# setting the final input argument to 1 means decadal bins of vapour pressure
-	sc = np.arange(-2.5, 7.5, 1.)
+	sc = vbs_lump.sc
 
 	# empty array for normalised mass contributions
 	nmc = np.zeros((len(sc), len(t_array)))
@@ -127,12 +126,7 @@ def plotter_wiw(caller, dir_path, self, now): # define function
 		# to particulate loading
 		for i in range(len(sc)):
 
-			if (i == 0):
-				indx = Psat_Cst < 10**(sc[i]+0.5)
-			if (i > 0 and i < len(sc)-1):
-				indx = (Psat_Cst >= 10**(sc[i-1]+0.5))*(Psat_Cst < 10**(sc[i]+0.5))
-			if (i == len(sc)-1):
-				indx = (Psat_Cst >= 10**(sc[i-1]+0.5))
+			indx = (vbin == i)
 
 			if (tpc[it] > 0.):
 				nmc[i, it] = (pc[it, indx].sum())/tpc[it]
@@ -28,13 +28,8 @@
 # user settings
 
 import numpy as np
-import sys
-import os
-from git import Repo
-import shutil
 import scipy.constants as si
-import errno
-import stat
+import prop_backend
 
 def volat_calc(spec_list, Pybel_objects, TEMP, H2Oi, num_speci, Psat_water, vol_Comp, 
 				volP, testf, corei, seed_name, pconc, umansysprop_update, core_dens, spec_namelist,
@@ -52,7 +47,8 @@ def volat_calc(spec_list, Pybel_objects, TEMP, H2Oi, num_speci, Psat_water, vol_
 	# corei - index of seed particle component
 	# seed_name - name(s) of components(s) comprising seed particles
 	# pconc - initial number concentration of particles (#/cc (air))
-	# umansysprop_update - marker for cloning UManSysProp so that latest version used
+	# umansysprop_update - marker for cloning UManSysProp, no longer used as 
+	#	UManSysProp is updated by the prop_backend refresh command
 	# core_dens - density of core material (g/cc (liquid/solid density))
 	# spec_namelist - list of components' names in chemical equation file
 	# ode_gen_flag - whether or not called from front or ode_gen
@@ -65,34 +61,8 @@ def volat_calc(spec_list, Pybel_objects, TEMP, H2Oi, num_speci, Psat_water, vol_
 	if (testf == 1):
 		return(0,0,0) # return dummies
 		
-	cwd = os.getcwd() # address of current working directory
-	if umansysprop_update == 1:
-		print('Cloning latest version of UManSysProp in volat_calc module')
-		# download latest version of umansysprop
-		
-		# check if there is an existing umansysprop folder
-		if os.path.isdir(cwd + '/umansysprop'): 
-			def handleRemoveReadonly(func, path, exc):
-				excvalue = exc[1]
-				if not os.access(path, os.W_OK):
-					# Is the error an access error ?
-					os.chmod(path, stat.S_IWUSR)
-					func(path)
-				else:
-					raise
-			# remove existing folder, onerror will change permission of directory if 
-			# needed
-			shutil.rmtree(cwd + '/umansysprop', ignore_errors=False, onerror=handleRemoveReadonly)
-		
-		git_url = 'https://github.com/loftytopping/UManSysProp_public.git'
-		Repo.clone_from(git_url, (cwd + '/umansysprop'))
-	
-	# point to umansysprop folder
-	sys.path.insert(1, (cwd + '/umansysprop')) # address for updated version
-	
-	from umansysprop import boiling_points
-	from umansysprop import vapour_pressures
-	from umansysprop import liquid_densities
+	# UManSysProp modules, imported once (see prop_backend for updating UManSysProp)
+	[boiling_points, vapour_pressures, liquid_densities] = prop_backend.load()
 
 	NA = si.Avogadro # Avogadro's number (molecules/mol)
 	y_dens = np.zeros((num_speci, 1)) # components' liquid density (kg/m3)
@@ -165,3 +135,52 @@ def volat_calc(spec_list, Pybel_objects, TEMP, H2Oi, num_speci, Psat_water, vol_
 	Psat = Psat*(NA/((si.R*1.e6)*TEMP))
 	
 	return(Psat, y_dens, Psat_Pa)
+
+# vapour pressures at a new temperature from the parameters set in prop_calc,
+# without estimating again
+def Psat_T(TEMP, Psat_water, H2Oi, self):
+
+	# inputs: ------------------------------------------------------------
+	# TEMP - temperature (K) in chamber at time function called
+	# Psat_water - vapour pressure of water (log10(atm)) at TEMP
+	# H2Oi - index of water
+	# self.Psat_Tb - boiling points (K) of components estimated by 
+	#	Nannoolal et al. (2008), zero for other components
+	# self.Psat_A - coefficient (4.1012+dB) of eq. 6 of Nannoolal et al. 
+	#	(2008) (log10(atm))
+	# self.Psat_O3i - index of ozone
+	# self.Psat_Pa0 - vapour pressures (Pa) at start of simulation, used
+	#	for components with temperature-independent vapour pressure
+	# ------------------------------------------------------------
+
+	NA = si.Avogadro # Avogadro's number (molecules/mol)
+
+	Psat_Pa = np.array((self.Psat_Pa0)) # vapour pressures (Pa)
+	
+	# eq. 6 of Nannoolal et al. (2008) (log10(atm)), converted to Pa
+	nani = (self.Psat_Tb > 0.)
+	Psat_Pa[nani] = (10.**(self.Psat_A[nani]*Psat_Tfac(TEMP, self.Psat_Tb[nani])))*101325.
+	
+	# water vapour pressure, converted to Pa from log10(atm)
+	Psat_Pa[H2Oi] = (10.**Psat_water)*101325.
+	
+	# vapour pressure of ozone from https://doi.org/10.1063/1.1700683
+	Psat_Pa[self.Psat_O3i] = (8.25313-(814.941587/TEMP)-0.001966943*TEMP)*1.31579e-3*101325.
+	
+	# convert saturation vapour pressures from Pa to molecules/cm3 (air) using ideal
+	# gas law, R has units cc.Pa/K.mol
+	Psat = Psat_Pa*(NA/((si.R*1.e6)*TEMP))
+	
+	return(Psat.reshape(-1, 1), Psat_Pa.reshape(-1, 1))
+
+# temperature factor of eq. 6 of Nannoolal et al. (2008)
+def Psat_Tfac(TEMP, Tb):
+
+	# inputs: ------------------------------------------------------------
+	# TEMP - temperature(s) (K)
+	# Tb - boiling point(s) (K)
+	# ------------------------------------------------------------
+
+	Tr = TEMP/Tb # reduced temperature
+
+	return((Tr-1.)/(Tr-1./8.))
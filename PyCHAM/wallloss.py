@@ -25,12 +25,12 @@
 
 import numpy as np
 import scipy.constants as si
-from scipy import integrate
+from scipy import special
 import matplotlib.pyplot as plt 
 
 def wallloss(Pn, Cn, Gi, eta_ai, Dp, MW, Varr, sbn, nc, TEMP, t, 
 			inflectDp, pwl_xpre, pwl_xpro, inflectk, ChamR, Rader, testf, p_char, 
-			e_field, num_asb, C_p2w):
+			e_field, num_asb, C_p2w, self):
 
 	# inputs:----------------------------------------------------------
 	
@@ -61,107 +61,36 @@ def wallloss(Pn, Cn, Gi, eta_ai, Dp, MW, Varr, sbn, nc, TEMP, t,
 	# C_p2w - concentration of components on the wall due to 
 	#	particle-wall loss, stacked by component first then by
 	#	size bin (molecules/cc)
+	# self - reference to PyCHAM, or None for no reuse of
+	#	deposition rates
 	# ----------------------------------------------------------------
-	if (Rader == 0): # manual input of wall loss rate
-		
-		Beta = np.zeros((Pn.shape))
-		Beta[Dp<inflectDp, 0] = 10**((np.log10(inflectDp)-
-								np.log10(Dp[Dp<inflectDp]))*pwl_xpre+np.log10(inflectk))
-		Beta[Dp>=inflectDp, 0] = 10**((np.log10(Dp[Dp>=inflectDp])-
-								np.log10(inflectDp))*pwl_xpro+np.log10(inflectk))
-		
+	
+	Dp = np.array((Dp)).reshape(-1)
+	Cn2 = Cn.reshape(sbn, nc) # view with size bins in rows
+	
 	if (Rader == 1):
-		# -------------------------------------------------------------------------
-		# McMurry & Rader option McMurry 1985, DOI: 10.1080/02786828508959054
-		# average number of charges per particle (/particle)
-		n = p_char
-		# elementary charge (C==A.s) (Charan et al. 2018)
-		e = 1.602e-19
-		# average magnitude of electric field (g.m/A.s3) (note: V/m == kg.m/A.s3) 
-		E = e_field
-		
-		# electrostatic migration velocity/deposition velocity 
-		# (eq. 11 McMurry and Rader (1985), eq. 5 Charan (2018)) (m/s)
-		ve = np.abs((n*e*Gi*E)/(3.0*np.pi*eta_ai*Dp))
-		
-		
 		# mass of components in particles (g)
-		ish = np.squeeze(Pn<1.0e-10) # only use size bins where particles available
-		ve[ish] = 0.0
-		mass = np.zeros((sbn, nc))
 		ish = (Pn>1.0e-20)[:, 0] # size bins where particles present
-		
-		mass[ish, :] = ((Cn.reshape(sbn, nc)[ish, :]/Pn[ish, 0].reshape(-1, 1))/
-						si.N_A)*MW.reshape(1, nc)
+		mass = ((Cn2[ish, :]/Pn[ish, 0].reshape(-1, 1))/si.N_A)*MW.reshape(1, nc)
 		# density of particles (g/m3)
 		rho = np.ones((sbn))
-		rho[ish] = np.sum(mass[ish, :], 1)/Varr[ish]
-		
-		
-		# terminal particle settling velocity (m/s) (eq. 4 Charan (2018) also 
-		# eq. 20.4 Jacobson 2005)
-		# gravitational constant has units m/s2
-		vs = (Dp**2.0*rho*si.g*Gi)/(18.0*eta_ai)
-	
-		# particle diffusion coefficient (15.29 of Jacobson (2005) and 
-		# 8.73 of Seinfeld and pandis (1998)) (m2/s)
-		# multiply eta_a by 1.0e-3 to convert from g/m.s to kg/m.s
-		# this makes it consistent with the units of Boltzmann constant
-		Dpi = (((si.k*TEMP)/(3.0*np.pi*Dp*(eta_ai*1.0e-3)))*Gi)
-		
-		# eddy diffusion coefficient (/s) (scalar)
-		if testf == 1:
-			Ke = 6.4e-3 
-		else:
-			Ke = 1.0
-			
-		# x and y terms in eq. 2 of Charan (2018)
-		# x (eq. 13 McMurry (1985)) (dimensionless)
-		x = (np.pi*vs)/(2.0*((Ke*Dpi)**(1.0/2.0)))
-		# y (eq. 14 McMurry (1985)) (dimensionless)
-		y = (np.pi*ve)/(2.0*((Ke*Dpi)**(1.0/2.0)))
-		
-		z1 = (x+y)
-		z2 = (x-y)
+		rho[ish] = np.sum(mass, 1)/Varr[ish]
 		
-		# empty array for Debye function results
-		D1 = np.zeros(sbn)
-		D11 = np.zeros(sbn)
-		
-		for sbi in range(sbn): # size bin loop
-			
-			if Pn[sbi]<1.0e-10: # only consider size bins with particles inside
-				continue 
-			
-			# state integration function
-			Dint = lambda t: t/(np.exp(t)-1.0)
-			# integrate for first order Debye function (eq. 3 Charan (2018))
-			# there is an upper limit to the variable, above which an overflow occurs in 
-			# the integration, the integration reaches a threshold result for high 
-			# positive numbers (>~700), so just set this threshold as the result if input 
-			# too great
-			if z1[sbi] > 700.0:
-				a = np.array(([1.644934066848228]))
-			else:
-				a = integrate.quad(Dint, 0.0, z1[sbi])
-			if z2[sbi] > 700.0:
-				a1 = np.array(([1.644934066848228]))
-			else:
-				a1 = integrate.quad(Dint, 0.0, z2[sbi])
-	
-			D1[sbi] = (1.0/z1[sbi])*a[0]
-			D11[sbi] = (1.0/z2[sbi])*a1[0]
-		
-		# first bit of Beta (loss rate to walls (/s)) calculation (eq. 2 Charan (2018))
-		Beta1 = np.zeros((sbn))
-		Beta1[ish] = (3.0*((Ke*Dpi[ish])**(0.5)))/(np.pi*ChamR*x[ish])
-		Beta2 = ((x+y)**2.0)/2.0+(x+y)*D1+(x-y)*D11 # second bit
+		# inputs to deposition rate per size bin: diameter, slip correction,
+		# density, whether particles present and whether particles present 
+		# above the threshold for electrostatic and diffusion terms
+		sbp = np.concatenate((Dp.reshape(-1, 1), 
+			(np.zeros((sbn))+Gi).reshape(-1, 1), rho.reshape(-1, 1), 
+			ish.reshape(-1, 1), (Pn>=1.0e-10)), axis=1)
+	else: # manual input of wall loss rate depends only on diameter
+		sbp = Dp.reshape(-1, 1)
 	
-		# Beta (loss rate to walls (/s)) calculation (eq. 2 Charan (2018) and eq. 15 
-		# McMurry and Rader 1985) - value
-		# represents fraction of particles lost to walls every second (Beta meaning is 
-		# just above eq. 1 of McMurry (1985) DOI: 10.1080/02786828508959054)
-		Beta = (Beta1*Beta2).reshape(-1, 1)
+	# inputs to deposition rate common to all size bins
+	cond = np.array((Rader, testf, TEMP, float(eta_ai), ChamR, p_char, e_field, 
+		inflectDp, pwl_xpre, pwl_xpro, inflectk))
+	
+	# deposition rate (fraction of particles lost to walls/s)
+	Beta = rate_cache(sbp, cond, self).reshape(-1, 1)
 	
 	if (Beta<0).sum()>0:
 		Beta[Beta<0] = 0.0
@@ -171,28 +100,170 @@ def wallloss(Pn, Cn, Gi, eta_ai, Dp, MW, Varr, sbn, nc, TEMP, t,
 		return(Beta)
 	
 	# integrate this fraction over the time step interval to give total 
-	# fraction lost over interval	
-	Beta = Beta*t
+	# fraction lost over interval, with a realistic maximum of all particles
+	Beta = np.minimum(Beta*t, 1.)
 	
-	# find where loss of particles exceeds available number of particles and change
-	# Beta to the realistic maximum
-	ish = Pn<(Beta*Pn)
-	Beta[ish] = 1.0
-		
 	# new particle number concentration
 	Pn -= (Beta*Pn)
-	# change in particle-phase concentrations of components
-	delC = (Beta*Cn.reshape(sbn, nc)).flatten(order = 'C')
-	Cn -= delC # new particle-phase concentrations of components (molecules/cc)
-	C_p2w += delC
+	# change in particle-phase concentrations of components, which are 
+	# deposited on the wall (molecules/cc)
+	delC = Beta*Cn2
+	Cn2 -= delC # new particle-phase concentrations of components (molecules/cc)
+	C_p2w += delC.reshape(-1)
 	
 	# remove particles and their components if particle number negative
-	ish = np.array((np.where(Pn<1.0e-8)))
-	for i in ish[0, :]:
-		Pn[i] = 0.
-		Cn[nc*(i):nc*(i+1)] = 0.
+	ish = Pn[:, 0]<1.0e-8
+	Pn[ish, 0] = 0.
+	Cn2[ish, :] = 0.
+	
+	return(Pn, Cn2.reshape(-1))
+
+# deposition rates reused for unchanged size bins
+def rate_cache(sbp, cond, self):
+
+	# inputs:----------------------------------------------------------
+	# sbp - inputs to deposition rate per size bin (size bins in rows)
+	# cond - inputs to deposition rate common to all size bins
+	# self - reference to PyCHAM, or None for no reuse
+	# self.wl_cache - the cached deposition rates and the inputs they were
+	#	calculated with
+	# self.wl_stats - number of times deposition rates reused, partially 
+	#	updated and fully calculated
+	# ----------------------------------------------------------------
+	
+	if self is None: # no reuse
+		return(rate(sbp, cond))
+	
+	if not hasattr(self, 'wl_cache'): # first call
+		self.wl_cache = {}
+		self.wl_stats = [0, 0, 0]
+	
+	cc = self.wl_cache
+	
+	# cache only usable for the same size bins and chamber conditions
+	if (len(cc) == 0 or cc['sbp'].shape != sbp.shape or 
+		any(cc['cond'] != cond)):
+		self.wl_cache = {'sbp': np.array(sbp), 'cond': np.array(cond), 
+			'Beta': rate(sbp, cond)}
+		self.wl_stats[2] += 1
+		return(self.wl_cache['Beta'].copy())
+	
+	ch = (sbp != cc['sbp']).any(axis=1) # size bins with changed inputs
+	if any(ch): # recalculate changed size bins
+		cc['Beta'][ch] = rate(sbp[ch, :], cond)
+		cc['sbp'][ch, :] = sbp[ch, :]
+		self.wl_stats[1] += 1
+	else:
+		self.wl_stats[0] += 1
+	
+	return(cc['Beta'].copy())
+
+# deposition rate per size bin
+def rate(sbp, cond):
+
+	# inputs:----------------------------------------------------------
+	# sbp - inputs to deposition rate per size bin (size bins in rows): 
+	#	diameter (m) and, for McMurry and Rader, Cunningham slip-correction
+	#	factor, particle density (g/m3), whether particles present (number
+	#	concentration above 1.e-20 #/cc) and whether above 1.e-10 #/cc
+	# cond - inputs to deposition rate common to all size bins: Rader 
+	#	flag, testf flag, temperature (K), dynamic viscosity of air (g/m.s),
+	#	chamber radius (m), average number of charges per particle, average 
+	#	electric field (g.m/A.s3), inflection diameter (m), x value preceding 
+	#	and proceeding inflection and deposition rate at inflection (/s)
+	# ----------------------------------------------------------------
+	
+	[Rader, testf, TEMP, eta_ai, ChamR, n, E, inflectDp, pwl_xpre, pwl_xpro, 
+		inflectk] = cond
+	Dp = sbp[:, 0]
+	
+	if (Rader == 0): # manual input of wall loss rate
+		
+		Beta = np.zeros((len(Dp)))
+		Beta[Dp<inflectDp] = 10**((np.log10(inflectDp)-
+								np.log10(Dp[Dp<inflectDp]))*pwl_xpre+np.log10(inflectk))
+		Beta[Dp>=inflectDp] = 10**((np.log10(Dp[Dp>=inflectDp])-
+								np.log10(inflectDp))*pwl_xpro+np.log10(inflectk))
+		
+		return(Beta)
+	
+	# -------------------------------------------------------------------------
+	# McMurry & Rader option McMurry 1985, DOI: 10.1080/02786828508959054
+	Gi = sbp[:, 1]; rho = sbp[:, 2]
+	ish = sbp[:, 3] == 1 # size bins where particles present
+	occ = sbp[:, 4] == 1 # size bins with particles above threshold
+	
+	# elementary charge (C==A.s) (Charan et al. 2018)
+	e = 1.602e-19
+	
+	# electrostatic migration velocity/deposition velocity 
+	# (eq. 11 McMurry and Rader (1985), eq. 5 Charan (2018)) (m/s), 
+	# only for size bins where particles available
+	ve = np.abs((n*e*Gi*E)/(3.0*np.pi*eta_ai*Dp))*occ
+	
+	# terminal particle settling velocity (m/s) (eq. 4 Charan (2018) also 
+	# eq. 20.4 Jacobson 2005)
+	# gravitational constant has units m/s2
+	vs = (Dp**2.0*rho*si.g*Gi)/(18.0*eta_ai)
+
+	# particle diffusion coefficient (15.29 of Jacobson (2005) and 
+	# 8.73 of Seinfeld and pandis (1998)) (m2/s)
+	# multiply eta_a by 1.0e-3 to convert from g/m.s to kg/m.s
+	# this makes it consistent with the units of Boltzmann constant
+	Dpi = (((si.k*TEMP)/(3.0*np.pi*Dp*(eta_ai*1.0e-3)))*Gi)
+	
+	# eddy diffusion coefficient (/s) (scalar)
+	if testf == 1:
+		Ke = 6.4e-3 
+	else:
+		Ke = 1.0
+		
+	# x and y terms in eq. 2 of Charan (2018)
+	# x (eq. 13 McMurry (1985)) (dimensionless)
+	x = (np.pi*vs)/(2.0*((Ke*Dpi)**(1.0/2.0)))
+	# y (eq. 14 McMurry (1985)) (dimensionless)
+	y = (np.pi*ve)/(2.0*((Ke*Dpi)**(1.0/2.0)))
+	
+	# first order Debye functions (eq. 3 Charan (2018)), only for size
+	# bins with particles inside
+	D1 = np.zeros((len(Dp)))
+	D11 = np.zeros((len(Dp)))
+	D1[occ] = Debye1(x[occ]+y[occ])
+	D11[occ] = Debye1(x[occ]-y[occ])
+	
+	# first bit of Beta (loss rate to walls (/s)) calculation (eq. 2 Charan (2018))
+	Beta1 = np.zeros((len(Dp)))
+	Beta1[ish] = (3.0*((Ke*Dpi[ish])**(0.5)))/(np.pi*ChamR*x[ish])
+	Beta2 = ((x+y)**2.0)/2.0+(x+y)*D1+(x-y)*D11 # second bit
+
+	# Beta (loss rate to walls (/s)) calculation (eq. 2 Charan (2018) and eq. 15 
+	# McMurry and Rader 1985) - value
+	# represents fraction of particles lost to walls every second (Beta meaning is 
+	# just above eq. 1 of McMurry (1985) DOI: 10.1080/02786828508959054)
+	return(Beta1*Beta2)
+
+# first order Debye function
+def Debye1(z):
+
+	# inputs:----------------------------------------------------------
+	# z - upper limit of integration (dimensionless)
+	# ----------------------------------------------------------------
+	
+	# the integral of t/(exp(t)-1) from 0 to |z|, in terms of the 
+	# dilogarithm (Li2(u) = spence(1-u)), which tends to pi**2/6 for large z
+	za = np.abs(z)
+	with np.errstate(divide='ignore', invalid='ignore'):
+		I = za*np.log(-np.expm1(-za))-special.spence(-np.expm1(-za))+(np.pi**2.)/6.
+	I[za > 700.] = (np.pi**2.)/6.
+	# for negative z the integrand is -t+(-t)/(exp(-t)-1)
+	I[z < 0.] = -(za[z < 0.]**2.)/2.-I[z < 0.]
+	
+	D = np.zeros((len(z)))
+	D[z != 0.] = I[z != 0.]/z[z != 0.]
 	
-	# prepare output
-	Pn.reshape(num_asb, 1)
+	# series expansion where the above loses precision for small z
+	ish = za < 1.e-1
+	D[ish] = (1.-z[ish]/4.+z[ish]**2./36.-z[ish]**4./3600.+
+		z[ish]**6./211680.)
 	
-	return(Pn, Cn)
+	return(D)
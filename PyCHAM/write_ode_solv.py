@@ -46,6 +46,8 @@ def ode_gen(con_infl_indx, int_tol, rowvals, num_comp,
 	# sav_nam - name of file to save results to
 	# pcont - flag for whether seed particle injection is 
 	#	instantaneous (0) or continuous (1)
+	# self.vbs_lump - flag for lumping particle- and wall-phase
+	#	organics into volatility basis set bins
 	# self - reference to PyCHAM
 	# -------------------------------------------------------
 	
@@ -192,6 +194,13 @@ def ode_gen(con_infl_indx, int_tol, rowvals, num_comp,
 		return()
 
 
+	if (eqn_num[1] > 0): # if particle-phase reactions present
+		f.write('	# change to components (rows) per unit rate of particle-phase\n')
+		f.write('	# reactions (columns), applying to all particle size bins\n')
+		f.write('	stoi_aq = (SP.csc_matrix((pstoi_flat_aq, y_pind_aq, prod_col_aq), shape = (num_comp, rindx_aq.shape[0]))-\n')
+		f.write('		SP.csc_matrix((rstoi_flat_aq, y_rind_aq, reac_col_aq), shape = (num_comp, rindx_aq.shape[0])))\n')
+		f.write('	\n')
+
 	# testing with 16 size bins and the MCM alpha-pinene chemical scheme
 	# showed that using the vectorised Python code gave just 1 %
 	# increase in wall clock time compared to using numba, and won't
@@ -281,28 +290,17 @@ def ode_gen(con_infl_indx, int_tol, rowvals, num_comp,
 	if (eqn_num[1] > 0): # if particle-phase reactions present
 		f.write('		# particle-phase reactions -------------------------\n')
 		f.write('		\n')
-		f.write('		# empty array to hold relevant concentrations for\n')
-		f.write('		# reaction rate coefficient calculation\n')
-		f.write('		# tile aqueous-phase reaction rate coefficients\n')
-		f.write('		rr_aq = np.tile(rrc[rindx.shape[0]::], num_asb)\n')
-		f.write('		# prepare aqueous-phase concentrations\n')
-		f.write('		rrc_y = np.ones((rindx_aq.shape[0]*rindx_aq.shape[1]))\n')
-		f.write('		rrc_y[y_arr_aq] = y[y_rind_aq, 0]\n')
-		f.write('		rrc_y = rrc_y.reshape(rindx_aq.shape[0], rindx_aq.shape[1], order = \'C\')\n')
-		f.write('		# reaction rate (molecules/cm3/s) \n')
-		f.write('		rr = rr_aq*((rrc_y**rstoi_aq).prod(axis=1))\n')
-		f.write('		# loss of reactants\n')
-		f.write('		data = rr[rr_arr_aq]*rstoi_flat_aq # prepare loss values\n')
-		f.write('		# convert to sparse matrix\n')
-		f.write('		loss = SP.csc_matrix((data[0, :], y_rind_aq, reac_col_aq))\n')
-		f.write('		# register loss of reactants\n')
-		f.write('		dd[uni_y_rind_aq, 0] -= np.array((loss.sum(axis = 1))[uni_y_rind_aq])[:, 0]\n')
-		f.write('		# gain of products\n')
-		f.write('		data = rr[rr_arr_p_aq]*pstoi_flat_aq # prepare loss values\n')
-		f.write('		# convert to sparse matrix\n')
-		f.write('		loss = SP.csc_matrix((data[0, :], y_pind_aq, prod_col_aq))\n')
-		f.write('		# register gain of products\n')
-		f.write('		dd[uni_y_pind_aq, 0] += np.array((loss.sum(axis = 1))[uni_y_pind_aq])[:, 0]\n')
+		f.write('		# particle-phase concentrations with size bins in rows and\n')
+		f.write('		# components in columns\n')
+		f.write('		y_aq = (y[num_comp:num_comp*(num_asb+1), 0]).reshape(num_asb, num_comp)\n')
+		f.write('		# prepare aqueous-phase concentrations for all size bins\n')
+		f.write('		rrc_y = np.ones((num_asb, rindx_aq.shape[0]*rindx_aq.shape[1]))\n')
+		f.write('		rrc_y[:, y_arr_aq] = y_aq[:, y_rind_aq]\n')
+		f.write('		rrc_y = rrc_y.reshape(num_asb, rindx_aq.shape[0], rindx_aq.shape[1], order = \'C\')\n')
+		f.write('		# reaction rate (molecules/cm3/s), size bins in rows\n')
+		f.write('		rr = rrc[rindx.shape[0]::]*((rrc_y**rstoi_aq).prod(axis=2))\n')
+		f.write('		# register loss of reactants and gain of products\n')
+		f.write('		dd[num_comp:num_comp*(num_asb+1), 0] += ((stoi_aq.dot(rr.transpose())).transpose()).flatten()\n')
 		f.write('		\n')
 	
 	if (len(con_infl_indx) > 0): # if a component has a continuous gas-phase influx
@@ -485,25 +483,20 @@ def ode_gen(con_infl_indx, int_tol, rowvals, num_comp,
 		f.write('		\n')
 	
 	if (eqn_num[1] > 0): # if particle-phase reactions present
+		f.write('		# particle-phase concentrations with size bins in rows and\n')
+		f.write('		# components in columns\n')
+		f.write('		y_aq = (y[num_comp:num_comp*(num_asb+1), 0]).reshape(num_asb, num_comp)\n')
 		f.write('		n_aqr = nreac_aq.shape[0] # number of aqueous-phase reactions \n')
-		f.write('		aqi = 0 # aqueous-phase reaction counter\n')
 		f.write('		\n')
-		f.write('		for i in range(rindx.shape[0], rrc.shape[0]): # aqueous-phase reaction loop\n')
-		f.write('			# reaction rate (molecules/cm3/s)\n')
-		f.write('			rr = rrc[i]*(y[rindx_aq[aqi::n_aqr, 0:nreac_aq[aqi]], 0].prod(axis=1))\n')
-		f.write('			# spread along affected components\n')
-		f.write('			rr = rr.reshape(-1, 1)\n')
-		f.write('			rr = (np.tile(rr, int(njac_aq[aqi, 0]/(num_sb-self.wall_on)))).flatten(order=\'C\')\n')
-		f.write('			# prepare Jacobian inputs\n')
-		f.write('			jac_coeff = np.zeros((njac_aq[aqi, 0]))\n')
+		f.write('		for aqi in range(n_aqr): # aqueous-phase reaction loop\n')
+		f.write('			# reaction rate (molecules/cm3/s) per size bin\n')
+		f.write('			rr = rrc[rindx.shape[0]+aqi]*(y_aq[:, rindx_aq[aqi, 0:nreac_aq[aqi]]].prod(axis=1))\n')
+		f.write('			# prepare Jacobian inputs, size bins in rows\n')
+		f.write('			jac_coeff = np.zeros((num_asb, njac_aq[aqi, 0]))\n')
 		f.write('			nzi = (rr != 0)\n')
-		f.write('			jac_coeff[nzi] = (rr[nzi]*((jac_stoi_aq[aqi, 0:njac_aq[aqi, 0]])[nzi])/\n')
-		f.write('				((y[jac_den_indx_aq[aqi, 0:njac_aq[aqi, 0]], 0])[nzi]))\n')
-		f.write('			# stack size bins\n')
-		f.write('			jac_coeff = jac_coeff.reshape(int(num_sb-self.wall_on), int(njac_aq[aqi, 0]/(num_sb-self.wall_on)), order=\'C\')\n')
-		f.write('			data[jac_indx_aq[aqi::n_aqr, 0:(int(njac_aq[aqi, 0]/(num_sb-self.wall_on)))]] += jac_coeff\n')
-		f.write('			\n')
-		f.write('			aqi += 1 # keep count on aqueous-phase reactions \n')
+		f.write('			jac_coeff[nzi, :] = (rr[nzi].reshape(-1, 1)*jac_stoi_aq[aqi, 0:njac_aq[aqi, 0]]/\n')
+		f.write('				y_aq[nzi, :][:, jac_den_indx_aq[aqi, 0:njac_aq[aqi, 0]]])\n')
+		f.write('			data[jac_indx_aq[aqi::n_aqr, 0:njac_aq[aqi, 0]]] += jac_coeff\n')
 	f.write('		\n')
 	
 	if (num_asb > 0): # include gas-particle partitioning in ode solver Jacobian
@@ -603,11 +596,33 @@ def ode_gen(con_infl_indx, int_tol, rowvals, num_comp,
 	f.write('	# reaction rate coefficient zeroed wherever product of reactant concentrations is zero (including where underflow causes zero, thereby preventing underflows breaking the solver which appears to be an issue on less powerful machines such as HP Spectre Folio) (/s) \n')
 	f.write('	#rrc[((rrc_y**rstoi).prod(axis=1)) == 0.0] = 0.\n')
 	f.write('	\n')
-	f.write('	# call on the ODE solver, note y contains the initial condition(s) (molecules/cm3 (air)) and must be 1D even though y in dydt and jac has shape (number of elements, 1)\n')
-	f.write('	sol = solve_ivp(dydt, [0, integ_step], y, atol = atol, rtol = rtol, method = \'BDF\', t_eval = [integ_step], vectorized = True, jac = jac)\n')
-	f.write('	\n')
-	f.write('	# force all components in size bins with no particle to zero\n')
-	f.write('	y = np.squeeze(sol.y)\n')
+	if (self.vbs_lump == 1 and (num_asb+self.wall_on) > 0): # lumped particle- and wall-phase organics
+		f.write('	# rates of change and Jacobian of the lumped state, where particle- and\n')
+		f.write('	# wall-phase organics are lumped into volatility basis set bins, mapping\n')
+		f.write('	# into components with lump_Q and back to the lumped state with lump_P\n')
+		f.write('	# (prepared by vbs_lump.lump_map)\n')
+		f.write('	def dydt_lump(t, yl):\n')
+		f.write('		return(self.lump_P.dot(dydt(t, self.lump_Q.dot(yl))))\n')
+		f.write('	\n')
+		f.write('	def jac_lump(t, yl):\n')
+		f.write('		return(((self.lump_P.dot(jac(t, self.lump_Q.dot(yl)))).dot(self.lump_Q)).tocsc())\n')
+		f.write('	\n')
+		f.write('	# call on the ODE solver for the lumped state\n')
+		f.write('	sol = solve_ivp(dydt_lump, [0, integ_step], self.lump_P.dot(y), atol = atol, rtol = rtol, method = \'BDF\', t_eval = [integ_step], vectorized = True, jac = jac_lump)\n')
+		f.write('	\n')
+		f.write('	# components from lumped state, with the sum of their rates of change at\n')
+		f.write('	# the start and end of the step for disaggregating lumps (vbs_lump.lump_out)\n')
+		f.write('	yl = self.lump_Q.dot(np.squeeze(sol.y))\n')
+		f.write('	self.lump_dd = dydt(0., y.reshape(-1, 1))+dydt(integ_step, yl.reshape(-1, 1))\n')
+		f.write('	\n')
+		f.write('	# force all components in size bins with no particle to zero\n')
+		f.write('	y = yl\n')
+	else:
+		f.write('	# call on the ODE solver, note y contains the initial condition(s) (molecules/cm3 (air)) and must be 1D even though y in dydt and jac has shape (number of elements, 1)\n')
+		f.write('	sol = solve_ivp(dydt, [0, integ_step], y, atol = atol, rtol = rtol, method = \'BDF\', t_eval = [integ_step], vectorized = True, jac = jac)\n')
+		f.write('	\n')
+		f.write('	# force all components in size bins with no particle to zero\n')
+		f.write('	y = np.squeeze(sol.y)\n')
 	f.write('	y = y.reshape(num_sb+1, num_comp)\n')
 	f.write('	if (num_asb > 0):\n')
 	f.write('		y[1:num_asb+1, :][N_perbin[:, 0] == 0, :] = 0\n')
@@ -21,59 +21,135 @@
 ##########################################################################################
 '''interrogate the xml file'''
 # opens and extracts the component names and associated SMILE strings
-# from the xml file
+# from the xml file, the file is read incrementally so that only the name
+# and SMILES of each component are held in memory, and the resulting 
+# index is cached by a hash of the file contents, in the folder of parsed
+# mechanisms (see mech_cache.cache_dir) rather than the PyCHAM package
 
-import xmltodict # for opening and converting xml files to python dictionaries
-import pybel # for converting SMILE strings to pybel objects
+import hashlib
+import os
+import pickle
+import xml.etree.ElementTree as ET # for incremental reading of xml files
+import mol_reg # for converting SMILE strings to pybel objects
+
+# SMILES of components that may be given without SMILES in the xml file
+smil_def = {'O3' : '[O-][O+]=O', 'NO2' : '[N+](=O)[O-]', 'NO3' : '[N+](=O)([O-])[O]'}
 
 # define function
-def xml_interr(xml_name):
+def xml_interr(xml_name, comp_use=None, cache_dir=None):
 
 	# inputs: --------------------------------------------------------
 	# xml_name - name of xml file
+	# comp_use - optional names of components to return, if not 
+	#	given all components in the xml file are returned
+	# cache_dir - optional folder for caching the index of names 
+	#	and SMILES
 	# ----------------------------------------------------------------
 
 	# start with no error message
 	err_mess_new = ''
 
-	with open(xml_name) as fd:
-		try:
-			doc = xmltodict.parse(fd.read())
-		except:
-			err_mess_new = 'Error: xml file could not be interpreted, please check file'
-			return(err_mess_new, [], [])
-
-	a = doc['mechanism']['species_defs']['species']
+	# index of names and SMILES (None where not given) in file order
+	[err_mess_new, index] = xml_index(xml_name, cache_dir)
+	if (err_mess_new != ''):
+		return(err_mess_new, [], [])
+	
+	# keep only the requested components
+	if comp_use is not None:
+		index = [i for i in index if i[0] in comp_use]
 	
 	# prepare arrays to fill	
-	comp_numb = list(('0',) * len(a))
-	comp_name = list(('0',) * len(a))
-	comp_smil = list(('0',) * len(a))
+	comp_name = [i[0] for i in index]
+	comp_smil = list(('0',) * len(index))
 	
-	for i in range(len(a)):
-		comp_numb[i] = a[i]['@species_number']
-		comp_name[i] = a[i]['@species_name']
+	for i in range(len(index)):
 		if (comp_name[i] == ''): # nothing to register here
 			continue
 
-		if ("smiles" in a[i]):
-			comp_smil[i] = a[i]['smiles']
-		else: # if no SMILE string explicitly given
-			succ = 0 # assume no success
-			if (comp_name[i] == 'O3'):
-				comp_smil[i] = '[O-][O+]=O'
-				succ = 1
-			if (comp_name[i] == 'NO2'):
-				comp_smil[i] = '[N+](=O)[O-]'
-				succ = 1
-			if (comp_name[i] == 'NO3'):
-				comp_smil[i] = '[N+](=O)([O-])[O]'
-				succ = 1
-			if (succ == 0):
-				try: # first try assuming that SMILE string is represented by component name
-					comp_smil[i] = comp_name[i]
-					Pybel_object = pybel.readstring('smi', comp_smil[i])
-				except:
-					err_mess_new = str('Error: a smiles string was not found for component ' + str(comp_name[i]) + ' in the xml file, nor could its name be interpreted as a SMILE string')
-					break
-	return(err_mess_new, comp_smil, comp_name)
\ No newline at end of file
+		if (index[i][1] is not None): # SMILE string given
+			comp_smil[i] = index[i][1]
+		elif comp_name[i] in smil_def: # if no SMILE string explicitly given
+			comp_smil[i] = smil_def[comp_name[i]]
+		else:
+			try: # first try assuming that SMILE string is represented by component name
+				comp_smil[i] = comp_name[i]
+				Pybel_object = mol_reg.mol(comp_smil[i])
+			except:
+				err_mess_new = str('Error: a smiles string was not found for component ' + str(comp_name[i]) + ' in the xml file, nor could its name be interpreted as a SMILE string')
+				break
+	
+	return(err_mess_new, comp_smil, comp_name)
+
+def xml_index(xml_name, cache_dir):
+
+	# inputs: --------------------------------------------------------
+	# xml_name - name of xml file
+	# cache_dir - folder for caching the index (None for no caching)
+	# ----------------------------------------------------------------
+
+	err_mess_new = ''
+	
+	if cache_dir is not None: # check for index of this file in cache
+		with open(xml_name, mode='rb') as f:
+			key = hashlib.sha256(f.read()).hexdigest()
+		fname = os.path.join(cache_dir, str('xml_' + key + '.pickle'))
+		try:
+			with open(fname, mode='rb') as f:
+				return(err_mess_new, pickle.load(f))
+		except Exception: # not cached or unreadable
+			pass
+	
+	# every (name, SMILES) pair is indexed, rather than only those of 
+	# components in the chemical scheme, so that one cached index serves 
+	# all chemical schemes using this xml file
+	index = [] # names and SMILES of components
+	depth = 0 # depth of current element
+	defs_depth = -1 # depth of species definitions (-1 if outside)
+	parents = [] # elements enclosing the current element
+	
+	try:
+		for [event, elem] in ET.iterparse(xml_name, events=('start', 'end')):
+			# tag without any namespace
+			tag = elem.tag.rpartition('}')[2]
+			if (event == 'start'):
+				depth += 1
+				parents.append(elem)
+				if (tag == 'species_defs' and depth == 2):
+					defs_depth = depth
+				continue
+			parents.pop()
+			
+			# species definitions are children of species_defs
+			if (tag == 'species' and depth == defs_depth+1):
+				smil = None
+				for child in elem:
+					if (child.tag.rpartition('}')[2] == 'smiles'):
+						smil = child.text
+						if smil is not None: # surrounding whitespace is ignored
+							smil = smil.strip()
+							if (smil == ''):
+								smil = None
+						break
+				index.append((elem.get('species_name', ''), smil))
+			if (tag == 'species_defs' and depth == defs_depth):
+				defs_depth = -1
+			# free memory of finished elements below the root by detaching 
+			# them from their parent, deeper elements go with their ancestor
+			if (depth == 2 or (tag == 'species' and depth == defs_depth+1)):
+				parents[-1].remove(elem)
+			depth -= 1
+	except:
+		err_mess_new = 'Error: xml file could not be interpreted, please check file'
+		return(err_mess_new, [])
+	
+	if cache_dir is not None: # store index for subsequent runs
+		try:
+			os.makedirs(cache_dir, exist_ok=True)
+			tname = str(fname + '.' + str(os.getpid()))
+			with open(tname, mode='wb') as f:
+				pickle.dump(index, f, protocol=pickle.HIGHEST_PROTOCOL)
+			os.replace(tname, fname)
+		except OSError:
+			pass
+	
+	return(err_mess_new, index)
\ No newline at end of file